@@ -11,6 +11,23 @@
 #include "distributionNDNormal.h"
 %}
 %include "std_vector.i"
+
+/* contiguous buffers of doubles (e.g. numpy arrays of floats), evaluated in place */
+%typemap(in) (double * values, int size) {
+  Py_buffer view;
+  if (PyObject_GetBuffer($input, &view, PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+    SWIG_fail;
+  }
+  bool isDouble = view.itemsize == sizeof(double) && view.format != NULL && strcmp(view.format, "d") == 0;
+  $1 = (double *) view.buf;
+  $2 = (int) (view.len / sizeof(double));
+  PyBuffer_Release(&view);
+  if (!isDouble) {
+    PyErr_SetString(PyExc_TypeError, "in method '$symname', expected a contiguous writable buffer of doubles");
+    SWIG_fail;
+  }
+}
+
 %include "distribution.h"
 %include "DistributionContainer.h"
 %include "distribution_1D.h"
@@ -42,6 +42,10 @@ public:
    virtual double  cdf(double x) = 0; ///< cdf function at coordinate x
    virtual double  inverseCdf(double x) = 0; ///< x
 
+   void pdfArray(double * values, int size); ///< pdf function at each coordinate of values (overwritten with the results)
+   void cdfArray(double * values, int size); ///< cdf function at each coordinate of values (overwritten with the results)
+   void inverseCdfArray(double * values, int size); ///< inverseCdf function at each probability of values (overwritten with the results)
+
    virtual double untrPdf(double x) = 0;
    virtual double untrCdf(double x) = 0;
    virtual double untrCdfComplement(double x)  = 0;
@@ -33,6 +33,7 @@ public:
   ~RandomClass();
   void seed(unsigned long int seed);
   double random();
+  void fill_random(double * values, int size);
   int get_rng_state();
   void forward_seed(unsigned int counts);
   int get_rng_seed();
@@ -96,6 +96,30 @@ BasicDistribution::getRandom(double x)
   }
 }
 
+void
+BasicDistribution::pdfArray(double * values, int size)
+{
+  for(int i = 0; i < size; i++) {
+    values[i] = pdf(values[i]);
+  }
+}
+
+void
+BasicDistribution::cdfArray(double * values, int size)
+{
+  for(int i = 0; i < size; i++) {
+    values[i] = cdf(values[i]);
+  }
+}
+
+void
+BasicDistribution::inverseCdfArray(double * values, int size)
+{
+  for(int i = 0; i < size; i++) {
+    values[i] = inverseCdf(values[i]);
+  }
+}
+
 BasicDistribution::EForceRandom
 BasicDistribution::forcingMethod()
 {
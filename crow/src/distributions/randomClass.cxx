@@ -40,6 +40,13 @@ double RandomClass::random() {
     return (_rng->_backend()-_rng->_backend.min())/_range;
   }
 
+void RandomClass::fill_random(double * values, int size) {
+    // same values as calling random() size times
+    for (int i = 0; i < size; i++) {
+      values[i] = random();
+    }
+  }
+
 int RandomClass::get_rng_state() {
     return _counter;
 }
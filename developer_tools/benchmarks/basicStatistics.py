@@ -0,0 +1,101 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the BasicStatistics postprocessor on time-dependent data.
+  Weighted histories are collected in a HistorySet, then the scalar metrics (including the
+  weighted median and percentiles) and the matrix metrics (sensitivity, covariance, pearson and
+  the variance dependent sensitivities) are computed for every pivot value. The time spent by
+  each group of metrics is reported.
+  Run it against different revisions to compare implementations:
+    python basicStatistics.py [numHistories] [historyLength]
+"""
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+from utils import utils
+utils.find_crow(frameworkDir)
+
+import MessageHandler
+import DataObjects
+from Models.PostProcessors import factory
+
+inputs = ['a', 'b', 'c']
+outputs = ['x', 'y']
+
+metrics = {'scalar': ['expectedValue', 'sigma', 'median', 'percentile', 'skewness', 'kurtosis'],
+           'matrix': ['sensitivity', 'covariance', 'pearson', 'VarianceDependentSensitivity']}
+
+def createHistorySet(numHistories, length):
+  """
+    Creates a HistorySet with weighted histories
+    @ In, numHistories, int, the number of histories
+    @ In, length, int, the length of the histories
+    @ Out, data, HistorySet, the data object
+  """
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity': 'silent'})
+  xml = ET.Element('HistorySet', {'name': 'benchmark'})
+  ET.SubElement(xml, 'Input').text = ','.join(inputs)
+  ET.SubElement(xml, 'Output').text = ','.join(outputs)
+  ET.SubElement(ET.SubElement(xml, 'options'), 'pivotParameter').text = 'time'
+  data = DataObjects.HistorySet()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  data.addExpectedMeta(['prefix', 'ProbabilityWeight'])
+  pivot = np.linspace(0.0, 1.0, length)
+  rng = np.random.RandomState(42)
+  for i in range(numHistories):
+    a, b, c = rng.rand(3)
+    data.addRealization({'a': np.array([a]), 'b': np.array([b]), 'c': np.array([c]),
+                         'x': a*np.sin(pivot*b) + c*(1.0 + pivot), 'y': (a + b)*np.cos(pivot) + rng.rand(length),
+                         'time': pivot, 'prefix': np.array([str(i)]),
+                         'ProbabilityWeight': np.array([rng.rand()])})
+  return data
+
+def createPostProcessor(data, requested):
+  """
+    Creates a BasicStatistics postprocessor computing the requested metrics
+    @ In, data, HistorySet, the input data object
+    @ In, requested, list, the requested metrics
+    @ Out, pp, BasicStatistics, the postprocessor
+  """
+  xml = ET.Element('PostProcessor', {'name': 'benchmark', 'subType': 'BasicStatistics'})
+  ET.SubElement(xml, 'pivotParameter').text = 'time'
+  for metric in requested:
+    node = ET.SubElement(xml, metric, {'prefix': metric})
+    if metric in metrics['matrix']:
+      ET.SubElement(node, 'targets').text = ','.join(outputs)
+      ET.SubElement(node, 'features').text = ','.join(inputs)
+    else:
+      node.text = ','.join(outputs)
+  pp = factory.returnInstance('BasicStatistics')
+  pp.messageHandler = data.messageHandler
+  pp._readMoreXML(xml)
+  pp.initialize({'WorkingDir': '.'}, [data], {})
+  return pp
+
+if __name__ == '__main__':
+  numHistories = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+  length = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+  data = createHistorySet(numHistories, length)
+  for group, requested in metrics.items():
+    pp = createPostProcessor(data, requested)
+    start = time.perf_counter()
+    pp.run(data)
+    print('{:6s} metrics, {} histories ({} steps): {:8.3f} s'.format(group, numHistories, length, time.perf_counter() - start))
@@ -0,0 +1,139 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the data collection in the DataObjects.
+  Scalar samples are collected in a PointSet and aligned histories in a HistorySet;
+  then both are converted into xr.Dataset (asDataset). For each case, the time spent
+  collecting and converting is reported, together with the memory held by the
+  collector and the peak memory reached up to the end of the conversion (from tracemalloc).
+  Run it against different revisions to compare implementations:
+    python dataObjectCollector.py [numScalarSamples] [numHistories] [historyLength]
+"""
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+from utils import utils
+utils.find_crow(frameworkDir)
+
+import MessageHandler
+import DataObjects
+
+def createDataObject(typ, inputs, outputs):
+  """
+    Creates a DataObject
+    @ In, typ, str, the type of DataObject (PointSet, HistorySet)
+    @ In, inputs, str, comma-separated input variables
+    @ In, outputs, str, comma-separated output variables
+    @ Out, data, DataObject, the data object
+  """
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity': 'silent'})
+  xml = ET.Element(typ, {'name': 'benchmark'})
+  ET.SubElement(xml, 'Input').text = inputs
+  ET.SubElement(xml, 'Output').text = outputs
+  data = getattr(DataObjects, typ)()
+  data.messageHandler = mh
+  data._readMoreXML(xml)
+  data.addExpectedMeta(['prefix', 'ProbabilityWeight'])
+  return data
+
+def collect(data, realizations):
+  """
+    Collects the realizations in the data object
+    @ In, data, DataObject, the data object
+    @ In, realizations, list, the realizations to collect
+    @ Out, None
+  """
+  if hasattr(data, 'addRealizations'):
+    data.addRealizations(realizations)
+  else:
+    for rlz in realizations:
+      data.addRealization(rlz)
+
+def measure(create, realizations):
+  """
+    Collects the realizations in new data objects and converts them into xr.Dataset, first
+    measuring the times, then (since tracing slows allocations down) the memory.
+    @ In, create, function, creates an empty data object
+    @ In, realizations, list, the realizations to collect
+    @ Out, results, dict, the times (s) and memory (MB)
+  """
+  results = {}
+  data = create()
+  start = time.perf_counter()
+  collect(data, realizations)
+  results['collect'] = time.perf_counter() - start
+  start = time.perf_counter()
+  data.asDataset()
+  results['convert'] = time.perf_counter() - start
+  del data
+  data = create()
+  tracemalloc.start()
+  collect(data, realizations)
+  results['collectorMB'] = tracemalloc.get_traced_memory()[0]/1e6
+  data.asDataset()
+  results['peakMB'] = tracemalloc.get_traced_memory()[1]/1e6
+  tracemalloc.stop()
+  return results
+
+def scalarCase(numSamples):
+  """
+    Scalar samples in a PointSet
+    @ In, numSamples, int, the number of samples
+    @ Out, results, dict, the measures
+  """
+  create = lambda: createDataObject('PointSet', 'a,b,c', 'x,y')
+  rlzs = []
+  for i in range(numSamples):
+    rlzs.append({'a': np.array([0.1*i]), 'b': np.array([1.0]), 'c': np.array([i]), 'x': np.array([2.0*i]),
+                 'y': np.array([True]), 'prefix': np.array([str(i)]), 'ProbabilityWeight': np.array([1.0])})
+  return measure(create, rlzs)
+
+def historyCase(numHistories, length):
+  """
+    Aligned histories in a HistorySet
+    @ In, numHistories, int, the number of histories
+    @ In, length, int, the length of the histories
+    @ Out, results, dict, the measures
+  """
+  create = lambda: createDataObject('HistorySet', 'a,b', 'x,y')
+  pivot = np.linspace(0.0, 1.0, length)
+  rlzs = []
+  for i in range(numHistories):
+    rlzs.append({'a': np.array([0.1*i]), 'b': np.array([1.0]), 'x': np.sin(pivot*i), 'y': np.cos(pivot*i),
+                 'time': pivot, 'prefix': np.array([str(i)]), 'ProbabilityWeight': np.array([1.0])})
+  return measure(create, rlzs)
+
+def report(name, results):
+  """
+    Prints the measures
+    @ In, name, str, the case name
+    @ In, results, dict, the measures
+    @ Out, None
+  """
+  print('{:28s} collect {:8.3f} s | asDataset {:8.3f} s | collector {:9.1f} MB | peak {:9.1f} MB'
+        .format(name, results['collect'], results['convert'], results['collectorMB'], results['peakMB']))
+
+if __name__ == '__main__':
+  numSamples = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+  numHistories = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+  length = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+  report('{} scalar samples'.format(numSamples), scalarCase(numSamples))
+  report('{} histories ({} steps)'.format(numHistories, length), historyCase(numHistories, length))
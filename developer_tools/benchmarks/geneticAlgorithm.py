@@ -0,0 +1,143 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the per-generation bookkeeping of the GeneticAlgorithm optimizer.
+  For a population of integer chromosomes, the steps that do not involve the model are timed:
+  the check of the children against the parents, the submission of the children and the
+  Hausdorff (AHD) and average Hausdorff (AHDp) convergence distances. The pairwise Python loops
+  used before these steps were vectorized are timed as well, for comparison.
+    python geneticAlgorithm.py [populationSize] [numGenes]
+"""
+import os
+import sys
+import time
+import numpy as np
+import xarray as xr
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+from utils import utils
+utils.find_crow(frameworkDir)
+utils.add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+
+import MessageHandler
+from Optimizers import factory
+
+def createOptimizer(numGenes):
+  """
+    Creates a GeneticAlgorithm with the given number of variables
+    @ In, numGenes, int, the number of variables (genes) to be sampled
+    @ Out, ga, GeneticAlgorithm, the optimizer
+  """
+  mh = MessageHandler.MessageHandler()
+  mh.initialize({'verbosity': 'silent'})
+  ga = factory.returnInstance('GeneticAlgorithm')
+  ga.messageHandler = mh
+  ga.toBeSampled = dict(('x{}'.format(g), 'dist') for g in range(numGenes))
+  return ga
+
+def loopRepeated(population, children):
+  """
+    Reference implementation of the check of the children against the parents
+    @ In, population, np.array, the parents
+    @ In, children, np.array, the children
+    @ Out, repeated, list, the repeated children
+  """
+  repeated = []
+  for i in range(np.shape(population)[0]):
+    for j in range(i, np.shape(children)[0]):
+      if all(population[i,:] == children[j,:]):
+        repeated.append(j)
+  return list(set(repeated))
+
+def loopSubmit(ga, children, traj, step):
+  """
+    Reference implementation of the submission of the children
+    @ In, ga, GeneticAlgorithm, the optimizer
+    @ In, children, np.array, the children
+    @ In, traj, int, the trajectory
+    @ In, step, int, the iteration
+    @ Out, None
+  """
+  daChildren = xr.DataArray(children,
+                            dims=['chromosome', 'Gene'],
+                            coords={'chromosome': np.arange(np.shape(children)[0]),
+                                    'Gene': list(ga.toBeSampled)})
+  for i in range(np.shape(daChildren)[0]):
+    newRlz = {}
+    for var in ga.toBeSampled.keys():
+      newRlz[var] = float(daChildren.loc[i, var].values)
+    ga._submitRun(newRlz, traj, step)
+
+def loopAHD(a, b, p=None):
+  """
+    Reference implementation of the (p-average) Hausdorff distance
+    @ In, a, np.array, population A
+    @ In, b, np.array, population B
+    @ In, p, float, optional, the averaging order (AHDp) or None (AHD)
+    @ Out, loopAHD, float, the distance
+  """
+  def gd(x, y):
+    """
+      Generational distance from x to y
+      @ In, x, np.array, population
+      @ In, y, np.array, population
+      @ Out, gd, float, the distance
+    """
+    dist = [min(np.linalg.norm(x[i,:] - y[j,:], 2) for j in range(np.shape(y)[0])) for i in range(np.shape(x)[0])]
+    if p is None:
+      return max(dist)
+    return (sum(d**p for d in dist)/len(dist))**(1/p)
+  return max(gd(a, b), gd(b, a))
+
+def timeIt(function, *args):
+  """
+    Times a function
+    @ In, function, callable, the function
+    @ In, args, list, the arguments
+    @ Out, (result, elapsed), tuple, the result and the time in seconds
+  """
+  start = time.perf_counter()
+  result = function(*args)
+  return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+  populationSize = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+  numGenes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+  ga = createOptimizer(numGenes)
+  rng = np.random.RandomState(42)
+  population = rng.randint(0, 5, size=(populationSize, numGenes)).astype(float)
+  children = rng.randint(0, 5, size=(populationSize, numGenes)).astype(float)
+  children[::10] = population[::10]
+  timings = []
+  old, oldTime = timeIt(loopRepeated, population, children)
+  new, newTime = timeIt(ga._findRepeatedChildren, population, children)
+  assert old == new
+  timings.append(('repeated children', oldTime, newTime))
+  _, oldTime = timeIt(loopSubmit, ga, children, 0, 1)
+  ga._submissionQueue.clear()
+  _, newTime = timeIt(ga._submitBatch, children, 0, 1)
+  timings.append(('submission', oldTime, newTime))
+  old, oldTime = timeIt(loopAHD, population, children)
+  new, newTime = timeIt(ga._ahd, population, children)
+  assert np.isclose(old, new)
+  timings.append(('AHD', oldTime, newTime))
+  old, oldTime = timeIt(loopAHD, population, children, 3)
+  new, newTime = timeIt(ga._ahdp, population, children, 3)
+  assert np.isclose(old, new)
+  timings.append(('AHDp', oldTime, newTime))
+  print('population {}, genes {}'.format(populationSize, numGenes))
+  for name, oldTime, newTime in timings:
+    print('{:18s} loops {:9.4f} s, arrays {:9.4f} s'.format(name, oldTime, newTime))
+  print('{:18s} loops {:9.4f} s, arrays {:9.4f} s'.format('per generation', sum(t[1] for t in timings), sum(t[2] for t in timings)))
@@ -0,0 +1,86 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the HDF5 database layouts.
+  Scalar realizations (as produced by Monte Carlo sampling) are stored in a database with a group
+  per realization ("groups") and in one with a dataset per variable ("columnar", in batches),
+  then read back. For each layout, the time spent writing and reading and the file size are reported.
+    python hdf5Layout.py [numRealizations] [batchSize]
+"""
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+from utils import utils
+utils.find_crow(frameworkDir)
+
+import h5py_interface_creator
+
+def createRealizations(numRealizations):
+  """
+    Creates scalar realizations
+    @ In, numRealizations, int, the number of realizations
+    @ Out, rlzs, list, the realizations
+  """
+  rlzs = []
+  for i in range(numRealizations):
+    rlz = dict(('x{}'.format(v), np.array([np.random.rand()])) for v in range(8))
+    rlz['prefix'] = np.array([str(i)])
+    rlz['ProbabilityWeight'] = np.array([1.0])
+    rlzs.append(rlz)
+  return rlzs
+
+def measure(dbClass, directory, rlzs, batchSize):
+  """
+    Writes the realizations in a new database, then reads them back
+    @ In, dbClass, type, the database class
+    @ In, directory, str, the directory of the database file
+    @ In, rlzs, list, the realizations
+    @ In, batchSize, int, the number of realizations added at once
+    @ Out, results, dict, the times (s) and the file size (MB)
+  """
+  results = {}
+  filename = dbClass.__name__ + '.h5'
+  db = dbClass('benchmark', directory, filename, False)
+  start = time.perf_counter()
+  for i in range(0, len(rlzs), batchSize):
+    db.addGroups(rlzs[i:i+batchSize])
+  results['write'] = time.perf_counter() - start
+  db.closeDatabaseW()
+  db = dbClass('benchmark', directory, filename, True)
+  start = time.perf_counter()
+  if dbClass is h5py_interface_creator.hdf5ColumnarDatabase:
+    db.getColumns()
+  else:
+    for name in db.retrieveAllHistoryNames():
+      db._getRealizationByName(name, {'reconstruct': False})
+  results['read'] = time.perf_counter() - start
+  db.closeDatabaseW()
+  results['sizeMB'] = os.path.getsize(os.path.join(directory, filename))/1e6
+  return results
+
+if __name__ == '__main__':
+  numRealizations = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+  batchSize = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+  rlzs = createRealizations(numRealizations)
+  with tempfile.TemporaryDirectory() as directory:
+    for name, dbClass in [('groups', h5py_interface_creator.hdf5Database),
+                          ('columnar', h5py_interface_creator.hdf5ColumnarDatabase)]:
+      results = measure(dbClass, directory, rlzs, batchSize)
+      print('{:8s} {} realizations: write {:8.3f} s | read {:8.3f} s | file {:7.1f} MB'
+            .format(name, numRealizations, results['write'], results['read'], results['sizeMB']))
@@ -0,0 +1,106 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the per-job overhead of the JobHandler.
+  A large number of (almost) empty jobs are submitted and collected the same
+  way a MultiRun step does ("collect, submit, wait" loop), measuring the wall
+  time and the CPU time spent per job, plus the CPU used while the JobHandler
+  is idle. Run it against different revisions to compare implementations:
+    python jobHandlerOverhead.py [numJobs] [batchSize]
+"""
+import os
+import sys
+import time
+import threading
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+from utils import utils
+utils.find_crow(frameworkDir)
+utils.add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+
+from Decorators.Parallelization import Parallel
+from JobHandler import JobHandler
+
+@Parallel()
+def emptyJob(value):
+  """
+    Job with negligible cost
+    @ In, value, int, a value
+    @ Out, value, int, the same value
+  """
+  return value
+
+def createJobHandler(batchSize):
+  """
+    Creates and starts a JobHandler using multi-threading
+    @ In, batchSize, int, number of parallel slots
+    @ Out, (jobHandler, thread), tuple, the JobHandler and its polling thread
+  """
+  jobHandler = JobHandler()
+  jobHandler.applyRunInfo({'maxQueueSize': None, 'batchSize': batchSize, 'internalParallel': False})
+  jobHandler.initialize()
+  thread = threading.Thread(target=jobHandler.startLoop)
+  thread.daemon = True
+  thread.start()
+  return jobHandler, thread
+
+def waitStep(jobHandler):
+  """
+    Waits for a job event the way a step does (using waitForEvent if available)
+    @ In, jobHandler, JobHandler, the JobHandler
+    @ Out, None
+  """
+  if hasattr(jobHandler, 'waitForEvent'):
+    jobHandler.waitForEvent()
+  else:
+    time.sleep(0.005)
+
+def runJobs(numJobs, batchSize):
+  """
+    Submits and collects numJobs empty jobs
+    @ In, numJobs, int, number of jobs to run
+    @ In, batchSize, int, number of parallel slots
+    @ Out, (wall, cpu, idleCpu), tuple(float), total wall and CPU times, and the CPU time over 1 s of idle
+  """
+  jobHandler, thread = createJobHandler(batchSize)
+  submitted = 0
+  collected = 0
+  startWall = time.perf_counter()
+  startCpu = time.process_time()
+  while collected < numJobs:
+    collected += len(jobHandler.getFinished())
+    for _ in range(min(jobHandler.availability(), numJobs - submitted)):
+      jobHandler.addJob((submitted, ), emptyJob, 'job_{}'.format(submitted))
+      submitted += 1
+    if collected < numJobs:
+      waitStep(jobHandler)
+  wall = time.perf_counter() - startWall
+  cpu = time.process_time() - startCpu
+  # measure CPU usage of an idle JobHandler
+  startCpu = time.process_time()
+  time.sleep(1.0)
+  idleCpu = time.process_time() - startCpu
+  jobHandler.shutdown()
+  thread.join()
+  return wall, cpu, idleCpu
+
+if __name__ == '__main__':
+  numJobs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+  batchSize = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+  wall, cpu, idleCpu = runJobs(numJobs, batchSize)
+  print('jobs: {}, batchSize: {}'.format(numJobs, batchSize))
+  print('per-job wall overhead: {:10.3e} s'.format(wall/numJobs))
+  print('per-job CPU overhead : {:10.3e} s'.format(cpu/numJobs))
+  print('idle CPU usage       : {:6.2f} %'.format(100.*idleCpu))
@@ -0,0 +1,136 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the startup time of RAVEN.
+  Driver.py is run several times on a minimal input (a single sample of a trivial
+  external model), measuring the wall time of the whole run and the time spent
+  importing the framework modules (as reported by "python -X importtime").
+  Run it against different revisions to compare implementations:
+    python startupTime.py [numRepeats]
+"""
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'framework'))
+driver = os.path.join(frameworkDir, 'Driver.py')
+
+minimalInput = """<?xml version="1.0" ?>
+<Simulation verbosity="silent">
+  <RunInfo>
+    <WorkingDir>.</WorkingDir>
+    <Sequence>sample</Sequence>
+  </RunInfo>
+  <Steps>
+    <MultiRun name="sample">
+      <Input class="DataObjects" type="PointSet">samples</Input>
+      <Model class="Models" type="ExternalModel">model</Model>
+      <Sampler class="Samplers" type="MonteCarlo">mc</Sampler>
+      <Output class="DataObjects" type="PointSet">samples</Output>
+    </MultiRun>
+  </Steps>
+  <Models>
+    <ExternalModel ModuleToLoad="model" name="model" subType="">
+      <variables>x,y</variables>
+    </ExternalModel>
+  </Models>
+  <Distributions>
+    <Uniform name="dist">
+      <lowerBound>0</lowerBound>
+      <upperBound>1</upperBound>
+    </Uniform>
+  </Distributions>
+  <Samplers>
+    <MonteCarlo name="mc">
+      <samplerInit>
+        <limit>1</limit>
+      </samplerInit>
+      <variable name="x">
+        <distribution>dist</distribution>
+      </variable>
+    </MonteCarlo>
+  </Samplers>
+  <DataObjects>
+    <PointSet name="samples">
+      <Input>x</Input>
+      <Output>y</Output>
+    </PointSet>
+  </DataObjects>
+</Simulation>
+"""
+
+minimalModel = """
+def run(self, Input):
+  self.y = 2.0 * self.x
+"""
+
+def writeCase(directory):
+  """
+    Writes the minimal input and its external model
+    @ In, directory, str, the directory where the files are written
+    @ Out, inputFile, str, the path of the input file
+  """
+  inputFile = os.path.join(directory, 'minimal.xml')
+  with open(inputFile, 'w') as out:
+    out.write(minimalInput)
+  with open(os.path.join(directory, 'model.py'), 'w') as out:
+    out.write(minimalModel)
+  return inputFile
+
+def importTime(stderr):
+  """
+    Sums the cumulative import times of the top level modules reported by "python -X importtime"
+    @ In, stderr, str, the standard error of the run
+    @ Out, total, float, the import time in seconds
+  """
+  total = 0.0
+  for line in stderr.splitlines():
+    if not line.startswith('import time:') or '|' not in line:
+      continue
+    fields = line[len('import time:'):].split('|')
+    # top level imports have the smallest indentation (separator plus two spaces)
+    if fields[2].startswith('   ') and not fields[2].startswith('    '):
+      try:
+        total += int(fields[1]) * 1e-6
+      except ValueError:
+        pass # header
+  return total
+
+def runDriver(inputFile):
+  """
+    Runs RAVEN on the input, measuring the wall and import times
+    @ In, inputFile, str, the input file
+    @ Out, (wall, imports), tuple(float), the wall time of the run and the time spent importing modules
+  """
+  start = time.perf_counter()
+  run = subprocess.run([sys.executable, '-X', 'importtime', driver, inputFile],
+                       cwd=os.path.dirname(inputFile), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                       universal_newlines=True)
+  wall = time.perf_counter() - start
+  if run.returncode != 0:
+    raise RuntimeError('RAVEN failed on the minimal input:\n' + run.stdout + run.stderr)
+  return wall, importTime(run.stderr)
+
+if __name__ == '__main__':
+  numRepeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+  with tempfile.TemporaryDirectory() as directory:
+    inputFile = writeCase(directory)
+    results = [runDriver(inputFile) for _ in range(numRepeats)]
+  walls = sorted(r[0] for r in results)
+  imports = sorted(r[1] for r in results)
+  print('runs: {}'.format(numRepeats))
+  print('wall time   (min / median): {:8.3f} / {:8.3f} s'.format(walls[0], walls[len(walls)//2]))
+  print('import time (min / median): {:8.3f} / {:8.3f} s'.format(imports[0], imports[len(imports)//2]))
@@ -0,0 +1,83 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the Fourier and ARMA time series analysis algorithms.
+  Several targets sharing the Fourier bases are characterized, then synthetic histories are
+  generated one at a time and all at once. The time spent by each operation is reported.
+  Run it against different revisions to compare implementations:
+    python timeSeriesAnalysis.py [numTargets] [historyLength] [numSamples]
+"""
+import os
+import sys
+import time
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+from utils import utils
+utils.find_crow(frameworkDir)
+
+from utils import randomUtils
+import TSA
+
+def createSignals(numTargets, length):
+  """
+    Creates periodic signals with autocorrelated noise
+    @ In, numTargets, int, the number of signals
+    @ In, length, int, the length of the signals
+    @ Out, pivot, np.array, the pivot values
+    @ Out, signals, np.array, the signals shaped [length, numTargets]
+  """
+  rng = np.random.RandomState(42)
+  pivot = np.arange(length, dtype=float)
+  noise = rng.randn(length, numTargets)
+  signals = np.zeros((length, numTargets))
+  for t in range(1, length):
+    signals[t] = 0.7 * signals[t - 1] + noise[t]
+  for period in [24.0, 168.0, 8760.0]:
+    signals += rng.rand(numTargets) * np.sin(2.0 * np.pi * pivot[:, np.newaxis] / period + rng.rand(numTargets))
+  return pivot, signals
+
+def timed(label, function, *args):
+  """
+    Calls a function and reports the time it took
+    @ In, label, str, description of the operation
+    @ In, function, callable, the operation
+    @ In, args, list, the arguments of the operation
+    @ Out, result, object, what the function returns
+  """
+  start = time.perf_counter()
+  result = function(*args)
+  print('{:40s}: {:8.3f} s'.format(label, time.perf_counter() - start))
+  return result
+
+if __name__ == '__main__':
+  numTargets = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+  length = int(sys.argv[2]) if len(sys.argv) > 2 else 8760
+  numSamples = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+  pivot, signals = createSignals(numTargets, length)
+  targets = ['signal{}'.format(t) for t in range(numTargets)]
+  fourier = TSA.Fourier()
+  fourierSettings = {'periods': [24.0, 168.0, 8760.0], 'target': targets, 'seed': None}
+  fourierParams = timed('Fourier characterize', fourier.characterize, signals, pivot, targets, fourierSettings)
+  residual = fourier.getResidual(signals, fourierParams, pivot, fourierSettings)
+  arma = TSA.ARMA()
+  armaSettings = arma.setDefaults({'P': 2, 'Q': 1, 'seed': 42, 'target': targets})
+  armaParams = timed('ARMA characterize', arma.characterize, residual, pivot, targets, armaSettings)
+  randomUtils.randomSeed(42)
+  timed('ARMA generate, {} samples'.format(numSamples),
+        lambda: [arma.generate(armaParams, pivot, armaSettings) for _ in range(numSamples)])
+  if hasattr(arma, 'generateSamples'):
+    randomUtils.randomSeed(42)
+    timed('ARMA generateSamples, {} samples'.format(numSamples), arma.generateSamples, armaParams, pivot, armaSettings, numSamples)
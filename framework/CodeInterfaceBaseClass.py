@@ -205,6 +205,16 @@ class CodeInterfaceBase(utils.metaclass_insert(abc.ABCMeta,object)):
     """
     self.addInputExtension(['i','inp','in'])
 
+  def canLinkInputFile(self, inputFile):
+    """
+      This method tells if an input file is never modified, neither by the code interface nor by the driven code,
+      so that it can be linked in the run directories instead of being copied for every run.
+      This method should be overwritten by the code interfaces that can take advantage of it.
+      @ In, inputFile, File, the input file
+      @ Out, canLink, bool, True if the file can be linked
+    """
+    return False
+
   def initialize(self, runInfo, oriInputFiles):
     """
       Method to initialize the run of a new step
@@ -21,6 +21,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 import os
 import copy
 import GenericParser
+from utils import utils
 from CodeInterfaceBaseClass import CodeInterfaceBase
 
 class GenericCode(CodeInterfaceBase):
@@ -44,6 +45,8 @@ class GenericCode(CodeInterfaceBase):
     self.execPostfix      = ''       # executioner command postfix (e.g. -zcvf)
     self.caseName         = None     # base label for outgoing files, should default to inputFileName
     self.fixedOutFileName = None     # CSV output filename of the run code (in case it is hardcoded in the driven code)
+    self.linkFiles        = False    # True if the input files not edited by RAVEN can be linked instead of copied
+    self.cacheTemplates   = True     # True if the templates are parsed once from the original input files (False if the current ones are edited before)
 
   def _readMoreXML(self,xmlNode):
     """
@@ -59,6 +62,8 @@ class GenericCode(CodeInterfaceBase):
         raise IOError('user defined output extension "'+userExt+'" is not a "csv"!')
       else:
         self.fixedOutFileName = '.'.join(self.fixedOutFileName.split(".")[:-1])
+    linkFiles = xmlNode.find("linkFiles")
+    self.linkFiles = utils.stringIsTrue(linkFiles.text) if linkFiles is not None else False
 
   def addDefaultExtension(self):
     """
@@ -68,6 +73,15 @@ class GenericCode(CodeInterfaceBase):
     """
     pass
 
+  def canLinkInputFile(self,inputFile):
+    """
+      See base class. The files whose extension is not listed in the input extensions are never edited by this interface,
+      thus they can be linked if requested by the user.
+      @ In, inputFile, File, the input file
+      @ Out, canLink, bool, True if the file can be linked
+    """
+    return self.linkFiles and inputFile.getExt() not in self.getInputExtension()
+
   def generateCommand(self,inputFiles,executable,clargs=None, fargs=None, preExec=None):
     """
       See base class.  Collects all the clargs and the executable to produce the command-line call.
@@ -178,7 +192,11 @@ class GenericCode(CodeInterfaceBase):
     for index,inputFile in enumerate(origInputFiles):
       if inputFile.getExt() in self.getInputExtension():
         origfiles.append(inputFile)
-    parser = GenericParser.GenericParser(infiles)
+    if self.cacheTemplates:
+      # the original files are parsed only once per step, then the compiled templates are reused
+      parser = GenericParser.GenericParser(origfiles, cache=True)
+    else:
+      parser = GenericParser.GenericParser(infiles)
     parser.modifyInternalDictionary(**Kwargs)
     parser.writeNewInput(infiles,origfiles)
     return currentInputFiles
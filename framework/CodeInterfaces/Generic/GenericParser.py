@@ -38,11 +38,72 @@ def _reprIfFloat(value):
   else:
     return str(value)
 
+# compiled templates shared by all the parsers, {(absFile, prefix, postfix, defaultDelim, formatDelim): (stamp, template)}
+_templateCache = {}
+
+def _compileTemplate(lines, prefix, postfix, defaultDelim, formatDelim, acceptFormats):
+  """
+    Splits the lines of an input file at the wildcards, producing the literal segments and the slots to fill
+    @ In, lines, list, the lines of the input file
+    @ In, prefix, string, the string prefix to find input variables within the input file
+    @ In, postfix, string, the string postfix signifying the end of an input variable within the input file
+    @ In, defaultDelim, string, the string used between prefix and postfix to set default values
+    @ In, formatDelim, string, the string used between prefix and postfix to set the format of the value
+    @ In, acceptFormats, dict, the accepted format characters, {character: type}
+    @ Out, template, tuple, (segments, slots), segments is the tuple of strings composing the file (the slots hold the variable name)
+      and slots is the tuple of (place, var, default, format) with default and format None if not given
+  """
+  segments = []
+  slots = []
+  seg = ''
+  for line in lines:
+    while prefix in line and postfix in line:
+      segments.append(seg)
+      start = line.find(prefix)
+      end = line.find(postfix,start+1)
+      var = line[start+len(prefix):end]
+      defval = None
+      varformat = None
+      if defaultDelim in var or formatDelim in var:
+        optionalPos = [None]*2
+        optionalPos[0], optionalPos[1] = var.find(defaultDelim), var.find(formatDelim)
+        if optionalPos[0] == -1:
+          optionalPos[0]  = sys.maxsize
+        if optionalPos[1] == -1:
+          optionalPos[1] = sys.maxsize
+        default   = var[optionalPos[0]+1:min(optionalPos[1],len(var))] if optionalPos[0] < optionalPos[1] else var[min(optionalPos[0]+1,len(var)):len(var)]
+        formatStr = var[min(optionalPos[1]+1,len(var)):len(var)] if optionalPos[0] < optionalPos[1] else var[optionalPos[1]+1:min(optionalPos[0],len(var))]
+        var = var[0:min(optionalPos)]
+        if optionalPos[0] != sys.maxsize:
+          defval = default
+        if optionalPos[1] != sys.maxsize:
+          # check if the format is valid
+          if not any(formVal in formatStr for formVal in acceptFormats.keys()):
+            try:
+              int(formatStr)
+            except ValueError:
+              raise ValueError("the format specified for wildcard "+ line[start+len(prefix):end] +
+                                                 " is unknown. Available are either a plain integer or the following "+" ".join(acceptFormats.keys()))
+            varformat = formatStr,int
+          else:
+            for formVal in acceptFormats.keys():
+              if formVal in formatStr:
+                varformat = formatStr,acceptFormats[formVal]; break
+      segments.append(line[:start])
+      segments.append(var)
+      slots.append((len(segments)-1, var, defval, varformat))
+      line=line[end+1:]
+      seg = ''
+    else:
+      seg+=line
+  segments.append(seg)
+  return tuple(segments), tuple(slots)
+
 class GenericParser():
   """
     import the user-edited input file, build list of strings with replacable parts
   """
-  def __init__(self,inputFiles,prefix='$RAVEN-',postfix='$',defaultDelim=':', formatDelim='|'):
+  def __init__(self,inputFiles,prefix='$RAVEN-',postfix='$',defaultDelim=':', formatDelim='|', cache=False):
     """
       Accept the input file and parse it by the prefix-postfix breaks. Someday might be able to change prefix,postfix,defaultDelim from input file, but not yet.
       @ In, inputFiles, list, string list of input filenames that might need parsing.
@@ -50,6 +111,8 @@ class GenericParser():
       @ In, postfix, string, optional, the string postfix signifying hte end of an input variable within an input file
       @ In, defaultDelim, string, optional, the string used between prefix and postfix to set default values
       @ In, formatDelim, string, optional, the string used between prefix and postfix to set the format of the value
+      @ In, cache, bool, optional, if True the parsed files are stored and reused while they are not modified
+        (to be used with the original input files, which are parsed again for every sample otherwise)
       @ Out, None
     """
     self.inputFiles = inputFiles
@@ -63,67 +126,62 @@ class GenericParser():
     self.printTag = 'GENERIC_PARSER'
     for inputFile in self.inputFiles:
       infileName = inputFile.getFilename()#os.path.basename(inputFile)
-      self.segments[infileName] = []
       if not os.path.exists(inputFile.getAbsFile()):
         ## Make sure to cast the inputFile to a string as it may be File object.
         raise IOError('Input file not found: ' + str(inputFile))
-      seg = ''
-      lines = inputFile.readlines()
-      inputFile.close()
-      for line in lines:
-        while self.prefixKey in line and self.postfixKey in line:
-          self.segments[infileName].append(seg)
-          start = line.find(self.prefixKey)
-          end = line.find(self.postfixKey,start+1)
-          var = line[start+len(self.prefixKey):end]
-          if defaultDelim in var or formatDelim in var:
-            optionalPos = [None]*2
-            optionalPos[0], optionalPos[1] = var.find(defaultDelim), var.find(formatDelim)
-            if optionalPos[0] == -1:
-              optionalPos[0]  = sys.maxsize
-            if optionalPos[1] == -1:
-              optionalPos[1] = sys.maxsize
-            defval    = var[optionalPos[0]+1:min(optionalPos[1],len(var))] if optionalPos[0] < optionalPos[1] else var[min(optionalPos[0]+1,len(var)):len(var)]
-            varformat = var[min(optionalPos[1]+1,len(var)):len(var)] if optionalPos[0] < optionalPos[1] else var[optionalPos[1]+1:min(optionalPos[0],len(var))]
-            var = var[0:min(optionalPos)]
-            if var in self.defaults.keys() and optionalPos[0] != sys.maxsize:
-              print('multiple default values given for variable',var)
-            if var in self.formats.keys() and optionalPos[1] != sys.maxsize:
-              print('multiple format values given for variable',var)
-            #TODO allow the user to specify take-last or take-first?
-            if var not in self.defaults.keys() and optionalPos[0] != sys.maxsize:
-              self.defaults[var] = {}
-            if var not in self.formats.keys()  and optionalPos[1] != sys.maxsize:
-              self.formats[var ] = {}
-            if optionalPos[0] != sys.maxsize:
-              self.defaults[var][infileName]=defval
-            if optionalPos[1] != sys.maxsize:
-              # check if the format is valid
-              if not any(formVal in varformat for formVal in self.acceptFormats.keys()):
-                try:
-                  int(varformat)
-                except ValueError:
-                  raise ValueError("the format specified for wildcard "+ line[start+len(self.prefixKey):end] +
-                                                     " is unknown. Available are either a plain integer or the following "+" ".join(self.acceptFormats.keys()))
-                self.formats[var][infileName ]=varformat,int
-              else:
-                for formVal in self.acceptFormats.keys():
-                  if formVal in varformat:
-                    self.formats[var][infileName ]=varformat,self.acceptFormats[formVal]; break
-          self.segments[infileName].append(line[:start])
-          self.segments[infileName].append(var)
-          if var not in self.varPlaces.keys():
-            self.varPlaces[var] = {infileName:[len(self.segments[infileName])-1]}
-          elif infileName not in self.varPlaces[var].keys():
-            self.varPlaces[var][infileName]=[len(self.segments[infileName])-1]
-          else:
-            self.varPlaces[var][infileName].append(len(self.segments[infileName])-1)
-          #self.segments.append(line[end+1:])
-          line=line[end+1:]
-          seg = ''
-        else:
-          seg+=line
-      self.segments[infileName].append(seg)
+      segments, slots = self._getTemplate(inputFile, defaultDelim, formatDelim, cache)
+      self.segments[infileName] = list(segments)
+      for place, var, defval, varformat in slots:
+        if var in self.defaults.keys() and defval is not None:
+          print('multiple default values given for variable',var)
+        if var in self.formats.keys() and varformat is not None:
+          print('multiple format values given for variable',var)
+        #TODO allow the user to specify take-last or take-first?
+        if defval is not None:
+          self.defaults.setdefault(var, {})[infileName] = defval
+        if varformat is not None:
+          self.formats.setdefault(var, {})[infileName] = varformat
+        self.varPlaces.setdefault(var, {}).setdefault(infileName, []).append(place)
+
+  def _getTemplate(self, inputFile, defaultDelim, formatDelim, cache):
+    """
+      Retrieves the compiled template of an input file, parsing the file only if not already cached
+      @ In, inputFile, File, the input file
+      @ In, defaultDelim, string, the string used between prefix and postfix to set default values
+      @ In, formatDelim, string, the string used between prefix and postfix to set the format of the value
+      @ In, cache, bool, if True the compiled template is looked up in (and stored into) the cache
+      @ Out, template, tuple, (segments, slots), see _compileTemplate
+    """
+    if cache:
+      key = (inputFile.getAbsFile(), self.prefixKey, self.postfixKey, defaultDelim, formatDelim)
+      info = os.stat(key[0])
+      stamp = (info.st_mtime_ns, info.st_size)
+      cached = _templateCache.get(key)
+      if cached is not None and cached[0] == stamp:
+        return cached[1]
+    lines = inputFile.readlines()
+    inputFile.close()
+    template = _compileTemplate(lines, self.prefixKey, self.postfixKey, defaultDelim, formatDelim, self.acceptFormats)
+    if cache:
+      _templateCache[key] = (stamp, template)
+    return template
+
+  def _formatValue(self, var, inputFile, value):
+    """
+      Converts the value of a variable into the text to write in an input file, applying the format if any
+      @ In, var, string, the variable name
+      @ In, inputFile, string, the name of the input file
+      @ In, value, object, the value to write
+      @ Out, text, string, the text to write (None if the variable has a format in other files only)
+    """
+    if var not in self.formats:
+      return _reprIfFloat(value)
+    if inputFile not in self.formats[var]:
+      return None
+    varformat, formatType = self.formats[var][inputFile]
+    if any(formVal in varformat for formVal in self.acceptFormats.keys()):
+      return ("{:"+varformat.strip()+"}").format(formatType(value))
+    return _reprIfFloat(value).strip().rjust(formatType(varformat))
 
   def modifyInternalDictionary(self,**Kwargs):
     """
@@ -143,33 +201,22 @@ class GenericParser():
           ioVars.append(v)
       else:
         ioVars.append(value)
-    for var in self.varPlaces.keys():
-      for inputFile in self.segments.keys():
-        for place in self.varPlaces[var][inputFile] if inputFile in self.varPlaces[var].keys() else []:
-          if var in modDict.keys():
-            if var in self.formats.keys():
-              if inputFile in self.formats[var].keys():
-                if any(formVal in self.formats[var][inputFile][0] for formVal in self.acceptFormats.keys()):
-                  formatstringc = "{:"+self.formats[var][inputFile][0].strip()+"}"
-                  self.segments[inputFile][place] = formatstringc.format(self.formats[var][inputFile][1](modDict[var]))
-                else:
-                  self.segments[inputFile][place] = _reprIfFloat(modDict[var]).strip().rjust(self.formats[var][inputFile][1](self.formats[var][inputFile][0]))
-            else:
-              self.segments[inputFile][place] = _reprIfFloat(modDict[var])
-          elif var in self.defaults.keys():
-            if var in self.formats.keys():
-              if inputFile in self.formats[var].keys():
-                if any(formVal in self.formats[var][inputFile][0] for formVal in self.acceptFormats.keys()):
-                  formatstringc = "{:"+self.formats[var][inputFile][0].strip()+"}"
-                  self.segments[inputFile][place] = formatstringc.format(self.formats[var][inputFile][1](self.defaults[var][inputFile]))
-                else:
-                  self.segments[inputFile][place] = _reprIfFloat(self.defaults[var][inputFile]).strip().rjust(self.formats[var][inputFile][1](self.formats[var][inputFile][0]))
-            else:
-              self.segments[inputFile][place] = self.defaults[var][inputFile]
-          elif var in ioVars:
-            continue #this gets handled in writeNewInput
-          else:
-            raise IOError('Generic Parser: Variable '+var+' was not sampled and no default given!')
+    for var, filePlaces in self.varPlaces.items():
+      if var in modDict:
+        values = dict.fromkeys(filePlaces, modDict[var])
+      elif var in self.defaults:
+        values = dict((inputFile, self.defaults[var][inputFile]) for inputFile in filePlaces)
+      elif var in ioVars:
+        continue #this gets handled in writeNewInput
+      else:
+        raise IOError('Generic Parser: Variable '+var+' was not sampled and no default given!')
+      for inputFile, places in filePlaces.items():
+        text = self._formatValue(var, inputFile, values[inputFile])
+        if text is None:
+          continue
+        segments = self.segments[inputFile]
+        for place in places:
+          segments[place] = text
 
   def writeNewInput(self,inFiles,origFiles):
     """
@@ -197,22 +244,26 @@ class GenericParser():
         raise IOError('No InputFile with extension '+ext+' found!')
       return index,inputFile
 
-    for var in self.varPlaces.keys():
-      for inputFile in self.segments.keys():
-        for place in self.varPlaces[var][inputFile] if inputFile in self.varPlaces[var].keys() else []:
-          for iotype,adlvar in self.adlDict.items():
-            if iotype=='output':
-              if var==self.adlDict[iotype]:
-                self.segments[inputFile][place] = case
-                break
-            elif iotype=='input':
-              if var in self.adlDict[iotype].keys():
-                self.segments[inputFile][place] = getFileWithExtension(inFiles,self.adlDict[iotype][var][0].strip('.'))[1].getAbsFile()
-                break
+    for var, filePlaces in self.varPlaces.items():
+      text = None
+      for iotype,adlvar in self.adlDict.items():
+        if iotype=='output':
+          if var==self.adlDict[iotype]:
+            text = case
+            break
+        elif iotype=='input':
+          if var in self.adlDict[iotype].keys():
+            text = getFileWithExtension(inFiles,self.adlDict[iotype][var][0].strip('.'))[1].getAbsFile()
+            break
+      if text is None:
+        continue
+      for inputFile, places in filePlaces.items():
+        for place in places:
+          self.segments[inputFile][place] = text
     #now just write the files.
     for f,inFile in enumerate(origFiles):
       outfile = inFiles[f]
       #if os.path.isfile(outfile.getAbsFile()): os.remove(outfile.getAbsFile())
       outfile.open('w')
-      outfile.writelines(''.join(self.segments[inFile.getFilename()]))
+      outfile.write(''.join(self.segments[inFile.getFilename()]))
       outfile.close()
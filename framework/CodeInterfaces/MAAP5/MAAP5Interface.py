@@ -48,6 +48,7 @@ class MAAP5(GenericCode):
     self.printInterval = ''  #value of the print interval
     self.boolOutputVariables=[] #list of MAAP5 boolean variables of interest
     self.contOutputVariables=[] #list of MAAP5 continuous variables of interest
+    self.cacheTemplates = False #the current input files are edited before being parsed (DET restarts)
 ###########
     self.multiBranchOccurred=[]
 ###########
@@ -311,6 +311,17 @@ class DataObject(utils.metaclass_insert(abc.ABCMeta, BaseEntity)):
     """
     pass
 
+  def addRealizations(self,rlzs,transferOwnership=False):
+    """
+      Adds many "rows" (or "samples") to this data object at once.
+      By default, the realizations are added one at a time; data objects may collect them more efficiently.
+      @ In, rlzs, list, list of realizations, each in the addRealization format
+      @ In, transferOwnership, bool, optional, if True the caller will not use or modify "rlzs" anymore
+      @ Out, None
+    """
+    for rlz in rlzs:
+      self.addRealization(rlz)
+
   @abc.abstractmethod
   def addVariable(self,varName,values,classify='meta'):
     """
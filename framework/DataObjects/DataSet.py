@@ -34,7 +34,7 @@ except ValueError:
   from DataObject import DataObject
 
 import CsvLoader
-from utils import utils, cached_ndarray, xmlUtils, mathUtils
+from utils import utils, cached_ndarray, xmlUtils, mathUtils, realizationIndex
 
 #
 #
@@ -64,7 +64,6 @@ class DataSet(DataObject):
     self.type             = 'DataSet'
     self.types            = None             # list of type objects, for each realization entry
     self.printTag         = self.name
-    self.defaultDtype     = object
     self._scaleFactors    = {}               # mean, sigma for data for matching purposes
     self._alignedIndexes  = {}               # dict {index:values} of indexes with aligned coordinates (so they are not in the collector, but here instead)
     self._neededForReload = [self.sampleTag] # metavariables required to reload this data object.
@@ -162,7 +161,7 @@ class DataSet(DataObject):
       ## TODO check structure?
       self._meta[tag] = node
 
-  def addRealization(self, rlz):
+  def addRealization(self, rlz, transferOwnership=False):
     """
       Adds a "row" (or "sample") to this data object.
       This is the method to add data to this data object.
@@ -171,6 +170,8 @@ class DataSet(DataObject):
       @ In, rlz, dict, {var:val} format where
                          "var" is the variable name as a string,
                          "val" is a np.ndarray of values.
+      @ In, transferOwnership, bool, optional, if True the caller hands "rlz" over to this data object
+        and will not use or modify it anymore, so the protective copy of it is skipped.
       @ Out, None
     """
     #########
@@ -198,7 +199,8 @@ class DataSet(DataObject):
     #  Yours truly, talbpw, May 2019
     #########
     # protect against back-changing realization
-    rlz = copy.deepcopy(rlz)
+    if not transferOwnership:
+      rlz = copy.deepcopy(rlz)
     # if index map was included, remove that now before checking variables
     indexMap = rlz.pop('_indexMap', None)
     if indexMap is not None:
@@ -222,30 +224,15 @@ class DataSet(DataObject):
 
     ## check alignment of indexes
     self._checkAlignedIndexes(rlz)
-    #  NB If no scalar entry is made, this construction fails.  In that case,
-    #  instead of treating each dataarrray as an object, numpy.asarray calls their asarray methods,
-    #  unfolding them and making a full numpy array with more dimensions, instead of effectively
-    #  a list of realizations, where each realization is effectively a list of xr.DataArray objects.
-    #
-    #  To mitigate this behavior, we forcibly add a [0.0] entry to each realization, then exclude
-    #  it once the realizations are constructed.  This seems like an innefficient option; others
-    #  should be explored.  - talbpaul, 12/2017
-    # newData is a numpy array of realizations,
-    #   each of which is a numpy array of some combination of scalar values and/or xr.DataArrays.
-    #   This is because the cNDarray collector expects a LIST of realization, not a single realization.
-    #   Maybe the "append" method should be renamed to "extend" or changed to append one at a time.
-    ## set realizations as a list of realizations (which are ordered lists)
-    newData = np.array(list(rlz[var] for var in self._orderedVars)+[0.0], dtype=object)
-    newData = newData[:-1]
     # if data storage isn't set up, set it up
     if self._collector is None:
       self._collector = self._newCollector(width=len(rlz))
-    # append
-    self._collector.append(newData)
+    # append the values in the order of the collector columns
+    self._collector.append(list(rlz[var] for var in self._orderedVars))
 
     # if hierarchical, clear the parent as an ending
     self._clearParentEndingStatus(rlz)
-    # reset scaling factors, kd tree
+    # reset scaling factors
     self._resetScaling()
 
   def addVariable(self,varName,values,classify='meta',indices=None):
@@ -365,6 +352,25 @@ class DataSet(DataObject):
     obj.rename(name)
     return obj
 
+  def emptyClone(self):
+    """
+      Creates an empty data object with the same variables and structure of this one.
+      Unlike a deepcopy, the entities this object refers to (e.g. the message handler) are shared, so
+      this is cheap enough to be used for temporary containers (e.g. one per sample).
+      @ In, None
+      @ Out, clone, DataSet, the empty data object
+    """
+    clone = copy.copy(self)
+    # the variable lists can be extended while collecting (e.g. expected meta), so they must not be shared
+    for attr, value in self.__dict__.items():
+      if isinstance(value, list):
+        setattr(clone, attr, list(value))
+      elif isinstance(value, dict):
+        setattr(clone, attr, dict((key, list(val) if isinstance(val, list) else val) for key, val in value.items()))
+    clone.reset()
+    clone.types = None
+    return clone
+
   def getDimensions(self,var=None):
     """
       Provides the independent dimensions that this variable depends on.
@@ -501,8 +507,9 @@ class DataSet(DataObject):
     # TODO dask
     else:
       self.raiseAnError(NotImplementedError,'Unrecognized read style: "{}"'.format(style))
-    # after loading, set or reset scaling factors
+    # after loading, set or reset scaling factors and realization index
     self._setScalingFactors()
+    self._inputKDTree = None
 
   # @profile
   def realization(self, index=None, matchDict=None, noMatchDict=None, tol=1e-15, unpackXArray=False, asDataSet = False, first = True):
@@ -530,7 +537,6 @@ class DataSet(DataObject):
                                      if asDataSet: xarray.Dataset, all matching realizations as xarray.Dataset OR None if not found
                                      else        : list, list of matching realizatiions as [{var:value1}, {var:value2}, ...]
     """
-    # TODO convert input space to KD tree for faster searching -> XArray.DataArray has this built in?
     ## first, check that some direction was given, either an index or a match to find
     if (index is None and (matchDict is None and noMatchDict is None)) or (index is not None and (matchDict is not None or noMatchDict is not None)):
       self.raiseAnError(TypeError,'Either "index" OR ("matchDict" and/or "noMatchDict") (not both) must be specified to use "realization!"')
@@ -637,8 +643,8 @@ class DataSet(DataObject):
 
     if self._scaleFactors is not None:
       self._scaleFactors.pop(variable,None)
-    #either way reset kdtree
-    self.inputKDTree = None
+    #either way reset realization index
+    self._inputKDTree = None
 
   def renameVariable(self,old,new):
     """
@@ -674,6 +680,7 @@ class DataSet(DataObject):
       self._scaleFactors[new] = self._scaleFactors.pop(old)
     if self._data is not None:
       self._data = self._data.rename({old:new})
+    self._inputKDTree = None
 
   def reset(self):
     """
@@ -687,6 +694,7 @@ class DataSet(DataObject):
     self._meta = {}
     self._alignedIndexes = {}
     self._scaleFactors = {}
+    self._inputKDTree = None
 
   def setData(self, data, meta):
     """
@@ -699,6 +707,7 @@ class DataSet(DataObject):
     self._collector = None
     self._data = data
     self._meta = meta
+    self._inputKDTree = None
     # if we have meta information, we can reconstruct the IO space for this DO
     if 'DataSet' in meta:
       self._setStructureFromMetaXML(meta['DataSet'])
@@ -823,6 +832,93 @@ class DataSet(DataObject):
     return list(self._pivotParams.keys())
 
   ### INTERNAL USE FUNCTIONS ###
+  def addRealizations(self, rlzs, transferOwnership=False):
+    """
+      Adds many "rows" (or "samples") to this data object at once.
+      If every variable of this data object is scalar for each realization (no indexes), the batch
+      is checked once and appended to the collector as a single block; otherwise the realizations
+      are added one at a time as in addRealization.
+      @ In, rlzs, list or dict, either a list of realizations in the addRealization format,
+        or a columnar dict {var:np.ndarray} where each array has one entry per realization
+      @ In, transferOwnership, bool, optional, if True the caller hands "rlzs" over to this data object
+        and will not use or modify them anymore, so the protective copies are skipped.
+      @ Out, None
+    """
+    if isinstance(rlzs, dict):
+      if self.indexes:
+        self.raiseAnError(TypeError, 'Columnar realizations can only be added to data objects without indexes, ' +
+                                     'but "{}" depends on "{}"!'.format(self.name, self.indexes))
+      columns = self._getColumnsFromColumnar(rlzs)
+    else:
+      rlzs = list(rlzs)
+      if not rlzs:
+        return
+      columns = None if self.indexes else self._getColumnsFromRealizations(rlzs)
+      if columns is None:
+        for rlz in rlzs:
+          self.addRealization(rlz, transferOwnership=transferOwnership)
+        return
+    numRlz = len(columns[self._orderedVars[0]])
+    if numRlz == 0:
+      return
+    ## establish types if not done yet
+    self._setDataTypes(dict((var, columns[var][0]) for var in self._orderedVars))
+    # if data storage isn't set up, set it up
+    if self._collector is None:
+      self._collector = self._newCollector(width=len(self._orderedVars), length=max(100, numRlz))
+    self._collector.extendColumns(list(columns[var] for var in self._orderedVars))
+    # reset scaling factors
+    self._resetScaling()
+    # if hierarchical, clear the parents as endings
+    if 'RAVEN_parentID' in self.getVars():
+      for r in range(numRlz):
+        self._clearParentEndingStatus({'RAVEN_parentID': columns['RAVEN_parentID'][r]})
+
+  def _getColumnsFromColumnar(self, data):
+    """
+      Checks a columnar batch of realizations and selects the variables of this data object.
+      @ In, data, dict, {var:np.ndarray} with one entry per realization for each variable
+      @ Out, columns, dict, {var:np.ndarray} one-dimensional array of values for each variable
+    """
+    columns = {}
+    try:
+      for var in self._orderedVars:
+        columns[var] = np.atleast_1d(data[var])
+    except KeyError as e:
+      self.raiseAWarning('Variables provided:', data.keys())
+      self.raiseAnError(KeyError, 'Provided realizations do not have all requisite values for object "{}": "{}"'.format(self.name, e.args[0]))
+    lengths = set(len(col) for col in columns.values())
+    if len(lengths) > 1 or any(col.ndim != 1 for col in columns.values()):
+      self.raiseAnError(IndexError, 'Columnar realizations for "{}" must be one-dimensional with the same length! '.format(self.name) +
+                                    'Got shapes: {}'.format(dict((var, col.shape) for var, col in columns.items())))
+    return columns
+
+  def _getColumnsFromRealizations(self, rlzs):
+    """
+      Converts a list of realizations into columns if every variable of this data object has a
+      single value in each realization.
+      @ In, rlzs, list, list of realizations (see addRealization)
+      @ Out, columns, dict, {var:np.ndarray} one entry per realization for each variable, or None if
+        the realizations cannot be collected as a block
+    """
+    columns = {}
+    for var in self._orderedVars:
+      try:
+        values = [rlz[var] for rlz in rlzs]
+      except KeyError:
+        # let the single-realization path report the problem
+        return None
+      if not all(isinstance(val, np.ndarray) for val in values):
+        return None
+      try:
+        column = np.concatenate(values)
+      except ValueError:
+        return None
+      if column.ndim != 1 or len(column) != len(rlzs):
+        return None
+      columns[var] = column
+    return columns
+
   def _addIndexMapToRlz(self, rlz):
     """
       Adds the special key _indexMap along with index mapping
@@ -857,9 +953,10 @@ class DataSet(DataObject):
       self._data[var].values[index] = value
     # if it's in the collector ...
     elif index < lenColl + lenData:
-      self._collector[index][self._orderedVars.index(var)] = value
+      self._collector[index, self._orderedVars.index(var)] = value
     else:
       self.raiseAnError(IndexError,'Requested value change for realization "{}", which is past the end of the data object!'.format(index))
+    self._inputKDTree = None
 
   def _checkAlignedIndexes(self,rlz,tol=1e-15):
     """
@@ -1086,7 +1183,7 @@ class DataSet(DataObject):
     # method = 'once' # see below, parallelization is possible but not implemented
     # first case: single entry per node: floats, strings, ints, etc
     if mathUtils.isSingleValued(data[i]):
-      data = np.array(data,dtype=dataType)
+      data = np.asarray(data,dtype=dataType)
       array = xr.DataArray(data,
                            dims=[self.sampleTag],
                            coords={self.sampleTag:labels},
@@ -1263,7 +1360,8 @@ class DataSet(DataObject):
     """
       Casts this dataobject as an xr.Dataset and returns a REFERENCE to the underlying data structure.
       Functionally, typically collects the data from self._collector and places it in self._data.
-      Efficiency note: this is the slowest part of typical data collection.
+      Scalars and aligned histories are handed over from the typed collector columns without copies;
+      other multidimensional entries are collapsed realization by realization.
       @ In, None
       @ Out, xarray.Dataset, all the data from this data object.
     """
@@ -1281,6 +1379,7 @@ class DataSet(DataObject):
           continue
         # gather the data type from first realization: if np.array, it's ND; otherwise singular
         dtype = self.types[v]
+        column = self._collector.getColumn(v)
         if isinstance(self._collector[0,v],np.ndarray):
           # for each index, determine if all aligned; make data arrays as required
           dims = self.getDimensions(var)[var]
@@ -1289,12 +1388,14 @@ class DataSet(DataObject):
           # loop over indexes (just one for now?) and create data
           ## SPECIAL CASE: if only histories/scalars, and histories are aligned, we can shortcut this
           if len(dims) == 1 and dims[0] in self._alignedIndexes:
-            # since aligned, grab the data into one large chunk and make a datarray with all rlzs
-              data = np.vstack(self._collector[:,v]).astype(dtype)
+            # since aligned, the collector usually has the data in one large chunk already; make a datarray with all rlzs
+              data = column if column.ndim > 1 else np.vstack(column)
+              data = data.astype(dtype, copy=False)
               coords = {dims[0]: self._alignedIndexes[dims[0]]}
               #coords[self.sampleTag] = np.arange(len(self._collector))
               arrays[var] = self.constructNDSample(data, dims=[self.sampleTag]+dims, coords=coords)
           else:
+            samples = np.empty(len(self._collector), dtype=object)
             for r in range(len(self._collector)):
               values = self._collector[r, v]
               dtype = self._getCompatibleType(values[0])
@@ -1305,22 +1406,22 @@ class DataSet(DataObject):
                 if val is None:
                   val = self._collector[r, self._orderedVars.index(idx)]
                 coords[idx] = val
-              self._collector[r][v] = self.constructNDSample(values, dims, coords, name=str(r))
+              samples[r] = self.constructNDSample(values, dims, coords, name=str(r))
             # then collapse these entries into a single datarray
-            arrays[var] = self._collapseNDtoDataArray(self._collector[:,v], var, dtype=dtype)
+            arrays[var] = self._collapseNDtoDataArray(samples, var, dtype=dtype)
         # if it's a dataarray, then that's old-style histories, no-can do right now
         elif isinstance(self._collector[0,v],xr.DataArray):
           self.raiseAnError(NotImplementedError,'History entries should be numpy arrays, not data arrays!')
         # if not ND, then it's a simple data array construction
         else:
           try:
-            varData = np.array(self._collector[:,v],dtype=dtype)
+            varData = np.asarray(column,dtype=dtype)
           except ValueError as e:
             # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
-            if dtype != float and pd.isnull(self._collector[:,v]).sum() != 0:
+            if dtype != float and pd.isnull(column).sum() != 0:
               self.raiseAWarning('NaN detected, but no safe casting NaN to "{}" so switching to "object" type. '.format(dtype) \
                   + ' This may cause problems with other entities in RAVEN.')
-              varData = self._collector[:,v][:]
+              varData = np.asarray(column,dtype=object)
               dtype = object
             # otherwise, let error be raised.
             else:
@@ -1503,19 +1604,9 @@ class DataSet(DataObject):
     # make a collector from scratch
     rows = len(utils.first(source.values()))
     cols = len(self._orderedVars)
-    # can this for-loop be done in a comprehension?  The dtype seems to be a bit of an issue.
-    data = np.zeros([rows,cols],dtype=object)
-    for v,var in enumerate(self._orderedVars):
-      if len(source[var].shape) > 1:
-        # we can't set all at once, because the user gave us an ND array instead of a np.array(dtype=object) of np.array.
-        #    if we try -> ValueError: "could not broadcast input array from shape (#rlz,#time) into shape (#rlz)
-        for i in range(len(data)):
-          data[i,v] = source[var][i]
-      else:
-        # we can set it at once, the fast way.
-        data[:,v] = source[var]
-    # set up collector as cached nd array of values -> TODO might be some wasteful copying here
-    self._collector = cached_ndarray.cNDarray(values=data,dtype=object)
+    # set up collector with the columns of values; ND arrays (#rlz,#time) are kept as one block per variable
+    self._collector = self._newCollector(width=cols, length=rows)
+    self._collector.extendColumns(list(np.asarray(source[var]) for var in self._orderedVars))
     # set datatypes for each variable
     rlz = self.realization(index=0)
     self._setDataTypes(rlz)
@@ -1586,6 +1677,71 @@ class DataSet(DataObject):
       _type = object
     return _type
 
+  def _getIndexableValues(self, var, start):
+    """
+      Provides the values of a scalar variable to the realization index.
+      @ In, var, str, name of the variable
+      @ In, start, int, index of the first realization (counting the data, then the collector)
+      @ Out, values, list, np.ndarray of the values from the data and from the collector, starting at "start"
+    """
+    values = []
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    if start < numInData:
+      values.append(self._data[var].values[start:])
+    if self._collector is not None and len(self._collector) > 0:
+      values.append(self._collector.getColumn(self._orderedVars.index(var))[max(start - numInData, 0):])
+    return values
+
+  def _getMatchCandidates(self, toMatch, tol, inData):
+    """
+      Uses the realization index to find the realizations that can match "toMatch" within "tol", so that
+      only those need to be checked.
+      Only scalar variables are indexed; matching numbers must be within "tol" relative to the scaling factors
+      in the data, and relative to the value in the collector.
+      @ In, toMatch, dict, elements to match
+      @ In, tol, float, tolerance to which match should be made
+      @ In, inData, bool, True to search the data, False to search the collector
+      @ Out, candidates, np.ndarray or None, sorted indices (in the data or in the collector) of the realizations
+        that can match, or None if all of them have to be checked
+    """
+    if not toMatch:
+      return None
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    numInCollector = len(self._collector) if self._collector is not None else 0
+    radii = {}
+    for var, val in toMatch.items():
+      if var not in self._orderedVars or var in self.indexes or self.getDimensions(var)[var]:
+        continue
+      if not mathUtils.isAFloatOrInt(val):
+        # exact match
+        radii[var] = None
+        continue
+      if not np.isfinite(val):
+        continue
+      if inData:
+        loc, scale = self._getScalingFactors(var)
+        radius = tol * abs(scale)
+      elif tol < 1.0:
+        # |val - x| < tol*|x| implies |val - x| < tol*|val|/(1-tol)
+        loc = 0.0
+        radius = tol * abs(val) / (1.0 - tol)
+      else:
+        continue
+      # margin for the rounding in the comparisons
+      radius += 1e-12 * (abs(val) + abs(loc) + radius)
+      if np.isfinite(radius):
+        radii[var] = radius
+    if not radii:
+      return None
+    if self._inputKDTree is None:
+      self._inputKDTree = realizationIndex.RealizationIndex()
+    candidates = self._inputKDTree.candidates(toMatch, radii, numInData + numInCollector, self._getIndexableValues)
+    if candidates is None:
+      return None
+    if inData:
+      return candidates[candidates < numInData]
+    return candidates[candidates >= numInData] - numInData
+
   def _getRealizationFromCollectorByIndex(self,index):
     """
       Obtains a realization from the collector storage using the provided index.
@@ -1621,14 +1777,16 @@ class DataSet(DataObject):
 
     assert(self._collector is not None)
 
-    # TODO KD Tree for faster values -> still want in collector?
-    # TODO slow double loop
     matchVars, matchVals = zip(*toMatch.items()) if toMatch else ([], [])
     avoidVars, avoidVals = zip(*noMatch.items()) if noMatch else ([], [])
     matchIndices = tuple(self._orderedVars.index(var) for var in matchVars)# What did we use this in?
+    # only check the realizations that can match, if the realization index can tell them
+    candidates = self._getMatchCandidates(toMatch, tol, inData=False)
+    candidates = range(len(self._collector)) if candidates is None else candidates.tolist()
     if not first:
       rr, rlz = [], []
-    for r, row in enumerate(self._collector[:]): #TODO: CAN WE MAKE R START FROM LAST MATCHINDEXES ?
+    match = False
+    for r in candidates:
       match = True
       # find matches first
       if toMatch:
@@ -1661,11 +1819,10 @@ class DataSet(DataObject):
         else:
           rr.append(r)
           rlz.append(self._getRealizationFromCollectorByIndex(r))
-    if match:
-      if first:
-        return r, self._getRealizationFromCollectorByIndex(r)
-      else:
-        return rr, rlz
+    if first and match:
+      return r, self._getRealizationFromCollectorByIndex(r)
+    elif not first and rr:
+      return rr, rlz
     else:
       return len(self), None
 
@@ -1702,7 +1859,14 @@ class DataSet(DataObject):
     matchVars = list(match.keys())
     avoidVars = list(noMatch.keys())
     # TODO what if a variable is in both??
-    # TODO this could be slow, should do KD tree instead
+    # only check the realizations that can match, if the realization index can tell them
+    candidates = self._getMatchCandidates(match, tol, inData=True)
+    if candidates is None:
+      data = self._data
+    elif len(candidates):
+      data = self._data[{self.sampleTag: candidates}]
+    else:
+      return len(self), None
     mask = 1.0
     for var in matchVars: #, val in match.items():
       val = match[var]
@@ -1712,9 +1876,9 @@ class DataSet(DataObject):
         loc, scale = self._getScalingFactors(var)
         scaleVal = (val-loc) / scale
         # create mask of where the dataarray matches the desired value
-        mask *= abs((self._data[var]-loc)/scale - scaleVal) < tol
+        mask *= abs((data[var]-loc)/scale - scaleVal) < tol
       else:
-        mask *= self._data[var] == val
+        mask *= data[var] == val
       # if all potential matches eliminated, stop looking
       if not np.any(mask):
         break
@@ -1728,22 +1892,26 @@ class DataSet(DataObject):
           # scale if we know how
           loc, scale = self._getScalingFactors(var)
           # create mask of where the dataarray matches the desired value
-          dataVal = (self._data[var] - loc) / scale
+          dataVal = (data[var] - loc) / scale
           for val in vals:
             scaleVal = (val-loc) / scale
             mask *= np.logical_not(abs(dataVal - scaleVal) < tol)
         else:
           for val in vals:
-            mask *= np.logical_not(self._data[var] == val)
+            mask *= np.logical_not(data[var] == val)
         # if all potential matches eliminated, stop looking
         if sum(mask) == 0:
           break
 
-    rlz = self._data.where(mask,drop=True)
-    try:
-      idx = rlz[self.sampleTag].item(0)
-    except IndexError:
+    # the first realization matching (anywhere along its other dimensions) is the one
+    if isinstance(mask, xr.DataArray):
+      otherDims = list(dim for dim in mask.dims if dim != self.sampleTag)
+      hits = np.flatnonzero(mask.any(dim=otherDims).values if otherDims else mask.values)
+    else:
+      hits = np.arange(len(data[self.sampleTag])) if mask else []
+    if not len(hits):
       return len(self),None
+    idx = data[self.sampleTag].values[hits[0]].item()
     return idx,self._getRealizationFromDataByIndex(idx,unpackXArray)
 
   def _getRequestedElements(self, options):
@@ -1850,16 +2018,15 @@ class DataSet(DataObject):
     # otherwise, return happily and continue loading the CSV
     return dims
 
-  def _newCollector(self,width=1,length=100,dtype=None):
+  def _newCollector(self,width=1,length=100):
     """
       Creates a new collector object and returns it.
+      The collector types each column (variable) according to the values it receives.
       @ In, width, int, optional, width of collector
       @ In, length, int, optional, initial length of (allocated) collector
-      @ In, dtype, type, optional, type of entires (float if all float, usually should be object)
+      @ Out, collector, cached_ndarray.cColumnarArray, the new collector
     """
-    if dtype is None:
-      dtype = self.defaultDtype # set in subclasses if different
-    return cached_ndarray.cNDarray(width=width,length=length,dtype=dtype)
+    return cached_ndarray.cColumnarArray(width=width,length=length)
 
   def _readPandasCSV(self, fname, nullOK=None):
     """
@@ -1880,12 +2047,12 @@ class DataSet(DataObject):
 
   def _resetScaling(self):
     """
-      Removes the KDTree and scaling factors, usually because the data changed in some way
+      Removes the scaling factors, usually because the data changed in some way.
+      Note the realization index (self._inputKDTree) is kept, since it follows the realizations being appended.
       @ In, None
       @ Out, None
     """
     self._scaleFactors = {}
-    self._inputKDTree = None
 
   def _selectiveRealization(self,rlz):
     """
@@ -1924,7 +2091,6 @@ class DataSet(DataObject):
         del self._scaleFactors[var]
       except KeyError:
         pass
-    # TODO someday make KDTree too!
     assert(self._data is not None) # TODO check against collector entries?
     ds = self._data[varList] if var is not None else self._data
     mean = ds.mean().variables
@@ -109,7 +109,7 @@ class HistorySet(DataSet):
     self._pivotParams = {self._tempPivotParam:self._outputs[:]}
 
   ### EXTERNAL API ###
-  def addRealization(self, rlz):
+  def addRealization(self, rlz, transferOwnership=False):
     """
       Adds a "row" (or "sample") to this data object.
       This is the method to add data to this data object.
@@ -118,6 +118,8 @@ class HistorySet(DataSet):
       @ In, rlz, dict, {var:val} format where
                          "var" is the variable name as a string,
                          "val" is a np.ndarray of values.
+      @ In, transferOwnership, bool, optional, if True the caller hands "rlz" over to this data object
+        and will not use or modify it anymore, so the protective copy of it is skipped.
       @ Out, None
     """
     # add the indexMap, then continue to base class method
@@ -128,7 +130,7 @@ class HistorySet(DataSet):
     for var in deps:
       indexMap[var] = [pivot]
     rlz['_indexMap'] = np.atleast_1d(indexMap)
-    DataSet.addRealization(self, rlz)
+    DataSet.addRealization(self, rlz, transferOwnership=transferOwnership)
 
 
   ### INTERNAL USE FUNCTIONS ###
@@ -187,6 +187,16 @@ class DateBase(BaseEntity, InputDataUser):
       @ Out, None
     """
 
+  def addRealizations(self, rlzs, transferOwnership=False):
+    """
+      Adds many "rows" (or "samples") to this database, one at a time.
+      @ In, rlzs, list, list of realizations, each in the addRealization format
+      @ In, transferOwnership, bool, optional, if True the caller will not use or modify "rlzs" anymore
+      @ Out, None
+    """
+    for rlz in rlzs:
+      self.addRealization(rlz)
+
   @abc.abstractmethod
   def allRealizations(self):
     """
@@ -27,6 +27,7 @@ import numpy as np
 #Internal Modules------------------------------------------------------------------------------------
 from utils import InputData, InputTypes
 from h5py_interface_creator import hdf5Database as h5Data
+from h5py_interface_creator import hdf5ColumnarDatabase as h5ColumnarData
 from DataObjects import PointSet, HistorySet
 from .Database import DateBase
 #Internal Modules End--------------------------------------------------------------------------------
@@ -36,6 +37,19 @@ class HDF5(DateBase):
     class to handle h5py (hdf5) databases,
     Used to add and retrieve attributes and values from said database
   """
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super().getInputSpecification()
+    inputSpecification.addParam("layout", InputTypes.makeEnumType("layout","layoutType",["groups","columnar"]), False)
+    return inputSpecification
+
   #####################
   # __magic__
   def __init__(self):
@@ -51,6 +65,7 @@ class HDF5(DateBase):
     self._allvars  = []
     self.printTag = 'DATABASE-HDF5'
     self._extension = '.h5'
+    self.layout = 'groups' # layout of new databases, either a group per realization or a dataset per variable
 
   def __getstate__(self):
     """
@@ -78,7 +93,7 @@ class HDF5(DateBase):
     """
     self.__dict__.update(newstate)
     self.exist = True
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist)
+    self.database = self._openDatabase()
 
   def _handleInput(self, paramInput):
     """
@@ -86,6 +101,7 @@ class HDF5(DateBase):
       @ In, paramInput, ParameterInput, the already parsed input.
       @ Out, None
     """
+    self.layout = paramInput.parameterValues.get('layout', self.layout)
     super(HDF5, self)._handleInput(paramInput)
 
   #####################
@@ -107,7 +123,23 @@ class HDF5(DateBase):
       @ Out, None
     """
     super(HDF5, self).initializeDatabase()
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist, self.variables)
+    self.database = self._openDatabase()
+
+  def _openDatabase(self):
+    """
+      Opens the underlying database object, with the layout of the existing file or the requested one.
+      @ In, None
+      @ Out, database, hdf5Database or hdf5ColumnarDatabase, the database object
+    """
+    if self.exist:
+      columnar = h5ColumnarData.isColumnar(self.get_fullpath())
+      if columnar != (self.layout == 'columnar'):
+        self.raiseAWarning('Database "{}" has the "{}" layout, which is kept instead of "{}".'
+                           .format(self.name, 'columnar' if columnar else 'groups', self.layout))
+    else:
+      columnar = self.layout == 'columnar'
+    dbClass = h5ColumnarData if columnar else h5Data
+    return dbClass(self.name, self.databaseDir, self.filename, self.exist, self.variables)
 
   def saveDataToFile(self, source):
     """
@@ -118,10 +150,11 @@ class HDF5(DateBase):
     if not isinstance(source, (PointSet, HistorySet)):
       self.raiseAnError(TypeError, 'RAVEN HDF5 Databases cannot currently handle N-Dimensional Datasets; ' +
                         f'use NetCDF instead. Received Dataset for database "{source.name}"')
+    rlzs = []
     for r in range(len(source)):
       rlz = source.realization(r, unpackXArray=True)
-      rlz = dict((var, np.atleast_1d(val)) for var, val in rlz.items())
-      self.addRealization(rlz)
+      rlzs.append(dict((var, np.atleast_1d(val)) for var, val in rlz.items()))
+    self.addRealizations(rlzs)
 
   def loadIntoData(self, target):
     """
@@ -129,9 +162,15 @@ class HDF5(DateBase):
       @ In, target, DataObjects.DataObjet, object to write data into
       @ Out, None
     """
+    if isinstance(self.database, h5ColumnarData) and not target.indexes:
+      # scalar columns go straight into the data object
+      columns = self.database.getColumns()
+      if all(columns[var][1] is None for var in target.getVars() if var in columns):
+        order = self._loadingOrder()
+        target.addRealizations(dict((var, values[order]) for var, (values, _) in columns.items()), transferOwnership=True)
+        return
     allRlz = self.allRealizations()
-    for rlz in allRlz:
-      target.addRealization(rlz)
+    target.addRealizations(allRlz, transferOwnership=True)
 
   def addRealization(self, rlz):
     """
@@ -144,19 +183,43 @@ class HDF5(DateBase):
                          "val" is either a float or a np.ndarray of values.
       @ Out, None
     """
+    self._checkRealization(rlz, len(self.database))
+    self.database.addGroup(rlz)
+    self.built = True
+
+  def addRealizations(self, rlzs, transferOwnership=False):
+    """
+      Adds many "rows" (or "samples") to this database at once.
+      With the columnar layout, each variable is extended once for the whole batch.
+      @ In, rlzs, list, list of realizations, each in the addRealization format
+      @ In, transferOwnership, bool, optional, if True the caller will not use or modify "rlzs" anymore
+      @ Out, None
+    """
+    rlzs = list(rlzs)
+    numRlz = len(self.database)
+    for r, rlz in enumerate(rlzs):
+      self._checkRealization(rlz, numRlz + r)
+    self.database.addGroups(rlzs)
+    self.built = True
+
+  def _checkRealization(self, rlz, index):
+    """
+      Checks a realization can be stored, and adds the prefix if missing.
+      @ In, rlz, dict, {var:val} format (see addRealization)
+      @ In, index, int, the index the realization will have in the database, used as default prefix
+      @ Out, None
+    """
     # realization must be a dictionary
     assert isinstance(rlz, dict)
     # prefix must be present
     if 'prefix' not in rlz:
-      rlz['prefix'] = len(self.database)
+      rlz['prefix'] = index
     # check dimensionality
     if '_indexMap' in rlz:
       for var, dims in rlz['_indexMap'][0].items():
         if len(dims) > 1:
           self.raiseAnError(TypeError, 'RAVEN HDF5 Databases cannot currently handle N-Dimensional data; ' +
                             f'use NetCDF instead. Received ND data for variable "{var}": {dims}')
-    self.database.addGroup(rlz)
-    self.built = True
 
   #####################
   # utilities
@@ -218,12 +281,34 @@ class HDF5(DateBase):
       @ In, None
       @ Out, allData, list of arrays, all the data from this data object.
     """
+    if isinstance(self.database, h5ColumnarData):
+      # split each column by realization
+      columns = self.database.getColumns()
+      numRlz = len(self.database)
+      splits = {}
+      for var, (values, lengths) in columns.items():
+        if lengths is None:
+          splits[var] = values.reshape(numRlz, 1)
+        else:
+          splits[var] = np.split(values, np.cumsum(lengths)[:-1])
+      allData = list(dict(zip(splits.keys(), rlz)) for rlz in zip(*splits.values()))
+      return [allData[r] for r in self._loadingOrder()]
     allRealizationNames = self.database.retrieveAllHistoryNames()
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
     allRealizationNames.sort()
     allData = [self.realization(name) for name in allRealizationNames]
     return allData
 
+  def _loadingOrder(self):
+    """
+      Provides the order the realizations are loaded in, which is the order of their names (as in allRealizations
+      for the groups layout); the realizations with the same name keep the order they were added in.
+      @ In, None
+      @ Out, order, np.ndarray, the indices of the realizations in loading order
+    """
+    names = np.array(self.database.retrieveAllHistoryNames(), dtype=str)
+    return np.argsort(names, kind='stable')
+
   def realization(self,index=None,matchDict=None,tol=1e-15):
     """
       Method to obtain a realization from the data, either by index (e.g. realization number) or matching value.
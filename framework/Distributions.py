@@ -391,14 +391,25 @@ class BoostDistribution(Distribution):
     self.dimensionality  = 1
     self.distType        = 'Continuous'
 
+  def _evaluateArray(self, method, x):
+    """
+      Evaluates a function of the crow distribution at each value of an array, in a single call
+      @ In, method, str, name of the crow method evaluating a contiguous array in place (e.g. "cdfArray")
+      @ In, x, array-like, values to evaluate the function at
+      @ Out, values, np.array, requested values, with the shape of x
+    """
+    values = np.array(x, dtype=float, order='C')
+    getattr(self._distribution, method)(values)
+    return values
+
   def cdf(self,x):
     """
       Function to get the cdf at a provided coordinate
-      @ In, x, float, value to get the cdf at
-      @ Out, retunrCdf, float, requested cdf
+      @ In, x, float or array-like, value(s) to get the cdf at
+      @ Out, retunrCdf, float or np.array, requested cdf
     """
     if hasattr(x,'__len__'):
-      returnCdf = np.array([self.cdf(i) for i in x])
+      returnCdf = self._evaluateArray('cdfArray', x)
     else:
       returnCdf = self._distribution.cdf(x)
     return returnCdf
@@ -406,12 +417,11 @@ class BoostDistribution(Distribution):
   def ppf(self,x):
     """
       Function to get the inverse cdf at a provided coordinate
-      @ In, x, float, value to get the inverse cdf at
-      @ Out, retunrPpf, float, requested inverse cdf
+      @ In, x, float or array-like, value(s) to get the inverse cdf at
+      @ Out, retunrPpf, float or np.array, requested inverse cdf
     """
-    # TODO speed this up by doing it in Crow, not in python
     if hasattr(x,'__len__'):
-      returnPpf = np.array([self.ppf(i) for i in x])
+      returnPpf = self._evaluateArray('inverseCdfArray', x)
     else:
       returnPpf = self._distribution.inverseCdf(x)
     return returnPpf
@@ -419,10 +429,13 @@ class BoostDistribution(Distribution):
   def pdf(self,x):
     """
       Function to get the pdf at a provided coordinate
-      @ In, x, float, value to get the pdf at
-      @ Out, returnPdf, float, requested pdf
+      @ In, x, float or array-like, value(s) to get the pdf at
+      @ Out, returnPdf, float or np.array, requested pdf
     """
-    returnPdf = self._distribution.pdf(x)
+    if hasattr(x,'__len__'):
+      returnPdf = self._evaluateArray('pdfArray', x)
+    else:
+      returnPdf = self._distribution.pdf(x)
     return returnPdf
 
   def logPdf(self,x):
@@ -493,8 +506,8 @@ class BoostDistribution(Distribution):
     if size is None:
       rvsValue = self.ppf(random())
     else:
-      # TODO to speed up, do this on the C side instead of in python
-      rvsValue = np.array([self.rvs() for _ in range(size)])
+      # same random numbers as drawing one at a time, transformed in a single call
+      rvsValue = self.ppf(random(samples=size, keepMatrix=True).ravel())
     return rvsValue
 
   def selectedRvs(self, discardedElems):
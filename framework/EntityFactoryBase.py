@@ -17,6 +17,9 @@ Created March 15, 2020
 @author: talbpaul
 """
 
+import inspect
+import importlib
+
 from BaseClasses import MessageUser
 from BaseClasses import InputDataUser
 import PluginManager
@@ -40,6 +43,7 @@ class EntityFactory(MessageUser):
     self.needsRunInfo = needsRunInfo                 # whether entity needs run info
     self.returnInputParameter = returnInputParameter # use xml or inputParams
     self._registeredTypes = {}                       # registered types for this entity
+    self._lazyTypes = {}                             # types registered by name, imported when first requested
     self._pluginFactory = PluginManager              # plugin factory, if any; provided by Simulation
 
   def registerType(self, name, obj):
@@ -55,6 +59,18 @@ class EntityFactory(MessageUser):
     #                      f'{self._registeredTypes[name]}, {obj}')
     self._registeredTypes[name] = obj
 
+  def registerLazyType(self, name, module, className=None):
+    """
+      Registers a class as type of this entity without importing it. The module defining the class
+      is imported only when the type is requested for the first time.
+      @ In, name, str, name by which entity should be known
+      @ In, module, str, full name of the module defining the class (e.g. SupervisedLearning.ARMA)
+      @ In, className, str or list, optional, name of the class in the module (defaults to "name");
+        if a list, the first one defined in the module is used (e.g. for classes depending on optional libraries)
+      @ Out, None
+    """
+    self._lazyTypes[name] = (module, className if className is not None else name)
+
   def registerAllSubtypes(self, baseType, alias=None):
     """
       Registers all inheritors of the baseType as types by classname for this entity.
@@ -75,6 +91,7 @@ class EntityFactory(MessageUser):
       @ Out, None
     """
     self._registeredTypes.pop(name, None)
+    self._lazyTypes.pop(name, None)
 
   def knownTypes(self):
     """
@@ -82,7 +99,7 @@ class EntityFactory(MessageUser):
       @ Out, __knownTypes, list, list of known types
     """
     # NOTE: plugins might not be listed if they haven't been loaded yet!
-    return self._registeredTypes.keys()
+    return list(self._registeredTypes.keys()) + [name for name in self._lazyTypes if name not in self._registeredTypes]
 
   def returnClass(self, Type):
     """
@@ -95,6 +112,8 @@ class EntityFactory(MessageUser):
     try:
       return self._registeredTypes[Type]
     except KeyError:
+      if Type in self._lazyTypes:
+        return self._loadLazyType(Type)
       # is this a request from an unloaded plugin?
       obj = self._checkInUnloadedPlugin(Type)
       if obj is None:
@@ -144,6 +163,27 @@ class EntityFactory(MessageUser):
 
   #############
   # UTILITIES
+  def _loadLazyType(self, typeName):
+    """
+      Imports the class of a type registered through "registerLazyType", and registers it for the next requests
+      @ In, typeName, str, name of the type
+      @ Out, obj, object, class definition
+    """
+    moduleName, classNames = self._lazyTypes[typeName]
+    module = importlib.import_module(moduleName)
+    for className in ([classNames] if isinstance(classNames, str) else classNames):
+      obj = getattr(module, className, None)
+      if inspect.ismodule(obj):
+        # a submodule imported directly (e.g. while unpickling) is bound to the package with the name of its class
+        obj = getattr(obj, className, None)
+      if obj is not None and not inspect.ismodule(obj):
+        break
+    else:
+      self.raiseAnError(ImportError, f'"{self.name}" type "{typeName}" is not defined in module "{moduleName}"!')
+    self.registerType(typeName, obj)
+    del self._lazyTypes[typeName]
+    return obj
+
   def _checkInUnloadedPlugin(self, typeName):
     """
       Checks if the requested entity is from a plugin (has '.' in type name), and if so loads plugin if it isn't already
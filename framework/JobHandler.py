@@ -64,10 +64,20 @@ class JobHandler(BaseType):
     self.isRayInitialized = False
     ## Variable containing the info about the RAY parallel server. If None, multi-threading is used
     self.rayServer = None
+    ## Pool of local worker processes, used for the internal parallel when RAY
+    ## is not available and no remote nodes are requested
+    self.processPool = None
 
-    ## Sleep time for collecting/inquiring/submitting new jobs
+    ## Sleep time for collecting/inquiring/submitting new jobs. It is only used
+    ## when some running job is not able to signal its own completion (e.g.
+    ## distributed runners), otherwise the polling thread sleeps until an event
     self.sleepTime = 1e-4 #0.005
 
+    ## Upper bound on the time the polling thread (and the clients waiting on
+    ## waitForEvent) are idle when no event is signaled. This is only a safety
+    ## net, since all the state changes are notified.
+    self.maxIdleTime = 0.5
+
     ## Is the execution completed? When True, the JobHandler is shut down
     self.completed = False
 
@@ -90,22 +100,43 @@ class JobHandler(BaseType):
 
     ## Queue of jobs to be run, when something on the list above opens up, the
     ## corresponding queue will pop a job (Runner) and put it into that location
-    ## and set it to start
-    self.__queue       = collections.deque()
-    self.__clientQueue = collections.deque()
+    ## and set it to start. They are ordered sets ({Runner: None}), so that
+    ## a job can be removed from the queue in constant time.
+    self.__queue       = collections.OrderedDict()
+    self.__clientQueue = collections.OrderedDict()
 
     ## A counter used for uniquely identifying the next id for an ExternalRunner
     ## InternalRunners will increment this counter, but do not use it currently
     self.__nextId = 0
 
-    ## List of finished jobs. When a job finishes, it is placed here until
-    ## something from the main thread can remove them.
-    self.__finished = []
+    ## Ordered set ({Runner: None}) of finished jobs. When a job finishes, it
+    ## is placed here until something from the main thread can remove them.
+    self.__finished = collections.OrderedDict()
+
+    ## Indexes of the jobs known by the JobHandler (queued, running or
+    ## finished but not collected yet), used to answer the queries on the jobs
+    ## without scanning the containers above:
+    ## - {identifier: {Runner: location}}
+    ## - {uniqueHandler: {Runner: location}}
+    ## - {uniqueHandler: ordered set of finished Runners}
+    ## where location is one of "queue", "clientQueue", "running",
+    ## "clientRunning" and "finished"
+    self.__jobsById            = {}
+    self.__jobsByHandler       = {}
+    self.__finishedByHandler   = {}
 
     ## End block of __queueLock protected variables
     ############################################################################
 
     self.__queueLock = threading.RLock()
+    ## Condition variables (sharing the __queueLock) used to wake up the polling
+    ## thread (new jobs queued, jobs finished, shutdown) and the clients waiting
+    ## for jobs to collect or for new room in the queue, respectively. The flags
+    ## avoid losing events signaled while nobody was waiting.
+    self.__loopCondition   = threading.Condition(self.__queueLock)
+    self.__loopSignaled    = False
+    self.__clientCondition = threading.Condition(self.__queueLock)
+    self.__clientSignaled  = False
     ## List of submitted job identifiers, includes jobs that have completed as
     ## this list is not cleared until a new step is entered
     self.__submittedJobs = []
@@ -169,12 +200,41 @@ class JobHandler(BaseType):
         self.raiseAMessage(" Process Failed " + str(running) + " internal returnCode " + str(returnCode))
         self.__failedJobs[running.identifier]=(returnCode,copy.deepcopy(metadataToKeep))
 
+  def __indexJob(self, run, location):
+    """
+      Records (or updates) the location of a job in the identifier and uniqueHandler indexes
+      @ In, run, Runner, the job
+      @ In, location, str, the container the job is in ("queue", "clientQueue",
+        "running", "clientRunning" or "finished")
+      @ Out, None
+    """
+    self.__jobsById.setdefault(run.identifier, {})[run] = location
+    self.__jobsByHandler.setdefault(run.uniqueHandler, {})[run] = location
+    if location == 'finished':
+      self.__finishedByHandler.setdefault(run.uniqueHandler, collections.OrderedDict())[run] = None
+
+  def __unindexJob(self, run):
+    """
+      Removes a job from the identifier and uniqueHandler indexes
+      @ In, run, Runner, the job
+      @ Out, None
+    """
+    for index, key in [(self.__jobsById, run.identifier),
+                       (self.__jobsByHandler, run.uniqueHandler),
+                       (self.__finishedByHandler, run.uniqueHandler)]:
+      jobs = index.get(key)
+      if jobs is not None:
+        jobs.pop(run, None)
+        if not jobs:
+          del index[key]
+
   def __initializeRay(self):
     """
       Internal method that is aimed to initialize the internal parallel system.
       It initializes the RAY implementation (with socketing system) in
       case RAVEN is run in a cluster with multiple nodes or the NumMPI > 1,
-      otherwise multi-threading is used.
+      otherwise multi-threading is used. If RAY is not available, a pool of
+      local worker processes is used (parallel python only for remote nodes).
       @ In, None
       @ Out, None
     """
@@ -192,9 +252,12 @@ class JobHandler(BaseType):
         self.rayServer = ray.init(num_cpus=int(nProcsHead)) if _rayAvail else pp.Server(ncpus=int(nProcsHead))
         ## Get localHost and servers
         servers = self.__runRemoteListeningSockets(self.rayServer['redis_address'])
+      elif _rayAvail:
+        self.rayServer = ray.init(num_cpus=int(self.runInfoDict['totalNumCoresUsed']))
       else:
-        self.rayServer = ray.init(num_cpus=int(self.runInfoDict['totalNumCoresUsed'])) if _rayAvail else \
-                           pp.Server(ncpus=int(self.runInfoDict['totalNumCoresUsed']))
+        ## local run without RAY: warm pool of worker processes (no extra dependency)
+        self.processPool = Runners.ProcessPool(int(self.runInfoDict['totalNumCoresUsed']))
+        self.raiseADebug("# of local worker processes: ", str(self.processPool.numWorkers))
       if _rayAvail:
         self.raiseADebug("Head node IP address: ", self.rayServer['node_ip_address'])
         self.raiseADebug("Redis address       : ", self.rayServer['redis_address'])
@@ -280,17 +343,71 @@ class JobHandler(BaseType):
 
   def startLoop(self):
     """
-    This function begins the polling loop for the JobHandler where it will
-    constantly fill up its running queue with jobs in its pending queue and
-    unload finished jobs into its finished queue to be extracted by
+    This function begins the loop for the JobHandler where it will fill up its
+    running queue with jobs in its pending queue and unload finished jobs into
+    its finished queue to be extracted by the clients. The loop sleeps until a
+    job is queued or a running job signals its completion; it falls back to
+    polling only if some running job cannot signal its own completion.
+    @ In, None
+    @ Out, None
     """
     while not self.completed:
       self.fillJobQueue()
       self.cleanJobQueue()
-      ## TODO May want to revisit this:
-      ## http://stackoverflow.com/questions/29082268/python-time-sleep-vs-event-wait
-      ## probably when we move to Python 3.
-      time.sleep(self.sleepTime)
+      with self.__queueLock:
+        if not self.__loopSignaled and not self.completed:
+          self.__loopCondition.wait(self.__loopWaitTime())
+        self.__loopSignaled = False
+
+  def __loopWaitTime(self):
+    """
+      Method to get the time the polling thread can wait for an event
+      @ In, None
+      @ Out, waitTime, float, the maximum waiting time in seconds
+    """
+    for run in self.__running + self.__clientRunning:
+      if run is not None and not run.notifiesCompletion:
+        return self.sleepTime
+    return self.maxIdleTime
+
+  def __signalLoop(self, runner=None):
+    """
+      Wakes up the polling thread. It is used as completion callback by the runners.
+      @ In, runner, Runner, optional, the runner signaling its completion (if any)
+      @ Out, None
+    """
+    with self.__queueLock:
+      self.__loopSignaled = True
+      self.__loopCondition.notify_all()
+
+  def __signalClients(self):
+    """
+      Wakes up the clients waiting for jobs to collect or for room in the queues
+      @ In, None
+      @ Out, None
+    """
+    with self.__queueLock:
+      self.__clientSignaled = True
+      self.__clientCondition.notify_all()
+
+  def waitForEvent(self, timeout=None):
+    """
+      Blocks the caller until a job is finished (ready to be collected) or a
+      queued job started (i.e. there is room for new ones). Events signaled after
+      the previous call are not lost, so this can be safely used in a
+      "collect, submit, wait" loop.
+      @ In, timeout, float, optional, maximum waiting time in seconds
+        (if None, the JobHandler's maxIdleTime is used)
+      @ Out, signaled, bool, True if an event occurred, False if the wait timed out
+    """
+    if timeout is None:
+      timeout = self.maxIdleTime
+    with self.__queueLock:
+      if not self.__clientSignaled and not self.completed:
+        self.__clientCondition.wait(timeout)
+      signaled = self.__clientSignaled
+      self.__clientSignaled = False
+    return signaled
 
   def addJob(self, args, functionToRun, identifier, metadata=None, forceUseThreads = False, uniqueHandler="any", clientQueue = False, groupInfo = None):
     """
@@ -322,13 +439,21 @@ class JobHandler(BaseType):
     """
     assert "original_function" in dir(functionToRun), "to parallelize a function, it must be" \
            " decorated with RAVEN Parallel decorator"
-    if self.rayServer is None or forceUseThreads:
+    if forceUseThreads or (self.rayServer is None and self.processPool is None):
       internalJob = Runners.factory.returnInstance('SharedMemoryRunner', args,
                                                    functionToRun.original_function,
                                                    identifier=identifier,
                                                    metadata=metadata,
                                                    uniqueHandler=uniqueHandler,
                                                    profile=self.__profileJobs)
+    elif self.processPool is not None:
+      internalJob = Runners.factory.returnInstance('ProcessPoolRunner', args,
+                                                   functionToRun.original_function,
+                                                   pool=self.processPool,
+                                                   identifier=identifier,
+                                                   metadata=metadata,
+                                                   uniqueHandler=uniqueHandler,
+                                                   profile=self.__profileJobs)
     else:
       arguments = args  if _rayAvail else  tuple([self.rayServer] + list(args))
       internalJob = Runners.factory.returnInstance('DistributedMemoryRunner', arguments,
@@ -348,7 +473,7 @@ class JobHandler(BaseType):
       if groupId not in self.__batching:
         # NOTE: The size of the group is only set once the first job beloning to a group is added
         #       ***** THE size of a group is IMMUTABLE *****
-        self.__batching[groupId] = {"counter": 0, "ids": [], "size": groupInfo['size'], 'finished': []}
+        self.__batching[groupId] = {"counter": 0, "ids": [], "size": groupInfo['size'], 'finished': [], 'finishedSet': set()}
       self.__batching[groupId]["counter"] += 1
       if self.__batching[groupId]["counter"] > self.__batching[groupId]["size"]:
         self.raiseAnError(RuntimeError, "group id {} is full. Size reached:".format(groupId))
@@ -362,14 +487,18 @@ class JobHandler(BaseType):
       @ In, runner, Runner Instance, this is the instance of the runner that we want to readd in the queque
       @ Out, None
     """
+    runner.setCompletionCallback(self.__signalLoop)
     with self.__queueLock:
       if not runner.clientRunner:
-        self.__queue.append(runner)
+        self.__queue[runner] = None
+        self.__indexJob(runner, 'queue')
       else:
-        self.__clientQueue.append(runner)
+        self.__clientQueue[runner] = None
+        self.__indexJob(runner, 'clientQueue')
       if self.__profileJobs:
         runner.trackTime('queue')
       self.__submittedJobs.append(runner.identifier)
+      self.__signalLoop()
 
   def addClientJob(self, args, functionToRun, identifier, metadata=None, uniqueHandler="any"):
     """
@@ -415,7 +544,9 @@ class JobHandler(BaseType):
                                          profile=profile)
     # place it on the finished queue
     with self.__queueLock:
-      self.__finished.append(run)
+      self.__finished[run] = None
+      self.__indexJob(run, 'finished')
+      self.__signalClients()
 
   def isFinished(self):
     """
@@ -442,11 +573,11 @@ class JobHandler(BaseType):
         if run:
           return False
 
-    ## Are there runs that need to be claimed? If so, then I cannot say I am
-    ## done.
-    numFinished = len(self.getFinishedNoPop())
-    if numFinished != 0:
-      return False
+      ## Are there runs that need to be claimed? If so, then I cannot say I am
+      ## done. NOTE: this is what "len(self.getFinishedNoPop()) != 0" checks,
+      ## i.e. finished runs with the default uniqueHandler or pending batches.
+      if len(self.__finishedByHandler.get('any', {})) > 0 or len(self.__batching) > 0:
+        return False
 
     return True
 
@@ -491,24 +622,11 @@ class JobHandler(BaseType):
     """
     identifier = identifier.strip()
     with self.__queueLock:
-      ## Look through the finished jobs and attempt to find a matching
-      ## identifier. If the job exists here, it is finished
-      for run in self.__finished:
-        if run.identifier == identifier:
-          return True
-
-      ## Look through the pending jobs and attempt to find a matching identifier
-      ## If the job exists here, it is not finished
-      for queue in [self.__queue, self.__clientQueue]:
-        for run in queue:
-          if run.identifier == identifier:
-            return False
-
-      ## Look through the running jobs and attempt to find a matching identifier
-      ## If the job exists here, it is not finished
-      for run in self.__running+self.__clientRunning:
-        if run is not None and run.identifier == identifier:
-          return False
+      ## If a job with this identifier is in the finished jobs, it is finished,
+      ## if it is only pending or running, it is not finished
+      jobs = self.__jobsById.get(identifier)
+      if jobs:
+        return 'finished' in jobs.values()
 
     ##  If you made it here and we still have not found anything, we have got
     ## problems.
@@ -525,18 +643,9 @@ class JobHandler(BaseType):
     """
     uniqueHandler = uniqueHandler.strip()
     with self.__queueLock:
-      for run in self.__finished:
-        if run.uniqueHandler == uniqueHandler:
-          return False
-
-      for queue in [self.__queue, self.__clientQueue]:
-        for run in queue:
-          if run.uniqueHandler == uniqueHandler:
-            return False
-
-      for run in self.__running + self.__clientRunning:
-        if run is not None and run.uniqueHandler == uniqueHandler:
-          return False
+      ## any pending, running or not yet collected job with this uniqueHandler?
+      if self.__jobsByHandler.get(uniqueHandler):
+        return False
 
     self.raiseADebug("The jobs with uniqueHandler ", uniqueHandler, "are finished")
 
@@ -580,21 +689,23 @@ class JobHandler(BaseType):
     with self.__queueLock:
       finished = []
       runsToBeRemoved = []
-      for i,run in enumerate(self.__finished):
-        ## If the jobIdentifier does not match or the uniqueHandler does not
-        ## match, then don't bother trying to do anything with it
-        if not run.identifier.startswith(jobIdentifier) \
-           or uniqueHandler != run.uniqueHandler:
+      ## Only the finished jobs with a matching uniqueHandler are considered
+      for run in self.__finishedByHandler.get(uniqueHandler, {}):
+        ## If the jobIdentifier does not match, then don't bother trying to do
+        ## anything with it
+        if not run.identifier.startswith(jobIdentifier):
           continue
         ## check if the run belongs to a subgroup and in case
         if run.groupId in self.__batching:
-          if not run in self.__batching[run.groupId]['finished']:
-            self.__batching[run.groupId]['finished'].append(run)
+          batch = self.__batching[run.groupId]
+          if run not in batch['finishedSet']:
+            batch['finished'].append(run)
+            batch['finishedSet'].add(run)
         else:
           finished.append(run)
 
         if removeFinished:
-          runsToBeRemoved.append(i)
+          runsToBeRemoved.append(run)
           self.__checkAndRemoveFinished(run)
           ##FIXME: IF THE RUN IS PART OF A BATCH AND IT FAILS, WHAT DO WE DO? alfoa
       ## check if batches are ready to be returned
@@ -609,13 +720,11 @@ class JobHandler(BaseType):
           doneBatch = self.__batching[groupId]
           finished.append(doneBatch['finished'])
 
-        ##Since these indices are sorted, reverse them to ensure that when we
-        ## delete something it will not shift anything to the left (lower index)
-        ## than it.
       if removeFinished:
-        for i in reversed(runsToBeRemoved):
-          self.__finished[i].trackTime('collected')
-          del self.__finished[i]
+        for run in runsToBeRemoved:
+          run.trackTime('collected')
+          del self.__finished[run]
+          self.__unindexJob(run)
 
       ## end with self.__queueLock
     return finished
@@ -682,7 +791,7 @@ class JobHandler(BaseType):
           ## The queue could be emptied during this loop, so we will to break
           ## out as soon as that happens so we don't hog the lock.
           if len(self.__queue) > 0:
-            item = self.__queue.popleft()
+            item, _ = self.__queue.popitem(last=False)
 
             ## Okay, this is a little tricky, but hang with me here. Whenever
             ## a code model is run, we need to replace some of its command
@@ -712,11 +821,14 @@ class JobHandler(BaseType):
               item.args[3].update(kwargs)
 
             self.__running[i] = item
+            self.__indexJob(item, 'running')
             self.__running[i].start()
             self.__running[i].trackTime('started')
             self.__nextId += 1
           else:
             break
+        ## there is now room in the queue for new jobs
+        self.__signalClients()
 
     ## Repeat the same process above, only for the clientQueue
     emptySlots = [i for i,run in enumerate(self.__clientRunning) if run is None]
@@ -724,12 +836,14 @@ class JobHandler(BaseType):
       with self.__queueLock:
         for i in emptySlots:
           if len(self.__clientQueue) > 0:
-            self.__clientRunning[i] = self.__clientQueue.popleft()
+            self.__clientRunning[i], _ = self.__clientQueue.popitem(last=False)
+            self.__indexJob(self.__clientRunning[i], 'clientRunning')
             self.__clientRunning[i].start()
             self.__clientRunning[i].trackTime('jobHandler_started')
             self.__nextId += 1
           else:
             break
+        self.__signalClients()
 
   def cleanJobQueue(self):
     """
@@ -749,9 +863,11 @@ class JobHandler(BaseType):
           ## should not be modified by the main thread, however they may inquire
           ## it by calling numRunning.
           with self.__queueLock:
-            self.__finished.append(run)
-            self.__finished[-1].trackTime('jobHandler_finished')
+            self.__finished[run] = None
+            self.__indexJob(run, 'finished')
+            run.trackTime('jobHandler_finished')
             runList[i] = None
+            self.__signalClients()
 
   def setProfileJobs(self,profile=False):
     """
@@ -763,12 +879,16 @@ class JobHandler(BaseType):
 
   def startingNewStep(self):
     """
-      Method to reset the __submittedJobs to an empty list.
+      Method to reset the __submittedJobs to an empty list (and the objects
+      shipped to the local worker processes, if any).
       @ In, None
       @ Out, None
     """
     with self.__queueLock:
       self.__submittedJobs = []
+    ## the objects (e.g. models) might have changed in the previous step
+    if self.processPool is not None:
+      self.processPool.reset()
 
   def shutdown(self):
     """
@@ -778,8 +898,12 @@ class JobHandler(BaseType):
     @ Out, None
     """
     self.completed = True
+    self.__signalLoop()
+    self.__signalClients()
     if _rayAvail and self.rayServer:
      ray.shutdown()
+    if self.processPool is not None:
+      self.processPool.shutdown()
 
 
   def terminateAll(self):
@@ -790,12 +914,15 @@ class JobHandler(BaseType):
     """
     with self.__queueLock:
       for queue in [self.__queue, self.__clientQueue]:
+        for run in queue:
+          self.__unindexJob(run)
         queue.clear()
 
-      for runList in [self.__running, self.__clientRunning]:
-        unfinishedRuns = [run for run in runList if run is not None]
-        for run in unfinishedRuns:
-          run.kill()
+      unfinishedRuns = [run for runList in [self.__running, self.__clientRunning] for run in runList if run is not None]
+    ## the runners are killed without holding the lock: a dying runner signals its
+    ## completion (see __signalLoop), which needs the lock
+    for run in unfinishedRuns:
+      run.kill()
 
   def terminateJobs(self, ids):
     """
@@ -803,23 +930,32 @@ class JobHandler(BaseType):
       @ In, ids, list(str), job prefixes to terminate
       @ Out, None
     """
-    queues = [self.__queue, self.__clientQueue, self.__running, self.__clientRunning]
+    queues = {'queue': self.__queue, 'clientQueue': self.__clientQueue,
+              'running': self.__running, 'clientRunning': self.__clientRunning}
+    toKill = []
     with self.__queueLock:
-      for q,queue in enumerate(queues):
-        toRemove = []
-        for job in queue:
-          if job is not None and job.identifier in ids:
-            # this assumes that each uniqueHandle only exists once in any queue anywhere
-            ids.remove(job.identifier)
-            toRemove.append(job)
-        for job in toRemove:
-          # for fixed-spot queues, need to replace job with None not remove
-          if isinstance(queue,list):
-            job.kill()
-            queue[queue.index(job)] = None
-          # for variable queues, can just remove the job
-          else:
-            queue.remove(job)
-          self.raiseADebug('Terminated job "{}" by request.'.format(job.identifier))
+      for identifier in list(ids):
+        ## the first pending or running job with this identifier is terminated
+        # this assumes that each uniqueHandle only exists once in any queue anywhere
+        active = [(job, location) for job, location in self.__jobsById.get(identifier, {}).items() if location != 'finished']
+        if not active:
+          continue
+        job, location = active[0]
+        ids.remove(identifier)
+        queue = queues[location]
+        # for fixed-spot queues, need to replace job with None not remove
+        if isinstance(queue,list):
+          toKill.append(job)
+          queue[queue.index(job)] = None
+        # for variable queues, can just remove the job
+        else:
+          del queue[job]
+        self.__unindexJob(job)
+        self.raiseADebug('Terminated job "{}" by request.'.format(job.identifier))
+    ## as in terminateAll, the runners are killed without holding the lock
+    for job in toKill:
+      job.kill()
+    ## the freed slots can be filled with the queued jobs
+    self.__signalLoop()
     if len(ids):
       self.raiseADebug('Tried to remove some jobs but not found in any queues:',', '.join(ids))
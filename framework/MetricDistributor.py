@@ -70,16 +70,44 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType), MessageUse
       Method to compute the the metric between each pair of rows of matrices in pairedData
       @ In, pairedData, tuple, (featureValues, targetValues), both featureValues and targetValues
         are 2D numpy array with the same number of columns. For example, featureValues with shape
-        (numRealizations1,numParameters), targetValues with shape (numRealizations2, numParameters)
+        (numRealizations1,numParameters), targetValues with shape (numRealizations2, numParameters).
+        featureValues and targetValues can also be stacks of histories, i.e. lists of 2D numpy arrays
+        with shape (numParameters, numHistorySteps); in this case the metric is computed between each
+        pair of histories. targetValues can be None (the metric among the featureValues is computed)
       @ Out, output, numpy.ndarray, 2D array, with shape (numRealizations1,numRealization2)
     """
     assert(type(pairedData).__name__ == 'tuple'), "The paired data is not a tuple!"
+    feat, targ = pairedData
+    if isinstance(feat, list):
+      if self.canHandleDynamicData and self.canHandlePairwiseData:
+        output = self.estimator.evaluatePairwise(feat, targ)
+      else:
+        output = self.__evaluateHistoriesPairwise(feat, targ)
+      return output
     if not self.canHandlePairwiseData:
       self.raiseAnError(IOError, "The metric", self.estimator.name, "can not handle pairwise data")
-    feat, targ = pairedData
     output = self.estimator.evaluate(feat,targ)
     return output
 
+  def __evaluateHistoriesPairwise(self, feat, targ):
+    """
+      Method to compute the metric between each pair of histories, one pair at the time (for the
+      metrics that can not handle the stacks of histories on their own)
+      @ In, feat, list, stack of histories, i.e. list of 2D numpy arrays with shape (numParameters, numHistorySteps)
+      @ In, targ, list, stack of histories, or None (the metric among the histories of feat is computed)
+      @ Out, output, numpy.ndarray, 2D array, with shape (len(feat), len(targ)) or (len(feat), len(feat))
+    """
+    symmetric = targ is None
+    if symmetric:
+      targ = feat
+    output = np.zeros((len(feat), len(targ)))
+    for i in range(len(feat)):
+      for j in range(i if symmetric else 0, len(targ)):
+        output[i][j] = self.evaluate(((feat[i],None), (targ[j],None)))
+        if symmetric and i != j:
+          output[j][i] = output[i][j]
+    return output
+
   def evaluate(self,pairedData, weights = None, multiOutput='mean'):
     """
       Method to perform the evaluation of given paired data
@@ -118,6 +118,18 @@ class MetricEntity(utils.metaclass_insert(abc.ABCMeta, PluginReadyEntity)):
     #   However, for consistency, we keep it here for future investigation.
     return self._metric.run(x, y, weights=weights, axis=0, **kwargs)
 
+  def evaluatePairwise(self, x, y=None):
+    """
+      This method computes the metric between each pair of histories of two stacks of histories
+      (only available for the metrics that handle both dynamic and pairwise data)
+      @ In, x, list, stack of histories, i.e. list of numpy.ndarray with shape (numParameters, numSteps)
+      @ In, y, list, optional, stack of histories, if not provided the metric among the histories
+        of x is computed
+      @ Out, value, numpy.ndarray, 2D array with shape (len(x), len(y)), or (len(x), len(x))
+        if y is not provided
+    """
+    return self._metric.evaluatePairwise(x, y)
+
   def getAlgorithmType(self):
     """
       Provide the metric sub-sub-type (used e.g. in SKL metrics)
@@ -27,6 +27,114 @@ from .MetricInterface import MetricInterface
 from utils import InputData, InputTypes
 #Internal Modules End--------------------------------------------------------------------------------
 
+## local distances for which the LB_Keogh lower bound holds: the distance between a point and the
+## envelope (box) of the other history is not larger than the distance to any point within the box
+_lowerBoundDistances = {'euclidean':   lambda diff: np.sqrt(np.sum(diff**2, axis=0)),
+                        'sqeuclidean': lambda diff: np.sum(diff**2, axis=0),
+                        'cityblock':   lambda diff: np.sum(np.abs(diff), axis=0),
+                        'chebyshev':   lambda diff: np.amax(np.abs(diff), axis=0)}
+
+def _bandWidth(window, r, c):
+  """
+    Returns the half width of the Sakoe-Chiba band, enlarged to the difference of the history lengths
+    so that the last points of the two histories can always be aligned
+    @ In, window, int, the requested half width (number of time steps), None if no band
+    @ In, r, int, number of time steps of the first history
+    @ In, c, int, number of time steps of the second history
+    @ Out, band, int, the half width of the band, None if no band
+  """
+  return None if window is None else max(int(window), abs(r - c))
+
+def _lbKeogh(x, y, localDistance, window=None):
+  """
+    Computes the LB_Keogh lower bound of the DTW distance between two histories, i.e. the sum of the
+    distances between each point of x and the envelope of y (within the band, if any)
+    @ In, x, numpy.ndarray, data matrix for x, shape (numParameters, numStepsX)
+    @ In, y, numpy.ndarray, data matrix for y, shape (numParameters, numStepsY)
+    @ In, localDistance, str, the local distance (one of the _lowerBoundDistances)
+    @ In, window, int, optional, the half width of the Sakoe-Chiba band
+    @ Out, bound, float, the lower bound of the DTW distance between x and y
+  """
+  r, c = x.shape[1], y.shape[1]
+  band = _bandWidth(window, r, c)
+  if band is None:
+    upper = np.repeat(np.amax(y, axis=1).reshape(-1,1), r, axis=1)
+    lower = np.repeat(np.amin(y, axis=1).reshape(-1,1), r, axis=1)
+  else:
+    upper = np.full(x.shape, -np.inf)
+    lower = np.full(x.shape, np.inf)
+    steps = np.arange(r)
+    for shift in range(-band, band + 1):
+      j = steps + shift
+      valid = (j >= 0) & (j < c)
+      upper[:, valid] = np.maximum(upper[:, valid], y[:, j[valid]])
+      lower[:, valid] = np.minimum(lower[:, valid], y[:, j[valid]])
+  return float(np.sum(_lowerBoundDistances[localDistance](x - np.clip(x, lower, upper))))
+
+def _accumulatedCost(cost, window=None, cutoff=None):
+  """
+    Fills the accumulated cost matrix of the DTW. The cells of an anti-diagonal (i+j constant) only
+    depend on the two previous anti-diagonals, so each anti-diagonal is computed at once
+    @ In, cost, numpy.ndarray, local cost matrix, shape (numStepsX, numStepsY)
+    @ In, window, int, optional, the half width of the Sakoe-Chiba band (the cells outside are not computed)
+    @ In, cutoff, float, optional, the calculation is abandoned as soon as the distance is known to be above it
+    @ Out, accumulated, numpy.ndarray, accumulated cost matrix, shape (numStepsX+1, numStepsY+1), the first
+      row and column are the boundary conditions
+    @ Out, value, float, the DTW distance (if the calculation is abandoned, a lower bound above the cutoff)
+  """
+  r, c = cost.shape
+  band = _bandWidth(window, r, c)
+  accumulated = np.full((r + 1, c + 1), np.inf)
+  accumulated[0, 0] = 0.0
+  previousMin = np.inf
+  for diagonal in range(r + c - 1):
+    first, last = max(0, diagonal - c + 1), min(r - 1, diagonal)
+    if band is not None:
+      # |i - j| = |2i - diagonal| <= band
+      first, last = max(first, (diagonal - band + 1) // 2), min(last, (diagonal + band) // 2)
+    i = np.arange(first, last + 1)
+    j = diagonal - i
+    accumulated[i + 1, j + 1] = cost[i, j] + np.minimum(np.minimum(accumulated[i, j], accumulated[i, j + 1]), accumulated[i + 1, j])
+    if cutoff is not None:
+      # any warping path crosses one of two consecutive anti-diagonals, and the accumulated cost never decreases along it
+      currentMin = np.amin(accumulated[i + 1, j + 1]) if len(i) > 0 else np.inf
+      if min(previousMin, currentMin) > cutoff:
+        return accumulated, min(previousMin, currentMin)
+      previousMin = currentMin
+  return accumulated, accumulated[r, c]
+
+def _dtw(x, y, localDistance, window=None, cutoff=None):
+  """
+    Computes the DTW distance between two histories
+    @ In, x, numpy.ndarray, data matrix for x, shape (numParameters, numStepsX)
+    @ In, y, numpy.ndarray, data matrix for y, shape (numParameters, numStepsY)
+    @ In, localDistance, str, the local distance (any of the scipy pairwise distances)
+    @ In, window, int, optional, the half width of the Sakoe-Chiba band
+    @ In, cutoff, float, optional, the distances above it are not computed exactly (a lower bound
+      above the cutoff is returned instead)
+    @ Out, accumulated, numpy.ndarray, accumulated cost matrix (None if pruned by the lower bound)
+    @ Out, value, float, the DTW distance
+  """
+  if cutoff is not None and localDistance in _lowerBoundDistances:
+    bound = _lbKeogh(x, y, localDistance, window)
+    if bound > cutoff:
+      return None, bound
+  cost = spatialDistance.cdist(x.T, y.T, metric=localDistance)
+  return _accumulatedCost(cost, window, cutoff)
+
+def _pairwiseDistances(histories, others, pairs, localDistance, window=None, cutoff=None):
+  """
+    Computes the DTW distances between the given pairs of histories (it can run in a worker process)
+    @ In, histories, list, list of data matrices, shape (numParameters, numSteps)
+    @ In, others, list, list of data matrices, shape (numParameters, numSteps)
+    @ In, pairs, list, list of tuples (index in histories, index in others)
+    @ In, localDistance, str, the local distance
+    @ In, window, int, optional, the half width of the Sakoe-Chiba band
+    @ In, cutoff, float, optional, the cutoff distance
+    @ Out, values, list, the DTW distances of the pairs
+  """
+  return [_dtw(histories[i], others[j], localDistance, window, cutoff)[1] for i, j in pairs]
+
 class DTW(MetricInterface):
   """
     Dynamic Time Warping Metric
@@ -46,6 +154,9 @@ class DTW(MetricInterface):
     orderInputType = InputTypes.makeEnumType("order","orderType",["0","1"])
     inputSpecification.addSub(InputData.parameterInputFactory("order",contentType=orderInputType),quantity=InputData.Quantity.one)
     inputSpecification.addSub(InputData.parameterInputFactory("localDistance",contentType=InputTypes.StringType),quantity=InputData.Quantity.one)
+    inputSpecification.addSub(InputData.parameterInputFactory("window",contentType=InputTypes.IntegerType),quantity=InputData.Quantity.zero_to_one)
+    inputSpecification.addSub(InputData.parameterInputFactory("cutoff",contentType=InputTypes.FloatType),quantity=InputData.Quantity.zero_to_one)
+    inputSpecification.addSub(InputData.parameterInputFactory("workers",contentType=InputTypes.IntegerType),quantity=InputData.Quantity.zero_to_one)
     return inputSpecification
 
   def __init__(self):
@@ -60,6 +171,12 @@ class DTW(MetricInterface):
     # the ID of distance function to be employed to determine the local distance evaluation of two time series
     # Available options are provided by scipy pairwise distances, i.e. cityblock, cosine, euclidean, manhattan.
     self.localDistance = None
+    # half width (number of time steps) of the Sakoe-Chiba band constraining the warping path, None if not constrained
+    self.window = None
+    # the distances above the cutoff are not computed exactly (pruned by LB_Keogh or abandoned), None if no pruning
+    self.cutoff = None
+    # number of processes computing the pairwise distances among histories
+    self.workers = 1
     # True indicates the metric needs to be able to handle dynamic data
     self._dynamicHandling = True
     # True indicates the metric needs to be able to handle pairwise data
@@ -77,6 +194,16 @@ class DTW(MetricInterface):
         self.order = int(child.value)
       elif child.getName() == "localDistance":
         self.localDistance = child.value
+      elif child.getName() == "window":
+        self.window = child.value
+        if self.window < 0:
+          self.raiseAnError(IOError, 'The "window" of the DTW metric', self.name, 'must be a non-negative integer!')
+      elif child.getName() == "cutoff":
+        self.cutoff = child.value
+      elif child.getName() == "workers":
+        self.workers = child.value
+        if self.workers < 1:
+          self.raiseAnError(IOError, 'The number of "workers" of the DTW metric', self.name, 'must be a positive integer!')
 
   def run(self, x, y, weights=None, axis=0, **kwargs):
     """
@@ -114,47 +241,87 @@ class DTW(MetricInterface):
       tempX = tempX.reshape(1,-1)
     if len(tempY.shape) == 1:
       tempY = tempY.reshape(1,-1)
-    X = np.empty(tempX.shape)
-    Y = np.empty(tempY.shape)
-    for index in range(len(tempX)):
-      if self.order == 1:
-        X[index] = np.gradient(tempX[index])
-        Y[index] = np.gradient(tempY[index])
-      else:
-        X[index] = tempX[index]
-        Y[index] = tempY[index]
+    X = self._derive(tempX)
+    Y = self._derive(tempY)
     value = self.dtwDistance(X, Y)
     return value
 
-  def dtwDistance(self, x, y):
+  def evaluatePairwise(self, x, y=None):
+    """
+      This method computes the DTW distance between each pair of histories of two stacks of histories.
+      The pairs are shared among self.workers processes.
+      @ In, x, list, stack of histories, i.e. list of numpy.ndarray with shape (numParameters, numSteps),
+        the number of steps can be different for each history
+      @ In, y, list, optional, stack of histories, if not provided the distances among the histories
+        of x are computed
+      @ Out, distances, numpy.ndarray, 2D array with shape (len(x), len(y)), or (len(x), len(x))
+        if y is not provided
+    """
+    histories = [self._derive(np.atleast_2d(history)) for history in x]
+    if y is None:
+      others = histories
+      # the distance is symmetric
+      pairs = [(i, j) for i in range(len(histories)) for j in range(i, len(histories))]
+    else:
+      others = [self._derive(np.atleast_2d(history)) for history in y]
+      pairs = [(i, j) for i in range(len(histories)) for j in range(len(others))]
+    numWorkers = min(self.workers, len(pairs))
+    if numWorkers > 1:
+      from Runners import ProcessPool
+      self.raiseADebug('Computing {} DTW distances with {} processes'.format(len(pairs), numWorkers))
+      # interleaved chunks balance the work when the histories have different lengths
+      chunks = [pairs[k::numWorkers] for k in range(numWorkers)]
+      pool = ProcessPool(numWorkers)
+      try:
+        jobs = [pool.submit(_pairwiseDistances, [histories, others, chunk, self.localDistance, self.window, self.cutoff]) for chunk in chunks]
+        values = [None] * len(pairs)
+        for k, job in enumerate(jobs):
+          values[k::numWorkers] = job.result()
+      finally:
+        pool.shutdown()
+    else:
+      values = _pairwiseDistances(histories, others, pairs, self.localDistance, self.window, self.cutoff)
+    distances = np.zeros((len(histories), len(others)))
+    for (i, j), value in zip(pairs, values):
+      distances[i, j] = value
+      if y is None:
+        distances[j, i] = value
+    return distances
+
+  def _derive(self, x):
+    """
+      This method returns the data the distance is computed on, i.e. the histories for the classical DTW
+      and their derivatives for the derivative DTW
+      @ In, x, numpy.ndarray, data matrix, shape (numParameters, numSteps)
+      @ Out, X, numpy.ndarray, data matrix, shape (numParameters, numSteps)
+    """
+    if self.order != 1:
+      return x
+    X = np.empty(x.shape)
+    for index in range(len(x)):
+      X[index] = np.gradient(x[index])
+    return X
+
+  def dtwDistance(self, x, y, returnPath=False):
     """
       This method actually calculates the distance between two histories x and y
       @ In, x, numpy.ndarray, data matrix for x
       @ In, y, numpy.ndarray, data matrix for y
+      @ In, returnPath, bool, optional, True to return the warping path too
       @ Out, value, float, distance between x and y
+      @ Out, path, tuple, (p, q) indices of the warping path along x and y (only if returnPath), None
+        if the distance is above the cutoff
     """
-    r, c = len(x[0,:]), len(y[0,:])
-    D0 = np.zeros((r + 1, c + 1))
-    D0[0, 1:] = np.inf
-    D0[1:, 0] = np.inf
-    D1 = D0[1:, 1:]
-    D1 = spatialDistance.cdist(x.T,y.T, metric=self.localDistance)
-    C = D1.copy()
-    for i in range(r):
-      for j in range(c):
-        D1[i, j] += min(D0[i, j], D0[i, j+1], D0[i+1, j])
-    if len(x)==1:
-      path = np.zeros(len(y)), range(len(y))
-    elif len(y) == 1:
-      path = range(len(x)), np.zeros(len(x))
-    else:
-      path = self.tracePath(D0)
-    return D1[-1, -1]
+    accumulated, value = _dtw(x, y, self.localDistance, self.window, self.cutoff)
+    if not returnPath:
+      return value
+    path = self.tracePath(accumulated) if accumulated is not None and accumulated[-1, -1] == value else None
+    return value, path
 
   def tracePath(self, D):
     """
-      This method calculate the time warping path given a local distance matrix D
-      @ In, D,  numpy.ndarray (2D), local distance matrix D
+      This method calculate the time warping path given an accumulated cost matrix D
+      @ In, D,  numpy.ndarray (2D), accumulated cost matrix D, with the boundary conditions in the first row and column
       @ Out, p, numpy.ndarray (1D), path along horizontal direction
       @ Out, q, numpy.ndarray (1D), path along vertical direction
     """
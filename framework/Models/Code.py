@@ -358,7 +358,8 @@ class Code(Model):
       @ Out, createNewInput, tuple, return the new input in a tuple form
     """
     found = False
-    newInputSet = copy.deepcopy(currentInput)
+    # the File objects only hold strings, a shallow copy is enough to relocate them
+    newInputSet = [copy.copy(inputFile) for inputFile in currentInput]
 
     #TODO FIXME I don't think the extensions are the right way to classify files anymore, with the new Files
     #  objects.  However, this might require some updating of many Code Interfaces as well.
@@ -383,7 +384,10 @@ class Code(Model):
         os.makedirs(subSubDirectory)
       ##########################################################################
       newInputSet[index].setPath(subSubDirectory)
-      shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      if 'canLinkInputFile' in dir(self.code) and self.code.canLinkInputFile(newInputSet[index]):
+        self._linkFile(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      else:
+        shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
 
     kwargs['subDirectory'] = subDirectory
     kwargs['alias'] = self.alias
@@ -398,6 +402,26 @@ class Code(Model):
 
     return (newInput,kwargs)
 
+  @staticmethod
+  def _linkFile(source, directory):
+    """
+      Links a file into a directory, instead of copying it. A hard link is used if possible,
+      a symbolic link otherwise; the file is copied if neither is available (e.g. on some Windows file systems).
+      @ In, source, string, the absolute path of the file to link
+      @ In, directory, string, the directory where the link is created
+      @ Out, None
+    """
+    destination = os.path.join(directory, os.path.basename(source))
+    if os.path.lexists(destination):
+      os.remove(destination)
+    try:
+      os.link(source, destination)
+    except (OSError, AttributeError):
+      try:
+        os.symlink(source, destination)
+      except (OSError, AttributeError, NotImplementedError):
+        shutil.copy(source, destination)
+
   def _expandCommand(self, origCommand):
     """
       Function to expand a command from string to list.
@@ -753,22 +777,31 @@ class Code(Model):
       @ In, options, dict, optional, dictionary of options that can be passed in when the collect of the output is performed by another model (e.g. EnsembleModel)
       @ Out, None
     """
-    evaluation = finishedJob.getEvaluation()
+    self.collectOutputs([finishedJob], output)
 
-    self._replaceVariablesNamesWithAliasSystem(evaluation, 'input',True)
-    # in the event a batch is run, the evaluations will be a dict as {'RAVEN_isBatch':True, 'realizations': [...]}
-    if evaluation.get('RAVEN_isBatch',False):
-      for rlz in evaluation['realizations']:
-        output.addRealization(rlz)
-    # otherwise, we received a single realization
-    else:
-      output.addRealization(evaluation)
+  def collectOutputs(self,finishedJobs,output):
+    """
+      Method that collects the outputs from a batch of runs that have just finished.
+      The realizations are stored in the output all at once.
+      @ In, finishedJobs, list, list of InternalRunner objects, instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    realizations = []
+    for finishedJob in finishedJobs:
+      evaluation = finishedJob.getEvaluation()
+      self._replaceVariablesNamesWithAliasSystem(evaluation, 'input',True)
+      # in the event a batch is run, the evaluations will be a dict as {'RAVEN_isBatch':True, 'realizations': [...]}
+      if evaluation.get('RAVEN_isBatch',False):
+        realizations.extend(evaluation['realizations'])
+      # otherwise, we received a single realization
+      else:
+        realizations.append(evaluation)
+    output.addRealizations(realizations)
 
     ##TODO How to handle restart?
     ##TODO How to handle collectOutputFromDataObject
 
-    return
-
   ###################################################################################
   ## THIS METHOD NEEDS TO BE REWORKED WHEN THE NEW DATAOBJECT STRUCURE IS IN PLACE ##
   ###################################################################################
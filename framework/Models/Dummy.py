@@ -151,6 +151,33 @@ class Dummy(Model):
       pass
     return [(inputDict)],copy.deepcopy(kwargs)
 
+  def _createBlockInput(self, myInput, blockInfo):
+    """
+      Builds the input of a block of samples (see Model.submitBlock) in columnar form.
+      The variables that are not sampled come from the step input and are the same for all the samples.
+      @ In, myInput, list, the inputs (list) to start from to generate the new ones
+      @ In, blockInfo, list(dict), the information coming from the sampler for each sample of the block
+      @ Out, inRun, dict, {var: np.array} the model input, one entry per sample (model variable names)
+      @ Out, sampled, dict, {var: np.array} the sampled variables, one entry per sample (framework variable names)
+    """
+    if len(myInput)>1:
+      self.raiseAnError(IOError,'Only one input is accepted by the model type '+self.type+' with name '+self.name)
+    numSamples = len(blockInfo)
+    sampled = dict((var, np.concatenate(list(np.atleast_1d(info['SampledVars'][var]) for info in blockInfo)))
+                   for var in blockInfo[0]['SampledVars'])
+    inRun = self._inputToInternal(myInput[0])
+    self._replaceVariablesNamesWithAliasSystem(inRun,'input',False)
+    sampledModel = dict(sampled)
+    self._replaceVariablesNamesWithAliasSystem(sampledModel,'input',False)
+    missing = list(var for var,val in inRun.items() if val is None and var not in sampledModel)
+    if len(missing) != 0:
+      self.raiseAnError(IOError,'Input values for variables {} not found while preparing the input for model "{}"!'.format(missing,self.name))
+    for var, val in inRun.items():
+      if var not in sampledModel:
+        inRun[var] = np.repeat(np.atleast_1d(val)[-1:], numSamples)
+    inRun.update(sampledModel)
+    return inRun, sampled
+
   @Parallel()
   def evaluateSample(self, myInput, samplerType, kwargs):
     """
@@ -191,9 +218,29 @@ class Dummy(Model):
     result = finishedJob.getEvaluation()
     # alias system
     self._replaceVariablesNamesWithAliasSystem(result,'output',True)
-    output.addRealization(result)
+    if (finishedJob.getMetadata() or {}).get('blockSize') is not None:
+      # a block of samples evaluated in one job (see submitBlock), stored all at once
+      self._addBlockToOutput(result, output)
+    else:
+      output.addRealization(result)
     # END can be abstracted to base class
 
+  def collectOutputs(self,finishedJobs,output):
+    """
+      Method that collects the outputs from a batch of runs that have just finished.
+      The realizations are stored in the output all at once.
+      @ In, finishedJobs, list, list of InternalRunner objects, instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    results = []
+    for finishedJob in finishedJobs:
+      result = finishedJob.getEvaluation()
+      # alias system
+      self._replaceVariablesNamesWithAliasSystem(result,'output',True)
+      results.append(result)
+    output.addRealizations(results)
+
   def collectOutputFromDict(self,exportDict,output,options=None):
     """
       Collect results from a dictionary
@@ -78,9 +78,13 @@ class EnsembleModel(Dummy):
     self.localTargetEvaluations = {}                    # temporary storage of target evaluation data objects
     self.maxIterations          = 30                    # max number of iterations (in case of non-linear system activated)
     self.convergenceTol         = 1.e-3                 # tolerance of the iteration scheme (if activated) => L2 norm
+    self.acceleration           = 'none'                # convergence accelerator of the iteration scheme (none, aitken or anderson)
+    self.accelerationDepth      = 5                     # number of previous iterations used by the Anderson's mixing
+    self.picardFeedbackVars     = OrderedDict()         # variables closing the loops {'varName':modelName using it}
     self.initialConditions      = {}                    # dictionary of initial conditions in case non-linear system is detected
     self.initialStartModels     = []                    # list of models that will execute first.
     self.ensembleModelGraph     = None                  # graph object (graphStructure.graphObject)
+    self.modelDependencies      = {}                    # models each model relies on ({'modelName':[modelName1,modelName2,..]})
     self.printTag               = 'EnsembleModel MODEL' # print tag
     self.parallelStrategy = 1                           # parallel strategy [1=MPI like (internalParallel), 2=threads]
     self.runInfoDict = None                             # dictionary containing run info in case of parallelStrategy=2
@@ -153,6 +157,14 @@ class EnsembleModel(Dummy):
         self.maxIterations  = int(child.text)
       elif child.tag == 'tolerance':
         self.convergenceTol = float(child.text)
+      elif child.tag == 'acceleration':
+        self.acceleration = child.text.strip().lower()
+        if self.acceleration not in ['none', 'aitken', 'anderson']:
+          self.raiseAnError(IOError, 'Unknown acceleration "'+child.text.strip()+'". Available are "none", "aitken" and "anderson"!')
+        if 'depth' in child.attrib:
+          self.accelerationDepth = int(child.attrib['depth'])
+          if self.accelerationDepth < 1:
+            self.raiseAnError(IOError, 'The "depth" of the acceleration must be a positive integer!')
       elif child.tag == 'initialStartModels':
         self.initialStartModels = list(inp.strip() for inp in child.text.strip().split(','))
       elif child.tag == 'initialConditions':
@@ -268,8 +280,8 @@ class EnsembleModel(Dummy):
       # assert acceptable TargetEvaluation types are used
       if targetEvaluation.type not in ['PointSet','HistorySet','DataSet']:
         self.raiseAnError(IOError, "Only DataObjects are allowed as TargetEvaluation object. Got "+ str(targetEvaluation.type)+"!")
-      # localTargetEvaluations are for passing data and then resetting, not keeping data between samples
-      self.localTargetEvaluations[modelName] = copy.deepcopy(targetEvaluation)
+      # localTargetEvaluations are the templates of the (empty) containers used for passing data in each sample
+      self.localTargetEvaluations[modelName] = targetEvaluation.emptyClone()
       # get input variables
       inps   = targetEvaluation.getVars('input')
       # get pivot parameters in input space if any and add it in the 'Input' list
@@ -340,6 +352,18 @@ class EnsembleModel(Dummy):
         self.raiseAnError(IOError, "The 'initialStartModels' xml node is missing, this is required siince the Picard's iteration is activated!")
       if len(self.initialConditions.keys()) == 0:
         self.raiseAnError(IOError,"Picard's iterations mode activated but no intial conditions provided!")
+      # the variables closing the loops are the inputs computed by the model itself or by a model executed later,
+      # i.e. the ones the convergence accelerator works on
+      self.picardFeedbackVars = OrderedDict()
+      for modelCnt, modelIn in enumerate(self.orderList):
+        laterOutputs = set(itertools.chain.from_iterable(self.modelsDictionary[model]['Output'] for model in self.orderList[modelCnt:]))
+        for var in self.modelsDictionary[modelIn]['Input']:
+          if var in laterOutputs and var not in self.picardFeedbackVars:
+            self.picardFeedbackVars[var] = modelIn
+      if self.acceleration != 'none':
+        self.raiseAMessage("Picard's iterations accelerated with the "+self.acceleration+" scheme on the variables: "+
+                           ', '.join(self.picardFeedbackVars.keys()))
+      self.addMetaKeys(['PicardIterations', 'PicardIterationsSaved'])
     else:
       if len(self.initialStartModels) !=0:
         self.raiseAnError(IOError, "The 'initialStartModels' xml node is not needed for non-Picard calculations, since the running sequence can be automatically determined by the code! Please delete this node to avoid a mistake.")
@@ -353,6 +377,12 @@ class EnsembleModel(Dummy):
           if self.orderList.index(source) >= indexModelIn:
             self.raiseAnError(IOError, 'In model "'+modelIn+'" the "metadataToTransfer" named "'+metadataToGet+
                                        '" is linked to the source"'+source+'" that will be executed after this model.')
+    # models each model relies on (the ones providing its inputs or its metadata), the others can run at the same time
+    self.modelDependencies = self.ensembleModelGraph.findPredecessors()
+    for modelIn in self.modelsDictionary.keys():
+      for _, source, _ in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+        if source not in self.modelDependencies[modelIn]:
+          self.modelDependencies[modelIn].append(source)
     self.needToCheckInputs = True
     # write debug statements
     self.raiseADebug("Specs of Graph Network represented by EnsembleModel:")
@@ -480,6 +510,16 @@ class EnsembleModel(Dummy):
       # collect optional output if present and not already collected
       output.addRealization(optionalOutputs[optionalOutputNames[output.name]])
 
+  def collectOutputs(self,finishedJobs,output):
+    """
+      Method that collects the outputs from a batch of runs that have just finished, one run at a time
+      @ In, finishedJobs, list, list of ClientRunner objects, instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    for finishedJob in finishedJobs:
+      self.collectOutput(finishedJob, output)
+
   def getAdditionalInputEdits(self,inputInfo):
     """
       Collects additional edits for the sampler to use when creating a new input. In this case, it calls all the getAdditionalInputEdits methods
@@ -579,77 +619,35 @@ class EnsembleModel(Dummy):
     inRunTargetEvaluations = {}
 
     for modelIn in self.orderList:
-      # reset the DataObject for the projection
-      self.localTargetEvaluations[modelIn].reset()
-      # deepcopy assures distinct copies
-      inRunTargetEvaluations[modelIn] = copy.deepcopy(self.localTargetEvaluations[modelIn])
-    residueContainer = dict.fromkeys(self.modelsDictionary.keys())
+      # empty containers for the projection, distinct for each sample
+      inRunTargetEvaluations[modelIn] = self.localTargetEvaluations[modelIn].emptyClone()
+
+    if not self.activatePicard and jobHandler is not None:
+      # linear system, the models that do not depend on each other run at the same time
+      returnDict, tempOutputs = self.__advanceModelsConcurrently(identifier, originalInput, inputKwargs,
+                                                                 inRunTargetEvaluations, samplerType, jobHandler)
+      returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
+      return returnEvaluation
+
     gotOutputs       = [{}]*len(self.orderList)
     typeOutputs      = ['']*len(self.orderList)
-
-    # if nonlinear system, initialize residue container
-    if self.activatePicard:
-      for modelIn in self.orderList:
-        residueContainer[modelIn] = {'residue':{},'iterValues':[{}]*2}
-        for out in self.modelsDictionary[modelIn]['Output']:
-          residueContainer[modelIn]['residue'][out] = np.zeros(1)
-          residueContainer[modelIn]['iterValues'][0][out] = np.zeros(1)
-          residueContainer[modelIn]['iterValues'][1][out] = np.zeros(1)
+    # if nonlinear system, outputs of each model at the previous iteration ({modelName:{var:values}})
+    # and the history of the iterations used by the convergence accelerator
+    previousOutputs  = dict((modelIn, {}) for modelIn in self.orderList)
+    picardHistory    = {'norms':[], 'residues':[], 'iterates':[], 'images':[], 'relaxation':1.0}
 
     maxIterations = self.maxIterations if self.activatePicard else 1
     iterationCount = 0
     while iterationCount < maxIterations:
       returnDict     = {}
       iterationCount += 1
+      squaredResidue = 0.0
 
       if self.activatePicard:
         self.raiseAMessage("Picard's Iteration "+ str(iterationCount))
 
       for modelCnt, modelIn in enumerate(self.orderList):
-        # clear the model's Target Evaluation data object
-        # in case there are metadataToTransfer, let's collect them from the source
-        metadataToTransfer = None
-        if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          metadataToTransfer = {}
-        for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          if metadataToGet in returnDict[source]['general_metadata']:
-            metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          elif metadataToGet in returnDict[source]['response']:
-            metaDataValue = returnDict[source]['response'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          else:
-            self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
-        # get dependent outputs
-        dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
-        # if nonlinear system, check for initial coditions
-        if iterationCount == 1  and self.activatePicard:
-          sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
-          conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
-          for initialConditionToSet in conditionsToCheck:
-            if initialConditionToSet in self.initialConditions.keys():
-              dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
-            else:
-              self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
-        # set new identifiers
-        inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
-        inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
-        if metadataToTransfer is not None:
-          inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
-
-        for key, value in dependentOutput.items():
-          inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
-          ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
-          ## Who has this information? -- DPM 4/11/17
-          inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
-        ## FIXME: this will come after we rework the "runInfo" collection in the code
-        ## if run info is present, we need to pass to to kwargs
-        ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
-        ##  inputKwargs[modelIn].update(self.runInfoDict)
+        self.__setModelInput(modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, iterationCount)
 
         retDict, gotOuts, evaluation = self.__advanceModel(identifier, self.modelsDictionary[modelIn],
                                                         originalInput[modelIn], inputKwargs[modelIn],
@@ -661,37 +659,222 @@ class EnsembleModel(Dummy):
         gotOutputs[modelCnt] =  gotOuts
         tempOutputs[modelIn] = evaluation
 
-        # if nonlinear system, compute the residue
-        ## it looks like this is handling _indexMap, but it's not clear since there's not a way to test it (yet).
+        # if nonlinear system, accumulate the residue (difference with respect to the previous iteration,
+        # or to zero at the first iteration)
         if self.activatePicard:
-          residueContainer[modelIn]['iterValues'][1] = copy.copy(residueContainer[modelIn]['iterValues'][0])
-          for out in  inRunTargetEvaluations[modelIn].getVars("output"):
-            residueContainer[modelIn]['iterValues'][0][out] = copy.copy(gotOutputs[modelCnt][out])
-            if iterationCount == 1:
-              residueContainer[modelIn]['iterValues'][1][out] = np.zeros(len(residueContainer[modelIn]['iterValues'][0][out]))
-          for out in gotOutputs[modelCnt].keys():
-            residueContainer[modelIn]['residue'][out] = abs(np.asarray(residueContainer[modelIn]['iterValues'][0][out]) - np.asarray(residueContainer[modelIn]['iterValues'][1][out]))
-          residueContainer[modelIn]['Norm'] =  np.linalg.norm(np.asarray(list(residueContainer[modelIn]['iterValues'][1].values()))-np.asarray(list(residueContainer[modelIn]['iterValues'][0].values())))
+          for out in inRunTargetEvaluations[modelIn].getVars("output"):
+            newValues = np.asarray(gotOuts[out])
+            oldValues = previousOutputs[modelIn].get(out, 0.0)
+            squaredResidue += np.sum((newValues - oldValues)**2)
+            previousOutputs[modelIn][out] = newValues
 
       # if nonlinear system, check the total residue and convergence
       if self.activatePicard:
-        iterZero = []
-        iterOne = []
-        for modelIn in self.orderList:
-          iterZero += residueContainer[modelIn]['iterValues'][0].values()
-          iterOne  += residueContainer[modelIn]['iterValues'][1].values()
-        residueContainer['TotalResidue'] = np.linalg.norm(np.asarray(iterOne)-np.asarray(iterZero))
-        self.raiseAMessage("Picard's Iteration Norm: "+ str(residueContainer['TotalResidue']))
-        residualPass = residueContainer['TotalResidue'] <= self.convergenceTol
-        # sometimes there can be multiple residual values
-        if hasattr(residualPass,'__len__'):
-          residualPass = all(residualPass)
-        if residualPass:
-          self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(residueContainer['TotalResidue']))
+        totalResidue = np.sqrt(squaredResidue)
+        picardHistory['norms'].append(totalResidue)
+        self.raiseAMessage("Picard's Iteration Norm: "+ str(totalResidue))
+        if totalResidue <= self.convergenceTol:
+          self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(totalResidue))
           break
+        if self.acceleration != 'none' and iterationCount < maxIterations:
+          self.__accelerateIteration(inputKwargs, gotOutputs, picardHistory)
+
+    if self.activatePicard:
+      picardMeta = {'PicardIterations':np.atleast_1d(iterationCount),
+                    'PicardIterationsSaved':np.atleast_1d(self.__estimateIterationsSaved(picardHistory, iterationCount))}
+      self.raiseADebug("Picard's Iterations performed: {}, estimated iterations saved by the acceleration: {}"
+                       .format(iterationCount, picardMeta['PicardIterationsSaved'][0]))
+      for modelIn in self.orderList:
+        returnDict[modelIn]['response'].update(picardMeta)
+        tempOutputs[modelIn].update(picardMeta)
     returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
     return returnEvaluation
 
+  def __accelerateIteration(self, inputKwargs, gotOutputs, picardHistory):
+    """
+      Method aimed to accelerate the convergence of the Picard's iterations. The values of the variables closing
+      the loops (self.picardFeedbackVars) for the next iteration are computed from the ones used in the current
+      iteration (iterate) and the ones it produced (image), with the Aitken's dynamic relaxation or the Anderson's mixing.
+      The gotOutputs are updated with the new values, so that the models of the next iteration get them.
+      @ In, inputKwargs, dict, the kwargs of each model ({modelName:dict of kwargs})
+      @ In, gotOutputs, list, list of dictionary outputs of the models, in the order of self.orderList
+      @ In, picardHistory, dict, the history of the iterations, updated here
+      @ Out, None
+    """
+    if not self.picardFeedbackVars:
+      return
+    iterate, image, shapes = [], [], []
+    for var, consumer in self.picardFeedbackVars.items():
+      # the last model computing the variable provides its value (as in __retrieveDependentOutput)
+      produced = [outputs[var] for outputs in gotOutputs if var in outputs][-1]
+      produced = np.atleast_1d(np.asarray(produced, dtype=float))
+      # the sampled variables of the consumer have already been renamed with the alias system
+      used = inputKwargs[consumer]['SampledVars'].get(self.alias['input'].get(var, var), produced)
+      used = np.atleast_1d(np.asarray(used, dtype=float))
+      iterate.append(used.ravel())
+      image.append(produced.ravel())
+      shapes.append(produced.shape)
+    iterate = np.concatenate(iterate)
+    image = np.concatenate(image)
+    residue = image - iterate
+    picardHistory['residues'].append(np.linalg.norm(residue))
+    if self.acceleration == 'aitken':
+      # Aitken's dynamic relaxation: x_{k+1} = x_k + w_k r_k, w_k = -w_{k-1} r_{k-1}.(r_k - r_{k-1})/|r_k - r_{k-1}|^2
+      if picardHistory['iterates']:
+        previousResidue = picardHistory['images'][-1] - picardHistory['iterates'][-1]
+        deltaResidue = residue - previousResidue
+        denominator = deltaResidue.dot(deltaResidue)
+        if denominator > 0.0:
+          picardHistory['relaxation'] = -picardHistory['relaxation'] * previousResidue.dot(deltaResidue) / denominator
+      picardHistory['iterates'] = [iterate]
+      picardHistory['images'] = [image]
+      newIterate = iterate + picardHistory['relaxation'] * residue
+    else:
+      # Anderson's mixing: x_{k+1} = g_k - dG gamma, gamma minimizing |r_k - dR gamma| over the last "depth" differences
+      picardHistory['iterates'] = (picardHistory['iterates'] + [iterate])[-(self.accelerationDepth + 1):]
+      picardHistory['images'] = (picardHistory['images'] + [image])[-(self.accelerationDepth + 1):]
+      if len(picardHistory['iterates']) > 1:
+        residues = np.column_stack(picardHistory['images']) - np.column_stack(picardHistory['iterates'])
+        deltaResidues = np.diff(residues, axis=1)
+        deltaImages = np.diff(np.column_stack(picardHistory['images']), axis=1)
+        gamma = np.linalg.lstsq(deltaResidues, residue, rcond=None)[0]
+        newIterate = image - deltaImages.dot(gamma)
+      else:
+        newIterate = image
+    # set the new values as outputs of the models computing them
+    start = 0
+    for (var, _), shape in zip(self.picardFeedbackVars.items(), shapes):
+      size = int(np.prod(shape))
+      newValues = newIterate[start:start + size].reshape(shape)
+      start += size
+      for outputs in gotOutputs:
+        if var in outputs:
+          outputs[var] = newValues
+
+  def __estimateIterationsSaved(self, picardHistory, iterationCount):
+    """
+      Method to estimate the number of Picard's iterations saved by the acceleration. The first two iterations
+      are not accelerated, so the convergence rate of the plain scheme is estimated from their residues and the
+      number of iterations it would require to reach the tolerance is extrapolated (linear convergence).
+      @ In, picardHistory, dict, the history of the iterations
+      @ In, iterationCount, int, the number of iterations performed
+      @ Out, saved, int, the estimated number of iterations saved
+    """
+    if self.acceleration == 'none' or len(picardHistory['residues']) < 2 or picardHistory['residues'][0] == 0.0:
+      return 0
+    rate = picardHistory['residues'][1] / picardHistory['residues'][0]
+    if rate >= 1.0:
+      # the plain scheme would not converge
+      plainIterations = self.maxIterations
+    elif rate == 0.0:
+      plainIterations = 3
+    else:
+      # the norm at the iteration k of the plain scheme is about norm_2 * rate^(k-2)
+      plainIterations = 2 + int(np.ceil(np.log(self.convergenceTol / picardHistory['norms'][1]) / np.log(rate)))
+      plainIterations = min(max(plainIterations, 3), self.maxIterations)
+    return max(0, plainIterations - iterationCount)
+
+  def __advanceModelsConcurrently(self, identifier, originalInput, inputKwargs, inRunTargetEvaluations, samplerType, jobHandler):
+    """
+      Method aimed to advance all the sub-models of a linear system through the jobHandler. Each model is
+      submitted as soon as all the models it depends on are finished, so the ones that are independent
+      of each other run at the same time (the time required by the sample is the one of the longest chain
+      of models and not the sum of all the models)
+      @ In, identifier, str, current job identifier
+      @ In, originalInput, dict, the inputs of each model ({modelName:list of model inputs})
+      @ In, inputKwargs, dict, the kwargs of each model ({modelName:dict of kwargs})
+      @ In, inRunTargetEvaluations, dict, the target evaluation of each model ({modelName:DataObject})
+      @ In, samplerType, str, sampler Type
+      @ In, jobHandler, jobHandler instance, the jobHandler instance
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluations ({modelName:dict})
+      @ Out, tempOutputs, dict, the evaluation dictionaries with the "unprojected" data ({modelName:dict})
+    """
+    returnDict  = {}
+    tempOutputs = {}
+    gotOutputs  = [{}]*len(self.orderList)
+    typeOutputs = ['']*len(self.orderList)
+    toSubmit    = list(self.orderList)
+    running     = []
+    while toSubmit or running:
+      # submit the models whose dependencies have been evaluated
+      for modelIn in [model for model in toSubmit if all(dep in returnDict for dep in self.modelDependencies[model])]:
+        toSubmit.remove(modelIn)
+        self.__setModelInput(modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, 1)
+        self.__submitModel(self.modelsDictionary[modelIn], originalInput[modelIn], inputKwargs[modelIn], samplerType, jobHandler)
+        running.append(modelIn)
+      ## wait until at least a model finishes, in order to get ready to run the ones depending on it
+      finished = [modelIn for modelIn in running if jobHandler.isThisJobFinished(modelIn+utils.returnIdSeparator()+identifier)]
+      if not finished:
+        time.sleep(1.e-3)
+        continue
+      for modelIn in finished:
+        running.remove(modelIn)
+        retDict, gotOuts, evaluation = self.__collectModel(identifier, self.modelsDictionary[modelIn],
+                                                        inRunTargetEvaluations[modelIn], 1, jobHandler, running)
+        modelCnt = self.orderList.index(modelIn)
+        returnDict[modelIn] = retDict
+        typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
+        gotOutputs[modelCnt] = gotOuts
+        tempOutputs[modelIn] = evaluation
+    return returnDict, tempOutputs
+
+  def __setModelInput(self, modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, iterationCount):
+    """
+      Method aimed to set the input of a sub-model before advancing it: the outputs of the models it depends on,
+      the metadata to transfer and (at the first Picard's iteration) the initial conditions
+      @ In, modelIn, str, the model name
+      @ In, identifier, str, current job identifier
+      @ In, inputKwargs, dict, the kwargs of each model ({modelName:dict of kwargs}), the one of modelIn is updated here
+      @ In, returnDict, dict, the data extracted from the target evaluations of the models already evaluated ({modelName:dict})
+      @ In, gotOutputs, list, list of dictionary outputs of the models, in the order of self.orderList
+      @ In, typeOutputs, list, list of the target evaluation types of the models, in the order of self.orderList
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, None
+    """
+    # in case there are metadataToTransfer, let's collect them from the source
+    metadataToTransfer = None
+    if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      metadataToTransfer = {}
+    for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      if metadataToGet in returnDict[source]['general_metadata']:
+        metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      elif metadataToGet in returnDict[source]['response']:
+        metaDataValue = returnDict[source]['response'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      else:
+        self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
+    # get dependent outputs
+    dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
+    # if nonlinear system, check for initial coditions
+    if iterationCount == 1  and self.activatePicard:
+      sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
+      conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
+      for initialConditionToSet in conditionsToCheck:
+        if initialConditionToSet in self.initialConditions.keys():
+          dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
+        else:
+          self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
+    # set new identifiers
+    inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
+    inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
+    if metadataToTransfer is not None:
+      inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
+
+    for key, value in dependentOutput.items():
+      inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
+      ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
+      ## Who has this information? -- DPM 4/11/17
+      inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
+    ## FIXME: this will come after we rework the "runInfo" collection in the code
+    ## if run info is present, we need to pass to to kwargs
+    ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
+    ##  inputKwargs[modelIn].update(self.runInfoDict)
+
   def __advanceModel(self, identifier, modelToExecute, origInputList, inputKwargs, inRunTargetEvaluations, samplerType, iterationCount, jobHandler = None):
     """
       This method is aimed to advance the execution of a sub-model and to collect the data using
@@ -708,55 +891,100 @@ class EnsembleModel(Dummy):
       @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
       @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
     """
-    returnDict = {}
-
-    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
-    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
     if self.parallelStrategy == 1:
+      self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
       # we evaluate the model directly
+      excInfo = (None, None, None)
       try:
         evaluation = modelToExecute['Instance'].evaluateSample.original_function(modelToExecute['Instance'], origInputList, samplerType, inputKwargs)
       except Exception as e:
-        excType, excValue, excTrace = sys.exc_info()
-        evaluation = None
-    else:
-      moveOn = False
-      while not moveOn:
-        # run the model
-        inputKwargs.pop("jobHandler", None)
-        modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
-        ## wait until the model finishes, in order to get ready to run the subsequential one
-        while not jobHandler.isThisJobFinished(localIdentifier):
-          time.sleep(1.e-3)
-        moveOn = True
-      # get job that just finished to gather the results
-      finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
-      evaluation = finishedRun[0].getEvaluation()
-      if isinstance(evaluation, rerror):
+        excInfo = sys.exc_info()
         evaluation = None
-        excType, excValue, excTrace = finishedRun.exceptionTrace
-        e = rerror
+      if not evaluation:
         # the model failed
-        for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
-          jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
-      else:
-        # collect the target evaluation
-        modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
-
-    if not evaluation:
-      # the model failed
-      import traceback
-      msg = io.StringIO()
-      traceback.print_exception(excType, excValue, excTrace, limit=10, file=msg)
-      msg = msg.getvalue().replace('\n', '\n        ')
-      self.raiseAnError(RuntimeError, f'The Model "{modelToExecute["Instance"].name}" id "{localIdentifier}" '+
-                        f'failed! Trace:\n{"*"*72}\n{msg}\n{"*"*72}')
-    else:
-      if self.parallelStrategy == 1:
-        inRunTargetEvaluations.addRealization(evaluation)
-      else:
-        modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
+        self.__raiseModelFailure(identifier, modelToExecute, excInfo)
+      inRunTargetEvaluations.addRealization(evaluation)
+      return self.__extractModelResults(identifier, inRunTargetEvaluations, evaluation, iterationCount)
+    # run the model
+    self.__submitModel(modelToExecute, origInputList, inputKwargs, samplerType, jobHandler)
+    ## wait until the model finishes, in order to get ready to run the subsequential one
+    localIdentifier = modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    while not jobHandler.isThisJobFinished(localIdentifier):
+      time.sleep(1.e-3)
+    return self.__collectModel(identifier, modelToExecute, inRunTargetEvaluations, iterationCount, jobHandler)
+
+  def __submitModel(self, modelToExecute, origInputList, inputKwargs, samplerType, jobHandler):
+    """
+      This method is aimed to submit a sub-model to the jobHandler (parallelStrategy == 2)
+      @ In, modelToExecute, super(Model), Model instance than needs to be avanced
+      @ In, origInputList, list, list of model input
+      @ In, inputKwargs, dict, dictionary of kwargs for this model
+      @ In, samplerType, str, sampler Type
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, None
+    """
+    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
+    inputKwargs.pop("jobHandler", None)
+    modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
 
+  def __collectModel(self, identifier, modelToExecute, inRunTargetEvaluations, iterationCount, jobHandler, running=None):
+    """
+      This method is aimed to collect the results of a finished sub-model from the jobHandler (parallelStrategy == 2)
+      @ In, identifier, str, current job identifier
+      @ In, modelToExecute, super(Model), Model instance that has been advanced
+      @ In, inRunTargetEvaluations, DataObject, target evaluation for the model
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ In, running, list, optional, the other models of this sample still running (waited for in case of failure)
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
+      @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
+      @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
+    """
+    # get job that just finished to gather the results
+    localIdentifier = modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
+    evaluation = finishedRun[0].getEvaluation()
+    if isinstance(evaluation, rerror):
+      # the model failed, the other models of this sample are removed from the jobHandler
+      for modelToWait in running or []:
+        while not jobHandler.isThisJobFinished(modelToWait + utils.returnIdSeparator() + identifier):
+          time.sleep(1.e-3)
+      for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
+        jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
+      self.__raiseModelFailure(identifier, modelToExecute, getattr(finishedRun[0], 'exceptionTrace', None) or (None, None, None))
+    # collect the target evaluation
+    modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
+    return self.__extractModelResults(identifier, inRunTargetEvaluations, evaluation, iterationCount)
+
+  def __raiseModelFailure(self, identifier, modelToExecute, excInfo):
+    """
+      This method raises the error for a sub-model that failed, reporting its trace
+      @ In, identifier, str, current job identifier
+      @ In, modelToExecute, super(Model), Model instance that failed
+      @ In, excInfo, tuple, the exception info (type, value, traceback)
+      @ Out, None
+    """
+    import traceback
+    localIdentifier = modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    excType, excValue, excTrace = excInfo
+    msg = io.StringIO()
+    traceback.print_exception(excType, excValue, excTrace, limit=10, file=msg)
+    msg = msg.getvalue().replace('\n', '\n        ')
+    self.raiseAnError(RuntimeError, f'The Model "{modelToExecute["Instance"].name}" id "{localIdentifier}" '+
+                      f'failed! Trace:\n{"*"*72}\n{msg}\n{"*"*72}')
+
+  def __extractModelResults(self, identifier, inRunTargetEvaluations, evaluation, iterationCount):
+    """
+      This method is aimed to extract the results of a sub-model from its target evaluation
+      @ In, identifier, str, current job identifier
+      @ In, inRunTargetEvaluations, DataObject, target evaluation of the model, already filled
+      @ In, evaluation, dict, the evaluation dictinary with the "unprojected" data
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
+      @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
+      @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
+    """
+    returnDict = {}
     ## FIXME: The call asDataset() is unuseful here. It must be done because otherwise the realization(...) method from collector
     ## does not return the indexes values (TO FIX)
     inRunTargetEvaluations.asDataset()
@@ -778,5 +1006,3 @@ class EnsembleModel(Dummy):
     returnDict['general_metadata'] = inRunTargetEvaluations.getMeta(general=True)
 
     return returnDict, gotOutputs, evaluation
-
-
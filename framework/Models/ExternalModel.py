@@ -20,13 +20,13 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 
 #External Modules------------------------------------------------------------------------------------
 import copy
+import keyword
 import numpy as np
 import inspect
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
 from .Dummy import Dummy
-import CustomCommandExecuter
 from utils import utils, InputData, InputTypes, mathUtils
 from Decorators.Parallelization import Parallel
 #Internal Modules End--------------------------------------------------------------------------------
@@ -80,6 +80,7 @@ class ExternalModel(Dummy):
     self._availableVariableTypes = self._availableVariableTypes + ['numpy.'+item for item in self._availableVariableTypes]                   # as above
     self.printTag = 'EXTERNAL MODEL'  # label
     self.initExtSelf = utils.Object() # initial externalizable object
+    self._hasCreateNewInput = False   # True if the external module implements "createNewInput"
     self.workingDir = None            # RAVEN working dir
 
   def applyRunInfo(self, runInfo):
@@ -114,7 +115,7 @@ class ExternalModel(Dummy):
       @ Out, ([(inputDict)],copy.deepcopy(kwargs)), tuple, return the new input in a tuple form
     """
     modelVariableValues = {}
-    if 'createNewInput' in dir(self.sim):
+    if self._hasCreateNewInput:
       if 'SampledVars' in kwargs.keys():
         sampledVars = self._replaceVariablesNamesWithAliasSystem(kwargs['SampledVars'],'input',False)
       extCreateNewInput = self.sim.createNewInput(self.initExtSelf,myInput,samplerType,**kwargs)
@@ -165,6 +166,7 @@ class ExternalModel(Dummy):
     else:
       self.raiseAnError(IOError,'"ModuleToLoad" attribute or "subType" not provided for Model "ExternalModel" named "'+self.name+'"!')
 
+    self._hasCreateNewInput = 'createNewInput' in dir(self.sim)
     # check if there are variables and, in case, load them
     for child in paramInput.subparts:
       if child.getName() =='variable':
@@ -183,60 +185,78 @@ class ExternalModel(Dummy):
     if '_readMoreXML' in dir(self.sim):
       self.sim._readMoreXML(self.initExtSelf,xmlNode)
 
-  def _externalRun(self, Input, modelVariables):
+  @staticmethod
+  def _isSelfMember(key):
     """
-      Method that performs the actual run of the imported external model (separated from run method for parallelization purposes)
-      @ In, Input, list, list of the inputs needed for running the model
+      Checks if a variable name can be used as a member of the "self" of the external module
+      @ In, key, str, the variable name
+      @ Out, isSelfMember, bool, True if "self.<key>" is valid Python
+    """
+    return key.isidentifier() and not keyword.iskeyword(key)
+
+  def _prepareExternalSelf(self, Input, modelVariables):
+    """
+      Builds the "self" of the external module for a run, binding the variables as plain attributes.
+      The values are copied once, so that the external module cannot modify the data they come from.
+      @ In, Input, dict, the inputs needed for running the model
       @ In, modelVariables, dict, the dictionary containing all the External Model variables
-      @ Out, (outcomes,self), tuple, tuple containing the dictionary of the results (pos 0) and the self (pos 1)
+      @ Out, externalSelf, utils.Object, the "self" of the external module
+      @ Out, modelVariableValues, dict, the values of the variables before the run
+      @ Out, InputDict, dict, the inputs passed to the external module
     """
-    externalSelf        = utils.Object()
-    #self.sim=__import__(self.ModuleToLoad)
-    modelVariableValues = {}
-    for key in self.modelVariableType.keys():
-      modelVariableValues[key] = None
+    externalSelf = utils.Object()
+    additionalKeys = ['_indexMap'] if '_indexMap' in Input else []
+    boundKeys = list(self.modelVariableType.keys()) + additionalKeys
+    modelVariableValues = dict.fromkeys(self.modelVariableType, None)
+    modelVariableValues.update(self.initExtSelf.__dict__)
+    for key, value in Input.items():
+      if key in modelVariableValues or key in modelVariables or key in additionalKeys:
+        modelVariableValues[key] = value
+    # the members of the initial "self" not listed as variables keep their values
     for key, value in self.initExtSelf.__dict__.items():
-      CustomCommandExecuter.execCommand('self.'+ key +' = copy.copy(object)',self=externalSelf,object=value)  # exec('externalSelf.'+ key +' = copy.copy(value)')
-      modelVariableValues[key] = copy.copy(value)
-    for key in Input.keys():
-      if key in modelVariableValues.keys():
-        modelVariableValues[key] = copy.copy(Input[key])
-    if 'createNewInput' not in dir(self.sim):
-      InputDict = {}
-    else:
-      InputDict = Input
-    #if 'createNewInput' not in dir(self.sim):
-    additionalKeys = []
-    if '_indexMap' in Input.keys():
-      additionalKeys.append('_indexMap')
-    for key in Input.keys():
-      if key in modelVariables.keys() or key in additionalKeys:
-        modelVariableValues[key] = copy.copy(Input[key])
-    for key in list(self.modelVariableType.keys()) + additionalKeys:
-      # add the variable as a member of "self"
-      try:
-        CustomCommandExecuter.execCommand('self.'+ key +' = copy.copy(object["'+key+'"])',self=externalSelf,object=modelVariableValues) #exec('externalSelf.'+ key +' = copy.copy(modelVariableValues[key])')  #self.__uploadSolution()
+      if key not in boundKeys:
+        setattr(externalSelf, key, copy.copy(value))
+    for key in boundKeys:
       # if variable name is too strange to be a member of "self", then skip it
-      except SyntaxError:
+      if self._isSelfMember(key):
+        setattr(externalSelf, key, copy.copy(modelVariableValues[key]))
+      else:
         self.raiseAWarning('Variable "{}" could not be added to "self" due to complex name.  Find it in "Inputs" dictionary instead.'.format(key))
-    #else:
-    #  InputDict = Input
     # only pass the variables and their values according to the model itself.
+    InputDict = Input if self._hasCreateNewInput else {}
     for key in Input.keys():
-      if key in self.modelVariableType.keys() or key in additionalKeys:
+      if key in self.modelVariableType or key in additionalKeys:
         InputDict[key] = Input[key]
+    return externalSelf, modelVariableValues, InputDict
 
-    self.sim.run(externalSelf, InputDict)
-
+  def _collectExternalSelf(self, externalSelf, modelVariableValues):
+    """
+      Retrieves the variables from the "self" of the external module after a run, and stores
+      back the members of the initial "self"
+      @ In, externalSelf, utils.Object, the "self" of the external module
+      @ In, modelVariableValues, dict, the values of the variables before the run, updated in place
+      @ Out, None
+    """
     for key in self.modelVariableType:
-      try:
-        # Note, the following string can't be converted using {} formatting, at least as far as I can tell.
-        CustomCommandExecuter.execCommand('object["'+key+'"]  = copy.copy(self.'+key+')', self=externalSelf,object=modelVariableValues) #exec('modelVariableValues[key]  = copy.copy(externalSelf.'+key+')') #self.__pointSolution()
-      except (SyntaxError, AttributeError):
+      if self._isSelfMember(key) and hasattr(externalSelf, key):
+        modelVariableValues[key] = getattr(externalSelf, key)
+      else:
         self.raiseAWarning('Variable "{}" cannot be read from "self" due to complex name.  Retaining original value.'.format(key))
     for key in self.initExtSelf.__dict__.keys():
-      # Note, the following string can't be converted using {} formatting, at least as far as I can tell.
-      CustomCommandExecuter.execCommand('self.' +key+' = copy.copy(object.'+key+')', self=self.initExtSelf, object=externalSelf) #exec('self.initExtSelf.' +key+' = copy.copy(externalSelf.'+key+')')
+      setattr(self.initExtSelf, key, copy.copy(getattr(externalSelf, key)))
+
+  def _externalRun(self, Input, modelVariables):
+    """
+      Method that performs the actual run of the imported external model (separated from run method for parallelization purposes)
+      @ In, Input, list, list of the inputs needed for running the model
+      @ In, modelVariables, dict, the dictionary containing all the External Model variables
+      @ Out, (outcomes,self), tuple, tuple containing the dictionary of the results (pos 0) and the self (pos 1)
+    """
+    externalSelf, modelVariableValues, InputDict = self._prepareExternalSelf(Input, modelVariables)
+
+    self.sim.run(externalSelf, InputDict)
+
+    self._collectExternalSelf(externalSelf, modelVariableValues)
     if None in self.modelVariableType.values():
       errorFound = False
       for key in self.modelVariableType:
@@ -262,6 +282,61 @@ class ExternalModel(Dummy):
     outcomes = dict((k, np.atleast_1d(val)) for k, val in outcomes.items())
     return outcomes, self
 
+  def _externalRunBatch(self, Input, numSamples):
+    """
+      Method that performs the run of the imported external model for many samples at once,
+      through the optional "runBatch" method of the external module
+      @ In, Input, dict, {var: np.array} the inputs needed for running the model, one entry per sample
+      @ In, numSamples, int, the number of samples
+      @ Out, outcomes, dict, {var: np.array} the results, one entry per sample
+    """
+    externalSelf, modelVariableValues, InputDict = self._prepareExternalSelf(Input, Input)
+
+    self.sim.runBatch(externalSelf, InputDict)
+
+    self._collectExternalSelf(externalSelf, modelVariableValues)
+    outcomes = {}
+    for key in self.listOfRavenAwareVars:
+      value = np.atleast_1d(modelVariableValues[key])
+      if len(value) == 1:
+        # a value shared by all the samples
+        value = np.repeat(value, numSamples)
+      elif value.ndim != 1 or len(value) != numSamples:
+        self.raiseAnError(RuntimeError, 'in external Model "{}" the method runBatch must set one value per sample for "{}"!'.format(self.name, key),
+                          'Expected {} values, got shape {}.'.format(numSamples, value.shape))
+      outcomes[key] = value
+    self._replaceVariablesNamesWithAliasSystem(outcomes, 'inout', True)
+    return outcomes
+
+  def canEvaluateBlocks(self):
+    """
+      Checks if this model can evaluate a block of samples in a single job (see submitBlock).
+      This is the case if the external module implements "runBatch" and not "createNewInput".
+      @ In, None
+      @ Out, canEvaluateBlocks, bool, True if submitBlock can be used
+    """
+    return 'runBatch' in dir(self.sim) and not self._hasCreateNewInput
+
+  @Parallel()
+  def evaluateBlock(self, myInput, samplerType, blockInfo):
+    """
+        This will evaluate a block of samples on this model with a single call of the "runBatch" method
+        of the external module.
+        @ In, myInput, list, the inputs (list) to start from to generate the new ones
+        @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+        @ In, blockInfo, list(dict), the information coming from the sampler for each sample of the block,
+           a mandatory key is the 'SampledVars' that contains a dictionary {'name variable':value}
+        @ Out, block, dict, {var: np.array} the realizations of the block in columnar form, one entry per sample
+    """
+    inRun, sampled = self._createBlockInput(myInput, blockInfo)
+    result = self._externalRunBatch(copy.copy(inRun), len(blockInfo))
+    # build realizations in the same order as evaluateSample
+    block = dict(inRun)
+    block.update(result)
+    block.update(self._blockMetadata(blockInfo))
+    block.update(sampled)
+    return block
+
   @Parallel()
   def evaluateSample(self, myInput, samplerType, kwargs):
     """
@@ -307,7 +382,27 @@ class ExternalModel(Dummy):
     # TODO this is done in dummy, so don't do it here?, but need to check before checking history lengths)
     # OLD instanciatedSelf = evaluation['RAVEN_instantiated_self']
     # OLD outcomes         = evaluatedOutput[0]
+    self._checkHistorySizes(evaluation, output)
+    Dummy.collectOutput(self, finishedJob, output, options)
+
+  def collectOutputs(self,finishedJobs,output):
+    """
+      Method that collects the outputs from a batch of runs that have just finished
+      @ In, finishedJobs, list, list of InternalRunner objects, instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    for finishedJob in finishedJobs:
+      self._checkHistorySizes(finishedJob.getEvaluation(), output)
+    Dummy.collectOutputs(self, finishedJobs, output)
 
+  def _checkHistorySizes(self, evaluation, output):
+    """
+      Checks that the output histories of an evaluation have consistent lengths, if collected in a HistorySet
+      @ In, evaluation, dict, the realization produced by the run
+      @ In, output, "DataObjects" object, output where the results of the calculation needs to be stored
+      @ Out, None
+    """
     # TODO move this check to the data object instead.
     if output.type in ['HistorySet']:
       outputSize = -1
@@ -317,5 +412,3 @@ class ExternalModel(Dummy):
           outputSize = len(np.atleast_1d(evaluation[key]))
         if not mathUtils.sizeMatch(evaluation[key],outputSize):
           self.raiseAnError(Exception,"the time series size needs to be the same for the output space in a HistorySet! Variable:"+key+". Size in the HistorySet="+str(outputSize)+".Size outputed="+str(outputSize))
-
-    Dummy.collectOutput(self, finishedJob, output, options)
@@ -209,6 +209,16 @@ class HybridModelBase(Dummy):
     """
     Dummy.collectOutput(self, finishedJob, output)
 
+  def collectOutputs(self,finishedJobs,output):
+    """
+      Method that collects the outputs from a batch of runs that have just finished, one run at a time
+      @ In, finishedJobs, list, list of ClientRunner objects, instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    for finishedJob in finishedJobs:
+      self.collectOutput(finishedJob, output)
+
   def _extractInputs(self,dataIn, paramsList):
     """
       Extract the the parameters in the paramsList from the given data object dataIn
@@ -123,7 +123,10 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
                                                 'CustomSampler',
                                                 'AdaptiveMonteCarlo',
                                                 'Metropolis',
-                                                'AdaptiveMetropolis']
+                                                'AdaptiveMetropolis',
+                                                'MultiChainMetropolis',
+                                                'AffineInvariantEnsemble',
+                                                'ParallelTempering']
   validateDict['Optimizer'].append(testDict.copy())
   validateDict['Optimizer'][0]['class'       ] ='Optimizers'
   validateDict['Optimizer'][0]['required'    ] = False
@@ -406,6 +409,62 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
                         uniqueHandler=uniqueHandler, forceUseThreads=forceThreads,
                         groupInfo={'id': kwargs['batchInfo']['batchId'], 'size': nRuns} if batchMode else None)
 
+  def canEvaluateBlocks(self):
+    """
+      Checks if this model can evaluate a block of samples in a single job (see submitBlock).
+      By default it cannot.
+      @ In, None
+      @ Out, canEvaluateBlocks, bool, True if submitBlock can be used
+    """
+    return False
+
+  def submitBlock(self, myInput, samplerType, jobHandler, blockInfo):
+    """
+        This will submit a block of samples to be evaluated together, in a single job, by this model.
+        The job evaluation is the realizations of the whole block in columnar form, {var: np.array}
+        with one entry per sample. Only models for which canEvaluateBlocks is True implement "evaluateBlock".
+        @ In, myInput, list, the inputs (list) to start from to generate the new ones
+        @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+        @ In, jobHandler, JobHandler instance, the global job handler instance
+        @ In, blockInfo, list(dict), the information coming from the sampler for each sample of the block,
+           a mandatory key is the sampledVars'that contains a dictionary {'name variable':value}
+        @ Out, None
+    """
+    prefix = '{}-{}'.format(blockInfo[0].get('prefix'), blockInfo[-1].get('prefix'))
+    metadata = {'prefix': prefix, 'blockSize': len(blockInfo)}
+    jobHandler.addJob((self, myInput, samplerType, blockInfo), self.__class__.evaluateBlock, prefix, metadata=metadata,
+                      uniqueHandler=blockInfo[0].get('uniqueHandler', 'any'), forceUseThreads=blockInfo[0].get('forceThreads', False))
+
+  @staticmethod
+  def _blockMetadata(blockInfo):
+    """
+      Collects the scalar information coming from the sampler for a block of samples in columnar form
+      @ In, blockInfo, list(dict), the information coming from the sampler for each sample of the block
+      @ Out, block, dict, {key: np.array} one entry per sample for each scalar piece of information
+    """
+    block = {}
+    for key, value in blockInfo[0].items():
+      if isinstance(value, dict):
+        continue
+      column = np.concatenate(list(np.atleast_1d(info[key]) for info in blockInfo))
+      if len(column) == len(blockInfo):
+        block[key] = column
+    return block
+
+  def _addBlockToOutput(self, block, output):
+    """
+      Stores the realizations of a block evaluation (see submitBlock) in an output
+      @ In, block, dict, {var: np.array} the realizations in columnar form, one entry per sample
+      @ In, output, DataObject or Database, where the realizations need to be stored
+      @ Out, None
+    """
+    if hasattr(output, 'addRealizations') and not getattr(output, 'indexes', None):
+      output.addRealizations(block)
+    else:
+      numSamples = len(next(iter(block.values())))
+      for i in range(numSamples):
+        output.addRealization(dict((var, np.atleast_1d(val[i])) for var, val in block.items()))
+
   def addOutputFromExportDictionary(self,exportDict,output,options,jobIdentifier):
     """
       Method that collects the outputs from them export dictionary
@@ -439,6 +498,17 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
     else:
       self.raiseAnError(IOError,'The place where we want to store the output has no addOutput method!')
 
+  def collectOutputs(self,finishedJobs,storeTo):
+    """
+      Method that collects the outputs from a batch of runs that have just finished.
+      By default the runs are collected one at a time.
+      @ In, finishedJobs, list, list of InternalRunner objects, instances of the runs just finished
+      @ In, storeTo, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    for finishedJob in finishedJobs:
+      self.collectOutput(finishedJob,storeTo)
+
   def getAdditionalInputEdits(self,inputInfo):
     """
       Collects additional edits for the sampler to use when creating a new input.  By default does nothing.
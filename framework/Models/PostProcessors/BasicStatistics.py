@@ -566,31 +566,36 @@ class BasicStatistics(PostProcessorInterface):
   def _computeWeightedPercentile(self,arrayIn,pbWeight,percent=0.5):
     """
       Method to compute the weighted percentile in a array of data
-      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated
-      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the values in 'array'
-      @ In, percent, float, the percentile that needs to be computed (between 0.01 and 1.0)
-      @ Out, result, float, the percentile
+      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated.
+        If multidimensional (e.g. [#pivotValues, #samples]), the percentile is computed along the last axis
+      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the values in 'array' (last axis)
+      @ In, percent, float or list/numpy.array, the percentile(s) that needs to be computed (between 0.01 and 1.0)
+      @ Out, result, float or numpy.array, the percentile, with shape (percent shape) + (arrayIn shape without the last axis)
     """
-
-    idxs                   = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
+    arrayIn = np.asarray(arrayIn)
+    pbWeight = np.asarray(pbWeight)
+    idxs = np.argsort(arrayIn, axis=-1)
+    sortedPoints = np.take_along_axis(arrayIn, idxs, axis=-1)
     # Inserting [0.0,arrayIn[idxs[0]]] is needed when few samples are generated and
     # a percentile that is < that the first pb weight is requested. Otherwise the median
     # is returned.
-    sortedWeightsAndPoints = np.insert(np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs]))),0,[0.0,arrayIn[idxs[0]]],axis=0)
-    weightsCDF             = np.cumsum(sortedWeightsAndPoints[:,0])
-    # This step returns the index of the array which is < than the percentile, because
-    # the insertion create another entry, this index should shift to the bigger side
-    indexL = utils.first(np.asarray(weightsCDF >= percent).nonzero())[0]
-    # This step returns the indices (list of index) of the array which is > than the percentile
-    indexH = utils.first(np.asarray(weightsCDF > percent).nonzero())
-    try:
-      # if the indices exists that means the desired percentile lies between two data points
-      # with index as indexL and indexH[0]. Calculate the midpoint of these two points
-      result = 0.5*(sortedWeightsAndPoints[indexL,1]+sortedWeightsAndPoints[indexH[0],1])
-    except IndexError:
-      result = sortedWeightsAndPoints[indexL,1]
-    return result
-
+    sortedPoints = np.concatenate((sortedPoints[...,:1], sortedPoints), axis=-1)
+    weightsCDF = np.cumsum(np.concatenate((np.zeros(arrayIn.shape[:-1]+(1,)), pbWeight[idxs]), axis=-1), axis=-1)
+    percent = np.asarray(percent, dtype=float)
+    percent = percent.reshape(percent.shape + (1,)*arrayIn.ndim)
+    # the indices of the first entries which are >= and > than the percentile, because
+    # the insertion create another entry, these indices are shifted to the bigger side
+    atOrAbove = weightsCDF >= percent
+    above = weightsCDF > percent
+    indexL = np.where(atOrAbove.any(axis=-1), np.argmax(atOrAbove, axis=-1), weightsCDF.shape[-1] - 1)
+    indexH = np.argmax(above, axis=-1)
+    sortedPoints = np.broadcast_to(sortedPoints, above.shape)
+    lower = np.take_along_axis(sortedPoints, indexL[...,np.newaxis], axis=-1)[...,0]
+    higher = np.take_along_axis(sortedPoints, indexH[...,np.newaxis], axis=-1)[...,0]
+    # if the higher index exists that means the desired percentile lies between two data points
+    # with index as indexL and indexH. Calculate the midpoint of these two points
+    result = np.where(above.any(axis=-1), 0.5*(lower+higher), lower)
+    return result[()]
 
   def __runLocal(self, inputData):
     """
@@ -777,12 +782,10 @@ class BasicStatistics(PostProcessorInterface):
           targWeight = relWeight[target].values
           targDa = dataSet[target]
           if self.pivotParameter in targDa.sizes.keys():
-            quantile = [self._computeWeightedPercentile(group.values,targWeight,percent=0.5) for label,group in targDa.groupby(self.pivotParameter)]
+            quantile = self._computeWeightedPercentile(targDa.transpose(self.pivotParameter,self.sampleTag).values,targWeight,percent=0.5)
+            da = xr.DataArray(quantile,dims=(self.pivotParameter),coords={self.pivotParameter:targDa.coords[self.pivotParameter].values})
           else:
             quantile = self._computeWeightedPercentile(targDa.values,targWeight,percent=0.5)
-          if self.pivotParameter in targDa.sizes.keys():
-            da = xr.DataArray(quantile,dims=(self.pivotParameter),coords={self.pivotParameter:self.pivotValue})
-          else:
             da = xr.DataArray(quantile)
           medianSet[target] = da
       else:
@@ -933,16 +936,11 @@ class BasicStatistics(PostProcessorInterface):
         for target in needed[metric]['targets']:
           targWeight = relWeight[target].values
           targDa = dataSet[target]
-          quantile = []
-          for pct in percent:
-            if self.pivotParameter in targDa.sizes.keys():
-              qtl = [self._computeWeightedPercentile(group.values,targWeight,percent=pct) for label,group in targDa.groupby(self.pivotParameter)]
-            else:
-              qtl = self._computeWeightedPercentile(targDa.values,targWeight,percent=pct)
-            quantile.append(qtl)
           if self.pivotParameter in targDa.sizes.keys():
-            da = xr.DataArray(quantile,dims=('percent',self.pivotParameter),coords={'percent':percent,self.pivotParameter:self.pivotValue})
+            quantile = self._computeWeightedPercentile(targDa.transpose(self.pivotParameter,self.sampleTag).values,targWeight,percent=percent)
+            da = xr.DataArray(quantile,dims=('percent',self.pivotParameter),coords={'percent':percent,self.pivotParameter:targDa.coords[self.pivotParameter].values})
           else:
+            quantile = self._computeWeightedPercentile(targDa.values,targWeight,percent=percent)
             da = xr.DataArray(quantile,dims=('percent'),coords={'percent':percent})
           percentileSet[target] = da
 
@@ -997,15 +995,12 @@ class BasicStatistics(PostProcessorInterface):
       relWeight = pbWeights[params] if self.pbPresent else None
       intersectionSet = set(targets) & set(features)
       if self.pivotParameter in dataSet.sizes.keys():
+        # all the pivot values at once, [#pivotValues, #samples, #variables]
         dataSet = dataSet.to_array().transpose(self.pivotParameter,self.sampleTag,'variable')
         featSet = dataSet.sel(**{'variable':features}).values
         targSet = dataSet.sel(**{'variable':targets}).values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        da = None
-        for i in range(len(pivotVals)):
-          ds = self.sensitivityCalculation(features,targets,featSet[i,:,:],targSet[i,:,:],intersectionSet)
-          da = ds if da is None else xr.concat([da,ds], dim=self.pivotParameter)
-        da.coords[self.pivotParameter] = pivotVals
+        da = self.sensitivityCalculation(features,targets,featSet,targSet,intersectionSet,pivotVals=pivotVals)
       else:
         # construct target and feature matrices
         dataSet = dataSet.to_array().transpose(self.sampleTag,'variable')
@@ -1038,17 +1033,12 @@ class BasicStatistics(PostProcessorInterface):
       varianceSet = self._computeVariance(dataSet,meanSet,pbWeight=relWeight,dim=self.sampleTag)
       dataSet = dataSet - meanSet
       if self.pivotParameter in dataSet.sizes.keys():
-        ds = None
+        # all the pivot values at once, [#pivotValues, #variables, #samples]
         paramDA = dataSet.to_array().transpose(self.pivotParameter,'variable',self.sampleTag).values
         varianceDA = varianceSet[targVars].to_array().transpose(self.pivotParameter,'variable').values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        for i in range(len(pivotVals)):
-          # construct target and feature matrices
-          paramSamples = paramDA[i,...]
-          da = self.covarianceCalculation(paramDA[i,...],fact,varianceDA[i,:],targVars)
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
-        ds.coords[self.pivotParameter] = pivotVals
-        calculations[metric] = ds
+        da = self.covarianceCalculation(paramDA,fact,varianceDA,targVars,pivotVals=pivotVals)
+        calculations[metric] = da
       else:
         # construct target and feature matrices
         paramSamples = dataSet.to_array().transpose('variable',self.sampleTag).values
@@ -1075,13 +1065,10 @@ class BasicStatistics(PostProcessorInterface):
       targCoords = reducedCovar.coords['targets'].values
       if self.pivotParameter in reducedCovar.sizes.keys():
         pivotCoords = reducedCovar.coords[self.pivotParameter].values
-        ds = None
-        for label, group in reducedCovar.groupby(self.pivotParameter):
-          corrMatrix = self.corrCoeff(group.values)
-          da = xr.DataArray(corrMatrix, dims=('targets','features'), coords={'targets':targCoords,'features':targCoords})
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
-        ds.coords[self.pivotParameter] = pivotCoords
-        calculations[metric] = ds
+        corrMatrix = self.corrCoeff(reducedCovar.transpose(self.pivotParameter,'targets','features').values)
+        da = xr.DataArray(corrMatrix, dims=(self.pivotParameter,'targets','features'),
+                          coords={self.pivotParameter:pivotCoords,'targets':targCoords,'features':targCoords})
+        calculations[metric] = da
       else:
         corrMatrix = self.corrCoeff(reducedCovar.values)
         da = xr.DataArray(corrMatrix, dims=('targets','features'), coords={'targets':targCoords,'features':targCoords})
@@ -1101,12 +1088,8 @@ class BasicStatistics(PostProcessorInterface):
       targCoords = reducedCovar.coords['targets'].values
       if self.pivotParameter in reducedCovar.sizes.keys():
         pivotCoords = reducedCovar.coords[self.pivotParameter].values
-        ds = None
-        for label, group in reducedCovar.groupby(self.pivotParameter):
-          da = self.varianceDepSenCalculation(targCoords,group.values)
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
-        ds.coords[self.pivotParameter] = pivotCoords
-        calculations[metric] = ds
+        da = self.varianceDepSenCalculation(targCoords,reducedCovar.transpose(self.pivotParameter,'targets','features').values,pivotVals=pivotCoords)
+        calculations[metric] = da
       else:
         da = self.varianceDepSenCalculation(targCoords,reducedCovar.values)
         calculations[metric] = da
@@ -1179,31 +1162,72 @@ class BasicStatistics(PostProcessorInterface):
       Unbiased weighted covariance matrix,   weights is not None, bias is 0
       Biased weighted covariance matrix,     weights is not None, bias is 1
       can be calcuated depending on the selection of the inputs.
-      @ In,  covM, numpy.array, [#targets,#targets] covariance matrix
-      @ Out, covM, numpy.array, [#targets,#targets] correlation matrix
+      @ In,  covM, numpy.array, [#targets,#targets] covariance matrix (or [#pivotValues,#targets,#targets])
+      @ Out, covM, numpy.array, [#targets,#targets] correlation matrix (or [#pivotValues,#targets,#targets])
     """
     try:
-      d = np.diag(covM)
+      d = np.diagonal(covM, axis1=-2, axis2=-1)
     except ValueError:
       # scalar covariance
       # nan if incorrect value (nan, inf, 0), 1 otherwise
       return covM / covM
     stdDev = np.sqrt(d)
-    covM /= stdDev[:,None]
-    covM /= stdDev[None,:]
+    covM /= stdDev[...,:,None]
+    covM /= stdDev[...,None,:]
     return covM
 
-  def sensitivityCalculation(self,featVars, targVars, featSamples, targSamples, intersectionSet):
+  def _matrixToDataArray(self, matrix, targVars, featVars, pivotVals=None):
+    """
+      Stores a matrix of results in a DataArray
+      @ In, matrix, numpy.ndarray, [#targets, #features] (or [#pivotValues, #targets, #features]) matrix
+      @ In, targVars, list, the list of target variables
+      @ In, featVars, list, the list of feature variables
+      @ In, pivotVals, numpy.ndarray, optional, the pivot values if the matrix has a pivot axis
+      @ Out, da, xarray.DataArray, the matrix with coordinates
+    """
+    dims = ('targets','features')
+    coords = {'targets':targVars,'features':featVars}
+    if pivotVals is not None:
+      dims = (self.pivotParameter,) + dims
+      coords[self.pivotParameter] = pivotVals
+    da = xr.DataArray(matrix, dims=dims, coords=coords)
+    return da
+
+  def _checkCondition(self, featSamples):
     """
-      This method computes the sensitivity coefficients based on the SciKitLearn LinearRegression method
+      Warns if the (largest) condition number of the feature samples shows multicollinearity
+      @ In, featSamples, numpy.ndarray, [#samples, #features] (or [#pivotValues, #samples, #features]) array of features
+      @ Out, None
+    """
+    condNumber = np.max(np.linalg.cond(featSamples))
+    if condNumber > 30.:
+      self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
+
+  def _linearRegressionCoefficients(self, featSamples, targSamples):
+    """
+      Computes the coefficients of the least squares linear regression (with intercept) of the targets
+      over the features, for all the leading (pivot) axes at once
+      @ In, featSamples, numpy.ndarray, [..., #samples, #features] array of features
+      @ In, targSamples, numpy.ndarray, [..., #samples, #targets] array of targets
+      @ Out, coeff, numpy.ndarray, [..., #targets, #features] regression coefficients
+    """
+    # the intercept is removed by centering the samples
+    featCentered = featSamples - featSamples.mean(axis=-2, keepdims=True)
+    targCentered = targSamples - targSamples.mean(axis=-2, keepdims=True)
+    coeff = np.matmul(np.linalg.pinv(featCentered), targCentered)
+    return np.swapaxes(coeff, -1, -2)
+
+  def sensitivityCalculation(self,featVars, targVars, featSamples, targSamples, intersectionSet, pivotVals=None):
+    """
+      This method computes the sensitivity coefficients based on the linear regression (least squares) of the samples
       @ In, featVars, list, list of feature variables
       @ In, targVars, list, list of target variables
-      @ In, featSamples, numpy.ndarray, [#samples, #features] array of features
-      @ In, targSamples, numpy.ndarray, [#samples, #targets] array of targets
+      @ In, featSamples, numpy.ndarray, [#samples, #features] (or [#pivotValues, #samples, #features]) array of features
+      @ In, targSamples, numpy.ndarray, [#samples, #targets] (or [#pivotValues, #samples, #targets]) array of targets
       @ In, intersectionSet, boolean, True if some target variables are in the list of features
+      @ In, pivotVals, numpy.ndarray, optional, the pivot values if the samples have a pivot axis
       @ Out, da, xarray.DataArray, contains the calculations of sensitivity coefficients
     """
-    from sklearn.linear_model import LinearRegression
     if self.multipleFeatures:
       # intersectionSet is flag that used to check the relationship between the features and targets.
       # If True, part of the target variables are listed in teh feature set, then multivariate linear
@@ -1213,79 +1237,75 @@ class BasicStatistics(PostProcessorInterface):
       # added for the feature set. ~ wangc
 
       if not intersectionSet:
-        condNumber = np.linalg.cond(featSamples)
-        if condNumber > 30.:
-          self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
-        senMatrix = LinearRegression().fit(featSamples,targSamples).coef_
+        self._checkCondition(featSamples)
+        senMatrix = self._linearRegressionCoefficients(featSamples,targSamples)
       else:
         # Target variables are in feature variables list, multi-target linear regression can not be used
         # Since the 'multi-colinearity' exists, we need to loop over target variables
         # TODO: Some general methods need to be implemented in order to handle the 'multi-colinearity' -- wangc
-        senMatrix = np.zeros((len(targVars), len(featVars)))
+        senMatrix = np.zeros(featSamples.shape[:-2] + (len(targVars), len(featVars)))
         for p, targ in enumerate(targVars):
           ind = list(featVars).index(targ) if targ in featVars else None
           if ind is not None:
-            featMat = np.delete(featSamples,ind,axis=1)
+            featMat = np.delete(featSamples,ind,axis=-1)
           else:
             featMat = featSamples
-          regCoeff = LinearRegression().fit(featMat, targSamples[:,p]).coef_
-          condNumber = np.linalg.cond(featMat)
-          if condNumber > 30.:
-            self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
+          regCoeff = self._linearRegressionCoefficients(featMat, targSamples[...,p:p+1])[...,0,:]
+          self._checkCondition(featMat)
           if ind is not None:
-            regCoeff = np.insert(regCoeff,ind,1.0)
-          senMatrix[p,:] = regCoeff
+            regCoeff = np.insert(regCoeff,ind,1.0,axis=-1)
+          senMatrix[...,p,:] = regCoeff
     else:
-      senMatrix = np.zeros((len(targVars), len(featVars)))
-      for p, feat in enumerate(featVars):
-        regCoeff = LinearRegression().fit(featSamples[:,p].reshape(-1,1),targSamples).coef_
-        senMatrix[:,p] = regCoeff[:,0]
-    da = xr.DataArray(senMatrix, dims=('targets','features'), coords={'targets':targVars,'features':featVars})
+      # one regression per feature, i.e. cov(target, feature) / var(feature)
+      featCentered = featSamples - featSamples.mean(axis=-2, keepdims=True)
+      targCentered = targSamples - targSamples.mean(axis=-2, keepdims=True)
+      senMatrix = np.matmul(np.swapaxes(targCentered, -1, -2), featCentered)
+      senMatrix /= np.sum(featCentered**2, axis=-2)[...,None,:]
+    da = self._matrixToDataArray(senMatrix, targVars, featVars, pivotVals)
 
     return da
 
-  def covarianceCalculation(self,paramSamples,fact,variance,targVars):
+  def covarianceCalculation(self,paramSamples,fact,variance,targVars,pivotVals=None):
     """
       This method computes the covariance of given sample matrix
-      @ In, paramSamples, numpy.ndarray, [#parameters, #samples], array of parameters
+      @ In, paramSamples, numpy.ndarray, [#parameters, #samples] (or [#pivotValues, #parameters, #samples]), array of parameters
       @ In, fact, float, the unbiase correction factor
-      @ In, variance, numpy.ndarray, [#parameters], variance of parameters
+      @ In, variance, numpy.ndarray, [#parameters] (or [#pivotValues, #parameters]), variance of parameters
       @ In, targVars, list, the list of parameters
+      @ In, pivotVals, numpy.ndarray, optional, the pivot values if the samples have a pivot axis
       @ Out, da, xarray.DataArray, contains the calculations of covariance
     """
     if self.pbPresent:
-      paramSamplesT = (paramSamples*self.realizationWeight['ProbabilityWeight'].values).T
+      paramSamplesT = np.swapaxes(paramSamples*self.realizationWeight['ProbabilityWeight'].values, -1, -2)
     else:
-      paramSamplesT = paramSamples.T
-    cov = np.dot(paramSamples, paramSamplesT.conj())
+      paramSamplesT = np.swapaxes(paramSamples, -1, -2)
+    cov = np.matmul(paramSamples, paramSamplesT.conj())
     cov *= fact
-    np.fill_diagonal(cov,variance)
-    da = xr.DataArray(cov, dims=('targets','features'), coords={'targets':targVars,'features':targVars})
+    diagonal = np.arange(cov.shape[-1])
+    cov[...,diagonal,diagonal] = variance
+    da = self._matrixToDataArray(cov, targVars, targVars, pivotVals)
     return da
 
-  def varianceDepSenCalculation(self,targCoords, cov):
+  def varianceDepSenCalculation(self,targCoords, cov, pivotVals=None):
     """
       This method computes the covariance of given sample matrix
       @ In, targCoords, list, the list of parameters
-      @ In, cov, numpy.ndarray, the covariance of parameters
+      @ In, cov, numpy.ndarray, the covariance of parameters (optionally with a leading pivot axis)
+      @ In, pivotVals, numpy.ndarray, optional, the pivot values if the covariance has a pivot axis
       @ Out, da, xarray.DataArray, contains the calculations of variance dependent sensitivities
     """
-    senMatrix = np.zeros((len(targCoords), len(targCoords)))
     if self.multipleFeatures:
+      senMatrix = np.zeros(cov.shape)
       for p, param in enumerate(targCoords):
-        covX = np.delete(cov,p,axis=0)
-        covX = np.delete(covX,p,axis=1)
-        covYX = np.delete(cov[p,:],p)
-        sensCoef = np.dot(covYX,np.linalg.pinv(covX))
-        sensCoef = np.insert(sensCoef,p,1.0)
-        senMatrix[p,:] = sensCoef
+        covX = np.delete(cov,p,axis=-2)
+        covX = np.delete(covX,p,axis=-1)
+        covYX = np.delete(cov[...,p:p+1,:],p,axis=-1)
+        sensCoef = np.matmul(covYX,np.linalg.pinv(covX))[...,0,:]
+        sensCoef = np.insert(sensCoef,p,1.0,axis=-1)
+        senMatrix[...,p,:] = sensCoef
     else:
-      for p, param in enumerate(targCoords):
-        covX = cov[p,p]
-        covYX = cov[:,p]
-        sensCoef = covYX / covX
-        senMatrix[:,p] = sensCoef
-    da = xr.DataArray(senMatrix, dims=('targets','features'), coords={'targets':targCoords,'features':targCoords})
+      senMatrix = cov / np.diagonal(cov, axis1=-2, axis2=-1)[...,None,:]
+    da = self._matrixToDataArray(senMatrix, targCoords, targCoords, pivotVals)
     return da
 
   def run(self, inputIn):
@@ -18,45 +18,39 @@ Factory for generating the instances of the  Models Module
 from EntityFactoryBase import EntityFactory
 from .PostProcessorInterface import PostProcessorInterface
 from .PostProcessorReadyInterface import PostProcessorReadyInterface
-from .BasicStatistics import BasicStatistics
-from .LimitSurface import LimitSurface
-from .Metric import Metric
-from .DataMining import DataMining
-from .SafestPoint import SafestPoint
-from .ValueDuration import ValueDuration
-from .SampleSelector import SampleSelector
-from .ImportanceRank import ImportanceRank
-from .CrossValidation import CrossValidation
-from .LimitSurfaceIntegral import LimitSurfaceIntegral
-from .FastFourierTransform import FastFourierTransform
-from .ExternalPostProcessor import ExternalPostProcessor
-from .TopologicalDecomposition import TopologicalDecomposition
-from .ComparisonStatisticsModule import ComparisonStatistics
-from .RealizationAverager import RealizationAverager
-from .ParetoFrontierPostProcessor import ParetoFrontier
-from .EconomicRatio import EconomicRatio
-from .Validation import Validation
-
-### PostProcessorFunctions (orig: InterfacedPostProcessor)
-from .HistorySetDelay import HistorySetDelay
-from .HS2PS import HS2PS
-from .HStoPSOperator import HStoPSOperator
-from .HistorySetSampling import HistorySetSampling
-from .HistorySetSnapShot import HistorySetSnapShot
-from .HistorySetSync import HistorySetSync
-from .TypicalHistoryFromHistorySet import TypicalHistoryFromHistorySet
-from .dataObjectLabelFilter import dataObjectLabelFilter
-## These utilize the optional prequisite library PySide, so don't error if they
-## do not import appropriately.
-try:
-  from .TopologicalDecomposition import QTopologicalDecomposition
-  from .DataMining import QDataMining
-  renaming = {'QTopologicalDecomposition': 'TopologicalDecomposition',
-              'QDataMining': 'DataMining'}
-except ImportError:
-  renaming = {}
 
 factory = EntityFactory('PostProcessorInterface', needsRunInfo=True)
-factory.registerAllSubtypes(PostProcessorInterface, alias=renaming)
+factory.registerType('PostProcessorReadyInterface', PostProcessorReadyInterface)
+# the PostProcessor modules are imported only when the corresponding type is requested
+# {type: module name}, the class name is the type
+lazyTypes = {'BasicStatistics'             : 'BasicStatistics',
+             'LimitSurface'                : 'LimitSurface',
+             'Metric'                      : 'Metric',
+             'SafestPoint'                 : 'SafestPoint',
+             'ValueDuration'               : 'ValueDuration',
+             'SampleSelector'              : 'SampleSelector',
+             'ImportanceRank'              : 'ImportanceRank',
+             'CrossValidation'             : 'CrossValidation',
+             'LimitSurfaceIntegral'        : 'LimitSurfaceIntegral',
+             'FastFourierTransform'        : 'FastFourierTransform',
+             'ExternalPostProcessor'       : 'ExternalPostProcessor',
+             'ComparisonStatistics'        : 'ComparisonStatisticsModule',
+             'RealizationAverager'         : 'RealizationAverager',
+             'ParetoFrontier'              : 'ParetoFrontierPostProcessor',
+             'EconomicRatio'               : 'EconomicRatio',
+             'Validation'                  : 'Validation',
+             'HistorySetDelay'             : 'HistorySetDelay',
+             'HS2PS'                       : 'HS2PS',
+             'HStoPSOperator'              : 'HStoPSOperator',
+             'HistorySetSampling'          : 'HistorySetSampling',
+             'HistorySetSnapShot'          : 'HistorySetSnapShot',
+             'HistorySetSync'              : 'HistorySetSync',
+             'TypicalHistoryFromHistorySet': 'TypicalHistoryFromHistorySet',
+             'dataObjectLabelFilter'       : 'dataObjectLabelFilter'}
+for typeName, module in lazyTypes.items():
+  factory.registerLazyType(typeName, f'{__package__}.{module}')
+# the Qt versions are used if Qt is available
+factory.registerLazyType('DataMining', f'{__package__}.DataMining', ['QDataMining', 'DataMining'])
+factory.registerLazyType('TopologicalDecomposition', f'{__package__}.TopologicalDecomposition', ['QTopologicalDecomposition', 'TopologicalDecomposition'])
 
-factory.registerType('External', ExternalPostProcessor)
+factory.registerLazyType('External', f'{__package__}.ExternalPostProcessor', 'ExternalPostProcessor')
@@ -415,8 +415,7 @@ class LimitSurface(PostProcessorInterface):
       if len(listSurfPoint[nodeName]) > 0:
         self.surfPoint[nodeName] = np.ndarray((len(listSurfPoint[nodeName]), self.nVar))
         evaluations[nodeName] = np.concatenate((-np.ones(nNegPoints), np.ones(nPosPoints)), axis = 0)
-        for pointID, coordinate in enumerate(listSurfPoint[nodeName]):
-          self.surfPoint[nodeName][pointID, :] = self.gridCoord[nodeName][tuple(coordinate)]
+        self.surfPoint[nodeName][:, :] = self.gridCoord[nodeName][tuple(np.asarray(listSurfPoint[nodeName]).T)]
     if self.name != exceptionGrid:
       self.listSurfPointNegative, self.listSurfPointPositive = listSurfPoint[self.name][:nNegPoints-1],listSurfPoint[self.name][nNegPoints:]
     if merge == True:
@@ -433,34 +432,30 @@ class LimitSurface(PostProcessorInterface):
       It returns the list of points belonging to the limit state surface and resulting in
       positive or negative responses by the ROM, depending on whether ''sign''
       equals either -1 or 1, respectively.
+      A node is on the limit surface if its response has the requested sign and, along any
+      axis for which the node has a successor, the successor or the predecessor does not.
+      The test is performed on the whole test matrix at once by comparing it with its
+      copies shifted by one node along each axis.
       @ In, toBeTested, np.ndarray, the nodes to be tested
       @ In, sign, int, the sign that should be tested (-1 or +1)
       @ In, nodeName, string, the sub-grid name
       @ Out, listSurfPoint, list, the list of limit surface coordinates
     """
-    #TODO: This approach might be extremely slow. It must be replaced with matrix operations
-    listSurfPoint = []
-    gridShape = self.gridEntity.returnParameter("gridShape",nodeName)
-    myIdList = np.zeros(self.nVar,dtype=int)
-    putIt = np.zeros(self.nVar,dtype=bool)
-    for coordinate in np.rollaxis(toBeTested, 0):
-      myIdList[:] = coordinate
-      putIt[:]    = False
-      if self.testMatrix[nodeName][tuple(coordinate)] * sign > 0:
-        for iVar in range(self.nVar):
-          if coordinate[iVar] + 1 < gridShape[iVar]:
-            myIdList[iVar] += 1
-            if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-              putIt[iVar] = True
-              listSurfPoint.append(copy.copy(coordinate))
-              break
-            myIdList[iVar] -= 1
-            if coordinate[iVar] > 0:
-              myIdList[iVar] -= 1
-              if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-                putIt[iVar] = True
-                listSurfPoint.append(copy.copy(coordinate))
-                break
-              myIdList[iVar] += 1
-      #if len(set(putIt)) == 1 and  list(set(putIt))[0] == True: listSurfPoint.append(copy.copy(coordinate))
+    toBeTested = np.atleast_2d(toBeTested)
+    if toBeTested.size == 0:
+      return []
+    signedMatrix = self.testMatrix[nodeName] * sign
+    otherSide = signedMatrix <= 0
+    crossed = np.zeros(signedMatrix.shape, dtype=bool)
+    for iVar in range(self.nVar):
+      # successor along iVar (only nodes that have one)
+      target = [slice(None)] * self.nVar
+      shifted = [slice(None)] * self.nVar
+      target[iVar], shifted[iVar] = slice(0, -1), slice(1, None)
+      crossed[tuple(target)] |= otherSide[tuple(shifted)]
+      # predecessor along iVar (only nodes that also have a successor)
+      target[iVar], shifted[iVar] = slice(1, -1), slice(0, -2)
+      crossed[tuple(target)] |= otherSide[tuple(shifted)]
+    onSurface = np.logical_and(signedMatrix > 0, crossed)[tuple(toBeTested.T)]
+    listSurfPoint = list(toBeTested[onSurface])
     return listSurfPoint
@@ -48,11 +48,13 @@ class ROM(Dummy):
   """
 
   @classmethod
-  def getInputSpecification(cls):
+  def getInputSpecification(cls, xml=None):
     """
       Method to get a reference to a class that specifies the input data for
       class cls. This one seems a bit excessive, are all of these for this class?
       @ In, cls, the class for which we are retrieving the specification
+      @ In, xml, xml.etree.ElementTree.Element, optional, if given then only get specs for
+          corresponding subType requested by the node
       @ Out, inputSpecification, InputData.ParameterInput, class to use for
         specifying input of cls.
     """
@@ -69,7 +71,12 @@ class ROM(Dummy):
     ######################
     # dynamically loaded #
     ######################
-    for typ in SupervisedLearning.factory.knownTypes():
+    # only the requested type is loaded if the XML is given (the ROM modules are imported on request)
+    if xml is None:
+      romTypes = SupervisedLearning.factory.knownTypes()
+    else:
+      romTypes = [typ for typ in [xml.attrib.get('subType')] if typ in SupervisedLearning.factory.knownTypes()]
+    for typ in romTypes:
       obj = SupervisedLearning.factory.returnClass(typ)
       if hasattr(obj, 'getInputSpecifications'):
         subspecs = obj.getInputSpecifications()
@@ -107,6 +114,8 @@ class ROM(Dummy):
     metric.addParam('type', InputTypes.StringType, True)
     segment.addSub(metric)
     segment.addSub(InputData.parameterInputFactory('macroParameter', contentType=InputTypes.StringType))
+    ## number of processes training the segment ROMs
+    segment.addSub(InputData.parameterInputFactory('trainingWorkers', contentType=InputTypes.IntegerType))
     inputSpecification.addSub(segment)
     ##### END ROMCollection
     # pickledROM
@@ -1329,7 +1338,7 @@ class ROM(Dummy):
     """
     Dummy._readMoreXML(self, xmlNode)
     self.initializationOptionDict['name'] = self.name
-    paramInput = ROM.getInputSpecification()()
+    paramInput = ROM.getInputSpecification(xml=xmlNode)()
     paramInput.parseNode(xmlNode)
 
     for child in paramInput.subparts:
@@ -1514,6 +1523,40 @@ class ROM(Dummy):
     rlz.update(dict((var,np.atleast_1d(inRun[var] if var in kwargs['SampledVars'] else result[var])) for var in set(itertools.chain(result.keys(),inRun.keys()))))
     return rlz
 
+  def canEvaluateBlocks(self):
+    """
+      Checks if this ROM can evaluate a block of samples in a single job (see submitBlock).
+      This is the case if each target is a scalar per sample, so that the ROM evaluates many points at once.
+      @ In, None
+      @ Out, canEvaluateBlocks, bool, True if submitBlock can be used
+    """
+    engine = self.supervisedEngine
+    return not engine.isADynamicModel and not engine.canHandleDynamicData and \
+           not isinstance(engine.supervisedContainer[0], SupervisedLearning.Collection)
+
+  @Parallel()
+  def evaluateBlock(self, myInput, samplerType, blockInfo):
+    """
+        This will evaluate a block of samples on this model with a single vectorized call of the ROM.
+        @ In, myInput, list, the inputs (list) to start from to generate the new ones
+        @ In, samplerType, string, is the type of sampler that is calling to generate the new inputs
+        @ In, blockInfo, list(dict), the information coming from the sampler for each sample of the block,
+           a mandatory key is the sampledVars'that contains a dictionary {'name variable':value}
+        @ Out, block, dict, {var: np.array} the realizations of the block in columnar form, one entry per sample
+    """
+    numSamples = len(blockInfo)
+    inRun, sampled = self._createBlockInput(myInput, blockInfo)
+    # collect results from model run, all the samples at once
+    result = self._externalRun(inRun)
+    for var, val in result.items():
+      if len(np.atleast_1d(val)) != numSamples:
+        self.raiseAnError(RuntimeError,'ROM "{}" returned {} values of "{}" for a block of {} samples!'.format(self.name, len(np.atleast_1d(val)), var, numSamples))
+    # build realizations, metadata first as in evaluateSample
+    block = self._blockMetadata(blockInfo)
+    block.update(inRun)
+    block.update(dict((var, np.atleast_1d(val)) for var, val in result.items() if var not in sampled))
+    return block
+
   def setAdditionalParams(self, params):
     """
       Used to set parameters at a time other than initialization (such as deserializing).
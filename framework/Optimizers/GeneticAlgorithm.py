@@ -27,6 +27,7 @@
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
 from scipy.special import comb
+import scipy.spatial.distance as spatialDistance
 from collections import deque, defaultdict
 import xarray as xr
 #External Modules End--------------------------------------------------------------------------------
@@ -72,6 +73,14 @@ class GeneticAlgorithm(RavenSampled):
     self.fitness = None    # population fitness
     self.ahdp = np.NaN     # p-Average Hausdorff Distance between populations
     self.ahd  = np.NaN     # Hausdorff Distance between populations
+    self.bestObjective = None # best objective found so far
+    self._evolution = 'generational' # evolution mode: generational, steadyState or island
+    self._numIslands = 1          # number of independent populations
+    self._migrationInterval = 5   # generations between migrations (island mode)
+    self._migrants = 1            # chromosomes migrating from each island (island mode)
+    self._islands = []            # by island, population state of the asynchronous modes
+    self._generation = None       # children collected in the current generation (asynchronous modes)
+    self._batchSize = 1           # number of model evaluations run at the same time (from RunInfo)
 
   ##########################
   # Initialization Methods #
@@ -230,6 +239,43 @@ class GeneticAlgorithm(RavenSampled):
         descr=r""" b: coefficient of constraint penalty.""")
     fitness.addSub(penaltyCoeff)
     GAparams.addSub(fitness)
+
+    # Evolution
+    evolutionEnum = InputTypes.makeEnumType('evolution', 'evolutionType', ['generational', 'steadyState', 'island'])
+    evolution = InputData.parameterInputFactory('evolution', strictMode=True,
+        printPriority=108,
+        descr=r"""a subnode defining how the population is evolved.
+                  In the \textbf{\textit{generational}} mode (default), a whole generation of children is evaluated
+                  before the next one is bred.
+                  In the \textbf{\textit{steadyState}} mode, each child is merged in the population by the survivor
+                  selection as soon as its evaluation returns, and children are submitted right away to keep
+                  \xmlNode{batchSize} evaluations running, so that no parallel slot waits for the slowest evaluation
+                  of a generation.
+                  The \textbf{\textit{island}} mode evolves several independent populations in steady state and
+                  periodically migrates the fittest chromosomes of each island to the next one (ring topology).
+                  In the steadyState and island modes, \xmlNode{limit} counts model evaluations, a generation is
+                  completed every \xmlNode{populationSize} (times the number of islands) evaluations, and convergence
+                  and the optimal point are checked at the end of each generation.""")
+    evolution.addParam("type", evolutionEnum, True,
+                       descr=r"""[generational, steadyState, island]""")
+    islands = InputData.parameterInputFactory('islands', strictMode=True,
+        contentType=InputTypes.IntegerType,
+        printPriority=108,
+        descr=r"""number of islands (island mode only). Each island holds \xmlNode{populationSize} chromosomes,
+                  hence \xmlNode{populationSize} times \xmlNode{islands} initial values are required. \default{2}""")
+    evolution.addSub(islands)
+    migrationInterval = InputData.parameterInputFactory('migrationInterval', strictMode=True,
+        contentType=InputTypes.IntegerType,
+        printPriority=108,
+        descr=r"""number of generations between two migrations (island mode only). \default{5}""")
+    evolution.addSub(migrationInterval)
+    migrants = InputData.parameterInputFactory('migrants', strictMode=True,
+        contentType=InputTypes.IntegerType,
+        printPriority=108,
+        descr=r"""number of chromosomes migrating from each island; they replace the least fit chromosomes
+                  of the next island (island mode only). \default{1}""")
+    evolution.addSub(migrants)
+    GAparams.addSub(evolution)
     specs.addSub(GAparams)
 
     # convergence
@@ -321,6 +367,21 @@ class GeneticAlgorithm(RavenSampled):
     self._repairInstance = repairReturnInstance(self,name='replacementRepair')  # currently only replacement repair is implemented,
                                                                                 # if other repair methods are implemented then
                                                                                 # ##TODO: make the repair type a user input
+    # Evolution
+    evolutionNode = gaParamsNode.findFirst('evolution')
+    if evolutionNode is not None:
+      self._evolution = evolutionNode.parameterValues['type']
+      if self._evolution == 'island':
+        islandsNode = evolutionNode.findFirst('islands')
+        self._numIslands = 2 if islandsNode is None else islandsNode.value
+        if evolutionNode.findFirst('migrationInterval') is not None:
+          self._migrationInterval = evolutionNode.findFirst('migrationInterval').value
+        if evolutionNode.findFirst('migrants') is not None:
+          self._migrants = evolutionNode.findFirst('migrants').value
+        if self._numIslands < 2:
+          self.raiseAnError(IOError, 'The island evolution requires at least 2 <islands>, got {}!'.format(self._numIslands))
+        if self._migrants >= self._populationSize:
+          self.raiseAnError(IOError, 'The number of <migrants> ({}) must be smaller than the population size ({})!'.format(self._migrants, self._populationSize))
     # Convergence Criterion
     convNode = paramInput.findFirst('convergence')
     if convNode is not None:
@@ -337,6 +398,15 @@ class GeneticAlgorithm(RavenSampled):
       self._requiredPersistence = 1
 
 
+  def applyRunInfo(self, runInfo):
+    """
+      Take information from the RunInfo
+      @ In, runInfo, dict, RunInfo info
+      @ Out, None
+    """
+    super().applyRunInfo(runInfo)
+    self._batchSize = runInfo['batchSize']
+
   def initialize(self, externalSeeding=None, solutionExport=None):
     """
       This function should be called every time a clean optimizer is needed. Called before takeAstep in <Step>
@@ -348,12 +418,34 @@ class GeneticAlgorithm(RavenSampled):
 
     meta = ['batchId']
     self.addMetaKeys(meta)
+    self.bestObjective = None
+    if self._evolution != 'generational':
+      self._initializeAsync()
+      return
     self.batch = self._populationSize*(self.counter==0)+self._nChildren*(self.counter>0)
     if self._populationSize != len(self._initialValues):
       self.raiseAnError(IOError, 'Number of initial values provided for each variable is {}, while the population size is {}'.format(len(self._initialValues),self._populationSize,self._populationSize))
     for _, init in enumerate(self._initialValues): # TODO: this should be single traj
       self._submitRun(init,0,self.getIteration(0)+1)
 
+  def _initializeAsync(self):
+    """
+      Initializes the steady-state and island evolutions.
+      Every run is collected on its own (no batching), and the initial values are spread over the islands.
+      @ In, None
+      @ Out, None
+    """
+    self.batch = 1
+    numInitial = self._populationSize*self._numIslands
+    if numInitial != len(self._initialValues):
+      self.raiseAnError(IOError, 'Number of initial values provided for each variable is {}, while the population size is {} for each of the {} islands'.format(len(self._initialValues),self._populationSize,self._numIslands))
+    if self.limit < numInitial:
+      self.raiseAnError(IOError, 'The <limit> ({}) must allow at least the evaluation of the initial population ({}) in {} evolution!'.format(self.limit,numInitial,self._evolution))
+    self._islands = [{'population': None, 'fitness': None, 'age': None, 'nursery': deque()} for _ in range(self._numIslands)]
+    self._generation = {'rlz': [], 'fitness': [], 'old': None}
+    for i, init in enumerate(self._initialValues):
+      self._submitRun(init,0,self.getIteration(0)+1,moreInfo={'island': i // self._populationSize})
+
   def initializeTrajectory(self, traj=None):
     """
       Handles the generation of a trajectory.
@@ -386,13 +478,16 @@ class GeneticAlgorithm(RavenSampled):
       Used to feedback the collected runs into actionable items within the sampler.
       This is called by localFinalizeActualSampling, and hence should contain the main skeleton.
       @ In, info, dict, identifying information about the realization
-      @ In, rlz, xr.Dataset, new batched realizations
+      @ In, rlz, xr.Dataset, new batched realizations (dict in the steadyState and island evolutions)
       @ Out, None
     """
     # The whole skeleton should be here, this should be calling all classes and _private methods.
     traj = info['traj']
     for t in self._activeTraj[1:]:
       self._closeTrajectory(t, 'cancel', 'Currently GA is single trajectory',0)#, None
+    if self._evolution != 'generational':
+      self._useAsyncRealization(info, rlz)
+      return
     self.incrementIteration(traj)
     info['step'] = self.counter
 
@@ -423,63 +518,219 @@ class GeneticAlgorithm(RavenSampled):
       self.objectiveVal = rlz[self._objectiveVar].data
       self.fitness = fitness
 
-      # 1 @ n: Parent selection from population
-      # pair parents together by indexes
-      parents = self._parentSelectionInstance(population,variables=list(self.toBeSampled),fitness=fitness,nParents=self._nParents)
-
-      # 2 @ n: Crossover from set of parents
-      # create childrenCoordinates (x1,...,xM)
-      childrenXover = self._crossoverInstance(parents=parents,variables=list(self.toBeSampled),crossoverProb=self._crossoverProb,points=self._crossoverPoints)
-
-      # 3 @ n: Mutation
-      # perform random directly on childrenCoordinates
-      childrenMutated = self._mutationInstance(offSprings=childrenXover, distDict = self.distDict,locs = self._mutationLocs, mutationProb=self._mutationProb,variables=list(self.toBeSampled))
-
-      # 4 @ n: repair/replacement
-      # repair should only happen if multiple genes in a single chromosome have the same values (),
-      # and at the same time the sampling of these genes should be with Out replacement.
-      needsRepair = False
-      for chrom in range(self._nChildren):
-        unique = set(childrenMutated.data[chrom,:])
-        if len(childrenMutated.data[chrom,:]) != len(unique):
-          for var in self.toBeSampled.keys(): ## TODO: there must be a smarter way to check if a variables strategy is without replacement
-            if (hasattr(self.distDict[var],'strategy') and self.distDict[var].strategy == 'withoutReplacement'):
-              needsRepair = True
-              break
-      if needsRepair:
-        children = self._repairInstance(childrenMutated,variables=list(self.toBeSampled),distInfo=self.distDict)
-      else:
-        children = childrenMutated
-      # Make sure no children are exactly similar to parents
-      flag = True
-      counter = 0
-      while flag and counter < self._populationSize:
-        counter += 1
-        repeated =[]
-        for i in range(np.shape(population.data)[0]):
-          for j in range(i,np.shape(children.data)[0]):
-            if all(population.data[i,:]==children.data[j,:]):
-              repeated.append(j)
-        repeated = list(set(repeated))
-        if repeated:
-          newChildren = self._mutationInstance(offSprings=children[repeated,:], distDict = self.distDict, locs = self._mutationLocs, mutationProb=self._mutationProb,variables=list(self.toBeSampled))
-          children.data[repeated,:] = newChildren.data
-        else:
-          flag = False
+      # steps 1 to 4 @ n: parent selection, crossover, mutation and repair
+      children = self._breed(population, fitness)
 
       self.batch = np.shape(children)[0]
 
-      daChildren = xr.DataArray(children,
-                              dims=['chromosome','Gene'],
-                              coords={'chromosome': np.arange(np.shape(children)[0]),
-                                      'Gene':list(self.toBeSampled)})
       # 5 @ n: Submit children batch
       # submit children coordinates (x1,...,xm), i.e., self.childrenCoordinates
-      for i in range(np.shape(daChildren)[0]):
-        newRlz={}
-        for _,var in enumerate(self.toBeSampled.keys()):
-          newRlz[var] = float(daChildren.loc[i,var].values)
-        self._submitRun(newRlz, traj, self.getIteration(traj))
+      self._submitBatch(np.atleast_2d(children.data), traj, self.getIteration(traj))
+
+  def _breed(self, population, fitness):
+    """
+      Breeds a new set of children from the population
+      @ In, population, xr.DataArray, the population, dims = ['chromosome','Gene']
+      @ In, fitness, xr.DataArray, the fitness of each chromosome of the population
+      @ Out, children, xr.DataArray, the children, dims = ['chromosome','Gene']
+    """
+    # 1 @ n: Parent selection from population
+    # pair parents together by indexes
+    parents = self._parentSelectionInstance(population,variables=list(self.toBeSampled),fitness=fitness,nParents=self._nParents)
+
+    # 2 @ n: Crossover from set of parents
+    # create childrenCoordinates (x1,...,xM)
+    childrenXover = self._crossoverInstance(parents=parents,variables=list(self.toBeSampled),crossoverProb=self._crossoverProb,points=self._crossoverPoints)
+
+    # 3 @ n: Mutation
+    # perform random directly on childrenCoordinates
+    childrenMutated = self._mutationInstance(offSprings=childrenXover, distDict = self.distDict,locs = self._mutationLocs, mutationProb=self._mutationProb,variables=list(self.toBeSampled))
+
+    # 4 @ n: repair/replacement
+    # repair should only happen if multiple genes in a single chromosome have the same values (),
+    # and at the same time the sampling of these genes should be with Out replacement.
+    needsRepair = False
+    if self._hasRepeatedGenes(childrenMutated.data):
+      needsRepair = any(hasattr(self.distDict[var],'strategy') and self.distDict[var].strategy == 'withoutReplacement'
+                        for var in self.toBeSampled.keys())
+    if needsRepair:
+      children = self._repairInstance(childrenMutated,variables=list(self.toBeSampled),distInfo=self.distDict)
+    else:
+      children = childrenMutated
+    # Make sure no children are exactly similar to parents
+    flag = True
+    counter = 0
+    while flag and counter < self._populationSize:
+      counter += 1
+      repeated = self._findRepeatedChildren(population.data, children.data)
+      if repeated:
+        newChildren = self._mutationInstance(offSprings=children[repeated,:], distDict = self.distDict, locs = self._mutationLocs, mutationProb=self._mutationProb,variables=list(self.toBeSampled))
+        children.data[repeated,:] = newChildren.data
+      else:
+        flag = False
+    return children
+
+  def _useAsyncRealization(self, info, rlz):
+    """
+      Steady-state use of a single collected run (steadyState and island evolutions).
+      The child enters the population of its island through the survivor selection, and new children
+      are submitted right away to fill the free slots. Every populationSize (times the number of islands)
+      collected runs make up a generation, for which the optimal point and the convergence are checked
+      as in the generational evolution.
+      @ In, info, dict, identifying information about the realization
+      @ In, rlz, dict, the collected realization
+      @ Out, None
+    """
+    traj = info['traj']
+    if traj not in self._activeTraj:
+      # late arrival after convergence
+      return
+    child = self._dictToDataset(rlz)
+    fitness = self._fitnessInstance(child, objVar=self._objectiveVar, a=self._objCoeff, b=self._penaltyCoeff, penalty=None)
+    island = self._islands[info['island']]
+    if island['population'] is None:
+      island['population'] = self._datasetToDataArray(child)
+      island['fitness'] = fitness
+    elif len(island['population']) < self._populationSize:
+      # initial population still being collected
+      island['population'] = xr.concat([island['population'], self._datasetToDataArray(child)], dim='chromosome')
+      island['population']['chromosome'] = np.arange(len(island['population']))
+      island['fitness'] = xr.concat([island['fitness'], fitness], dim='RAVEN_sample_ID')
+      island['fitness']['RAVEN_sample_ID'] = np.arange(len(island['fitness']))
+    else:
+      population, newFitness, age = self._survivorSelectionInstance(age=island['age'], variables=list(self.toBeSampled), population=island['population'], fitness=island['fitness'], newRlz=child, offSpringsFitness=fitness)
+      island['population'], island['fitness'], island['age'] = population, newFitness, age
+    self._generation['rlz'].append(child)
+    self._generation['fitness'].append(fitness)
+    if len(self._generation['rlz']) == self._populationSize*self._numIslands:
+      self._resolveAsyncGeneration(traj, info)
+      if traj not in self._activeTraj:
+        return
+    self._fillAsyncSlots(traj, info['island'])
+
+  def _fillAsyncSlots(self, traj, first):
+    """
+      Submits children until batchSize runs are in flight (steadyState and island evolutions).
+      The islands whose initial population is complete take turns, starting from the island of the
+      collected run, and breed new children when their nursery is empty.
+      @ In, traj, int, trajectory identifier
+      @ In, first, int, the island of the collected run
+      @ Out, None
+    """
+    order = [(first + i) % len(self._islands) for i in range(len(self._islands))]
+    ready = [i for i in order if self._islands[i]['population'] is not None and len(self._islands[i]['population']) == self._populationSize]
+    if not ready:
+      return
+    # the runs registered for collection are in flight, the queued ones are about to be
+    free = self._batchSize - len(self._prefixToIdentifiers) - len(self._submissionQueue)
+    for k in range(free):
+      index = ready[k % len(ready)]
+      island = self._islands[index]
+      if not island['nursery']:
+        children = self._breed(island['population'], island['fitness'])
+        island['nursery'].extend(np.atleast_2d(children.data).astype(float).tolist())
+      point = dict(zip(self.toBeSampled, island['nursery'].popleft()))
+      self._submitRun(point, traj, self.getIteration(traj)+1, moreInfo={'island': index})
+
+  def _resolveAsyncGeneration(self, traj, info):
+    """
+      Closes a generation of the steadyState and island evolutions: collects the optimal point,
+      checks convergence, and migrates chromosomes between islands if due.
+      @ In, traj, int, trajectory identifier
+      @ In, info, dict, identifying information about the last realization of the generation
+      @ Out, None
+    """
+    self.incrementIteration(traj)
+    self.batchId += 1
+    # generations are counted from 0, as the iterations of the trajectory
+    generation = self.getIteration(traj)
+    first = generation == 0
+    rlz = xr.concat(self._generation['rlz'], dim='RAVEN_sample_ID')
+    rlz['RAVEN_sample_ID'] = np.arange(rlz.sizes['RAVEN_sample_ID'])
+    fitness = xr.concat(self._generation['fitness'], dim='RAVEN_sample_ID')
+    fitness['RAVEN_sample_ID'] = rlz['RAVEN_sample_ID']
+    objectiveVal = list(np.atleast_1d(rlz[self._objectiveVar].data))
+    info = dict(info, step=generation)
+    self._collectOptPoint(self._datasetToDataArray(rlz), fitness, objectiveVal, first=first)
+    self._resolveNewGeneration(traj, rlz, objectiveVal, fitness, info, old=self._generation['old'], first=first)
+    if self._evolution == 'island' and (generation + 1) % self._migrationInterval == 0:
+      self._migrate()
+    # the merged islands are the population of reference for the next generation
+    self.population = xr.concat([island['population'] for island in self._islands], dim='chromosome')
+    self.population['chromosome'] = np.arange(len(self.population))
+    self.fitness = xr.concat([xr.DataArray(np.atleast_1d(island['fitness'].data), dims=['chromosome']) for island in self._islands], dim='chromosome')
+    self.objectiveVal = rlz[self._objectiveVar].data
+    if all(island['age'] is not None for island in self._islands):
+      self.popAge = [age for island in self._islands for age in island['age']]
+    self._generation = {'rlz': [], 'fitness': [], 'old': self.population}
+    if traj not in self._activeTraj:
+      # converged: stop the runs still in flight
+      self._cancelAssociatedJobs(traj)
+
+  def _migrate(self):
+    """
+      Migrates the fittest chromosomes of each island to the next one (ring topology),
+      where they replace the least fit chromosomes.
+      @ In, None
+      @ Out, None
+    """
+    migrants = []
+    for island in self._islands:
+      fitness = np.atleast_1d(island['fitness'].data)
+      best = np.argsort(-fitness, kind='stable')[:self._migrants]
+      migrants.append((island['population'].data[best].copy(), fitness[best].copy()))
+    for i, island in enumerate(self._islands):
+      chromosomes, fitness = migrants[i-1]
+      worst = np.argsort(np.atleast_1d(island['fitness'].data), kind='stable')[:self._migrants]
+      island['population'].data[worst] = chromosomes
+      island['fitness'].data[worst] = fitness
+      if island['age'] is not None:
+        for w in worst:
+          island['age'][w] = 0
+      island['nursery'].clear()
+    self.raiseADebug('Migrated {} chromosomes between {} islands'.format(self._migrants, self._numIslands))
+
+  def _dictToDataset(self, rlz):
+    """
+      Converts a single realization to a DataSet with one sample, as collected in batch
+      @ In, rlz, dict, the realization
+      @ Out, dataset, xr.Dataset, the realization with dims = ['RAVEN_sample_ID']
+    """
+    dataset = xr.Dataset(dict((var, ('RAVEN_sample_ID', np.atleast_1d(rlz[var]).astype(float)))
+                              for var in list(self.toBeSampled) + [self._objectiveVar]),
+                         coords={'RAVEN_sample_ID': [0]})
+    return dataset
+
+  def _hasRepeatedGenes(self, chromosomes):
+    """
+      Checks if any chromosome contains the same gene value more than once
+      @ In, chromosomes, np.array, the chromosomes (one per row)
+      @ Out, _hasRepeatedGenes, bool, True if at least one chromosome has repeated genes
+    """
+    chromosomes = np.atleast_2d(chromosomes)
+    if chromosomes.shape[1] < 2:
+      return False
+    ordered = np.sort(chromosomes, axis=1)
+    return bool((ordered[:,1:] == ordered[:,:-1]).any())
+
+  def _findRepeatedChildren(self, population, children):
+    """
+      Finds the children identical to a parent of the population.
+      The rows of the population are hashed once, so that each child is checked in constant time.
+      Child j is only compared with the parents i <= j.
+      @ In, population, np.array, the chromosomes of the population (one per row)
+      @ In, children, np.array, the chromosomes of the children (one per row)
+      @ Out, repeated, list, indices of the repeated children
+    """
+    firstParent = {}
+    for i, chromosome in enumerate(map(tuple, np.atleast_2d(population).tolist())):
+      firstParent.setdefault(chromosome, i)
+    matches = [(firstParent[chromosome], j) for j, chromosome in enumerate(map(tuple, np.atleast_2d(children).tolist()))
+               if firstParent.get(chromosome, j + 1) <= j]
+    # the repeated children are mutated again in this order: gather them parent by parent in a set,
+    # as the pairwise comparison did, so that the mutations (and the runs) are unchanged
+    repeated = list(set(j for _, j in sorted(matches)))
+    return repeated
 
   def _datasetToDataArray(self,rlzDataset):
     """
@@ -516,10 +767,22 @@ class GeneticAlgorithm(RavenSampled):
     self.raiseADebug('Adding run to queue: {} | {}'.format(self.denormalizeData(point), info))
     self._submissionQueue.append((point, info))
 
+  def _submitBatch(self, chromosomes, traj, step):
+    """
+      Submits a batch of chromosomes, one run each, to the submission queue
+      @ In, chromosomes, np.array, the chromosomes to submit (one per row, one column per variable to be sampled)
+      @ In, traj, int, trajectory identifier
+      @ In, step, int, iteration number identifier
+      @ Out, None
+    """
+    variables = list(self.toBeSampled)
+    for chromosome in np.asarray(chromosomes, dtype=float).tolist():
+      self._submitRun(dict(zip(variables, chromosome)), traj, step)
+
   # END queuing Runs
   # * * * * * * * * * * * * * * * *
 
-  def _resolveNewGeneration(self, traj, rlz, objectiveVal, fitness, info):
+  def _resolveNewGeneration(self, traj, rlz, objectiveVal, fitness, info, old=None, first=None):
     """
       Store a new Generation after checking convergence
       @ In, traj, int, trajectory for this new point
@@ -527,13 +790,18 @@ class GeneticAlgorithm(RavenSampled):
       @ In, objectiveVal, list, objective values at each chromosome of the realization
       @ In, fitness, xr.DataArray, fitness values at each chromosome of the realization
       @ In, info, dict, identifying information about the realization
+      @ In, old, xr.DataArray, optional, previous population (default self.population)
+      @ In, first, bool, optional, True if first generation (default from the sampling counter)
     """
     self.raiseADebug('*'*80)
     self.raiseADebug('Trajectory {} iteration {} resolving new state ...'.format(traj, info['step']))
     # note the collection of the opt point
     self._stepTracker[traj]['opt'] = (rlz, info)
-    acceptable = 'accepted' if self.counter >1 else 'first'
-    old = self.population
+    if first is None:
+      first = self.counter == 1
+    acceptable = 'first' if first else 'accepted'
+    if old is None:
+      old = self.population
     converged = self._updateConvergence(traj, rlz, old, acceptable)
     if converged:
       self._closeTrajectory(traj, 'converge', 'converged', self.bestObjective)
@@ -558,17 +826,20 @@ class GeneticAlgorithm(RavenSampled):
     else: # e.g. rerun
       pass # nothing to do, just keep moving
 
-  def _collectOptPoint(self, population, fitness, objectiveVal):
+  def _collectOptPoint(self, population, fitness, objectiveVal, first=None):
     """
       Collects the point (dict) from a realization
       @ In, population, Dataset, container containing the population
       @ In, objectiveVal, list, objective values at each chromosome of the realization
       @ In, fitness, xr.DataArray, fitness values at each chromosome of the realization
+      @ In, first, bool, optional, True if first generation (default from the sampling counter)
       @ Out, point, dict, point used in this realization
     """
     optPoints,fit,obj = zip(*[[x,y,z] for x,y,z in sorted(zip(np.atleast_2d(population.data),np.atleast_1d(fitness.data),objectiveVal),reverse=True,key=lambda x: (x[1]))])
     point = dict((var,float(optPoints[0][i])) for i,var in enumerate(self.toBeSampled.keys()))
-    if (self.counter>1 and obj[0] < self.bestObjective) or self.counter == 1:
+    if first is None:
+      first = self.counter == 1
+    if first or obj[0] < self.bestObjective:
       self.bestPoint = point
       self.bestFitness = fit[0]
       self.bestObjective = obj[0]
@@ -687,21 +958,21 @@ class GeneticAlgorithm(RavenSampled):
       @ In, b, np.array, new population B
       @ Out, _AHDp, float, average Hausdorff distance
     """
-    return max(self._GDp(a,b,p),self._GDp(b,a,p))
+    dist = self._pairwiseDist(a,b)
+    return max(self._GDp(a,b,p,dist=dist),self._GDp(b,a,p,dist=dist.T))
 
-  def _GDp(self,a,b,p):
+  def _GDp(self,a,b,p,dist=None):
     """
       Modified Generational Distance Indicator
       @ In, a, np.array, old population A
       @ In, b, np.array, new population B
       @ In, p, float, the order of norm
+      @ In, dist, np.array, optional, the distances between A and B if already computed (see _pairwiseDist)
       @ Out, _GDp, float, the modified generational distance $\frac{1}{n_A} \Sigma_{i=1}^{n_A}min_{b \in B} dist(ai,B)$
     """
-    s = 0
-    n = np.shape(a)[0]
-    for i in range(n):
-      s += self._popDist(a[i,:],b)**p
-    return (1/n * s)**(1/p)
+    if dist is None:
+      dist = self._pairwiseDist(a,b)
+    return np.mean(dist.min(axis=1)**p)**(1/p)
 
   def _popDist(self,ai,b,q=2):
     """
@@ -711,10 +982,17 @@ class GeneticAlgorithm(RavenSampled):
       @ In, q, integer, order of the norm
       @ Out, _popDist, float, the minimum distance from ai to B $inf_(\|ai-bj\|_q)**\frac{1}{q}$
     """
-    nrm=[]
-    for j in range(np.shape(b)[0]):
-      nrm.append(np.linalg.norm(ai-b[j,:],q))
-    return min(nrm)
+    return self._pairwiseDist(np.atleast_2d(ai),b,q).min()
+
+  def _pairwiseDist(self,a,b,q=2):
+    """
+      Minkowski distances between all the chromosomes of A and B
+      @ In, a, np.array, population A
+      @ In, b, np.array, population B
+      @ In, q, integer, optional, order of the norm
+      @ Out, dist, np.array, the distances, dist[i,j] = \|ai-bj\|_q
+    """
+    return spatialDistance.cdist(np.atleast_2d(a).astype(float), np.atleast_2d(b).astype(float), metric='minkowski', p=q)
 
   def _ahd(self,a,b):
     """
@@ -723,20 +1001,20 @@ class GeneticAlgorithm(RavenSampled):
       @ In, b, np.array, new population B
       @ Out, _AHD, float, Hausdorff distance
     """
-    return max(self._GD(a,b),self._GD(b,a))
+    dist = self._pairwiseDist(a,b)
+    return max(self._GD(a,b,dist=dist),self._GD(b,a,dist=dist.T))
 
-  def _GD(self,a,b):
+  def _GD(self,a,b,dist=None):
     """
       Generational Distance Indicator
       @ In, a, np.array, old population A
       @ In, b, np.array, new population B
+      @ In, dist, np.array, optional, the distances between A and B if already computed (see _pairwiseDist)
       @ Out, _GD, float, the generational distance $\frac{1}{n_A} \max_{i \in A}min_{b \in B} dist(ai,B)$
     """
-    s = []
-    n = np.shape(a)[0]
-    for i in range(n):
-      s.append(self._popDist(a[i,:],b))
-    return max(s)
+    if dist is None:
+      dist = self._pairwiseDist(a,b)
+    return dist.min(axis=1).max()
 
   def _updateConvergence(self, traj, new, old, acceptable):
     """
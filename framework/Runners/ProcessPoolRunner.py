@@ -0,0 +1,339 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Module for the ProcessPoolRunner class, which runs internal objects (e.g.
+  ExternalModel, ROM or PostProcessor evaluations) in a pool of local worker
+  processes, without requiring any additional library (i.e. when Ray is not
+  available).
+"""
+#External Modules------------------------------------------------------------------------------------
+import sys
+import hashlib
+import threading
+import collections
+from concurrent import futures
+import cloudpickle
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+## Objects (e.g. the models) already received by this worker process, of the form
+## {digest: {'pickled':bytes, 'object':object or None, 'members':dict}}. Only the most
+## recently used ones are kept.
+_workerObjects = collections.OrderedDict()
+_maxWorkerObjects = 8
+
+class ObjectNotShipped(Exception):
+  """
+    Raised by a worker process asked to run a job on an object it has not received
+  """
+  pass
+
+def _sameMembers(obj, members):
+  """
+    Checks if the members of an object are still the given ones. This is a cheap way to know if the
+    object changed, which works as long as its members are assigned (e.g. when a ROM is trained)
+    rather than changed in place.
+    @ In, obj, object, the object
+    @ In, members, dict, the members of the object when it was last checked, {name: value}
+    @ Out, _sameMembers, bool, True if the object has the same members
+  """
+  current = vars(obj)
+  return len(current) == len(members) and all(members.get(name, current) is value for name, value in current.items())
+
+def _initializeWorker(path):
+  """
+    Initializer of the worker processes. It makes the RAVEN modules importable.
+    @ In, path, list, the sys.path of the parent process
+    @ Out, None
+  """
+  for entry in path:
+    if entry not in sys.path:
+      sys.path.append(entry)
+
+def _runInWorker(payload, digest, shippedObject):
+  """
+    Runs a job in a worker process.
+    @ In, payload, bytes, the pickled (function, arguments) of the job. If digest
+      is not None, the first argument of the function is the shipped object and
+      it is not part of the arguments.
+    @ In, digest, bytes, the digest of the pickled shipped object, or None
+    @ In, shippedObject, bytes, the pickled shipped object, or None if the
+      worker is supposed to have it already
+    @ Out, result, object, the outcome of the function
+  """
+  if digest is None:
+    function, args = cloudpickle.loads(payload)
+    return function(*args)
+  if shippedObject is not None:
+    if digest not in _workerObjects:
+      _workerObjects[digest] = {'pickled':shippedObject, 'object':None, 'members':None}
+  elif digest not in _workerObjects:
+    raise ObjectNotShipped()
+  _workerObjects.move_to_end(digest)
+  while len(_workerObjects) > _maxWorkerObjects:
+    _workerObjects.popitem(last=False)
+  entry = _workerObjects[digest]
+  if entry['object'] is None:
+    entry['object'] = cloudpickle.loads(entry['pickled'])
+    entry['members'] = dict(vars(entry['object']))
+  obj = entry['object']
+  function, args = cloudpickle.loads(payload)
+  try:
+    return function(obj, *args)
+  finally:
+    ## the object is unpickled once and reused by the following jobs, unless this job changed
+    ## it: then the next job gets a fresh copy (as when shipping it every time)
+    if not _sameMembers(obj, entry['members']):
+      entry['object'] = None
+
+class PoolFuture(futures.Future):
+  """
+    Future of a job submitted to the ProcessPool. The job might be submitted
+    again to the executor (if the worker did not have the object), so this
+    future follows the latest submission.
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    super().__init__()
+    self.submitted = None # the future of the executor for the latest submission
+
+  def cancel(self):
+    """
+      Cancels the job, if it did not start in a worker yet
+      @ In, None
+      @ Out, cancel, bool, True if cancelled
+    """
+    if self.submitted is not None and not self.submitted.cancel():
+      return False
+    return super().cancel()
+
+class ProcessPool(object):
+  """
+    Pool of warm local worker processes. The object the jobs are evaluated on
+    (i.e. the first argument, e.g. the model in Model.evaluateSample) is
+    identified by the digest of its pickled form. It is pickled again only when
+    one of its members has been assigned since, so a changed object is sent
+    again. The pickled object is sent along with the first jobs until the
+    workers are supposed to have it; afterwards only its digest is sent.
+    A worker that does not have it yet (e.g. a worker started later by the
+    executor) rejects the job, which is then submitted again with the object.
+  """
+  def __init__(self, numWorkers):
+    """
+      Constructor
+      @ In, numWorkers, int, number of worker processes
+      @ Out, None
+    """
+    self.numWorkers = max(1, int(numWorkers))
+    self.executor = futures.ProcessPoolExecutor(max_workers=self.numWorkers,
+                                                initializer=_initializeWorker,
+                                                initargs=(list(sys.path),))
+    self.__lock = threading.Lock()
+    ## {digest: number of jobs the object was sent with}
+    self.__shipped = {}
+    ## {id(object): {'object':object, 'members':dict, 'digest':bytes, 'pickled':bytes}}
+    self.__pickled = {}
+
+  def reset(self):
+    """
+      Forgets the objects shipped to the workers, so that they are sent along
+      with the next jobs (e.g. at the beginning of a new step)
+      @ In, None
+      @ Out, None
+    """
+    with self.__lock:
+      self.__shipped = {}
+      self.__pickled = {}
+
+  def submit(self, function, args):
+    """
+      Submits a job to the pool
+      @ In, function, function, the function to run as function(*args)
+      @ In, args, list, the arguments of the function
+      @ Out, future, PoolFuture, the future of the job, whose result is its outcome
+    """
+    args = tuple(args)
+    digest, pickled, shippedObject = None, None, None
+    if len(args) > 0 and hasattr(args[0], '__dict__') and not isinstance(args[0], type):
+      digest, pickled = self.__pickle(args[0])
+      args = args[1:]
+      with self.__lock:
+        shipped = self.__shipped.get(digest, 0)
+        if shipped < self.numWorkers:
+          self.__shipped[digest] = shipped + 1
+          shippedObject = pickled
+    payload = cloudpickle.dumps((function, args))
+    future = PoolFuture()
+    self.__submit(future, payload, digest, pickled, shippedObject)
+    return future
+
+  def __pickle(self, obj):
+    """
+      Pickles the object the jobs are evaluated on, unless it did not change since it was last pickled
+      @ In, obj, object, the object
+      @ Out, (digest, pickled), tuple, the digest of the pickled object and the pickled object
+    """
+    with self.__lock:
+      cached = self.__pickled.get(id(obj))
+    if cached is not None and cached['object'] is obj and _sameMembers(obj, cached['members']):
+      return cached['digest'], cached['pickled']
+    members = dict(vars(obj))
+    pickled = cloudpickle.dumps(obj)
+    digest = hashlib.sha1(pickled).digest()
+    with self.__lock:
+      self.__pickled[id(obj)] = {'object':obj, 'members':members, 'digest':digest, 'pickled':pickled}
+    return digest, pickled
+
+  def __submit(self, future, payload, digest, pickled, shippedObject):
+    """
+      Submits a job to the executor, and forwards its outcome to the future
+      @ In, future, PoolFuture, the future of the job
+      @ In, payload, bytes, the pickled (function, arguments) of the job
+      @ In, digest, bytes, the digest of the pickled object, or None
+      @ In, pickled, bytes, the pickled object, or None
+      @ In, shippedObject, bytes, the pickled object if sent with this submission, or None
+      @ Out, None
+    """
+    def forward(submitted):
+      """
+        Forwards the outcome of a submission to the future
+        @ In, submitted, concurrent.futures.Future, the completed submission
+        @ Out, None
+      """
+      if submitted.cancelled():
+        return
+      exception = submitted.exception()
+      if isinstance(exception, ObjectNotShipped):
+        self.__submit(future, payload, digest, pickled, pickled)
+      elif exception is not None:
+        future.set_exception(exception)
+      else:
+        future.set_result(submitted.result())
+    if future.cancelled():
+      return
+    future.submitted = self.executor.submit(_runInWorker, payload, digest, shippedObject)
+    future.submitted.add_done_callback(forward)
+
+  def shutdown(self):
+    """
+      Shuts the pool down, without waiting for the running jobs
+      @ In, None
+      @ Out, None
+    """
+    self.executor.shutdown(wait=False)
+
+class ProcessPoolRunner(InternalRunner):
+  """
+    Class for running internal objects in a pool of local worker processes
+  """
+  def __init__(self, args, functionToRun, pool=None, **kwargs):
+    """
+      Init method
+      @ In, args, list, this is a list of arguments that will be passed as
+        function parameters into whatever method is stored in functionToRun.
+        e.g., functionToRun(*args)
+      @ In, functionToRun, method or function, function that needs to be run
+      @ In, pool, ProcessPool, the pool of worker processes running the job
+      @ In, kwargs, dict, additional arguments to pass to base
+      @ Out, None
+    """
+    super().__init__(args, functionToRun, **kwargs)
+    self.pool = pool
+    self.notifiesCompletion = True
+    self.skipOnCopy.append('pool')
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    ## If the process has not been started yet, then return False
+    if not self.started:
+      return False
+
+    if self.thread is None:
+      return True
+    else:
+      return self.thread.done()
+
+  def getReturnCode(self):
+    """
+      Returns the return code from running the code. If return code not yet
+      set, then set it.
+      @ In, None
+      @ Out, returnCode, int,  the return code of this evaluation
+    """
+    if not self.hasBeenAdded:
+      self._collectRunnerResponse()
+    if self.runReturn is None:
+      self.returnCode = -1
+    return self.returnCode
+
+  def _collectRunnerResponse(self):
+    """
+      Method to add the process response in the internal variable (pointer)
+      self.runReturn
+      @ In, None
+      @ Out, None
+    """
+    if not self.hasBeenAdded:
+      self.runReturn = None
+      if self.thread is not None and not self.thread.cancelled():
+        exception = self.thread.exception()
+        if exception is None:
+          self.runReturn = self.thread.result()
+        else:
+          self.exceptionTrace = (type(exception), exception, exception.__traceback__)
+          self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(exception) +" !",'ExceptedError')
+      self.hasBeenAdded = True
+
+  def start(self):
+    """
+      Method to start the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    try:
+      ## the job might be re-submitted (e.g. after a failure)
+      self.hasBeenAdded = False
+      self.returnCode = 0
+      self.thread = self.pool.submit(self.functionToRun, self.args)
+      if self.completionCallback is not None:
+        self.thread.add_done_callback(lambda _: self.completionCallback(self))
+      self.trackTime('runner_started')
+      self.started = True
+    except Exception as ae:
+      self.exceptionTrace = sys.exc_info()
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+      self.returnCode = -1
+
+  def kill(self):
+    """
+      Method to kill the job associated to this Runner. Only jobs that did not
+      start in a worker yet can be cancelled.
+      @ In, None
+      @ Out, None
+    """
+    if self.thread is not None:
+      self.thread.cancel()
+    self.returnCode = -1
+    self.trackTime('runner_killed')
@@ -56,6 +56,10 @@ class Runner(MessageUser):
     self.uniqueHandler  = uniqueHandler
     self.groupId        = None  # the id of the group this run belong to (batching, if activated)
     self.started        = False
+    ## callable(runner) used to signal the end of the job (e.g. to wake up the JobHandler).
+    ## Only runners that set "notifiesCompletion" to True are able to call it.
+    self.completionCallback = None
+    self.notifiesCompletion = False
 
     ## First attempt to use a user-specified identifier name
     if identifier is not None:
@@ -123,6 +127,14 @@ class Runner(MessageUser):
     """
     return self.metadata
 
+  def setCompletionCallback(self, callback):
+    """
+      Sets the method to be called as soon as the job associated with this Runner ends.
+      @ In, callback, method or function, callable accepting this runner as only argument (or None)
+      @ Out, None
+    """
+    self.completionCallback = callback
+
   def trackTime(self,event):
     """
       Records the time under 'event'.
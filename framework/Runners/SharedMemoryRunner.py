@@ -54,6 +54,10 @@ class SharedMemoryRunner(InternalRunner):
     ## Other parameters manipulated internally
     self.subque = collections.deque()
     #self.subque = queue.Queue()
+    ## set by the thread itself once functionToRun has returned (or raised),
+    ## so that the job is seen as done as soon as the completion is signaled
+    self.functionReturned = False
+    self.notifiesCompletion = True
 
     self.skipOnCopy.append('subque')
 
@@ -70,7 +74,7 @@ class SharedMemoryRunner(InternalRunner):
     if self.thread is None:
       return True
     else:
-      return not self.thread.is_alive()
+      return self.functionReturned or not self.thread.is_alive()
 
   def getReturnCode(self):
     """
@@ -111,7 +115,8 @@ class SharedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = InterruptibleThread(target = lambda q, *arg : q.append(self.functionToRun(*arg)),
+      self.functionReturned = False
+      self.thread = InterruptibleThread(target = self._runAndSignal,
                                      name = self.identifier,
                                      args=(self.subque,) + tuple(self.args))
 
@@ -124,6 +129,21 @@ class SharedMemoryRunner(InternalRunner):
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def _runAndSignal(self, subque, *args):
+    """
+      Thread target. Runs the function associated to this Runner, stores its
+      outcome and signals the completion of the job (even if it failed)
+      @ In, subque, collections.deque, container for the outcome of the function
+      @ In, args, list, arguments to pass into functionToRun
+      @ Out, None
+    """
+    try:
+      subque.append(self.functionToRun(*args))
+    finally:
+      self.functionReturned = True
+      if self.completionCallback is not None:
+        self.completionCallback(self)
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -132,7 +152,7 @@ class SharedMemoryRunner(InternalRunner):
     """
     if self.thread is not None:
       self.raiseADebug('Terminating job thread "{}" and RAVEN identifier "{}"'.format(self.thread.ident, self.identifier))
-      while self.thread is not None and self.thread.isAlive():
+      while self.thread is not None and self.thread.is_alive():
         time.sleep(0.1)
         try:
           self.thread.raiseException(RuntimeError)
@@ -152,13 +172,14 @@ def _asyncRaise(tid, exceptionType):
   """
   if not inspect.isclass(exceptionType):
     raise TypeError("Only types can be raised (not instances)")
-  res = ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, ctypes.py_object(exceptionType))
+  ## the thread ids are unsigned long (they do not fit in the default int argument)
+  res = ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(tid), ctypes.py_object(exceptionType))
   if res == 0:
     raise ValueError("invalid thread id")
   elif res != 1:
     # "if it returns a number greater than one, you're in trouble,
     # and you should call it again with exc=NULL to revert the effect"
-    ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, 0)
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(tid), None)
     raise SystemError("PyThreadState_SetAsyncExc failed")
 
 class InterruptibleThread(threading.Thread):
@@ -173,7 +194,7 @@ class InterruptibleThread(threading.Thread):
        t = InterruptibleThread( ... )
         ...
         t.raiseException( SomeException )
-        while t.isAlive():
+        while t.is_alive():
           time.sleep( 0.1 )
           t.raiseException( SomeException )
       If the exception is to be caught by the thread, you need a way to check that your thread has caught it.
@@ -182,7 +203,7 @@ class InterruptibleThread(threading.Thread):
       @ In, exceptionType, Exception, the type of exception to raise in this thread
       @ Out, None
     """
-    if self.isAlive():
+    if self.is_alive():
       ## Assuming Python 2.6+, we can remove the need for the _get_my_tid as
       ## specifed in the Stack Overflow answer
       _asyncRaise( self.ident, exceptionType )
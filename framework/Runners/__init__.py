@@ -28,6 +28,7 @@ from .Runner import Runner
 from .InternalRunner import InternalRunner
 from .SharedMemoryRunner import SharedMemoryRunner
 from .DistributedMemoryRunner import DistributedMemoryRunner
+from .ProcessPoolRunner import ProcessPoolRunner, ProcessPool
 from .PassthroughRunner import PassthroughRunner
 from .Error import Error
 
@@ -35,6 +35,7 @@ class AdaptiveSampler(Sampler):
   """
     This is a general adaptive sampler
   """
+  blockSampling = False
   @classmethod
   def getInputSpecification(cls):
     """
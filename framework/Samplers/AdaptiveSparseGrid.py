@@ -48,6 +48,7 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
   """
    Adaptive Sparse Grid Collocation sampling strategy
   """
+  blockSampling = False # the grid is refined from the collected runs
 
   @classmethod
   def getInputSpecification(cls):
@@ -387,35 +388,21 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
         self.newSolutionSizeShouldBe+=1
         self.neededPoints.append(pt)
 
-  def _convergence(self,poly,rom,target):
+  def _convergenceAll(self,rom,target):
     """
-      Checks the convergence of the adaptive index set via one of (someday) several ways, currently "variance"
-      @ In, poly, list(int), the polynomial index to check convergence for
+      Checks the convergence of the adaptive index set via one of (someday) several ways, currently "variance".
+      The impacts of all the polynomials are computed at once from the dense coefficient arrays of the ROM.
       @ In, rom, supervisedContainer, the GaussPolynomialROM object with respect to which we check convergence
       @ In, target, string, target to check convergence with respect to
-      @ Out, impact, float, estimated impact factor for this index set and sparse grid
+      @ Out, impacts, dict, {poly: impact} estimated impact factor for each index set point
     """
     if self.convType.lower()=='variance':
-      impact = rom.polyCoeffDict[target][poly]**2 / sum(rom.polyCoeffDict[target][p]**2 for p in rom.polyCoeffDict[target].keys())
+      sq = rom.polyCoeffs[:,rom.target.index(target)]**2
+      impacts = dict(zip((tuple(int(o) for o in poly) for poly in rom.polyOrders), sq / sq.sum()))
     #FIXME 'coeffs' has to be updated to fit in the new rework before it can be used.
-    # elif self.convType.lower()=='coeffs':
-    #   #new = self._makeARom(rom.sparseGrid,rom.indexSet).supervisedContainer[target]
-    #   tot = 0 #for L2 norm of coeffs
-    #   if self.oldSG != None:
-    #     oSG,oSet = self._makeSparseQuad()
-    #     old = self._makeARom(oSG,oSet).supervisedContainer[target]
-    #   else: old=None
-    #   for coeff in new.polyCoeffDict.keys():
-    #     if old!=None and coeff in old.polyCoeffDict.keys():
-    #       n = new.polyCoeffDict[coeff]
-    #       o = old.polyCoeffDict[coeff]
-    #       tot+= (n - o)**2
-    #     else:
-    #       tot+= new.polyCoeffDict[coeff]**2
-    #   impact = np.sqrt(tot)
     else:
       self.raiseAnError(KeyError,'Unexpected convergence criteria:',self.convType)
-    return impact
+    return impacts
 
   def _estimateImpact(self,idx):
     """
@@ -614,10 +601,10 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
       self.inTraining.remove(active)
     #update all the impacts
     rom = self._makeARom(self.sparseGrid,self.indexSet)
-    for poly in self.indexSet.points:
-      for t in self.targets:
-        impact = self._convergence(poly,rom.supervisedEngine.supervisedContainer[0],t)
-        self.actImpact[t][poly] = impact
+    for t in self.targets:
+      impacts = self._convergenceAll(rom.supervisedEngine.supervisedContainer[0],t)
+      for poly in self.indexSet.points:
+        self.actImpact[t][poly] = impacts[tuple(poly)]
 
   # disabled until we determine a consistent way to do this without bypassing dataobjects
   #def _writeConvergencePoint(self,runPoint):
@@ -51,6 +51,7 @@ class DynamicEventTree(Grid):
   """
     DYNAMIC EVENT TREE Sampler (DET)
   """
+  blockSampling = False # branches are generated from the collected runs
 
   @classmethod
   def getInputSpecification(cls):
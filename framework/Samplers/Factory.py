@@ -50,6 +50,9 @@ from Samplers.AdaptiveDynamicEventTree import AdaptiveDynamicEventTree
 # MCMC Samplers
 from .MCMC import Metropolis
 from .MCMC import AdaptiveMetropolis
+from .MCMC import MultiChainMetropolis
+from .MCMC import AffineInvariantEnsemble
+from .MCMC import ParallelTempering
 
 factory = EntityFactory('Sampler')
 factory.registerType('MonteCarlo'              , MonteCarlo)
@@ -69,3 +72,6 @@ factory.registerType('AdaptiveDynamicEventTree', AdaptiveDynamicEventTree)
 factory.registerType('AdaptiveMonteCarlo'      , AdaptiveMonteCarlo)
 factory.registerType('Metropolis'              , Metropolis)
 factory.registerType('AdaptiveMetropolis'      , AdaptiveMetropolis)
+factory.registerType('MultiChainMetropolis'    , MultiChainMetropolis)
+factory.registerType('AffineInvariantEnsemble' , AffineInvariantEnsemble)
+factory.registerType('ParallelTempering'       , ParallelTempering)
@@ -25,4 +25,4 @@ class ForwardSampler(Sampler):
   """
     This is a general forward, blind, static sampler
   """
-  pass
+  blockSampling = True
@@ -165,6 +165,10 @@ class LimitSurfaceSearch(AdaptiveSampler):
                                                 #  cutoff (%  of range space)
     self.sizeGrid       = None                  # size of grid
     self.sizeSubGrid    = None                  # size of subgrid
+    self.distanceTree   = None                  # spatial index of the collected points used for the distance scoring
+    self.treePoints     = None                  # collected points included in the spatial index
+    self.bufferPoints   = None                  # collected points not included in the spatial index and hanging points
+    self.treeBufferSize = 128                   # number of collected points kept out of the spatial index before rebuilding it
     self.printTag            = 'SAMPLER ADAPTIVE'
 
     self.acceptedScoringParam = ['distance','distancePersistence']
@@ -405,6 +409,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
     self.persistenceMatrix[self.name+"LSpp"]  = np.zeros(matrixShape) #matrix that for each point of the testing grid tracks the persistence of the limit surface position
     self.oldTestMatrix[self.name+"LSpp"]      = np.zeros(matrixShape) #swap matrix fro convergence test
     self.hangingPoints                        = np.ndarray((0, self.nVar))
+    self.distanceTree, self.treePoints        = None, np.ndarray((0, self.nVar))
     self.raiseADebug('Initialization done')
 
   def localStillReady(self,ready):
@@ -512,8 +517,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
       if len(listsurfPoint)>0:
         self.invPointPersistence[gridID] = np.ones(len(listsurfPoint))
         if self.firstSurface == False:
-          for pointID, coordinate in enumerate(listsurfPoint):
-            self.invPointPersistence[gridID][pointID]=abs(self.persistenceMatrix[gridID][tuple(coordinate)])
+          self.invPointPersistence[gridID][:] = np.abs(self.persistenceMatrix[gridID][tuple(np.asarray(listsurfPoint).T)])
           maxPers = np.max(self.invPointPersistence[gridID])
           if maxPers != 0:
             self.invPointPersistence[gridID] = (maxPers-self.invPointPersistence[gridID])/maxPers
@@ -571,19 +575,19 @@ class LimitSurfaceSearch(AdaptiveSampler):
     matrixShape = self.limitSurfacePP.getTestMatrix().shape
     self.scores = OrderedDict()
     if self.scoringMethod.startswith('distance'):
-      sampledMatrix = np.zeros((len(self.limitSurfacePP.getFunctionValue()[axisNames[0]])+len(self.hangingPoints[:,0]),len(self.axisName)))
+      sampledMatrix = np.zeros((len(self.limitSurfacePP.getFunctionValue()[axisNames[0]]),len(self.axisName)))
       for varIndex, name in enumerate(axisNames):
-        sampledMatrix[:,varIndex] = np.append(self.limitSurfacePP.getFunctionValue()[name],self.hangingPoints[:,varIndex])
-      distanceTree = spatial.cKDTree(copy.copy(sampledMatrix),leafsize=12)
+        sampledMatrix[:,varIndex] = self.limitSurfacePP.getFunctionValue()[name]
       # The hanging point are added to the list of the already explored points
       # so as not to pick the same when in parallel
+      self.__updateDistanceTree(sampledMatrix)
       for varIndex, _ in enumerate(axisNames):
         self.inputInfo['distributionName'][self.axisName[varIndex]] = self.toBeSampled[self.axisName[varIndex]]
         self.inputInfo['distributionType'][self.axisName[varIndex]] = self.distDict[self.axisName[varIndex]].type
 
       for key, value in self.invPointPersistence.items():
         if key != self.exceptionGrid and self.surfPoint[key] is not None:
-          distance, _ = distanceTree.query(self.surfPoint[key])
+          distance = self.__nearestSampledDistance(self.surfPoint[key])
           # Different versions of scipy/numpy will yield different results on
           # our various supported platforms. If things are this close, then it
           # it is highly unlikely choosing one point over the other will affect
@@ -608,6 +612,36 @@ class LimitSurfaceSearch(AdaptiveSampler):
     else:
       self.raiseAnError(NotImplementedError,self.scoringMethod + ' scoring method is not implemented yet')
 
+  def __updateDistanceTree(self, sampledMatrix):
+    """
+      Updates the spatial index of the collected points. The collected points only grow
+      between two iterations, so the index is rebuilt only when more than treeBufferSize
+      points are not included in it (the others are searched by brute force) or when the
+      collected points changed.
+      @ In, sampledMatrix, np.array, the collected points, shape (nPoints, nVar)
+      @ Out, None
+    """
+    nTree = len(self.treePoints)
+    appended = len(sampledMatrix) >= nTree and np.array_equal(sampledMatrix[:nTree], self.treePoints)
+    if not appended or len(sampledMatrix) - nTree > self.treeBufferSize:
+      self.treePoints = np.array(sampledMatrix)
+      self.distanceTree = spatial.cKDTree(self.treePoints,leafsize=12) if len(self.treePoints) else None
+    self.bufferPoints = np.vstack((sampledMatrix[len(self.treePoints):], self.hangingPoints))
+
+  def __nearestSampledDistance(self, points):
+    """
+      Computes the distance from each point to the closest collected or hanging point
+      @ In, points, np.array, the points, shape (nPoints, nVar)
+      @ Out, distance, np.array, the distances, shape (nPoints,)
+    """
+    if self.distanceTree is not None:
+      distance, _ = self.distanceTree.query(points)
+    else:
+      distance = np.full(len(points), np.inf)
+    if len(self.bufferPoints):
+      distance = np.minimum(distance, spatial.distance.cdist(points, self.bufferPoints).min(axis=1))
+    return distance
+
   def localGenerateInput(self,model,oldInput):
     """
       Function to select the next most informative point for refining the limit
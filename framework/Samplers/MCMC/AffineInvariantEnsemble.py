@@ -0,0 +1,155 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Affine invariant ensemble sampler (Goodman and Weare stretch move) for Markov Chain Monte Carlo
+"""
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .MultiChainMCMC import MultiChainMCMC
+from utils import utils,randomUtils,InputData, InputTypes
+#Internal Modules End--------------------------------------------------------------------------------
+
+class AffineInvariantEnsemble(MultiChainMCMC):
+  """
+    Affine Invariant Ensemble Sampler
+  """
+
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super(AffineInvariantEnsemble, cls).getInputSpecification()
+    samplerInitInput = inputSpecification.getSub('samplerInit')
+    stretch = InputData.parameterInputFactory("stretch", contentType=InputTypes.FloatType,
+        descr=r"""The scale $a$ of the stretch move, must be larger than 1. \default{2.0}""")
+    samplerInitInput.addSub(stretch)
+    return inputSpecification
+
+  def __init__(self):
+    """
+      Default Constructor that will initialize member variables with reasonable
+      defaults or empty lists/dictionaries where applicable.
+      @ In, None
+      @ Out, None
+    """
+    MultiChainMCMC.__init__(self)
+    self._stretch = 2.0 # the scale of the stretch move
+    self._halves = [] # the walker indices of the two halves of the ensemble
+    self._activeHalf = None # the half currently moving, None while evaluating the starting points
+    self._pending = 0 # the number of proposals of the moving half not resolved yet
+
+  def handleInput(self, paramInput):
+    """
+      Read input specs
+      @ In, paramInput, InputData.ParameterInput, parameter specs interpreted
+      @ Out, None
+    """
+    MultiChainMCMC.handleInput(self, paramInput)
+    init = paramInput.findFirst('samplerInit')
+    stretch = init.findFirst('stretch')
+    if stretch is not None:
+      self._stretch = stretch.value
+    if self._stretch <= 1.0:
+      self.raiseAnError(IOError, '"stretch" must be larger than 1, but got {}!'.format(self._stretch))
+    if self._numChains < 2 * len(self.toBeCalibrated):
+      self.raiseAWarning('The number of walkers ({}) is less than twice the number of sampled variables,'.format(self._numChains),
+                         'the ensemble may not span the parameter space!')
+
+  def _defaultNumChains(self):
+    """
+      Provides the number of walkers used when "chains" is not given
+      @ In, None
+      @ Out, numChains, int, number of walkers
+    """
+    return max(4, 2 * len(self.toBeCalibrated))
+
+  def initialize(self, externalSeeding=None, solutionExport=None):
+    """
+      This function should be called every time a clean MCMC is needed. Called before takeAstep in <Step>
+      @ In, externalSeeding, int, optional, external seed
+      @ In, solutionExport, DataObject, optional, a PointSet to hold the solution
+      @ Out, None
+    """
+    MultiChainMCMC.initialize(self, externalSeeding=externalSeeding, solutionExport=solutionExport)
+    half = self._numChains // 2
+    self._halves = [list(range(half)), list(range(half, self._numChains))]
+    self._activeHalf = None
+    self._pending = self._numChains
+    if self._proposal:
+      self.raiseAWarning('"proposal" is not used by "{}" and will be ignored!'.format(self.type))
+
+  def _useChainRealization(self, index, state, info):
+    """
+      Feeds a collected realization back to the walker that proposed it
+      @ In, index, int, the walker index
+      @ In, state, dict, the evaluated proposal, i.e. {'rlz':dict, 'logPrior':float, 'logLikelihood':float}
+      @ In, info, dict, the information stored with the proposal (None for the starting point)
+      @ Out, None
+    """
+    if info is None:
+      accepted = True
+    else:
+      walker = self._chains[index]
+      net = self._logPosterior(state) - self._logPosterior(walker['current'])
+      alpha = min(0.0, (len(self.toBeCalibrated) - 1.) * np.log(info['z']) + net)
+      accepted = self._checkChainAcceptance(alpha, index)
+    self._advanceChain(index, state, accepted)
+    self._resolve()
+
+  def _resolve(self):
+    """
+      Accounts for a resolved proposal and, once the whole half is resolved, moves the other half
+      @ In, None
+      @ Out, None
+    """
+    self._pending -= 1
+    while not self._pending:
+      activeHalf = 0 if self._activeHalf is None else 1 - self._activeHalf
+      if all(self._chainFinished(k) for k in self._halves[activeHalf]):
+        return
+      self._activeHalf = activeHalf
+      self._pending = len(self._halves[self._activeHalf])
+      self._proposeHalf()
+
+  def _proposeHalf(self):
+    """
+      Draws the stretch moves of all the walkers of the active half. The proposals that fall
+      outside the bounds of the distributions are rejected without evaluating the model.
+      @ In, None
+      @ Out, None
+    """
+    active = self._halves[self._activeHalf]
+    complement = self._halves[1 - self._activeHalf]
+    a = self._stretch
+    for k in active:
+      engine = self._chains[k]['engine']
+      j = complement[randomUtils.randomIntegers(0, len(complement) - 1, self, engine=engine)]
+      z = ((a - 1.) * randomUtils.random(engine=engine) + 1.) ** 2 / a
+      walker = self._chains[k]['current']['rlz']
+      partner = self._chains[j]['current']['rlz']
+      values = dict((var, float(partner[var]) + z * (float(walker[var]) - float(partner[var]))) for var in self.toBeCalibrated)
+      if self._inSupport(values):
+        self._proposals.append((k, values, {'z': z}))
+      else:
+        self._advanceChain(k, None, False)
+        self._pending -= 1
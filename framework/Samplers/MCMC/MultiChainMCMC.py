@@ -0,0 +1,465 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Multiple chain Markov Chain Monte Carlo
+  This base class advances several Markov chains at the same time, so that every
+  JobHandler slot can be busy with one chain's model evaluation. Each chain draws its
+  random numbers from its own engine and takes the same share of the samples, so the
+  chains do not depend on the order in which the JobHandler returns the runs.
+"""
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+import abc
+from collections import deque
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from Samplers import AdaptiveSampler
+from .MCMC import MCMC
+from utils import utils,randomUtils,InputData, InputTypes
+#Internal Modules End--------------------------------------------------------------------------------
+
+class MultiChainMCMC(MCMC):
+  """
+    Base class for the MCMC samplers that advance several chains at the same time.
+    Every chain owns at most one model evaluation at a time, and the realizations
+    are collected in whichever order the JobHandler returns them.
+    The samples ("limit") are shared evenly among the chains.
+  """
+
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super(MultiChainMCMC, cls).getInputSpecification()
+    samplerInitInput = inputSpecification.getSub('samplerInit')
+    chains = InputData.parameterInputFactory("chains", contentType=InputTypes.IntegerType,
+        descr=r"""The number of Markov chains advanced at the same time""")
+    samplerInitInput.addSub(chains)
+    return inputSpecification
+
+  @classmethod
+  def getSolutionExportVariableNames(cls):
+    """
+      Compiles a list of acceptable SolutionExport variable options.
+      @ In, None
+      @ Out, vars, dict, {varName: manual description} for each solution export option
+    """
+    vars = super(MultiChainMCMC, cls).getSolutionExportVariableNames()
+    new = {'traceID': 'integer identifying which iteration the Markov chain given by "chainID" is on',
+           'chainID': 'integer identifying the Markov chain',
+           'AcceptRate': 'the accept rate of the Markov chain given by "chainID"',
+           'Rhat_{VAR}': r"""the Gelman-Rubin potential scale reduction factor of variable {VAR} among
+                           all chains, computed on the samples after burn-in"""
+           }
+    vars.update(new)
+    return vars
+
+  def __init__(self):
+    """
+      Default Constructor that will initialize member variables with reasonable
+      defaults or empty lists/dictionaries where applicable.
+      @ In, None
+      @ Out, None
+    """
+    MCMC.__init__(self)
+    self._numChains = None     # number of chains, if None the default of the sampler is used
+    self._chains = []          # list of dict, the state of each chain
+    self._proposals = deque()  # proposals ready to be evaluated, i.e. (chain, {var:val}, info)
+    self._inFlight = {}        # proposals submitted as jobs, i.e. {prefix: (chain, {var:val}, info)}
+    self._totalSteps = 0       # total number of chain transitions
+    self._acceptCount = 0      # total number of accepted transitions
+
+  def handleInput(self, paramInput):
+    """
+      Read input specs
+      @ In, paramInput, InputData.ParameterInput, parameter specs interpreted
+      @ Out, None
+    """
+    MCMC.handleInput(self, paramInput)
+    init = paramInput.findFirst('samplerInit')
+    chains = init.findFirst('chains')
+    if chains is not None:
+      self._numChains = chains.value
+    else:
+      self._numChains = self._defaultNumChains()
+    if self._numChains < self._minNumChains():
+      self.raiseAnError(IOError, 'Sampler "{}" requires at least {} chains, but "chains" is {}!'.format(self.name, self._minNumChains(), self._numChains))
+    if self._burnIn >= self._chainLimit():
+      self.raiseAnError(IOError, 'The samples of all chains ("limit") must exceed "burnIn" times the number of chains!')
+
+  def _defaultNumChains(self):
+    """
+      Provides the number of chains used when "chains" is not given
+      @ In, None
+      @ Out, numChains, int, number of chains
+    """
+    return 4
+
+  def _minNumChains(self):
+    """
+      Provides the smallest number of chains allowed
+      @ In, None
+      @ Out, minChains, int, the smallest number of chains
+    """
+    return 2
+
+  def _numReplicas(self):
+    """
+      Provides the number of Markov chains advanced at the same time
+      @ In, None
+      @ Out, numReplicas, int, the number of chains
+    """
+    return self._numChains
+
+  def _chainLimit(self):
+    """
+      Provides the number of samples of each chain, including the starting point
+      @ In, None
+      @ Out, chainLimit, int, the number of samples of each chain
+    """
+    return self.limit // self._numReplicas()
+
+  def _chainFinished(self, index):
+    """
+      Checks if a chain has taken all its samples
+      @ In, index, int, the chain index
+      @ Out, finished, bool, True if the chain must not propose any other point
+    """
+    return self._chains[index]['step'] + 1 >= self._chainLimit()
+
+  def initialize(self, externalSeeding=None, solutionExport=None):
+    """
+      This function should be called every time a clean MCMC is needed. Called before takeAstep in <Step>
+      @ In, externalSeeding, int, optional, external seed
+      @ In, solutionExport, DataObject, optional, a PointSet to hold the solution
+      @ Out, None
+    """
+    MCMC.initialize(self, externalSeeding=externalSeeding, solutionExport=solutionExport)
+    if self._correlated:
+      self.raiseAnError(IOError, 'Multivariate case can not be handled by "{}", please consider adaptive Metropolis!'.format(self.type))
+    for var, dist in self.distDict.items():
+      if dist.getDimensionality() != 1:
+        self.raiseAnError(IOError, 'Only 1-dimensional probability distribution is allowed in "{}"!'.format(self.type),
+                          'Please check your input for variable "{}".'.format(var))
+    for var in self._priorFuns:
+      if self._initialValues[var] is None:
+        self.raiseAnError(IOError, '"initial" is required when using "probabilityFunction", but not found \
+          for variable "{}"'.format(var))
+    self.addMetaKeys(['chainID'])
+    self._chains = [self._newChain(c) for c in range(self._numReplicas())]
+    self._proposals.clear()
+    self._inFlight = {}
+    self._totalSteps = 0
+    self._acceptCount = 0
+    for c in range(self._numReplicas()):
+      self._proposals.append((c, self._startingPoint(c), None))
+
+  def _newChain(self, index):
+    """
+      Creates the bookkeeping of a chain
+      @ In, index, int, the chain index
+      @ Out, chain, dict, the chain state
+    """
+    # the seed of each chain is drawn from the sampler seed, see "initialize"
+    engine = randomUtils.newRNG()
+    randomUtils.randomSeed(randomUtils.randomIntegers(0, 2**31, self), engine=engine)
+    chain = {'chainID': index,   # identifier of the chain in the solution export
+             'engine': engine,   # random number generator of the chain
+             'export': True,     # True if the chain samples the posterior and is reported
+             'beta': 1.0,        # inverse temperature of the likelihood
+             'current': None,    # current state, i.e. {'rlz':dict, 'logPrior':float, 'logLikelihood':float}
+             'step': 0,          # number of transitions
+             'accepted': 0,      # number of accepted transitions
+             'n': 0,             # number of samples after burn-in, for the diagnostics
+             'mean': np.zeros(len(self.toBeCalibrated)),
+             'M2': np.zeros(len(self.toBeCalibrated))}
+    return chain
+
+  def _startingPoint(self, index):
+    """
+      Provides the starting point of a chain. The first chain starts at the "initial" values,
+      the others (and the variables without "initial") at random draws from the distributions.
+      @ In, index, int, the chain index
+      @ Out, values, dict, the starting point, i.e. {var: val}
+    """
+    values = {}
+    for var in self.toBeCalibrated:
+      initial = self._initialValues.get(var, None)
+      if var in self.distDict:
+        values[var] = initial if index == 0 and initial is not None else self.distDict[var].rvs()
+      else:
+        values[var] = initial if index == 0 else initial + self._stdProposalDefault * randomUtils.randomNormal()
+    return values
+
+  def localGenerateInput(self, model, myInput):
+    """
+      Provides the next sample to take.
+      After this method is called, the self.inputInfo should be ready to be sent
+      to the model
+      @ In, model, model instance, an instance of a model
+      @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
+      @ Out, None
+    """
+    index, values, info = self._proposals.popleft()
+    chain = self._chains[index]
+    self.values.update(values)
+    for key, value in values.items():
+      if key in self.distDict:
+        self.inputInfo['SampledVarsPb'][key] = self.distDict[key].pdf(value)
+      else:
+        self.inputInfo['SampledVarsPb'][key] = self._priorFuns[key].evaluate("pdf", values)
+      self.inputInfo['ProbabilityWeight-' + key] = 1.
+    self.inputInfo['PointProbability'] = 1.0
+    self.inputInfo['ProbabilityWeight'] = 1.0
+    self.inputInfo['SamplerType'] = self.type
+    self.inputInfo['chainID'] = chain['chainID']
+    self.inputInfo['LogPosterior'] = self._logPosterior(chain['current']) if chain['current'] is not None else 0.0
+    self.inputInfo['AcceptRate'] = self._chainAcceptRate(chain)
+    self._inFlight[self.inputInfo['prefix']] = (index, values, info)
+
+  def localFinalizeActualSampling(self, jobObject, model, myInput):
+    """
+      General function (available to all samplers) that finalizes the sampling
+      calculation just ended. The realization is fed back to the chain that proposed it.
+      @ In, jobObject, instance, an instance of a JobHandler
+      @ In, model, model instance, it is the instance of a RAVEN model
+      @ In, myInput, list, the generating input
+      @ Out, None
+    """
+    AdaptiveSampler.localFinalizeActualSampling(self, jobObject, model, myInput)
+    prefix = jobObject.getMetadata()['prefix']
+    if prefix not in self._inFlight:
+      return
+    index, _, info = self._inFlight.pop(prefix)
+    _, full = self._targetEvaluation.realization(matchDict={'prefix': prefix})
+    if full is None:
+      self.raiseAWarning('Realization "{}" was not found in "{}", chain {} is stopped!'.format(prefix, self._targetEvaluation.name, index))
+      return
+    rlz = dict((var, full[var]) for var in (list(self.toBeCalibrated.keys()) + [self._likelihood] + list(self.dependentSample.keys())))
+    state = {'rlz': rlz,
+             'logPrior': self._logPrior(rlz),
+             'logLikelihood': self._logLikelihoodValue(rlz)}
+    self._useChainRealization(index, state, info)
+
+  @abc.abstractmethod
+  def _useChainRealization(self, index, state, info):
+    """
+      Feeds a collected realization back to the chain that proposed it
+      @ In, index, int, the chain index
+      @ In, state, dict, the evaluated proposal, i.e. {'rlz':dict, 'logPrior':float, 'logLikelihood':float}
+      @ In, info, dict, the information stored with the proposal (None for the starting point)
+      @ Out, None
+    """
+
+  def localStillReady(self, ready):
+    """
+      Determines if sampler is prepared to provide another input.  If not, and
+      if jobHandler is finished, this will end sampling.
+      @ In,  ready, bool, a boolean representing whether the caller is prepared for another input.
+      @ Out, ready, bool, a boolean representing whether the caller is prepared for another input.
+    """
+    ready = bool(self._proposals) and MCMC.localStillReady(self, ready)
+    return ready
+
+  def _logPrior(self, rlz):
+    """
+      Computes the log prior of a realization
+      @ In, rlz, dict, the realization
+      @ Out, logPrior, float, the log prior
+    """
+    logPrior = 0.0
+    for var in self.toBeCalibrated:
+      if var in self.distDict:
+        logPrior += self.distDict[var].logPdf(float(rlz[var]))
+      else:
+        logPrior += np.log(self._priorFuns[var].evaluate("pdf", rlz))
+    return float(logPrior)
+
+  def _logLikelihoodValue(self, rlz):
+    """
+      Computes the log likelihood of a realization
+      @ In, rlz, dict, the realization
+      @ Out, logLikelihood, float, the log likelihood
+    """
+    value = float(rlz[self._likelihood])
+    return value if self._logLikelihood else float(np.log(value))
+
+  @staticmethod
+  def _logPosterior(state, beta=1.0):
+    """
+      Computes the (tempered) log posterior of a chain state
+      @ In, state, dict, the chain state
+      @ In, beta, float, optional, the inverse temperature of the likelihood
+      @ Out, logPosterior, float, the log posterior
+    """
+    return state['logPrior'] + beta * state['logLikelihood']
+
+  def _useRealization(self, newRlz, currentRlz):
+    """
+      Computes the log acceptance probability of a move between two chain states
+      @ In, newRlz, dict, the proposed chain state
+      @ In, currentRlz, dict, the current chain state, with the inverse temperature "beta"
+      @ Out, netLogPosterior, float, the accepted probabilty
+    """
+    beta = currentRlz.get('beta', 1.0)
+    netLogPosterior = self._logPosterior(newRlz, beta) - self._logPosterior(currentRlz, beta)
+    netLogPosterior = min(0.0, netLogPosterior)
+    return netLogPosterior
+
+  def _inSupport(self, values):
+    """
+      Checks if a point lies within the bounds of the distributions
+      @ In, values, dict, the point, i.e. {var: val}
+      @ Out, inSupport, bool, True if all the values are within the bounds
+    """
+    for var, dist in self.distDict.items():
+      lowerBound = dist.lowerBound
+      upperBound = dist.upperBound
+      if (lowerBound is not None and values[var] < lowerBound) or (upperBound is not None and values[var] > upperBound):
+        return False
+    return True
+
+  def _checkChainAcceptance(self, alpha, index):
+    """
+      Method to check the acceptance of a chain transition
+      @ In, alpha, float, the log accepted probabilty
+      @ In, index, int, the index of the chain drawing the random number
+      @ Out, acceptable, bool, True if we accept the new sampled point
+    """
+    return alpha > np.log(randomUtils.random(engine=self._chains[index]['engine']))
+
+  def _advanceChain(self, index, state, accepted):
+    """
+      Moves a chain one step forward, records the step in the solution export and
+      updates the convergence diagnostics
+      @ In, index, int, the chain index
+      @ In, state, dict, the proposed chain state (None if it was rejected without evaluation)
+      @ In, accepted, bool, True if the proposal is accepted
+      @ Out, None
+    """
+    chain = self._chains[index]
+    chain['step'] += 1
+    self._totalSteps += 1
+    if accepted:
+      chain['current'] = {'rlz': state['rlz'], 'logPrior': state['logPrior'], 'logLikelihood': state['logLikelihood'], 'beta': chain['beta']}
+      chain['accepted'] += 1
+      self._acceptCount += 1
+    self._acceptRate = self._acceptCount / self._totalSteps
+    if not chain['export'] or chain['step'] <= self._burnIn:
+      return
+    # running mean and variance (Welford) for the diagnostics
+    values = np.array([float(chain['current']['rlz'][var]) for var in self.toBeCalibrated])
+    chain['n'] += 1
+    delta = values - chain['mean']
+    chain['mean'] += delta / chain['n']
+    chain['M2'] += delta * (values - chain['mean'])
+    rlz = dict(chain['current']['rlz'])
+    rlz['traceID'] = chain['step']
+    rlz['chainID'] = chain['chainID']
+    rlz['LogPosterior'] = self._logPosterior(chain['current'])
+    rlz['AcceptRate'] = self._chainAcceptRate(chain)
+    rlz.update(self._exportDiagnostics(chain))
+    rlz = dict((var, np.atleast_1d(val)) for var, val in rlz.items())
+    self._solutionExport.addRealization(rlz)
+
+  def _exportDiagnostics(self, chain):
+    """
+      Provides the diagnostics stored in the solution export with each sample
+      @ In, chain, dict, the chain state
+      @ Out, diagnostics, dict, {name: value}
+    """
+    return dict(('Rhat_{}'.format(var), val) for var, val in self.gelmanRubin().items())
+
+  @staticmethod
+  def _chainAcceptRate(chain):
+    """
+      Computes the accept rate of a chain
+      @ In, chain, dict, the chain state
+      @ Out, acceptRate, float, the accept rate
+    """
+    return chain['accepted'] / chain['step'] if chain['step'] else 1.0
+
+  def gelmanRubin(self):
+    """
+      Computes the Gelman-Rubin potential scale reduction factor of each variable among
+      the reported chains, using the samples after burn-in.
+      @ In, None
+      @ Out, rhat, dict, {var: potential scale reduction factor} (nan if not enough samples)
+    """
+    chains = [chain for chain in self._chains if chain['export'] and chain['n'] > 1]
+    if len(chains) < 2:
+      return dict((var, np.nan) for var in self.toBeCalibrated)
+    counts = np.array([chain['n'] for chain in chains], dtype=float)
+    means = np.array([chain['mean'] for chain in chains])
+    variances = np.array([chain['M2'] for chain in chains]) / (counts[:, np.newaxis] - 1.)
+    n = counts.mean()
+    within = variances.mean(axis=0)
+    between = n * means.var(axis=0, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+      rhat = np.sqrt(((n - 1.) / n * within + between / n) / within)
+    return dict(zip(self.toBeCalibrated, rhat))
+
+  def _formatSolutionExportVariableNames(self, acceptable):
+    """
+      Does magic formatting for variables, based on this class's needs.
+      Extend in inheritors as needed.
+      @ In, acceptable, set, set of acceptable entries for solution export for this entity
+      @ Out, new, set, modified set of acceptable variables with all formatting complete
+    """
+    acceptable = MCMC._formatSolutionExportVariableNames(self, acceptable)
+    new = []
+    for template in acceptable:
+      if template == 'Rhat_{VAR}':
+        new.extend([utils.partialFormat(template, {'VAR': var}) for var in self.toBeCalibrated])
+      else:
+        new.append(template)
+    return new
+
+  def finalizeSampler(self, failedRuns):
+    """
+      Method called at the end of the Step when no more samples will be taken.  Closes out sampler for step.
+      Reports the accept rate of each chain and the convergence diagnostics.
+      @ In, failedRuns, list, list of JobHandler.ExternalRunner objects
+      @ Out, None
+    """
+    MCMC.finalizeSampler(self, failedRuns)
+    for chain in self._chains:
+      self.raiseAMessage('Chain {} ({}): {} steps, accept rate {:1.3f}'.format(self._chains.index(chain), self._chainLabel(chain),
+                         chain['step'], self._chainAcceptRate(chain)))
+    for var, rhat in self.gelmanRubin().items():
+      self.raiseAMessage('Gelman-Rubin factor of "{}": {:1.4f}'.format(var, rhat))
+
+  def _chainLabel(self, chain):
+    """
+      Provides a short description of a chain for the summary
+      @ In, chain, dict, the chain state
+      @ Out, label, str, the description
+    """
+    return 'chainID {}'.format(chain['chainID'])
+
+  def _localHandleFailedRuns(self, failedRuns):
+    """
+      Specialized method for samplers to handle failed runs.  Defaults to failing runs.
+      @ In, failedRuns, list, list of JobHandler.ExternalRunner objects
+      @ Out, None
+    """
+    if len(failedRuns)>0:
+      self.raiseADebug('  The chains of the failed runs stopped, continuing with the other chains.')
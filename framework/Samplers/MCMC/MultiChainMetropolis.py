@@ -0,0 +1,137 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Metropolis Hastings Algorithm with multiple independent chains
+"""
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .MultiChainMCMC import MultiChainMCMC
+from utils import utils,randomUtils,InputData, InputTypes
+#Internal Modules End--------------------------------------------------------------------------------
+
+class MultiChainMetropolis(MultiChainMCMC):
+  """
+    Metropolis Sampler with multiple independent chains
+  """
+
+  def __init__(self):
+    """
+      Default Constructor that will initialize member variables with reasonable
+      defaults or empty lists/dictionaries where applicable.
+      @ In, None
+      @ Out, None
+    """
+    MultiChainMCMC.__init__(self)
+
+  def initialize(self, externalSeeding=None, solutionExport=None):
+    """
+      This function should be called every time a clean MCMC is needed. Called before takeAstep in <Step>
+      @ In, externalSeeding, int, optional, external seed
+      @ In, solutionExport, DataObject, optional, a PointSet to hold the solution
+      @ Out, None
+    """
+    MultiChainMCMC.initialize(self, externalSeeding=externalSeeding, solutionExport=solutionExport)
+    for var in self.toBeCalibrated:
+      if isinstance(self._proposal.get(var, None), str):
+        self._proposal[var] = self.retrieveObjectFromAssemblerDict('proposal', self._proposal[var])
+        distType = self._proposal[var].getDistType()
+        dim = self._proposal[var].getDimensionality()
+        if distType != 'Continuous':
+          self.raiseAnError(IOError, 'variable "{}" requires continuous proposal distribution, but "{}" is provided!'.format(var, distType))
+        if dim != 1:
+          self.raiseAnError(IOError, 'When "proposal" is used, only 1-dimensional probability distribution is allowed!',
+                            'Please check your input for variable "{}".'.format(var))
+      elif var not in self._proposal:
+        std = self._stdProposalDefault
+        if var in self.distDict:
+          std *= self.distDict[var].untruncatedStdDev()
+        propDist = self._availProposal['normal'](0.0, std)
+        propDist.initializeDistribution()
+        self._proposal[var] = propDist
+        self.raiseAWarning('"proposal" is not provided for variable "{}", default normal distribution with std={} is used!'.format(var, std))
+    for chain in self._chains:
+      chain['scaling'] = self._scaling
+      chain['countsUntilTune'] = self._tuneInterval
+      chain['acceptInTune'] = 0
+
+  def _propose(self, index):
+    """
+      Draws the random walk proposal of a chain
+      @ In, index, int, the chain index
+      @ Out, values, dict, the proposed point, i.e. {var: val}
+    """
+    chain = self._chains[index]
+    current = chain['current']['rlz']
+    values = {}
+    for var in self.toBeCalibrated:
+      newVal = float(current[var]) + self._proposal[var].ppf(randomUtils.random(engine=chain['engine'])) * chain['scaling']
+      if var in self.distDict:
+        ## check the lowerBound and upperBound
+        lowerBound = self.distDict[var].lowerBound
+        upperBound = self.distDict[var].upperBound
+        if lowerBound is not None and newVal < lowerBound:
+          newVal = lowerBound
+        if upperBound is not None and newVal > upperBound:
+          newVal = upperBound
+      values[var] = newVal
+    return values
+
+  def _useChainRealization(self, index, state, info):
+    """
+      Feeds a collected realization back to the chain that proposed it
+      @ In, index, int, the chain index
+      @ In, state, dict, the evaluated proposal, i.e. {'rlz':dict, 'logPrior':float, 'logLikelihood':float}
+      @ In, info, dict, the information stored with the proposal (None for the starting point)
+      @ Out, None
+    """
+    chain = self._chains[index]
+    if info is None:
+      accepted = True
+    else:
+      alpha = self._useRealization(state, chain['current'])
+      accepted = self._checkChainAcceptance(alpha, index)
+    self._advanceChain(index, state, accepted)
+    self._tuneChain(index, accepted)
+    self._continueChain(index)
+
+  def _tuneChain(self, index, accepted):
+    """
+      Tunes the scaling parameter of a chain's proposal distributions
+      @ In, index, int, the chain index
+      @ In, accepted, bool, True if the last proposal was accepted
+      @ Out, None
+    """
+    if not self._tune:
+      return
+    chain = self._chains[index]
+    chain['acceptInTune'] += 1 if accepted else 0
+    chain['countsUntilTune'] -= 1
+    if not chain['countsUntilTune']:
+      chain['scaling'] = self.tuneScalingParam(chain['scaling'], chain['acceptInTune']/float(self._tuneInterval))
+      chain['countsUntilTune'] = self._tuneInterval
+      chain['acceptInTune'] = 0
+
+  def _continueChain(self, index):
+    """
+      Queues the next proposal of a chain, unless the chain has taken all its samples
+      @ In, index, int, the chain index
+      @ Out, None
+    """
+    if self._chainFinished(index):
+      return
+    self._proposals.append((index, self._propose(index), {}))
@@ -0,0 +1,223 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Parallel Tempering (replica exchange) Markov Chain Monte Carlo
+"""
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .MultiChainMetropolis import MultiChainMetropolis
+from utils import utils,randomUtils,InputData, InputTypes
+#Internal Modules End--------------------------------------------------------------------------------
+
+class ParallelTempering(MultiChainMetropolis):
+  """
+    Parallel Tempering Sampler
+  """
+
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super(ParallelTempering, cls).getInputSpecification()
+    samplerInitInput = inputSpecification.getSub('samplerInit')
+    temperatures = InputData.parameterInputFactory("temperatures", contentType=InputTypes.FloatListType,
+        descr=r"""The temperatures of the replicas of each ladder, the smallest must be 1. \default{1 2 4 8}""")
+    samplerInitInput.addSub(temperatures)
+    swapInterval = InputData.parameterInputFactory("swapInterval", contentType=InputTypes.IntegerType,
+        descr=r"""The number of steps of each replica between two exchanges of states. \default{10}""")
+    samplerInitInput.addSub(swapInterval)
+    return inputSpecification
+
+  @classmethod
+  def getSolutionExportVariableNames(cls):
+    """
+      Compiles a list of acceptable SolutionExport variable options.
+      @ In, None
+      @ Out, vars, dict, {varName: manual description} for each solution export option
+    """
+    vars = super(ParallelTempering, cls).getSolutionExportVariableNames()
+    new = {'chainID': 'integer identifying the ladder of the cold replica',
+           'SwapRate': 'the accept rate of the exchanges between the cold replica and the next temperature'
+           }
+    vars.update(new)
+    return vars
+
+  def __init__(self):
+    """
+      Default Constructor that will initialize member variables with reasonable
+      defaults or empty lists/dictionaries where applicable.
+      @ In, None
+      @ Out, None
+    """
+    MultiChainMetropolis.__init__(self)
+    self._temperatures = [1.0, 2.0, 4.0, 8.0] # temperatures of the replicas of each ladder
+    self._swapInterval = 10 # number of steps between the exchanges
+
+  def handleInput(self, paramInput):
+    """
+      Read input specs
+      @ In, paramInput, InputData.ParameterInput, parameter specs interpreted
+      @ Out, None
+    """
+    init = paramInput.findFirst('samplerInit')
+    if init is not None:
+      temperatures = init.findFirst('temperatures')
+      if temperatures is not None:
+        self._temperatures = sorted(temperatures.value)
+      swapInterval = init.findFirst('swapInterval')
+      if swapInterval is not None:
+        self._swapInterval = swapInterval.value
+    if len(self._temperatures) < 2 or self._temperatures[0] != 1.0:
+      self.raiseAnError(IOError, '"temperatures" requires at least two values and the smallest must be 1!')
+    if self._swapInterval < 1:
+      self.raiseAnError(IOError, '"swapInterval" must be a positive integer!')
+    MultiChainMetropolis.handleInput(self, paramInput)
+
+  def _defaultNumChains(self):
+    """
+      Provides the number of ladders used when "chains" is not given
+      @ In, None
+      @ Out, numChains, int, number of ladders
+    """
+    return 2
+
+  def _minNumChains(self):
+    """
+      Provides the smallest number of ladders allowed
+      @ In, None
+      @ Out, minChains, int, the smallest number of ladders
+    """
+    return 1
+
+  def _numReplicas(self):
+    """
+      Provides the number of Markov chains advanced at the same time, one per temperature in each ladder
+      @ In, None
+      @ Out, numReplicas, int, the number of replicas
+    """
+    return self._numChains * len(self._temperatures)
+
+  def initialize(self, externalSeeding=None, solutionExport=None):
+    """
+      This function should be called every time a clean MCMC is needed. Called before takeAstep in <Step>
+      @ In, externalSeeding, int, optional, external seed
+      @ In, solutionExport, DataObject, optional, a PointSet to hold the solution
+      @ Out, None
+    """
+    MultiChainMetropolis.initialize(self, externalSeeding=externalSeeding, solutionExport=solutionExport)
+    self.addMetaKeys(['temperature'])
+    numTemps = len(self._temperatures)
+    for index, chain in enumerate(self._chains):
+      ladder, rung = divmod(index, numTemps)
+      chain['chainID'] = ladder
+      chain['rung'] = rung
+      chain['beta'] = 1.0 / self._temperatures[rung]
+      chain['export'] = rung == 0
+      chain['waiting'] = False
+      chain['swapTried'] = 0
+      chain['swapAccepted'] = 0
+
+  def _startingPoint(self, index):
+    """
+      Provides the starting point of a replica, the first ladder starts at the "initial" values
+      @ In, index, int, the replica index
+      @ Out, values, dict, the starting point, i.e. {var: val}
+    """
+    return MultiChainMetropolis._startingPoint(self, index // len(self._temperatures))
+
+  def localGenerateInput(self, model, myInput):
+    """
+      Provides the next sample to take.
+      After this method is called, the self.inputInfo should be ready to be sent
+      to the model
+      @ In, model, model instance, an instance of a model
+      @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
+      @ Out, None
+    """
+    index = self._proposals[0][0]
+    MultiChainMetropolis.localGenerateInput(self, model, myInput)
+    self.inputInfo['temperature'] = 1.0 / self._chains[index]['beta']
+
+  def _continueChain(self, index):
+    """
+      Queues the next proposal of a replica, or waits for the other replicas of the ladder
+      when an exchange of states is due
+      @ In, index, int, the replica index
+      @ Out, None
+    """
+    chain = self._chains[index]
+    if self._chainFinished(index):
+      return
+    if chain['step'] % self._swapInterval:
+      MultiChainMetropolis._continueChain(self, index)
+      return
+    chain['waiting'] = True
+    numTemps = len(self._temperatures)
+    start = (index // numTemps) * numTemps
+    ladder = range(start, start + numTemps)
+    if not all(self._chains[i]['waiting'] for i in ladder):
+      return
+    self._swap(list(ladder))
+    for i in ladder:
+      self._chains[i]['waiting'] = False
+      MultiChainMetropolis._continueChain(self, i)
+
+  def _swap(self, ladder):
+    """
+      Proposes the exchange of states between the replicas of adjacent temperatures,
+      from the hottest to the coldest pair
+      @ In, ladder, list, the replica indices of the ladder, from the coldest to the hottest
+      @ Out, None
+    """
+    for k in reversed(range(len(ladder) - 1)):
+      cold = self._chains[ladder[k]]
+      hot = self._chains[ladder[k + 1]]
+      alpha = (cold['beta'] - hot['beta']) * (hot['current']['logLikelihood'] - cold['current']['logLikelihood'])
+      cold['swapTried'] += 1
+      hot['swapTried'] += 1
+      # the cold replica draws the random numbers of the exchanges of its ladder
+      if self._checkChainAcceptance(min(0.0, alpha), ladder[0]):
+        cold['swapAccepted'] += 1
+        hot['swapAccepted'] += 1
+        cold['current'], hot['current'] = hot['current'], cold['current']
+        cold['current']['beta'] = cold['beta']
+        hot['current']['beta'] = hot['beta']
+
+  def _exportDiagnostics(self, chain):
+    """
+      Provides the diagnostics stored in the solution export with each sample
+      @ In, chain, dict, the chain state
+      @ Out, diagnostics, dict, {name: value}
+    """
+    diagnostics = MultiChainMetropolis._exportDiagnostics(self, chain)
+    diagnostics['SwapRate'] = chain['swapAccepted'] / chain['swapTried'] if chain['swapTried'] else 0.0
+    return diagnostics
+
+  def _chainLabel(self, chain):
+    """
+      Provides a short description of a replica for the summary
+      @ In, chain, dict, the chain state
+      @ Out, label, str, the description
+    """
+    swapRate = chain['swapAccepted'] / chain['swapTried'] if chain['swapTried'] else 0.0
+    return 'ladder {}, temperature {}, swap rate {:1.3f}'.format(chain['chainID'], 1.0 / chain['beta'], swapRate)
@@ -21,6 +21,13 @@
 from .MCMC import MCMC
 from .Metropolis import Metropolis
 from .AdaptiveMetropolis import AdaptiveMetropolis
+from .MultiChainMCMC import MultiChainMCMC
+from .MultiChainMetropolis import MultiChainMetropolis
+from .AffineInvariantEnsemble import AffineInvariantEnsemble
+from .ParallelTempering import ParallelTempering
 
 __all__ = ['Metropolis',
-           'AdaptiveMetropolis']
+           'AdaptiveMetropolis',
+           'MultiChainMetropolis',
+           'AffineInvariantEnsemble',
+           'ParallelTempering']
@@ -33,6 +33,9 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
     This is the base class for samplers
     Samplers own the sampling strategy (Type) and they generate the input values using the associate distribution.
   """
+  # True if many samples can be generated and evaluated together before any of them is collected
+  # (see "blockSize" in Steps.MultiRun), i.e. the sampler never needs the outcome of a run
+  blockSampling = False
 
   #### INITIALIZATION METHODS ####
   @classmethod
@@ -49,5 +49,8 @@ from .AdaptiveDynamicEventTree import AdaptiveDynamicEventTree
 # MCMC Samplers
 from .MCMC import Metropolis
 from .MCMC import AdaptiveMetropolis
+from .MCMC import MultiChainMetropolis
+from .MCMC import AffineInvariantEnsemble
+from .MCMC import ParallelTempering
 
 from .Factory import factory
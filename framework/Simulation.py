@@ -22,6 +22,7 @@ import string
 import datetime
 import numpy as np
 import threading
+import importlib
 
 import MessageHandler # this needs to happen early to instantiate message handler
 from BaseClasses import MessageUser
@@ -29,9 +30,7 @@ import Steps
 import DataObjects
 import Files
 import Samplers
-import Optimizers
 import Models
-import Metrics
 import Distributions
 import Databases
 import Functions
@@ -170,6 +169,7 @@ class Simulation(MessageUser):
     Add in Simulation.__init__ the following
      self.<myClass>Dict = {}
      self.entityModules['<myClass>'] = <MyModule>
+    (or the module name, if the module has to be imported only when <myClass> is used)
      self.entities['<myClass>'  ] = self.<myClass>+'Dict'
     The XML describing the new entity should be organized as it follows:
      <MyModule (camelback with first letter capital)>
@@ -276,13 +276,13 @@ class Simulation(MessageUser):
     self.entityModules['Steps'            ] = Steps
     self.entityModules['DataObjects'      ] = DataObjects
     self.entityModules['Samplers'         ] = Samplers
-    self.entityModules['Optimizers'       ] = Optimizers
+    self.entityModules['Optimizers'       ] = 'Optimizers' # imported when its block is read
     self.entityModules['Models'           ] = Models
     self.entityModules['Distributions'    ] = Distributions
     self.entityModules['Databases'        ] = Databases
     self.entityModules['Functions'        ] = Functions
     self.entityModules['Files'            ] = Files
-    self.entityModules['Metrics'          ] = Metrics
+    self.entityModules['Metrics'          ] = 'Metrics'    # imported when its block is read
     self.entityModules['OutStreams'       ] = OutStreams
 
     #Mapping between an entity type and the dictionary containing the instances for the simulation
@@ -421,6 +421,9 @@ class Simulation(MessageUser):
         else:
           globalAttributes = child.attrib
         module = self.entityModules[className]
+        if isinstance(module, str):
+          module = importlib.import_module(module)
+          self.entityModules[className] = module
         if module.factory.returnInputParameter:
           paramInput = module.returnInputParameter()
           paramInput.parseNode(child)
@@ -81,7 +81,7 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
     """
     super().__init__(**kwargs)
     self.parList    = []   # List of list [[role played in the step, class type, specialization, global name (user assigned by the input)]]
-    self.sleepTime  = 0.005  # Waiting time before checking if a run is finished
+    self.sleepTime  = None   # Maximum waiting time before checking if a run is finished (None: JobHandler default)
     #If a step possess re-seeding instruction it is going to ask to the sampler to re-seed according
     #  re-seeding = a number to be used as a new seed
     #  re-seeding = 'continue' the use the already present random environment
@@ -113,7 +113,9 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
                        \xmlNode{MultiRun} XML block."""
 
     inputSpecification.addParam("sleepTime", InputTypes.FloatType,
-        descr='Determines the wait time between successive iterations within this step, in seconds.')
+        descr=r"""Determines the maximum wait time between successive iterations within this step, in seconds.
+              The step is woken up as soon as a run finishes or there is room for new runs, so this
+              value is only an upper bound. If not inputted, the JobHandler default is used.""")
     inputSpecification.addParam("re-seeding", InputTypes.StringType, descr=r"""
               this optional
               attribute could be used to control the seeding of the random number generator (RNG).
@@ -121,6 +123,12 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
               can be: either 1) an integer value with the seed to be used (e.g. \xmlAttr{re-seeding} =
               ``20021986''), or 2) string value named ``continue'' where the RNG is not re-initialized""")
     inputSpecification.addParam("pauseAtEnd", InputTypes.StringType)
+    inputSpecification.addParam("blockSize", InputTypes.IntegerType,
+        descr=r"""MultiRun only. Number of samples generated by the sampler and evaluated together, in a single
+              job and a single vectorized call, by the model. The block is stored in the outputs at once.
+              Only used by models able to evaluate blocks of samples (e.g. static ROMs) driven by forward
+              samplers; otherwise each sample is a separate job.
+              \default{1}""")
     inputSpecification.addParam("fromDirectory", InputTypes.StringType)
     inputSpecification.addParam("repeatFailureRuns", InputTypes.StringType)
     inputSpecification.addParam("clearRunDir", InputTypes.BoolType,
@@ -533,7 +541,7 @@ class SingleRun(Step):
                                  str(self.failureHandling['repetitions'])+' times, failing all the times!!!')
       if jobHandler.isFinished() and len(jobHandler.getFinishedNoPop()) == 0:
         break
-      time.sleep(self.sleepTime)
+      jobHandler.waitForEvent(self.sleepTime)
     if sampler is not None:
       sampler.handleFailedRuns(self.failedRuns)
     else:
@@ -566,6 +574,8 @@ class MultiRun(SingleRun):
     super().__init__()
     self._samplerInitDict = {} #this is a dictionary that gets sent as key-worded list to the initialization of the sampler
     self.counter          = 0  #just an handy counter of the runs already performed
+    self.blockSize        = 1  #number of samples evaluated together by the model in a single job
+    self._useBlocks       = False #True if the samples are submitted in blocks of self.blockSize
     self.printTag = 'STEP MULTIRUN'
 
   def _localInputAndCheckParam(self,paramInput):
@@ -578,6 +588,9 @@ class MultiRun(SingleRun):
     SingleRun._localInputAndCheckParam(self,paramInput)
     if self.samplerType not in [item[0] for item in self.parList]:
       self.raiseAnError(IOError,'It is not possible a multi-run without a sampler or optimizer!')
+    self.blockSize = paramInput.parameterValues.get('blockSize', 1)
+    if self.blockSize < 1:
+      self.raiseAnError(IOError,'In Step named "{}" the "blockSize" attribute must be a positive integer!'.format(self.name))
 
   def _initializeSampler(self,inDictionary):
     """
@@ -618,18 +631,22 @@ class MultiRun(SingleRun):
     self._initializeSampler(inDictionary)
     #generate lambda function list to collect the output without checking the type
     self._outputCollectionLambda = []
+    self._outputBatchCollectionLambda = []
     self._outputDictCollectionLambda = []
     # set up output collection lambdas
     for outIndex, output in enumerate(inDictionary['Output']):
       if not isinstance(output, OutStreamEntity):
         if 'SolutionExport' in inDictionary.keys() and output.name == inDictionary['SolutionExport'].name:
           self._outputCollectionLambda.append((lambda x:None, outIndex))
+          self._outputBatchCollectionLambda.append((lambda x:None, outIndex))
           self._outputDictCollectionLambda.append((lambda x:None, outIndex))
         else:
           self._outputCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutput(x[0],x[1]), outIndex) )
+          self._outputBatchCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputs(x[0],x[1]), outIndex) )
           self._outputDictCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputFromDict(x[0],x[1]), outIndex) )
       else:
         self._outputCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
+        self._outputBatchCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
         self._outputDictCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
     self._registerMetadata(inDictionary)
     self.raiseADebug('Generating input batch of size '+str(inDictionary['jobHandler'].runInfoDict['batchSize']))
@@ -637,17 +654,25 @@ class MultiRun(SingleRun):
     # FIXME this duplicates a lot of code from _locatTakeAstepRun, which should be consolidated
     # first, check and make sure the model is ready
     model = inDictionary['Model']
+    sampler = inDictionary[self.samplerType]
     if isinstance(model,Models.ROM):
       if not model.amITrained:
         model.raiseAnError(RuntimeError,'ROM model "%s" has not been trained yet, so it cannot be sampled!' %model.name+\
                                         ' Use a RomTrainer step to train it.')
+    # blocks of samples are only possible if the sampler does not need to see any evaluation
+    # before providing the next samples, and if the model can evaluate many samples at once
+    self._useBlocks = self.blockSize > 1 and getattr(sampler, 'blockSampling', False) \
+                      and getattr(sampler, 'batch', 1) <= 1 and model.canEvaluateBlocks()
+    if self.blockSize > 1:
+      if self._useBlocks:
+        self.raiseADebug('Samples are evaluated by model "{}" in blocks of {}'.format(model.name, self.blockSize))
+      else:
+        self.raiseAWarning('"blockSize" is ignored, since sampler "{}" and model "{}" cannot work in blocks of samples!'.format(sampler.name, model.name))
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
-      if inDictionary[self.samplerType].amIreadyToProvideAnInput():
+      if sampler.amIreadyToProvideAnInput():
         try:
-          newInput = self._findANewInputToRun(inDictionary[self.samplerType], inDictionary['Model'], inDictionary['Input'], inDictionary['Output'], inDictionary['jobHandler'])
-          if newInput is not None:
-            inDictionary["Model"].submit(newInput, inDictionary[self.samplerType].type, inDictionary['jobHandler'], **copy.deepcopy(inDictionary[self.samplerType].inputInfo))
-            self.raiseADebug('Submitted input '+str(inputIndex+1))
+          self._submitNewRun(sampler, model, inDictionary['Input'], inDictionary['Output'], inDictionary['jobHandler'])
+          self.raiseADebug('Submitted input '+str(inputIndex+1))
         except utils.NoMoreSamplesNeeded:
           self.raiseAMessage('Sampler returned "NoMoreSamplesNeeded".  Continuing...')
   @profile
@@ -685,12 +710,17 @@ class MultiRun(SingleRun):
           self.raiseADebug('BATCHING: Collecting JOB batch named "{}".'.format(finishedJobList[0].groupId))
         else:
           finishedJobList = [finishedJobObjs]
+        # successful runs of a batch, collected all together in the outputs
+        batchToCollect = []
         for finishedJob in finishedJobList:
           finishedJob.trackTime('step_collected')
           # update number of collected runs
           self.counter +=1
           # collect run if it succeeded
           if finishedJob.getReturnCode() == 0:
+            if type(finishedJobObjs).__name__ in 'list':
+              batchToCollect.append(finishedJob)
+              continue
             for myLambda, outIndex in self._outputCollectionLambda:
               myLambda([finishedJob,outputs[outIndex]])
               self.raiseADebug('Just collected job {j:^8} and sent to output "{o}"'
@@ -722,6 +752,13 @@ class MultiRun(SingleRun):
               self.raiseAWarning('The sampler/optimizer "'+sampler.type+'" is able to handle failed runs!')
             #pop the failed job from the list
             finishedJobList.pop(finishedJobList.index(finishedJob))
+        if batchToCollect:
+          for myLambda, outIndex in self._outputBatchCollectionLambda:
+            myLambda([batchToCollect,outputs[outIndex]])
+            self.raiseADebug('Just collected {n} jobs of batch "{b}" and sent to output "{o}"'
+                            .format(n=len(batchToCollect),
+                                    b=batchToCollect[0].groupId,
+                                    o=inDictionary['Output'][outIndex].name))
         if type(finishedJobObjs).__name__ in 'list': # TODO: should be consistent, if no batching should batch size be 1 or 0 ?
           # if sampler claims it's batching, then only collect once, since it will collect the batch
           # together, not one-at-a-time
@@ -758,7 +795,8 @@ class MultiRun(SingleRun):
         # NOTE for some reason submission outside collection breaks the DET
         # however, it is necessary i.e. batch sampling
         self._addNewRuns(sampler, model, inputs, outputs, jobHandler, inDictionary, verbose=False)
-      time.sleep(self.sleepTime)
+      # sleep until a job finishes or there is room for new jobs
+      jobHandler.waitForEvent(self.sleepTime)
     # END while loop that runs the step iterations (collection and submission-for-DET)
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
@@ -791,9 +829,7 @@ class MultiRun(SingleRun):
     for _ in range(min(jobHandler.availability(isEnsemble), sampler.endJobRunnable())):
       if sampler.amIreadyToProvideAnInput():
         try:
-          newInput = self._findANewInputToRun(sampler, model, inputs, outputs, jobHandler)
-          if newInput is not None:
-            model.submit(newInput, inDictionary[self.samplerType].type, jobHandler, **copy.deepcopy(sampler.inputInfo))
+          self._submitNewRun(sampler, model, inputs, outputs, jobHandler)
         except utils.NoMoreSamplesNeeded:
           self.raiseAMessage(' ... Sampler returned "NoMoreSamplesNeeded".  Continuing...')
           break
@@ -805,6 +841,46 @@ class MultiRun(SingleRun):
       if verbose:
         self.raiseADebug(' ... no available JobHandler spots currently (or the Sampler is done.)')
 
+  def _submitNewRun(self, sampler, model, inputs, outputs, jobHandler):
+    """
+      Generates the next sample and submits it to the model. In block mode (see "blockSize"),
+      up to self.blockSize samples are generated and submitted as a single job.
+      @ In, sampler, Sampler, the sampler in charge of generating the sample
+      @ In, model, Model, the model in charge of evaluating the sample
+      @ In, inputs, object, the raven object used as the input in this step
+      @ In, outputs, object, the raven object used as the output in this step
+      @ In, jobHandler, object, the raven object used to handle jobs
+      @ Out, None
+    """
+    if not self._useBlocks:
+      newInput = self._findANewInputToRun(sampler, model, inputs, outputs, jobHandler)
+      if newInput is not None:
+        model.submit(newInput, sampler.type, jobHandler, **copy.deepcopy(sampler.inputInfo))
+      return
+    blockInfo = []
+    try:
+      while len(blockInfo) < self.blockSize and sampler.amIreadyToProvideAnInput():
+        newInput = self._findANewInputToRun(sampler, model, inputs, outputs, jobHandler)
+        if newInput is not None:
+          blockInfo.append(self._copySampleInfo(sampler.inputInfo))
+    except utils.NoMoreSamplesNeeded:
+      # the samples already generated still need to be evaluated
+      if blockInfo:
+        model.submitBlock(inputs, sampler.type, jobHandler, blockInfo)
+      raise
+    if blockInfo:
+      model.submitBlock(inputs, sampler.type, jobHandler, blockInfo)
+
+  @staticmethod
+  def _copySampleInfo(inputInfo):
+    """
+      Copies the information of a sample for block submission. The sampler reuses its containers
+      (e.g. "SampledVars") for the next sample, so they are copied one level deep instead of deep-copied.
+      @ In, inputInfo, dict, the sampler information of the current sample
+      @ Out, sampleInfo, dict, the copied information
+    """
+    return dict((key, copy.copy(val) if isinstance(val, (dict, list)) else val) for key, val in inputInfo.items())
+
   def _findANewInputToRun(self, sampler, model, inputs, outputs, jobHandler):
     """
       Repeatedly calls Sampler until a new run is found or "NoMoreSamplesNeeded" is raised.
@@ -28,10 +28,9 @@ import collections
 import utils.importerUtils
 statsmodels = utils.importerUtils.importModuleLazy("statsmodels", globals())
 import numpy as np
-import functools
 from scipy.linalg import solve_discrete_lyapunov
 from scipy import stats
-from scipy.signal import find_peaks
+from scipy.signal import find_peaks, lfilter
 from scipy.stats import rv_histogram
 
 #External Modules End--------------------------------------------------------------------------------
@@ -263,11 +262,41 @@ class ARMA(supervisedLearning):
     """
     rngCounts = d.pop('crow_rng_counts')
     self.__dict__.update(d)
+    self._convertStatsmodelsResults()
     self.setEngine(randomUtils.newRNG(), seed=None, count=rngCounts)
     if self.reseedCopies:
       randd = np.random.randint(1, 2e9)
       self.reseed(randd)
 
+  def _convertStatsmodelsResults(self):
+    """
+      Converts the statsmodels results kept by the ROMs pickled before the sampling was done without
+      statsmodels (ARMAResults and fitted VARMAX models) into the proxies used for sampling.
+      @ In, None
+      @ Out, None
+    """
+    for target, result in self.armaResult.items():
+      self.armaResult[target] = self._convertStatsmodelsResult(result, 'ARMA of target "{}"'.format(target))
+    if getattr(self, 'varmaResult', None) is not None:
+      # NOTE the zeroed part of the zero-filtered VARMA is an ARMA if only one variable was left
+      self.varmaResult = tuple(self._convertStatsmodelsResult(result, 'VARMA') for result in self.varmaResult)
+
+  def _convertStatsmodelsResult(self, result, name):
+    """
+      Converts one statsmodels result kept by the ROMs pickled by older RAVEN versions.
+      @ In, result, object, the result to convert
+      @ In, name, str, description of the result, for the error message
+      @ Out, result, armaResultsProxy or varmaResultsProxy, the converted result
+    """
+    if isinstance(result, (armaResultsProxy, varmaResultsProxy)):
+      return result
+    if all(hasattr(result, attr) for attr in ['arparams', 'maparams', 'sigma2']):
+      return armaResultsProxy.fromResults(result)
+    if hasattr(result, 'ssm'):
+      return varmaResultsProxy.fromModel(result)
+    self.raiseAnError(IOError, 'The {} was pickled by an older RAVEN version and cannot be converted ({}). '.format(name, type(result).__name__) +
+                      'Please retrain the ROM.')
+
   def setMulticycleParams(self, node):
     """
       Sets multicycle parameters in an object-oriented sense
@@ -704,27 +733,30 @@ class ARMA(supervisedLearning):
     denormed = self._sampleICDF(denormed, params)
     return denormed
 
-  def _generateARMASignal(self, model, numSamples=None,randEngine=None):
+  def _generateARMASignal(self, model, numSamples=None, randEngine=None, numRealizations=None):
     """
       Generates a synthetic history from fitted parameters.
-      @ In, model, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA such as otained from _trainARMA
+      @ In, model, armaResultsProxy, fitted ARMA such as otained from _trainARMA
       @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
       @ In, randEngine, instance, optional, method to call to get random samples (for example "randEngine(size=6)")
-      @ Out, hist, np.array(float), synthetic ARMA signal
+      @ In, numRealizations, int, optional, if given then generate this many histories at once
+      @ Out, hist, np.array(float), synthetic ARMA signal, shaped [numSamples] or [numRealizations, numSamples]
     """
     if numSamples is None:
       numSamples =  len(self.pivotParameterValues)
     if randEngine is None:
       randEngine=self.randomEng
-    import statsmodels.tsa
-    hist = statsmodels.tsa.arima_process.arma_generate_sample(ar = np.append(1., -model.arparams),
-                                                    ma = np.append(1., model.maparams),
-                                                    nsample = numSamples,
-                                                    distrvs = functools.partial(randomUtils.randomNormal,engine=randEngine),
-                                       # functool.partial provide the random number generator as a function
-                                       # with normal distribution and take engine as the positional arguments keywords.
-                                                    scale = np.sqrt(model.sigma2),
-                                                    burnin = 2*max(self.P,self.Q)) # @alfoa, 2020
+    burnin = 2*max(self.P,self.Q) # @alfoa, 2020
+    # the noise is filtered through the ARMA recursion, discarding the burn-in
+    ## same as statsmodels.tsa.arima_process.arma_generate_sample, for the same random numbers
+    if numRealizations is None:
+      noise = randomUtils.randomNormal(size=(numSamples + burnin,), keepMatrix=True, engine=randEngine)
+    else:
+      noise = randomUtils.randomNormal(size=(numRealizations, numSamples + burnin), keepMatrix=True, engine=randEngine)
+    hist = lfilter(np.append(1., model.maparams),
+                   np.append(1., -model.arparams),
+                   np.sqrt(model.sigma2) * noise,
+                   axis=-1)[..., burnin:]
     return hist
 
   def _generateFourierSignal(self, pivots, periods):
@@ -741,45 +773,39 @@ class ARMA(supervisedLearning):
       fourier[:, 2 * p + 1] = np.cos(hist)
     return fourier
 
-  def _generateVARMASignal(self, model, numSamples=None, randEngine=None, rvsIndex=None):
+  def _generateVARMASignal(self, model, numSamples=None, randEngine=None, rvsIndex=None, numRealizations=None):
     """
       Generates a set of correlated synthetic histories from fitted parameters.
-      @ In, model, statsmodels.tsa.statespace.VARMAX, fitted VARMA such as otained from _trainVARMA
+      @ In, model, varmaResultsProxy, fitted VARMA such as otained from _trainVARMA
       @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
       @ In, randEngine, instance, optional, method to call to get random samples (for example "randEngine(size=6)")
       @ In, rvsIndex, int, optional, if provided then will take from list of varmaNoise and varmaInit distributions
-      @ Out, hist, np.array(float), synthetic ARMA signal
+      @ In, numRealizations, int, optional, if given then generate this many sets of histories at once
+      @ Out, hist, np.array(float), synthetic ARMA signal, shaped [numSamples, numVariables] or
+                                    [numRealizations, numSamples, numVariables]
     """
     if numSamples is None:
       numSamples = len(self.pivotParameterValues)
-    # sample measure, state shocks
-    ## TODO it appears that measure shock always has a 0 variance multivariate normal, so just create it
-    numVariables = len(self.correlations)
-    if rvsIndex == 1:
-      # TODO implicit; this indicates that we're sampling ZEROED correlated variables,
-      # -> so the dimensionality is actually one less (since we don't train the VARMA coupled to the all-zeroes variable)
-      numVariables -= 1
-    measureShocks = np.zeros([numSamples, numVariables])
-    ## state shocks come from sampling multivariate
+    # sample state shocks
+    ## it appears that measure shock always has a 0 variance multivariate normal, so they are not sampled
     noiseDist = self.varmaNoise
     initDist = self.varmaInit
     if rvsIndex is not None:
       noiseDist = noiseDist[rvsIndex]
       initDist = initDist[rvsIndex]
+    ## state shocks come from sampling multivariate
     # with NUMPY:
     mean = noiseDist.mu
     cov = noiseDist.covariance.reshape([len(mean)]*2)
-    stateShocks = np.random.multivariate_normal(mean, cov, numSamples)
+    size = numSamples if numRealizations is None else (numRealizations, numSamples)
+    stateShocks = np.random.multivariate_normal(mean, cov, size)
     # with CROW:
     #stateShocks = np.array([noiseDist.rvs() for _ in range(numSamples)])
     # pick an intial by sampling multinormal distribution
-    init = np.array(initDist.rvs())
-    obs, states = model.ssm.simulate(numSamples,
-                                     initial_state=init,
-                                     measurement_shocks=measureShocks,
-                                     state_shocks=stateShocks)
+    init = np.array([initDist.rvs() for _ in range(1 if numRealizations is None else numRealizations)])
+    hist = self._simulateStateSpace(model, stateShocks.reshape(len(init), numSamples, -1), init)
     # add zeros back in for zeroed variable, if necessary? FIXME -> looks like no, this is done later in _evaluateCycle
-    return obs
+    return hist[0] if numRealizations is None else hist
 
   def _interpolateDist(self, x, y, Xlow, Xhigh, Ylow, Yhigh, inMask):
     """
@@ -885,18 +911,64 @@ class ARMA(supervisedLearning):
     y = self._interpolateDist(x,y,Xlow,Xhigh,Ylow,Yhigh,inMask)
     return y
 
+  def _simulateStateSpace(self, model, stateShocks, initialState):
+    """
+      Simulates the observations of a linear state space model
+        y_t = d + Z a_t,   a_{t+1} = c + T a_t + R e_t
+      as statsmodels does for a VARMA, without measurement shocks. Instead of stepping through the
+      whole history, it is split in blocks that are all stepped through at once, starting from zero
+      states; then the actual starting states of the blocks are propagated from block to block and
+      their contribution is added. This takes about twice the square root of the history length of
+      steps, each vectorized over blocks and realizations.
+      @ In, model, varmaResultsProxy, state space representation of the trained VARMA
+      @ In, stateShocks, np.array, state shocks e_t, shaped [realizations, time, shocks]
+      @ In, initialState, np.array, initial states a_0, shaped [realizations, states]
+      @ Out, obs, np.array, simulated observations y_t, shaped [realizations, time, observations]
+    """
+    transition = model.transition
+    numRealizations, numTime, numShocks = stateShocks.shape
+    numStates = transition.shape[0]
+    blockLen = int(np.ceil(np.sqrt(numTime)))
+    numBlocks = -(-numTime // blockLen)
+    # state increments c + R e_t, padded to a whole number of blocks
+    ## arrays are ordered [step in block, block, realization, ...] so each step is contiguous
+    shocks = np.zeros((numBlocks * blockLen, numRealizations, numShocks))
+    shocks[:numTime] = stateShocks.transpose(1, 0, 2)
+    shocks = shocks.reshape(numBlocks, blockLen, numRealizations, numShocks).transpose(1, 0, 2, 3)
+    increments = model.stateIntercept + np.matmul(shocks, model.selection.T)
+    # states within each block if the block started from a zero state
+    states = np.empty((blockLen + 1, numBlocks, numRealizations, numStates))
+    states[0] = 0.0
+    for j in range(blockLen):
+      np.add(np.matmul(states[j], transition.T), increments[j], out=states[j+1])
+    # powers of the transition matrix, T^0 through T^blockLen
+    powers = [np.eye(numStates)]
+    for _ in range(blockLen):
+      powers.append(np.dot(transition, powers[-1]))
+    # actual starting states of the blocks
+    starts = np.empty((numBlocks, numRealizations, numStates))
+    starts[0] = initialState
+    for b in range(1, numBlocks):
+      starts[b] = np.dot(starts[b-1], powers[blockLen].T) + states[blockLen, b-1]
+    # add the response to the starting states, T^j a_s, and observe the states
+    responses = np.matmul(starts[np.newaxis], np.asarray(powers[:blockLen]).transpose(0, 2, 1)[:, np.newaxis])
+    obs = model.obsIntercept + np.matmul(states[:blockLen] + responses, model.design.T)
+    obs = obs.transpose(2, 1, 0, 3).reshape(numRealizations, numBlocks * blockLen, -1)[:, :numTime]
+    return obs
+
   def _trainARMA(self, data, masks=None):
     r"""
       Fit ARMA model: x_t = \sum_{i=1}^P \phi_i*x_{t-i} + \alpha_t + \sum_{j=1}^Q \theta_j*\alpha_{t-j}
       @ In, data, np.array(float), data on which to train
       @ In, masks, np.array, optional, boolean mask where is the signal should be train by ARMA
-      @ Out, results, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA
+      @ Out, results, armaResultsProxy, coefficients of the fitted ARMA
     """
     if masks is not None:
       data = data[masks]
     import statsmodels.api
     results = statsmodels.tsa.arima_model.ARMA(data, order = (self.P, self.Q)).fit(disp = False)
-    return results
+    # only keep the coefficients, so sampling (and unpickling) does not need statsmodels
+    return armaResultsProxy.fromResults(results)
 
   def _trainCDF(self, data, binOps=None):
     """
@@ -1064,7 +1136,7 @@ class ARMA(supervisedLearning):
     """
       Train correlated ARMA model on white noise ARMA, with Fourier already removed
       @ In, data, np.array(np.array(float)), data on which to train with shape (# pivot values, # targets)
-      @ Out, results, statsmodels.tsa.arima_model.ARMAResults, fitted VARMA
+      @ Out, results, varmaResultsProxy, state space representation of the fitted VARMA
       @ Out, stateDist, Distributions.MultivariateNormal, MVN from which VARMA noise is taken
       @ Out, initDist, Distributions.MultivariateNormal, MVN from which VARMA initial state is taken
     """
@@ -1094,7 +1166,9 @@ class ARMA(supervisedLearning):
     initDist = self._trainMultivariateNormal(len(mean),mean,cov)
     # NOTE: uncomment this line to get a printed summary of a lot of information about the fitting.
     # self.raiseADebug('VARMA model training summary:\n',results.summary())
-    return model, stateDist, initDist
+    # only keep the state space matrices, so sampling (and unpickling) does not need statsmodels
+    varma = varmaResultsProxy.fromModel(model)
+    return varma, stateDist, initDist
 
   def _trainZeroRemoval(self, data, tol=1e-10):
     """
@@ -2343,3 +2417,50 @@ class armaResultsProxy:
     self.arparams = np.atleast_1d(arparams)
     self.maparams = np.atleast_1d(maparams)
     self.sigma2 = sigma**2
+
+  @classmethod
+  def fromResults(cls, results):
+    """
+      Constructs the proxy from the results of a statsmodels ARMA fit.
+      @ In, results, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA
+      @ Out, proxy, armaResultsProxy, coefficients of the fitted ARMA
+    """
+    proxy = cls(results.arparams, results.maparams, 0.0)
+    proxy.sigma2 = results.sigma2
+    return proxy
+
+# Class replacing a statsmodels VARMAX with the matrices needed for sampling.
+class varmaResultsProxy:
+  """
+    Class that holds the state space representation of a trained VARMA,
+      y_t = obsIntercept + design a_t,  a_{t+1} = stateIntercept + transition a_t + selection e_t
+  """
+  def __init__(self, design, obsIntercept, transition, stateIntercept, selection):
+    """
+      Constructor.
+      @ In, design, np.array(float), observation matrix, shaped [observations, states]
+      @ In, obsIntercept, np.array(float), observation intercept, shaped [observations]
+      @ In, transition, np.array(float), state transition matrix, shaped [states, states]
+      @ In, stateIntercept, np.array(float), state intercept, shaped [states]
+      @ In, selection, np.array(float), shock selection matrix, shaped [states, shocks]
+      @ Out, None
+    """
+    self.design = np.array(design)
+    self.obsIntercept = np.array(obsIntercept)
+    self.transition = np.array(transition)
+    self.stateIntercept = np.array(stateIntercept)
+    self.selection = np.array(selection)
+
+  @classmethod
+  def fromModel(cls, model):
+    """
+      Constructs the proxy from a fitted statsmodels VARMAX model.
+      @ In, model, statsmodels.tsa.statespace.VARMAX, fitted VARMA
+      @ Out, proxy, varmaResultsProxy, state space representation of the fitted VARMA
+    """
+    ssm = model.ssm
+    return cls(ssm['design',:,:,0],
+               ssm['obs_intercept',:,0],
+               ssm['transition',:,:,0],
+               ssm['state_intercept',:,0],
+               ssm['selection',:,:,0])
@@ -23,48 +23,26 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 from EntityFactoryBase import EntityFactory
 
 ################################################################################
-
-from SupervisedLearning.SupervisedLearning import supervisedLearning
-# Forward Samplers
-from SupervisedLearning.ARMA               import ARMA
-from SupervisedLearning.GaussPolynomialRom import GaussPolynomialRom
-from SupervisedLearning.HDMRRom            import HDMRRom
-from SupervisedLearning.MSR                import MSR
-from SupervisedLearning.NDinterpolatorRom  import NDinterpolatorRom
-from SupervisedLearning.NDinvDistWeight    import NDinvDistWeight
-from SupervisedLearning.NDsplineRom        import NDsplineRom
-from SupervisedLearning.SciKitLearn        import SciKitLearn
-from SupervisedLearning.SyntheticHistory   import SyntheticHistory
-from SupervisedLearning.pickledROM         import pickledROM
-from SupervisedLearning.PolyExponential    import PolyExponential
-from SupervisedLearning.DynamicModeDecomposition import DynamicModeDecomposition
-from SupervisedLearning.ROMCollection      import Collection, Segments, Clusters, Interpolated
-from .KerasClassifier import KerasClassifier
-from SupervisedLearning.KerasMLPClassifier import KerasMLPClassifier
-from SupervisedLearning.KerasConvNetClassifier import KerasConvNetClassifier
-from SupervisedLearning.KerasLSTMClassifier import KerasLSTMClassifier
-from SupervisedLearning.KerasLSTMRegression import KerasLSTMRegression
-from SupervisedLearning.ROMCollection      import Collection, Segments, Clusters
-
-################################################################################
-
+# The ROM modules are imported only when the corresponding type is requested
+# (some of them depend on heavy libraries, e.g. TensorFlow, scikit-learn),
+# the classes are retrieved through the package (see __init__.py)
 factory = EntityFactory('supervisedLearning')
-factory.registerType('NDspline'              , NDsplineRom)
-factory.registerType('NDinvDistWeight'       , NDinvDistWeight)
-factory.registerType('NDsplineRom'           , NDsplineRom)
-factory.registerType('SciKitLearn'           , SciKitLearn)
-factory.registerType('GaussPolynomialRom'    , GaussPolynomialRom)
-factory.registerType('HDMRRom'               , HDMRRom)
-factory.registerType('MSR'                   , MSR)
-factory.registerType('ARMA'                  , ARMA)
-factory.registerType('SyntheticHistory'      , SyntheticHistory)
-factory.registerType('pickledROM'            , pickledROM)
-factory.registerType('PolyExponential'       , PolyExponential)
-factory.registerType('DMD'                   , DynamicModeDecomposition)
-factory.registerType('Segments'              , Segments)
-factory.registerType('Clusters'              , Clusters)
-factory.registerType('Interpolated'          , Interpolated)
-factory.registerType('KerasMLPClassifier'    , KerasMLPClassifier)
-factory.registerType('KerasConvNetClassifier', KerasConvNetClassifier)
-factory.registerType('KerasLSTMClassifier'   , KerasLSTMClassifier)
-factory.registerType('KerasLSTMRegression'   , KerasLSTMRegression)
+factory.registerLazyType('NDspline'              , 'SupervisedLearning', 'NDsplineRom')
+factory.registerLazyType('NDinvDistWeight'       , 'SupervisedLearning')
+factory.registerLazyType('NDsplineRom'           , 'SupervisedLearning')
+factory.registerLazyType('SciKitLearn'           , 'SupervisedLearning')
+factory.registerLazyType('GaussPolynomialRom'    , 'SupervisedLearning')
+factory.registerLazyType('HDMRRom'               , 'SupervisedLearning')
+factory.registerLazyType('MSR'                   , 'SupervisedLearning')
+factory.registerLazyType('ARMA'                  , 'SupervisedLearning')
+factory.registerLazyType('SyntheticHistory'      , 'SupervisedLearning')
+factory.registerLazyType('pickledROM'            , 'SupervisedLearning')
+factory.registerLazyType('PolyExponential'       , 'SupervisedLearning')
+factory.registerLazyType('DMD'                   , 'SupervisedLearning', 'DynamicModeDecomposition')
+factory.registerLazyType('Segments'              , 'SupervisedLearning')
+factory.registerLazyType('Clusters'              , 'SupervisedLearning')
+factory.registerLazyType('Interpolated'          , 'SupervisedLearning')
+factory.registerLazyType('KerasMLPClassifier'    , 'SupervisedLearning')
+factory.registerLazyType('KerasConvNetClassifier', 'SupervisedLearning')
+factory.registerLazyType('KerasLSTMClassifier'   , 'SupervisedLearning')
+factory.registerLazyType('KerasLSTMRegression'   , 'SupervisedLearning')
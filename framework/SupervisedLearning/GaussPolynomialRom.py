@@ -94,6 +94,8 @@ class GaussPolynomialRom(supervisedLearning):
     self.polys         = None #dict{varName: OrthoPolynomial object}, has polynomials for evaluation
     self.indexSet      = None #array of tuples, polynomial order combinations
     self.polyCoeffDict = None #dict{index set point, float}, polynomial combination coefficients for each combination
+    self.polyOrders    = None #np.array(int), [n_polynomials, n_features], the index set as dense array, rows aligned with polyCoeffs
+    self.polyCoeffs    = None #np.array(float), [n_polynomials, n_targets], the polynomial coefficients as dense array
     self.numRuns       = None #number of runs to generate ROM; default is len(self.sparseGrid)
     self.itpDict       = {}   #dict{varName: dict{attribName:value} }
     self.featv         = None  # list of feature variables
@@ -278,6 +280,63 @@ class GaussPolynomialRom(supervisedLearning):
       tot*=self.polys[varName](o,p)
     return tot
 
+  def _standardizePoints(self,featureVals):
+    """
+      Converts points from the distribution domains to the standard quadrature domains, one feature at a time.
+      @ In, featureVals, np.array, [n_samples, n_features], points to convert
+      @ Out, stdPts, np.array, [n_samples, n_features], converted points
+    """
+    featureVals = np.atleast_2d(np.asarray(featureVals,dtype=float))
+    stdPts = np.zeros(featureVals.shape)
+    for p,varName in enumerate(self.sparseGrid.varNames):
+      stdPts[:,p] = self.distDict[varName].convertToQuad(self.quads[varName].type,featureVals[:,p])
+    return stdPts
+
+  def _polyTable(self,varName,maxOrder,pts):
+    """
+      Evaluates the one-dimensional polynomials of a feature up to a given order at many points.
+      @ In, varName, str, name of the feature
+      @ In, maxOrder, int, largest polynomial order to evaluate
+      @ In, pts, np.array, [n_samples], standardized values of the feature
+      @ Out, table, np.array, [n_samples, maxOrder+1], polynomial evaluations, column o is order o
+    """
+    poly = self.polys[varName]
+    table = np.zeros((len(pts),maxOrder+1))
+    for o in range(maxOrder+1):
+      try:
+        table[:,o] = poly(o,pts)
+      except TypeError:
+        # some point modifications (e.g. inverse CDFs) only accept scalars
+        table[:,o] = [poly(o,p) for p in pts]
+    return table
+
+  def _basisMatrix(self,stdPts,orders=None):
+    """
+      Evaluates the multidimensional polynomial basis at many points.
+      The one-dimensional polynomials are evaluated once per feature and order, then
+      combined for every index set point by indexing.
+      @ In, stdPts, np.array, [n_samples, n_features], standardized points
+      @ In, orders, np.array, optional, [n_polynomials, n_features], polynomial orders (default self.polyOrders)
+      @ Out, basis, np.array, [n_samples, n_polynomials], product of polynomial evaluations
+    """
+    if orders is None:
+      orders = self.polyOrders
+    basis = np.ones((len(stdPts),len(orders)))
+    for p,varName in enumerate(self.sparseGrid.varNames):
+      table = self._polyTable(varName,int(orders[:,p].max()),stdPts[:,p])
+      basis *= table[:,orders[:,p]]
+    return basis
+
+  def _buildCoefficientArrays(self):
+    """
+      Collects the polynomial coefficients into dense arrays for fast evaluation.
+      @ In, None
+      @ Out, None
+    """
+    indices = list(self.polyCoeffDict[self.target[0]].keys())
+    self.polyOrders = np.array(indices,dtype=int).reshape(len(indices),len(self.features))
+    self.polyCoeffs = np.array([[self.polyCoeffDict[target][idx] for target in self.target] for idx in indices],dtype=float)
+
   def __trainLocal__(self,featureVals,targetVals):
     """
       Trains ROM.
@@ -292,28 +351,11 @@ class GaussPolynomialRom(supervisedLearning):
     self.polyCoeffDict = {key: dict({}) for key in self.target}
     #check equality of point space
     self.raiseADebug('...checking required points are available...')
-    fvs = []
-    tvs = {key: list({}) for key in self.target}
     sgs = list(self.sparseGrid.points())
-    missing=[]
     kdTree = spatial.KDTree(featureVals)
-    #TODO this is slowest loop in this algorithm, by quite a bit.
-    for pt in sgs:
-      #KDtree way
-      distances,idx = kdTree.query(pt,k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
-      #KDTree repots a "not found" as at infinite distance with index len(data)
-      if idx >= len(featureVals):
-        found = False
-      else:
-        found = True
-        point = tuple(featureVals[idx])
-      #end KDTree way
-      if found:
-        fvs.append(point)
-        for cnt, target in enumerate(self.target):
-          tvs[target].append(targetVals[idx,cnt])
-      else:
-        missing.append(pt)
+    #KDTree reports a "not found" as at infinite distance with index len(data)
+    _,found = kdTree.query(np.array(sgs),k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
+    missing = [pt for pt,idx in zip(sgs,found) if idx >= len(featureVals)]
     if len(missing)>0:
       msg='\n'
       msg+='DEBUG missing feature vals:\n'
@@ -321,34 +363,25 @@ class GaussPolynomialRom(supervisedLearning):
         msg+='  '+str(i)+'\n'
       self.raiseADebug(msg)
       self.raiseADebug('sparse:',sgs)
-      self.raiseADebug('solns :',fvs)
+      self.raiseADebug('solns :',[tuple(featureVals[idx]) for idx in found if idx < len(featureVals)])
       self.raiseAnError(IOError,'input values do not match required values!')
-    #make translation matrix between lists, also actual-to-standardized point map
+    #weights aligned with the sparse grid points, and the points standardized
     self.raiseADebug('...constructing translation matrices...')
-    translate={}
-    for i in range(len(fvs)):
-      translate[tuple(fvs[i])]=sgs[i]
-    standardPoints = {}
-    for pt in fvs:
-      stdPt = []
-      for i,p in enumerate(pt):
-        varName = self.sparseGrid.varNames[i]
-        stdPt.append( self.distDict[varName].convertToQuad(self.quads[varName].type,p) )
-      standardPoints[tuple(pt)] = stdPt[:]
+    fvs = featureVals[found]
+    tvs = targetVals[found]
+    wts = np.array(self.sparseGrid.weights())
+    stdPts = self._standardizePoints(fvs)
     #make polynomials
     self.raiseADebug('...constructing polynomials...')
     self.norm = np.prod(list(self.distDict[v].measureNorm(self.quads[v].type) for v in self.distDict.keys()))
-    for i,idx in enumerate(self.indexSet):
-      idx=tuple(idx)
-      for target in self.target:
-        self.polyCoeffDict[target][idx]=0
-        wtsum=0
-        for pt,soln in zip(fvs,tvs[target]):
-          tupPt = tuple(pt)
-          stdPt = standardPoints[tupPt]
-          wt = self.sparseGrid.weights(translate[tupPt])
-          self.polyCoeffDict[target][idx]+=soln*self._multiDPolyBasisEval(idx,stdPt)*wt
-        self.polyCoeffDict[target][idx]*=self.norm
+    orders = np.array([tuple(idx) for idx in self.indexSet],dtype=int).reshape(len(self.indexSet),len(self.features))
+    basis = self._basisMatrix(stdPts,orders)
+    coeffs = np.dot(basis.T,tvs*wts[:,np.newaxis])*self.norm
+    for i,idx in enumerate(orders):
+      idx = tuple(int(o) for o in idx)
+      for cnt,target in enumerate(self.target):
+        self.polyCoeffDict[target][idx] = coeffs[i,cnt]
+    self._buildCoefficientArrays()
     self.amITrained=True
     self.raiseADebug('...training complete!')
 
@@ -408,34 +441,31 @@ class GaussPolynomialRom(supervisedLearning):
       @ Out, tot, float, evaluation of moment
     """
     target = self.target[0] if targ is None else targ
-    #TODO is there a faster way still to do this?
     if r==1:
       return self.polyCoeffDict[target][tuple([0]*len(self.features))]
     elif r==2:
       return sum(s**2 for s in self.polyCoeffDict[target].values())
-    tot=0
-    for pt,wt in self.sparseGrid:
-      tot+=self.__evaluateLocal__([pt])[target]**r*wt
-    tot*=self.norm
+    #quadrature of the r-th power, evaluating the expansion on the whole sparse grid at once
+    pts = np.array(self.sparseGrid.points())
+    wts = np.array(self.sparseGrid.weights())
+    vals = self.__evaluateLocal__(pts)[target]
+    tot = np.sum(vals**r*wts)*self.norm
     return tot
 
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list, of values at which to evaluate the ROM
-      @ Out, returnDict, dict, the evaluated point for each target
+      Evaluates points.
+      @ In, featureVals, np.array, [n_samples, n_features], values at which to evaluate the ROM
+      @ Out, returnDict, dict, the evaluated points for each target, {target: np.array([n_samples])}
     """
-    featureVals=featureVals[0]
+    if getattr(self,'polyCoeffs',None) is None:
+      # ROMs pickled before the dense arrays existed
+      self._buildCoefficientArrays()
+    basis = self._basisMatrix(self._standardizePoints(featureVals))
+    values = np.dot(basis,self.polyCoeffs)
     returnDict={}
-    stdPt = np.zeros(len(featureVals))
-    for p,pt in enumerate(featureVals):
-      varName = self.sparseGrid.varNames[p]
-      stdPt[p] = self.distDict[varName].convertToQuad(self.quads[varName].type,pt)
-    for target in self.target:
-      tot=0
-      for idx,coeff in self.polyCoeffDict[target].items():
-        tot+=coeff*self._multiDPolyBasisEval(idx,stdPt)
-      returnDict[target] = tot
+    for cnt,target in enumerate(self.target):
+      returnDict[target] = values[:,cnt]
     return returnDict
 
   def _printPolynomial(self):
@@ -144,6 +144,7 @@ class HDMRRom(GaussPolynomialRom):
     self.refSoln = {key:dict({}) for key in self.target}
     for i in range(len(featureVals)):
       ft[tuple(featureVals[i])]=targetVals[i,:]
+    trainPoints = np.asarray(featureVals,dtype=float)
 
     #get the reference case
     self.refpt = tuple(self.__fillPointWithRef((),[]))
@@ -159,7 +160,7 @@ class HDMRRom(GaussPolynomialRom):
       for i in range(len(SG)):
         getpt=tuple(self.__fillPointWithRef(combo,SG[i][0]))
         #the 1e-10 is to be consistent with RAVEN's CSV print precision
-        tvals[i,:] = ft[tuple(mathUtils.NDInArray(np.array(list(ft.keys())),getpt,tol=1e-10)[2])]
+        tvals[i,:] = targetVals[self.__findTrainingPoint(trainPoints,getpt,tol=1e-10),:]
         for fp,fpt in enumerate(SG[i][0]):
           fvals[i][fp] = fpt
       for i,c in enumerate(combo):
@@ -225,24 +226,46 @@ class HDMRRom(GaussPolynomialRom):
         newpt[v] = pt[combo.index(var)]
     return tuple(newpt)
 
+  def __findTrainingPoint(self,trainPoints,point,tol=1e-12):
+    """
+      Finds the training point matching a requested point within a relative tolerance,
+      comparing against all the training points at once (same criterion as mathUtils.NDInArray).
+      @ In, trainPoints, np.array, [n_samples, n_features], training feature values
+      @ In, point, tuple(float), point to look for
+      @ In, tol, float, optional, relative tolerance to check match within
+      @ Out, index, int, row of trainPoints matching the point
+    """
+    val = np.asarray(point,dtype=float)
+    den = np.where(val != 0.0, val, np.where(trainPoints != 0.0, trainPoints, 1.0))
+    match = np.all(np.abs((trainPoints - val) / den) < tol, axis=1)
+    if not match.any():
+      self.raiseAnError(IOError,'Required point',point,'was not found in the training data!')
+    return int(np.argmax(match))
+
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list(float), list of values at which to evaluate the ROM
-      @ Out, tot, float, the evaluated point
+      Evaluates points.
+      @ In, featureVals, np.array, [n_samples, n_features], values at which to evaluate the ROM
+      @ Out, returnDict, dict, the evaluated points for each target, {target: np.array([n_samples])}
     """
     #am I trained?
     returnDict = dict.fromkeys(self.target,None)
     if not self.amITrained:
       self.raiseAnError(IOError,'Cannot evaluate, as ROM is not trained!')
+    featureVals = np.atleast_2d(np.asarray(featureVals,dtype=float))
+    #each sub-ROM is evaluated once for all the points and targets
+    cutEvals = {}
+    for term in self.reducedTerms.keys():
+      if term != ():
+        cutVals = featureVals[:,[self.features.index(j) for j in term]]
+        cutEvals[term] = self.ROMs[term].__evaluateLocal__(cutVals)
     for target in self.target:
-      tot = 0
+      tot = np.zeros(len(featureVals))
       for term,mult in self.reducedTerms.items():
         if term == ():
           tot += self.refSoln[target]*mult
         else:
-          cutVals = [list(featureVals[0][self.features.index(j)] for j in term)]
-          tot += self.ROMs[term].__evaluateLocal__(cutVals)[target]*mult
+          tot += cutEvals[term][target]*mult
       returnDict[target] = tot
     return returnDict
 
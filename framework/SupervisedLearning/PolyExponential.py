@@ -28,7 +28,7 @@ import numpy as np
 
 #Internal Modules------------------------------------------------------------------------------------
 from SupervisedLearning import supervisedLearning
-from SupervisedLearning import NDsplineRom
+from .NDsplineRom import NDsplineRom
 #Internal Modules End--------------------------------------------------------------------------------
 
 
@@ -36,6 +36,21 @@ from .SupervisedLearning import supervisedLearning
 import os
 
 
+def _trainROM(romClass, state, data):
+  """
+    Trains a ROM in a worker process.
+    The ROM is rebuilt from its state as a plain update of its members (without the pickling hooks
+    of the ROM, which might e.g. reseed the copies), so that it is trained as it would be in place.
+    @ In, romClass, type, the class of the ROM
+    @ In, state, dict, the state of the untrained ROM (from __getstate__)
+    @ In, data, dict, the training data
+    @ Out, state, dict, the members of the trained ROM
+  """
+  rom = romClass.__new__(romClass)
+  rom.__dict__.update(state)
+  rom.train(data)
+  return rom.__dict__
+
 #
 #
 #
@@ -172,6 +187,7 @@ class Segments(Collection):
     self._divisionPivotShift = {}      # whether and how to normalize/shift subspaces
     self._indexValues = {}             # original index values, by index
     self.divisions = None              # trained subdomain division information
+    self._trainingWorkers = 1          # number of processes training the subdomain ROMs
     # allow some ROM training to happen globally, seperate from individual segment training
     ## see design note for Clusters
     self._romGlobalAdjustments = None  # global ROM settings, provided by the templateROM before clustering
@@ -217,6 +233,12 @@ class Segments(Collection):
     self._divisionInstructions = divisionMode
     if len(self._divisionInstructions) > 1:
       self.raiseAnError(NotImplementedError, 'Segmented ROMs do not yet handle multiple subspaces!')
+    # parallel training of the subdomain ROMs
+    workersNode = inputSpecs.findFirst('trainingWorkers')
+    if workersNode is not None:
+      if workersNode.value < 1:
+        self.raiseAnError(IOError, '<trainingWorkers> must be at least 1; got {}!'.format(workersNode.value))
+      self._trainingWorkers = workersNode.value
 
   ###############
   # RUN METHODS #
@@ -511,7 +533,11 @@ class Segments(Collection):
     if pivotID not in self._indexValues:
       self._indexValues[pivotID] = trainingSet[pivotID][0]
     # loop over clusters and train data
+    ## when training in parallel, the ROMs are all created first (in order, so that they are the same
+    ## as in serial, e.g. their seeds), then trained in worker processes
+    parallel = self._trainingWorkers > 1 and len(counter) > 1
     roms = []
+    segmentData = []
     for i, subdiv in enumerate(counter):
       # slicer for data selection
       picker = slice(subdiv[0], subdiv[-1] + 1)
@@ -531,13 +557,45 @@ class Segments(Collection):
       newROM = copy.deepcopy(templateROM)
       newROM.name = '{}_seg{}'.format(self._romName, i)
       newROM.adjustLocalRomSegment(self._romGlobalAdjustments, picker)
-      self.raiseADebug('Training segment', i, picker)
-      newROM.train(data)
+      if parallel:
+        segmentData.append(data)
+      else:
+        self.raiseADebug('Training segment', i, picker)
+        newROM.train(data)
       roms.append(newROM)
+    if parallel:
+      self._trainInParallel(roms, segmentData)
     # format array for future use
     roms = np.array(roms)
     return roms
 
+  def _trainInParallel(self, roms, segmentData):
+    """
+      Trains the subdomain ROMs in a pool of worker processes.
+      The result is the same as training them one after the other, as long as the training
+      of a ROM only depends on its own state and data (e.g. not on the global random number generators).
+      @ In, roms, list(supervisedLearning), untrained ROMs for each subdomain, trained in place
+      @ In, segmentData, list(dict), training data for each subdomain
+      @ Out, None
+    """
+    from Runners import ProcessPool
+    numWorkers = min(self._trainingWorkers, len(roms))
+    self.raiseADebug('Training {} segments with {} processes'.format(len(roms), numWorkers))
+    pool = ProcessPool(numWorkers)
+    try:
+      jobs = []
+      for rom, data in zip(roms, segmentData):
+        state = rom.__getstate__()
+        # members only used for pickling (not part of the ROM)
+        pickleOnly = set(state) - set(rom.__dict__)
+        jobs.append((pickleOnly, pool.submit(_trainROM, [type(rom), state, data])))
+      for rom, (pickleOnly, job) in zip(roms, jobs):
+        rom.__dict__.update(job.result())
+        for member in pickleOnly:
+          rom.__dict__.pop(member, None)
+    finally:
+      pool.shutdown()
+
   def _writeSegmentsRealization(self, writeTo):
     """
       Writes pointwise data about segmentation to a realization.
@@ -124,11 +124,16 @@ class SyntheticHistory(supervisedLearning):
 
   def __evaluateLocal__(self, featureVals):
     """
-      @ In, featureVals, float, a scalar feature value is passed as scaling factor
-      @ Out, rlz, dict, realization dictionary of values for each target
+      Generates one synthetic history for each row of featureVals; the histories are generated all
+      at once by the TSA algorithms.
+      @ In, featureVals, np.array, feature values shaped [numSamples, features]; the features are
+                                   used as scaling factors
+      @ Out, rlz, dict, realization dictionary of values for each target, shaped [pivotValues] for a
+                        single sample or [numSamples, pivotValues] for several
     """
     pivots = self.pivotParameterValues
-    result = np.zeros((self.pivotParameterValues.size, len(self.target) - 1)) # -1 is pivot
+    numSamples = max(len(featureVals), 1)
+    result = np.zeros((numSamples, self.pivotParameterValues.size, len(self.target) - 1)) # -1 is pivot
     for algo in self.tsaAlgorithms[::-1]:
       settings = self.algoSettings[algo]
       targets = settings['target']
@@ -136,10 +141,12 @@ class SyntheticHistory(supervisedLearning):
       params = self.trainedParams[algo]
       if not algo.canGenerate():
         self.raiseAnError(IOError, "This TSA algorithm cannot generate synthetic histories.")
-      signal = algo.generate(params, pivots, settings)
-      result[:, indices] += signal
+      signal = algo.generateSamples(params, pivots, settings, numSamples)
+      result[:, :, indices] += signal
+    if numSamples == 1:
+      result = result[0]
     # RAVEN realization construction
-    rlz = dict((target, result[:, t]) for t, target in enumerate(self.target) if target != self.pivotParameterID)
+    rlz = dict((target, result[..., t]) for t, target in enumerate(self.target) if target != self.pivotParameterID)
     rlz[self.pivotParameterID] = self.pivotParameterValues
     return rlz
 
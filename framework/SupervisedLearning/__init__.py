@@ -22,27 +22,53 @@
 
 from __future__ import absolute_import
 
+import sys
+import importlib
+
 # These lines ensure that we do not have to do something like:
 # 'from Samplers.Sampler import Sampler' outside of this submodule
 from .SupervisedLearning import supervisedLearning
 
-from .ARMA               import ARMA
-from .GaussPolynomialRom import GaussPolynomialRom
-from .HDMRRom            import HDMRRom
-from .MSR                import MSR
-from .NDinterpolatorRom  import NDinterpolatorRom
-from .NDinvDistWeight    import NDinvDistWeight
-from .NDsplineRom        import NDsplineRom
-from .SciKitLearn        import SciKitLearn
-from .SyntheticHistory   import SyntheticHistory
-from .pickledROM         import pickledROM
-from .PolyExponential    import PolyExponential
-from .DynamicModeDecomposition import DynamicModeDecomposition
-from .ROMCollection      import Collection, Segments, Clusters, Interpolated
+# the ROM classes are imported when first accessed (e.g. "SupervisedLearning.ARMA"), so that
+# importing this module does not import all the ROMs and their dependencies
+_lazyClasses = {'ARMA'                    : '.ARMA',
+                'GaussPolynomialRom'      : '.GaussPolynomialRom',
+                'HDMRRom'                 : '.HDMRRom',
+                'MSR'                     : '.MSR',
+                'NDinterpolatorRom'       : '.NDinterpolatorRom',
+                'NDinvDistWeight'         : '.NDinvDistWeight',
+                'NDsplineRom'             : '.NDsplineRom',
+                'SciKitLearn'             : '.SciKitLearn',
+                'SyntheticHistory'        : '.SyntheticHistory',
+                'pickledROM'              : '.pickledROM',
+                'PolyExponential'         : '.PolyExponential',
+                'DynamicModeDecomposition': '.DynamicModeDecomposition',
+                'Collection'              : '.ROMCollection',
+                'Segments'                : '.ROMCollection',
+                'Clusters'                : '.ROMCollection',
+                'Interpolated'            : '.ROMCollection',
+                # KERAS classifiers
+                'KerasClassifier'         : '.KerasClassifier',
+                'KerasMLPClassifier'      : '.KerasMLPClassifier',
+                'KerasConvNetClassifier'  : '.KerasConvNetClassifier',
+                'KerasLSTMClassifier'     : '.KerasLSTMClassifier',
+                'KerasLSTMRegression'     : '.KerasLSTMRegression'}
 
-# KERAS classifiers
-from .KerasClassifier import KerasClassifier
-from .KerasMLPClassifier import KerasMLPClassifier
-from .KerasConvNetClassifier import KerasConvNetClassifier
+def __getattr__(name):
+  """
+    Imports the ROM classes on first access
+    @ In, name, str, the name of the attribute
+    @ Out, obj, object, the requested class
+  """
+  if name not in _lazyClasses:
+    raise AttributeError(f'module "{__name__}" has no attribute "{name}"')
+  importlib.import_module(_lazyClasses[name], __name__)
+  # importing a submodule binds it to its name in this package, which for most of the ROMs
+  # is also the class name: bind the classes of all the modules imported so far instead
+  for className, module in _lazyClasses.items():
+    loaded = sys.modules.get(__name__ + module)
+    if loaded is not None and hasattr(loaded, className):
+      globals()[className] = getattr(loaded, className)
+  return globals()[name]
 
 from .Factory import factory
@@ -14,10 +14,12 @@
 """
   AutoRegressive Moving Average time series analysis
 """
+import sys
 import copy
 import collections
 import numpy as np
 import scipy as sp
+import scipy.signal
 
 import Decorators
 
@@ -168,12 +170,13 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer):
       selCov = r.dot(q).dot(r.T)
       initCov = sp.linalg.solve_discrete_lyapunov(smoother['transition',:,:,0], selCov)
       initDist = {'mean': initMean, 'cov': initCov}
+      # NOTE only the coefficients are kept for sampling, not the statsmodels model
       params[target]['arma'] = {'const': res.params[0], # exog/intercept/constant
                                 'ar': res.arparams,     # AR
                                 'ma': res.maparams,     # MA
                                 'var': res.params[-1],  # variance
                                 'initials': initDist,   # characteristics for sampling initial states
-                                'model': model}
+                                'stateCov': q}          # covariance of the state shocks for sampling
       if not settings['reduce_memory']:
         params[target]['arma']['results'] = res
     return params
@@ -210,28 +213,32 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer):
       @ In, settings, dict, settings for this ROM
       @ Out, synthetic, np.array(float), synthetic ARMA signal
     """
-    # TODO if there's not a model, generate one?
-    # -> I think we need the training signal though ...
-    synthetic = np.zeros((len(pivot), len(params)))
+    return self.generateSamples(params, pivot, settings, 1)[0]
+
+  def generateSamples(self, params, pivot, settings, numSamples):
+    """
+      Generates several synthetic histories from fitted parameters.
+      The noise is drawn in the same order as generating the histories one at a time, so the
+      samples are the same as calling self.generate numSamples times.
+      @ In, params, dict, characterization such as otained from self.characterize()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, settings for this ROM
+      @ In, numSamples, int, number of synthetic histories to generate
+      @ Out, synthetic, np.array(float), synthetic ARMA signals shaped [numSamples, pivotValues, targets]
+    """
+    size = len(pivot)
+    # for each target: measurement shocks, state shocks, then the initial state
+    numNoise = [2 * size + len(data['arma']['initials']['mean']) for data in params.values()]
+    noise = randomUtils.randomNormal(size=(numSamples, sum(numNoise)), keepMatrix=True)
+    splits = np.cumsum(numNoise)[:-1]
+    synthetic = np.zeros((numSamples, size, len(params)))
     for t, (target, data) in enumerate(params.items()):
-      armaData = data['arma']
-      modelParams = np.hstack([[armaData.get('const', 0)],
-                               armaData['ar'],
-                               armaData['ma'],
-                               [armaData.get('var', 1)]])
-      msrShocks, stateShocks, initialState = self._generateNoise(armaData['model'], armaData['initials'], synthetic.shape[0])
-      # measurement shocks
-      # statsmodels if we don't provide them.
-      # produce sample
-      new = armaData['model'].simulate(modelParams,
-                                       synthetic.shape[0],
-                                       measurement_shocks=msrShocks,
-                                       state_shocks=stateShocks,
-                                       initial_state=initialState)
+      targetNoise = np.split(noise, splits, axis=1)[t]
+      new = self._simulate(data['arma'], targetNoise[:, :size], targetNoise[:, size:2*size], targetNoise[:, 2*size:])
       if settings.get('gaussianize', True):
         # back-transform through CDF
-        new = mathUtils.degaussianize(new, params[target]['cdf'])
-      synthetic[:, t] = new
+        new = mathUtils.degaussianize(new, data['cdf'])
+      synthetic[:, :, t] = new
     return synthetic
 
   def writeXML(self, writeTo, params):
@@ -251,26 +258,41 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer):
         base.append(xmlUtils.newNode(f'MA_{q}', text=f'{float(ma):1.9e}'))
       base.append(xmlUtils.newNode('variance', text=f'{float(info["arma"]["var"]):1.9e}'))
 
-  def _generateNoise(self, model, initDict, size):
+  def _simulate(self, armaData, msrNoise, stateNoise, initNoise):
     """
-      Generates purturbations for ARMA sampling.
-      @ In, model, statsmodels.tsa.arima.model.ARIMA, trained ARIMA model
-      @ In, initDict, dict, mean and covariance of initial sampling distribution
-      @ In, size, int, length of time-like variable
-      @ Out, msrShocks, np.array, measurement shocks
-      @ Out, stateShocks, np.array, state shocks
-      @ Out, initialState, np.array, initial random state
+      Samples ARMA histories by filtering the state shocks through the fitted recursion.
+      This is the simulation of the state space form of the ARMA used by statsmodels, with the
+      initial state drawn from its stationary distribution.
+      @ In, armaData, dict, trained ARMA coefficients (as from self.characterize)
+      @ In, msrNoise, np.array, standard normal noise for the measurement shocks, shaped [samples, time]
+      @ In, stateNoise, np.array, standard normal noise for the state shocks, shaped [samples, time]
+      @ In, initNoise, np.array, standard normal noise for the initial states, shaped [samples, states]
+      @ Out, histories, np.array, sampled histories shaped [samples, time]
     """
-    # measurement shocks -> these are usually near 0 but not exactly
-    # note in statsmodels.tsa.statespace.kalman_filter, mean of measure shocks is 0s
-    msrCov = model['obs_cov']
-    msrShocks = randomUtils.randomMultivariateNormal(msrCov, size=size)
+    # regularization of the covariances, as in randomUtils.randomMultivariateNormal
+    eps = 10 * sys.float_info.epsilon
+    # measurement shocks -> the ARMA has no measurement error, so only the regularization is left
+    msrShocks = np.sqrt(eps) * msrNoise
     # state shocks -> these are the significant noise terms
-    # note in statsmodels.tsa.statespace.kalman_filter, mean of state shocks is 0s
-    stateCov = model['state_cov']
-    stateShocks = randomUtils.randomMultivariateNormal(stateCov, size=size)
-    # initial state
-    initMean = initDict['mean']
-    initCov = initDict['cov']
-    initialState = randomUtils.randomMultivariateNormal(initCov, size=1, mean=initMean)
-    return msrShocks, stateShocks, initialState
+    # note they are drawn from the covariance of the trained model (as in statsmodels, when the shocks are
+    # given to the simulation), so the variance in the parameters does not change them
+    stateShocks = np.sqrt(armaData['stateCov'][0, 0] + eps) * stateNoise
+    # initial states
+    initMean = armaData['initials']['mean']
+    initCov = armaData['initials']['cov']
+    numStates = len(initMean)
+    decomp = np.linalg.cholesky(initCov + eps * np.identity(numStates))
+    initialState = initMean + np.dot(initNoise, decomp.T)
+    # the state space recursion is the transposed direct form of the ARMA filter, so the states
+    # (padded to the filter length) give the filter's initial conditions
+    ar = np.zeros(numStates + 1)
+    ar[:len(armaData['ar'])] = armaData['ar']
+    ma = np.zeros(numStates)
+    ma[:len(armaData['ma'])] = armaData['ma']
+    zi = np.outer(initialState[:, 0], ar[:numStates]) + np.hstack([initialState[:, 1:], np.zeros((len(initialState), 1))])
+    filtered, _ = sp.signal.lfilter(np.hstack([[1.0], ma]), np.hstack([[1.0], -ar[:numStates]]), stateShocks, axis=1, zi=zi)
+    histories = np.empty(stateShocks.shape)
+    histories[:, 0] = initialState[:, 0]
+    histories[:, 1:] = filtered[:, :-1]
+    histories += armaData.get('const', 0) + msrShocks
+    return histories
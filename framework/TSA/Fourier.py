@@ -15,10 +15,7 @@
   Fourier time series analysis
   Note this determines the fit of desired bases, not a fast fourier transform
 """
-import copy
-import collections
 import numpy as np
-import sklearn.linear_model
 
 from utils import InputData, InputTypes, randomUtils, xmlUtils, mathUtils, utils
 from .TimeSeriesAnalyzer import TimeSeriesGenerator, TimeSeriesCharacterizer
@@ -99,63 +96,49 @@ class Fourier(TimeSeriesGenerator, TimeSeriesCharacterizer):
     #                 3:   cos(2pi*t/period[1]), ...
     # check collinearity
     cond = np.linalg.cond(fourierSignals) if simultFit else 30
-    # fit
-    params = {}
-    for tg, target in enumerate(targets):
-      history = signal[:, tg] # TODO need to keep in sync with SyntheticSignal ROM!
-      if simultFit and cond < 30:
+    # fit all the targets at once, since they share the Fourier bases
+    history = signal # TODO need to keep in sync with SyntheticSignal ROM!
+    if simultFit and cond < 30:
+      for target in targets:
         print(f'Fourier fitting condition number is {cond:1.1e} for "{target}". ',
                         ' Calculating all Fourier coefficients at once.')
-        fourierEngine = sklearn.linear_model.LinearRegression(normalize=False)
-        fourierEngine.fit(fourierSignals, history)
-        intercept = fourierEngine.intercept_
-        coeffs = fourierEngine.coef_
-      else:
+      # least squares of the bases plus a constant against all targets together
+      bases = np.hstack([fourierSignals, np.ones((len(pivot), 1))])
+      solution = np.linalg.lstsq(bases, history, rcond=None)[0]
+      coeffs = solution[:-1].T
+      intercepts = solution[-1]
+    else:
+      for target in targets:
         print(f'Fourier fitting condition number is {cond:1.1e} for "{target}"! ',
                         'Calculating iteratively instead of all at once.')
-        # fourierSignals has shape (H, 2F) where H is history len and F is number of Fourier periods
-        ## Fourier periods are in order from largest period to smallest, with sin then cos for each:
-        ## [S0, C0, S1, C1, ..., SN, CN]
-        H, F2 = fourierSignals.shape
-        signalToFit = copy.deepcopy(history) # will be modified during analysis
-        intercept = 0
-        coeffs = np.zeros(F2) # amplitude coeffs for sine, cosine
-        for fn in range(F2):
-          fSignal = fourierSignals[:,fn] # Fourier base signal for this waveform
-          eng = sklearn.linear_model.LinearRegression(normalize=False) # regressor
-          eng.fit(fSignal.reshape(H,1), signalToFit)
-          thisIntercept = eng.intercept_
-          thisCoeff = eng.coef_[0]
-          coeffs[fn] = thisCoeff
-          intercept += thisIntercept
-          # remove this signal from the signal to fit
-          thisSignal = thisIntercept + thisCoeff * fSignal
-          signalToFit -= thisSignal
-
-      # get coefficient map for A*sin(ft) + B*cos(ft)
-      waveCoefMap = collections.defaultdict(dict) # {period: {sin:#, cos:#}}
-      for c, coef in enumerate(coeffs):
-        period = periods[c//2]
-        waveform = 'sin' if c % 2 == 0 else 'cos'
-        waveCoefMap[period][waveform] = coef
-      # convert to C*sin(ft + s)
-      ## since we use fitting to get A and B, the magnitudes can be deceiving.
-      ## this conversion makes "C" a useful value to know the contribution from a period
-      coefMap = {}
-      # TODO can we put off making and storing the signal until called on?
-      # signal = np.ones(len(pivot)) * intercept
-      for period, coefs in waveCoefMap.items():
-        A = coefs['sin']
-        B = coefs['cos']
-        C, s = mathUtils.convertSinCosToSinPhase(A, B)
-        coefMap[period] = {'amplitude': C, 'phase': s}
-      #   signal += mathUtils.evalFourier(period, C, s, pivot)
-
-      # store results
-      params[target] = {'intercept': intercept,
-                        'coeffs'   : coefMap} #,
-                        # 'periods'  : self._periods}
-      # END for target in targets
+      # fourierSignals has shape (H, 2F) where H is history len and F is number of Fourier periods
+      ## Fourier periods are in order from largest period to smallest, with sin then cos for each:
+      ## [S0, C0, S1, C1, ..., SN, CN]
+      H, F2 = fourierSignals.shape
+      signalToFit = np.array(history, dtype=float) # will be modified during analysis
+      intercepts = np.zeros(len(targets))
+      coeffs = np.zeros((len(targets), F2)) # amplitude coeffs for sine, cosine
+      for fn in range(F2):
+        fSignal = fourierSignals[:, fn] # Fourier base signal for this waveform
+        # simple linear regression of each target against this base
+        fCentered = fSignal - fSignal.mean()
+        thisCoeff = fCentered.dot(signalToFit - signalToFit.mean(axis=0)) / fCentered.dot(fCentered)
+        thisIntercept = signalToFit.mean(axis=0) - thisCoeff * fSignal.mean()
+        coeffs[:, fn] = thisCoeff
+        intercepts += thisIntercept
+        # remove this signal from the signal to fit
+        signalToFit -= thisIntercept + np.outer(fSignal, thisCoeff)
+    # convert A*sin(ft) + B*cos(ft) to C*sin(ft + s)
+    ## since we use fitting to get A and B, the magnitudes can be deceiving.
+    ## this conversion makes "C" a useful value to know the contribution from a period
+    amplitudes, phases = mathUtils.convertSinCosToSinPhase(coeffs[:, 0::2], coeffs[:, 1::2])
+    # store results
+    params = {}
+    for tg, target in enumerate(targets):
+      coefMap = dict((period, {'amplitude': amplitudes[tg, p], 'phase': phases[tg, p]})
+                     for p, period in enumerate(periods))
+      params[target] = {'intercept': intercepts[tg],
+                        'coeffs'   : coefMap}
     return params
 
   # getResidual -> use base implementation
@@ -168,15 +151,28 @@ class Fourier(TimeSeriesGenerator, TimeSeriesCharacterizer):
       @ In, settings, dict, additional settings specific to algorithm
       @ Out, synthetic, np.array(float), synthetic ARMA signal
     """
-    synthetic = np.zeros((len(pivot), len(params)))
-    for t, (target, data) in enumerate(params.items()):
-      synthetic[:, t] += data['intercept']
-      for period, coeffs in data['coeffs'].items():
-        C = coeffs['amplitude']
-        s = coeffs['phase']
-        synthetic[:, t] += mathUtils.evalFourier(period, C, s, pivot)
+    periods = list(next(iter(params.values()))['coeffs']) if params else []
+    intercepts = np.array([data['intercept'] for data in params.values()])
+    amplitudes = np.array([[data['coeffs'][period]['amplitude'] for period in periods] for data in params.values()])
+    phases = np.array([[data['coeffs'][period]['phase'] for period in periods] for data in params.values()])
+    # evaluate all waveforms of all targets at once, shape [time, target, period]
+    angles = 2. * np.pi * pivot[:, np.newaxis, np.newaxis] / np.asarray(periods) + phases
+    synthetic = intercepts + np.sum(amplitudes * np.sin(angles), axis=2)
     return synthetic
 
+  def generateSamples(self, params, pivot, settings, numSamples):
+    """
+      Generates several synthetic histories from fitted parameters.
+      Fourier signals are deterministic, so all the samples are the same.
+      @ In, params, dict, characterization such as otained from self.characterize()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ In, numSamples, int, number of synthetic histories to generate
+      @ Out, synthetic, np.array(float), synthetic signals shaped [numSamples, pivotValues, targets]
+    """
+    synthetic = self.generate(params, pivot, settings)
+    return np.repeat(synthetic[np.newaxis, :, :], numSamples, axis=0)
+
   def writeXML(self, writeTo, params):
     """
       Allows the engine to put whatever it wants into an XML to print to file.
@@ -16,6 +16,7 @@
   checking time histories.
 """
 import abc
+import numpy as np
 
 from utils import utils, InputData, InputTypes
 
@@ -141,6 +142,19 @@ class TimeSeriesGenerator(TimeSeriesAnalyzer):
     """
     pass
 
+  def generateSamples(self, params, pivot, settings, numSamples):
+    """
+      Generates several synthetic histories from fitted parameters.
+      Overload in inheritors that can generate many histories at once.
+      @ In, params, dict, training parameters as from self.characterize
+      @ In, pivot, np.array, time-like array values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ In, numSamples, int, number of synthetic histories to generate
+      @ Out, synthetic, np.array(float), synthetic signals shaped [numSamples, pivotValues, targets]
+    """
+    # DEFAULT IMPLEMENTATION, generate the histories one at a time
+    return np.asarray([self.generate(params, pivot, settings) for _ in range(numSamples)])
+
 
 class TimeSeriesCharacterizer(TimeSeriesAnalyzer):
   """
@@ -265,6 +265,15 @@ class hdf5Database(InputDataUser, MessageUser):
     self.h5FileW.flush()
 
 
+  def addGroups(self, rlzs):
+    """
+      Function to add many groups into the database, one at a time
+      @ In, rlzs, list, list of realizations (see addGroup)
+      @ Out, None
+    """
+    for rlz in rlzs:
+      self.addGroup(rlz)
+
   def addGroupInit(self,groupName,attributes=None):
     """
       Function to add an empty group to the database
@@ -617,3 +626,349 @@ class hdf5Database(InputDataUser, MessageUser):
     return parentGroupName
 
 
+
+#
+#  **********************************
+#  *  HDF5 COLUMNAR DATABASE CLASS  *
+#  **********************************
+#
+
+class hdf5ColumnarDatabase(InputDataUser, MessageUser):
+  """
+    class to create a h5py (hdf5) database with a columnar layout: instead of a group per realization,
+    each variable is stored in a chunked, extendable dataset "columns/<var>" with the values of all the
+    realizations one after the other. For variables with more than one value in some realization (histories),
+    the number of values of each realization is stored in "lengths/<var>".
+    Each dataset keeps the type of the values (integer, float, boolean or string); integer columns become float
+    columns if a realization has non-integer or missing values.
+    Realizations are appended in batches and read back all at once; the structure is always parallel (MC),
+    the "RAVEN_parentID" of hierarchical realizations being stored as any other variable.
+  """
+  # number of realizations added between flushes of the file
+  flushInterval = 1000
+  # number of entries in each chunk of the datasets
+  chunkSize = 1024
+
+  @staticmethod
+  def isColumnar(filenameAndPath):
+    """
+      Checks if an existing database has the columnar layout.
+      @ In, filenameAndPath, str, path to the database file
+      @ Out, isColumnar, bool, True if columnar
+    """
+    if not os.path.exists(filenameAndPath):
+      return False
+    with h5.File(filenameAndPath, 'r') as fh5:
+      return fh5.attrs.get('layout', None) == 'columnar'
+
+  def __init__(self, name, databaseDir, filename, exist, variables=None):
+    """
+      Constructor
+      @ In, name, string, name of this database
+      @ In, databaseDir, string, database directory (full path)
+      @ In, filename, string, the database filename
+      @ In, exist, bool, does it exist?
+      @ In, variables, list, the user wants to store just some specific variables (default =None => all variables are stored)
+      @ Out, None
+    """
+    super().__init__()
+    self.name = name
+    self.variables = variables
+    self.type = 'MC'
+    self.printTag = 'DATABASE HDF5'
+    self.fileExist = exist
+    self.onDiskFile = filename
+    self.databaseDir = databaseDir
+    self.filenameAndPath = os.path.join(self.databaseDir,self.onDiskFile)
+    self.fileOpen = False
+    self._numRlz = 0      # number of realizations stored
+    self._unflushed = 0   # number of realizations added since the last flush
+    self._names = None    # index of the realization names, {name: index}, built when first needed
+    self._offsets = {}    # offsets of the realizations in the columns with lengths, {var: np.ndarray}
+    if self.fileExist:
+      if not os.path.exists(self.filenameAndPath):
+        self.raiseAnError(IOError,'database file has not been found, searched Path is: ' + self.filenameAndPath )
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'r+')
+      self._numRlz = int(self.h5FileW.attrs['nRealizations'])
+      self.raiseAMessage('TOTAL NUMBER OF REALIZATIONS = ' + str(self._numRlz))
+    else:
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'w')
+      self.h5FileW.attrs['layout'] = 'columnar'
+      self.h5FileW.attrs['nRealizations'] = 0
+      self.h5FileW.create_group('columns')
+      self.h5FileW.create_group('lengths')
+
+  def __len__(self):
+    """
+      Overload len method
+      @ In, None
+      @ Out, __len__, int, number of realizations
+    """
+    return self._numRlz
+
+  def addExpectedMeta(self, keys, params={}):
+    """
+      Store expected metadata
+      @ In, keys, set(), the metadata list
+      @ In, params, dict, optional, {key:[indexes]}, keys of the dictionary are the variable names,
+        values of the dictionary are lists of the corresponding indexes/coordinates of given variable
+      @ Out, None
+    """
+    self.h5FileW.attrs['expectedMetadata'] = list(str(key) for key in keys)
+
+  def provideExpectedMetaKeys(self):
+    """
+      Provides the registered list of metadata keys for this entity.
+      @ In, None
+      @ Out, meta, tuple, (set(str),dict), expected keys (empty if none) and dictionary of expected keys corresponding to their indexes
+        i.e. {keys, [indexes]}
+    """
+    meta = set(utils.toString(key) for key in self.h5FileW.attrs.get('expectedMetadata', []))
+    return meta,{}
+
+  def addGroup(self, rlz):
+    """
+      Function to add a realization into the database
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    self.addGroups([rlz])
+
+  def addGroups(self, rlzs):
+    """
+      Function to add a batch of realizations into the database, extending each column once.
+      @ In, rlzs, list, list of realizations (dictionaries with the data and metadata to add)
+      @ Out, None
+    """
+    if not rlzs:
+      return
+    if self.variables is not None:
+      for rlz in rlzs:
+        if not set(self.variables).issubset(rlz.keys()):
+          self.raiseAnError(IOError, "Not all the requested variables have been passed in the realization. Missing are: "+
+                            ",".join(list(set(self.variables).symmetric_difference(set(rlz.keys())))))
+    # collect the variables, in order of appearance, with the values of each realization
+    values = {}
+    for r, rlz in enumerate(rlzs):
+      for var, value in rlz.items():
+        # the index map is rebuilt by the data objects from their pivot parameters
+        if var == '_indexMap' or not isinstance(value, (np.ndarray, float, int, str, bool, np.number, np.bool_)):
+          continue
+        value = np.atleast_1d(value)
+        # as in the groups layout, numbers are stored only if requested
+        if self.variables is not None and var not in self.variables and value.dtype.kind in 'fiu':
+          continue
+        if var not in values:
+          values[var] = [None]*len(rlzs)
+        values[var][r] = value
+    columns = self.h5FileW['columns']
+    for var in columns:
+      values.setdefault(var, [None]*len(rlzs))
+    for var, column in values.items():
+      self.__extendColumn(var, column)
+    if self._names is not None:
+      for r, name in enumerate(self.__names(values.get('prefix'), self._numRlz, len(rlzs))):
+        self._names.setdefault(name, self._numRlz + r)
+    self._offsets = {}
+    self._numRlz += len(rlzs)
+    self.h5FileW.attrs['nRealizations'] = self._numRlz
+    self._unflushed += len(rlzs)
+    if self._unflushed >= self.flushInterval:
+      self.h5FileW.flush()
+      self._unflushed = 0
+
+  def __extendColumn(self, var, column):
+    """
+      Appends the values of a variable for a batch of realizations
+      @ In, var, str, the variable
+      @ In, column, list, np.ndarray values of each realization, or None if missing (stored as NaN or empty string)
+      @ Out, None
+    """
+    columns = self.h5FileW['columns']
+    if var not in columns:
+      example = next(value for value in column if value is not None)
+      # the prefix is the name of the realization, so it is always a string
+      if example.dtype.kind in 'iu' and var != 'prefix':
+        dtype = np.int64
+      elif example.dtype.kind == 'f' and var != 'prefix':
+        dtype = float
+      elif example.dtype.kind == 'b':
+        dtype = bool
+      else:
+        dtype = h5.special_dtype(vlen=str)
+      dataset = columns.create_dataset(var, shape=(self.chunkSize,), maxshape=(None,), chunks=(self.chunkSize,), dtype=dtype)
+      dataset.attrs['size'] = 0
+      dataset.attrs['numRlz'] = 0
+      # realizations stored before this variable appeared
+      if self._numRlz:
+        self.__extendColumn(var, [None]*self._numRlz)
+    dataset = columns[var]
+    # integers can not represent missing values nor non-integer ones
+    if dataset.dtype.kind == 'i' and any(value is None or value.dtype.kind not in 'iub' for value in column):
+      dataset = self.__toFloat(var)
+    isString = h5.check_string_dtype(dataset.dtype) is not None
+    missing = np.array([''], dtype=object) if isString else np.array([np.nan if dataset.dtype.kind == 'f' else False])
+    column = list(missing if value is None else value for value in column)
+    lengths = np.fromiter((len(value) for value in column), dtype=int, count=len(column))
+    data = np.concatenate(column)
+    try:
+      data = data.astype(str).astype(object) if isString else data.astype(dataset.dtype)
+    except ValueError:
+      self.raiseAnError(TypeError, 'Values of "{}" in database "{}" cannot be stored as "{}"!'.format(var, self.name, dataset.dtype))
+    # extend the dataset (by at least doubling it) and write the new values
+    size = int(dataset.attrs['size'])
+    newSize = size + len(data)
+    if newSize > len(dataset):
+      dataset.resize((max(newSize, 2*len(dataset)),))
+    dataset[size:newSize] = data
+    dataset.attrs['size'] = newSize
+    # lengths are only needed once some realization has a number of values different than one
+    numRlz = int(dataset.attrs['numRlz'])
+    dataset.attrs['numRlz'] = numRlz + len(column)
+    allLengths = self.h5FileW['lengths']
+    if var not in allLengths and np.any(lengths != 1):
+      allLengths.create_dataset(var, data=np.ones(numRlz, dtype=int), maxshape=(None,), chunks=(self.chunkSize,))
+    if var in allLengths:
+      dataset = allLengths[var]
+      if numRlz + len(lengths) > len(dataset):
+        dataset.resize((max(numRlz + len(lengths), 2*len(dataset)),))
+      dataset[numRlz:numRlz + len(lengths)] = lengths
+
+  def __toFloat(self, var):
+    """
+      Converts the dataset of an integer variable into a float dataset
+      @ In, var, str, the variable
+      @ Out, dataset, h5py.Dataset, the new dataset
+    """
+    columns = self.h5FileW['columns']
+    old = columns[var]
+    attrs = dict(old.attrs)
+    values = old[:int(attrs['size'])].astype(float)
+    del columns[var]
+    dataset = columns.create_dataset(var, shape=(max(len(values), self.chunkSize),), maxshape=(None,), chunks=(self.chunkSize,), dtype=float)
+    dataset[:len(values)] = values
+    dataset.attrs.update(attrs)
+    return dataset
+
+  def __names(self, prefixes, start, numRlz):
+    """
+      Provides the names of new realizations from their prefixes, as in retrieveAllHistoryNames
+      @ In, prefixes, list, the prefix (np.ndarray) of each realization or None if missing, or None if no realization has one
+      @ In, start, int, the index of the first realization
+      @ In, numRlz, int, the number of realizations
+      @ Out, names, list, the names
+    """
+    if prefixes is None:
+      return list(str(start + r) for r in range(numRlz))
+    return list('' if prefix is None else str(prefix[0]) for prefix in prefixes)
+
+  def __offsets(self, var):
+    """
+      Provides the position of the values of each realization in the column of a variable with lengths
+      @ In, var, str, the variable
+      @ Out, offsets, np.ndarray, the offsets, with one more entry than the realizations (the size of the column)
+    """
+    if var not in self._offsets:
+      offsets = np.zeros(self._numRlz + 1, dtype=int)
+      np.cumsum(self.h5FileW['lengths'][var][:self._numRlz], out=offsets[1:])
+      self._offsets[var] = offsets
+    return self._offsets[var]
+
+  def addGroupInit(self,groupName,attributes=None):
+    """
+      Function to add an empty group to the database.
+      The columnar layout is not divided in groups, so only the attributes are kept.
+      @ In, groupName, string, group name
+      @ In, attributes, dict, optional, dictionary of attributes that must be added as metadata (None by default)
+      @ Out, None
+    """
+    if attributes:
+      self.h5FileW['columns'].attrs.update(attributes)
+
+  def getColumns(self):
+    """
+      Reads all the realizations at once.
+      @ In, None
+      @ Out, columns, dict, {var: (values, lengths)}, with "values" the np.ndarray of the values of all the
+        realizations and "lengths" the np.ndarray of the number of values of each realization, or None
+        if each realization has one value
+    """
+    columns = {}
+    allLengths = self.h5FileW['lengths']
+    for var, dataset in self.h5FileW['columns'].items():
+      size = int(dataset.attrs['size'])
+      if h5.check_string_dtype(dataset.dtype) is not None:
+        values = dataset.asstr()[:size].astype(str)
+      else:
+        values = dataset[:size]
+      lengths = allLengths[var][:self._numRlz] if var in allLengths else None
+      columns[var] = (values, lengths)
+    return columns
+
+  def retrieveAllHistoryNames(self,rootName=None):
+    """
+      Function to create a list of the names (prefixes) of all the realizations in the database
+      @ In, rootName, string, optional, not used (there are no root groups in the columnar layout)
+      @ Out, workingList, list, list of the realization names
+    """
+    columns = self.h5FileW['columns']
+    if 'prefix' not in columns:
+      return list(str(r) for r in range(self._numRlz))
+    dataset = columns['prefix']
+    names = dataset.asstr()[:self._numRlz] if h5.check_string_dtype(dataset.dtype) is not None else dataset[:self._numRlz]
+    return list(str(name) for name in names)
+
+  def _getRealizationByName(self,name,options = {}):
+    """
+      Function to retrieve the realization whose name (prefix) is "name"
+      @ In, name, string, realization name
+      @ In, options, dict, dictionary of options (not used, kept for compatibility with the groups layout)
+      @ Out, (newData,attrs), tuple, tuple where position 0 = dict containing the realization, 1 = dictionary of some attributes
+    """
+    if self._names is None:
+      # the first realization with a given name is found, as in the list of names
+      self._names = {}
+      for index, rlzName in enumerate(self.retrieveAllHistoryNames()):
+        self._names.setdefault(rlzName, index)
+    index = self._names.get(str(name))
+    if index is None:
+      self.raiseAnError(IOError,'Realization named ' + str(name) + ' not found in database "'+self.name+'"!')
+    newData = {}
+    allLengths = self.h5FileW['lengths']
+    for var, dataset in self.h5FileW['columns'].items():
+      if var in allLengths:
+        offsets = self.__offsets(var)
+        start, end = offsets[index], offsets[index+1]
+      else:
+        start, end = index, index + 1
+      if h5.check_string_dtype(dataset.dtype) is not None:
+        newData[var] = dataset.asstr()[start:end].astype(str)
+      else:
+        newData[var] = dataset[start:end]
+    attrs = {'nVars':len(newData.keys()),'varKeys':newData.keys()}
+    return newData, attrs
+
+  def closeDatabaseW(self):
+    """
+      Function to close the database, trimming the datasets to the stored values
+      @ In,  None
+      @ Out, None
+    """
+    if self.fileOpen:
+      for dataset in self.h5FileW['columns'].values():
+        dataset.resize((int(dataset.attrs['size']),))
+      for dataset in self.h5FileW['lengths'].values():
+        dataset.resize((self._numRlz,))
+      self.h5FileW.close()
+    self.fileOpen = False
+
+  def openDatabaseW(self,filename,mode='w'):
+    """
+      Function to open the database
+      @ In, filename, string, name of the file (string)
+      @ In, mode, string, open mode (default "w=write")
+      @ Out, fh5, hdf5 object, instance of hdf5
+    """
+    fh5 = h5.File(filename,mode)
+    self.fileOpen = True
+    return fh5
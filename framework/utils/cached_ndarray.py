@@ -351,6 +351,27 @@ class cNDarray(object):
     self.values[self.size] = entry[:]
     self.size += 1
 
+  def extend(self,entries):
+    """
+      Extend method, appends a block of samples at once. call format cNDarrayInstance.extend(values)
+      @ In, entries, np.ndarray, the entries to append, with shape (# new samples, # entities)
+      @ Out, None
+    """
+    if type(entries) not in [np.ndarray]:
+      raise IOError('Tried to add new data to cNDarray.  Can only accept np.ndarray, but got '+type(entries).__name__)
+    if len(entries.shape) != 2 or entries.shape[1] != self.width:
+      raise IOError('Tried to add new data to cNDarray.  Need shape (#,{}) but got "{}"!'.format(self.width,entries.shape))
+    new = entries.shape[0]
+    # check if there's enough space in cache to append the new entries
+    if self.size + new > self.capacity:
+      # quadruple available space, or more if the block needs it
+      self.capacity = max(self.capacity*4, self.size + new)
+      newdata = np.zeros((self.capacity,self.width),dtype=self.values.dtype)
+      newdata[:self.size] = self.values[:self.size]
+      self.values = newdata
+    self.values[self.size:self.size+new] = entries
+    self.size += new
+
   def addEntity(self,vals,firstEver=False):
     """
       Adds a column to the dataset.
@@ -384,3 +405,340 @@ class cNDarray(object):
     assert(abs(index) < self.width)
     self.values = np.delete(self.values,index,axis=1)
     self.width -= 1
+
+class cColumnarArray(object):
+  """
+    Caching of realizations (rows) made of several entities (columns), stored column by column.
+    Each column is kept in its own growable buffer, typed according to the values it receives:
+      - scalars (float, int, bool) are stored in a typed np.ndarray with one entry per sample;
+      - numeric arrays with the same shape for every sample (e.g. aligned histories) are stored in a
+        typed np.ndarray with shape (# samples, ) + shape of the entry;
+      - anything else (strings, ragged arrays, other objects) is stored in an object np.ndarray.
+    If a column receives a value that does not fit its typed buffer, the column is converted to an
+    object buffer. Indexing (e.g. array[r], array[r, c], array[:, c]) behaves as for cNDarray.
+  """
+  ### CONSTRUCTOR ###
+  def __init__(self, width=None, length=None):
+    """
+      Constructor.
+      @ In, width, int, the number of entities (columns)
+      @ In, length, int, optional, the initial capacity (number of samples) to allocate
+      @ Out, None
+    """
+    if width is None:
+      raise IOError('Creating cColumnarArray: "width" was not specified!')
+    self.width    = width                                    # number of entities aka columns
+    self.size     = 0                                        # number of rows (samples) with actual data
+    self.capacity = length if length is not None else 100    # cached number of rows
+    self.columns  = [None] * width                           # buffers, created when the first values are received
+
+  ### PROPERTIES ###
+  @property
+  def shape(self):
+    """
+      Shape property, as used in np.ndarray structures.
+      @ In, None
+      @ Out, (int,int), the (#rows, #columns) of useful data in this cached array
+    """
+    return (self.size, self.width)
+
+  ### BUILTINS ###
+  def __array__(self, dtype=None):
+    """
+      so that numpy's array() returns the values as an object array of rows
+      @ In, dtype, np.type, the requested type of the array
+      @ Out, __array__, numpy.ndarray, the requested array
+    """
+    data = self.getData()
+    if dtype is not None:
+      return data.astype(dtype)
+    return data
+
+  def __getitem__(self, val):
+    """
+      Get item method. Slicing works as if the data was an object array with shape (# samples, # entities).
+      @ In, val, slice object, the slicing object (e.g. 1, :, :2, 1:3, (1, 2), (:, 2), etc.)
+      @ Out, __getitem__, object or np.ndarray, the element(s)
+    """
+    if isinstance(val, tuple) and len(val) == 2:
+      rows, cols = val
+    else:
+      rows, cols = val, slice(None)
+    # single column requested
+    if isinstance(cols, (int, np.integer)):
+      return self.getColumn(cols, asObject=True)[rows]
+    if isinstance(cols, slice):
+      cols = range(self.width)[cols]
+    cols = list(cols)
+    # single row requested, only gather its elements
+    if isinstance(rows, (int, np.integer)):
+      row = range(self.size)[rows]
+      data = np.empty(len(cols), dtype=object)
+      for c, col in enumerate(cols):
+        data[c] = self.columns[col][row]
+      return data
+    data = np.empty((self.size, len(cols)), dtype=object)
+    for c, col in enumerate(cols):
+      data[:, c] = self.getColumn(col, asObject=True)
+    return data[rows]
+
+  def __setitem__(self, val, value):
+    """
+      Set item method, for a single element.
+      @ In, val, tuple, (row, column) of the element to set
+      @ In, value, object, the new value
+      @ Out, None
+    """
+    row, col = val
+    if row < 0:
+      row += self.size
+    if not 0 <= row < self.size:
+      raise IndexError('Row {} is out of range for cColumnarArray with {} rows!'.format(val[0], self.size))
+    if not self._fits(self.columns[col], value):
+      self._toObject(col)
+    self.columns[col][row] = value
+
+  def __iter__(self):
+    """
+      Overload of iterator, iterates over the rows
+      @ In, None
+      @ Out, __iter__, iterator, iterator
+    """
+    return iter(self.getData())
+
+  def __len__(self):
+    """
+      Return size, which is the number of samples, independent of entities, containing useful data.
+      Does not include cached entries that have not yet been filled.
+      @ In, None
+      @ Out, __len__, integer, size
+    """
+    return self.size
+
+  def __repr__(self):
+    """
+      overload of __repr__ function
+      @ In, None
+      @ Out, __repr__, string, the representation string
+    """
+    return repr(self.getData())
+
+  ### UTILITY FUNCTIONS ###
+  def append(self, entry):
+    """
+      Append method, adds one sample.
+      @ In, entry, list or np.ndarray, the values of the sample, one per entity
+      @ Out, None
+    """
+    if len(entry) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} entries, but got {}!'.format(self.width, len(entry)))
+    self._reserve(self.size + 1)
+    for c, value in enumerate(entry):
+      column = self.columns[c]
+      if column is None:
+        column = self._newColumn(c, value)
+      elif not self._fits(column, value):
+        column = self._toObject(c)
+      column[self.size] = value
+    self.size += 1
+
+  def extend(self, entries):
+    """
+      Extend method, appends a block of samples at once.
+      @ In, entries, np.ndarray, the entries to append, with shape (# new samples, # entities)
+      @ Out, None
+    """
+    if not isinstance(entries, np.ndarray) or len(entries.shape) != 2 or entries.shape[1] != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need np.ndarray with shape (#,{})!'.format(self.width))
+    self.extendColumns(list(entries[:, c] for c in range(self.width)))
+
+  def extendColumns(self, columns):
+    """
+      Appends a block of samples given column by column.
+      @ In, columns, list, np.ndarray for each entity, all with the same length (# new samples);
+        typed arrays are copied into the buffers at once
+      @ Out, None
+    """
+    if len(columns) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} columns, but got {}!'.format(self.width, len(columns)))
+    new = len(columns[0]) if self.width else 0
+    if any(len(values) != new for values in columns):
+      raise IOError('Tried to add new data to cColumnarArray.  All the columns need the same length!')
+    if new == 0:
+      return
+    self._reserve(self.size + new)
+    for c, values in enumerate(columns):
+      values = np.asarray(values) if not isinstance(values, np.ndarray) else values
+      column = self.columns[c]
+      if values.dtype == object:
+        # objects need checking one at a time
+        if column is None:
+          column = self._newColumn(c, values[0])
+        if not all(self._fits(column, value) for value in values):
+          column = self._toObject(c)
+        if column.ndim > 1:
+          column[self.size:self.size+new] = np.stack(values)
+        else:
+          column[self.size:self.size+new] = values
+        continue
+      if column is None:
+        column = self._newColumn(c, values[0])
+      if column.dtype != object and (column.shape[1:] != values.shape[1:] or not self._castable(values.dtype, column.dtype)):
+        column = self._toObject(c)
+      if column.dtype == object and values.ndim > 1:
+        # keep each entry as an array
+        column[self.size:self.size+new] = list(values)
+      else:
+        column[self.size:self.size+new] = values
+    self.size += new
+
+  def addEntity(self, vals, firstEver=False):
+    """
+      Adds a column to the dataset.
+      @ In, vals, list, as list(#,#,#) where # is either single-valued or numpy array, one per sample
+      @ Out, None
+    """
+    self.columns.append(None)
+    self.width += 1
+    if self.size > 0:
+      values = np.empty(self.size, dtype=object)
+      values[:] = vals
+      self._newColumn(self.width - 1, values[0])
+      for r, value in enumerate(values):
+        if not self._fits(self.columns[-1], value):
+          self._toObject(self.width - 1)
+        self.columns[-1][r] = value
+
+  def getColumn(self, index, asObject=False):
+    """
+      Returns the values of an entity for all the samples. The values are NOT copied (for typed
+      columns, this is a view of the buffer), so the collector must not be modified afterwards if
+      the result is kept.
+      @ In, index, int, index of the entity
+      @ In, asObject, bool, optional, if True then multidimensional entries are returned as a
+        one-dimensional object array with one entry per sample
+      @ Out, getColumn, np.ndarray, the values
+    """
+    column = self.columns[index]
+    if column is None:
+      return np.empty(self.size, dtype=object)
+    values = column[:self.size]
+    if asObject and values.ndim > 1:
+      objValues = np.empty(self.size, dtype=object)
+      objValues[:] = list(values)
+      values = objValues
+    return values
+
+  def getData(self):
+    """
+      Returns the data as an object array of rows.
+      @ In, None
+      @ Out, getData, np.ndarray, the data, with shape (# samples, # entities)
+    """
+    return self[:, :]
+
+  def removeEntity(self, index):
+    """
+      Removes a column from this dataset
+      @ In, index, int, index of entry to remove
+      @ Out, None
+    """
+    assert(abs(index) < self.width)
+    self.columns.pop(index)
+    self.width -= 1
+
+  ### PRIVATE UTILITIES ###
+  @staticmethod
+  def _fits(column, value):
+    """
+      Checks if a value can be stored in a column buffer without loss.
+      @ In, column, np.ndarray, the buffer of the column
+      @ In, value, object, the value
+      @ Out, _fits, bool, True if the value fits
+    """
+    kind = column.dtype.kind
+    if kind == 'O':
+      return True
+    if column.ndim > 1:
+      return isinstance(value, np.ndarray) and value.shape == column.shape[1:] and cColumnarArray._castable(value.dtype, column.dtype)
+    if isinstance(value, (bool, np.bool_)):
+      return kind == 'b'
+    if isinstance(value, (int, np.integer)):
+      # integers are not stored as floats (precision is lost above 2**53), nor past the range of the buffer
+      if kind not in 'iu':
+        return False
+      info = np.iinfo(column.dtype)
+      return int(info.min) <= int(value) <= int(info.max)
+    if isinstance(value, (float, np.floating)):
+      return kind == 'f'
+    return False
+
+  @staticmethod
+  def _castable(fromType, toType):
+    """
+      Checks if values of a type can be stored in a buffer of another type without loss.
+      Booleans are only stored with booleans, and integers are only stored with floats if these represent them exactly.
+      @ In, fromType, np.dtype, the type of the values
+      @ In, toType, np.dtype, the type of the buffer
+      @ Out, _castable, bool, True if the values can be stored
+    """
+    if (fromType.kind == 'b') != (toType.kind == 'b'):
+      return False
+    # np.can_cast allows int64 to float64, which is not exact above 2**53
+    if fromType.kind in 'iu' and toType.kind == 'f' and fromType.itemsize >= toType.itemsize:
+      return False
+    return np.can_cast(fromType, toType)
+
+  def _newColumn(self, index, value):
+    """
+      Creates the buffer of a column, typed according to the first value it receives.
+      @ In, index, int, the index of the column
+      @ In, value, object, the first value of the column
+      @ Out, column, np.ndarray, the buffer, also stored in self.columns
+    """
+    if isinstance(value, np.ndarray) and value.ndim > 0 and value.dtype.kind in 'biuf':
+      dtype = value.dtype
+      shape = (self.capacity,) + value.shape
+    else:
+      shape = (self.capacity,)
+      if isinstance(value, (bool, np.bool_)):
+        dtype = bool
+      elif isinstance(value, (int, np.integer)):
+        dtype = np.int64
+      elif isinstance(value, (float, np.floating)):
+        dtype = float
+      else:
+        dtype = object
+    column = np.empty(shape, dtype=dtype)
+    self.columns[index] = column
+    return column
+
+  def _reserve(self, size):
+    """
+      Assures there is room for "size" samples in the buffers.
+      @ In, size, int, the requested number of samples
+      @ Out, None
+    """
+    if size <= self.capacity:
+      return
+    # double the available space, or more if needed
+    self.capacity = max(2 * self.capacity, size)
+    for c, column in enumerate(self.columns):
+      if column is None:
+        continue
+      new = np.empty((self.capacity,) + column.shape[1:], dtype=column.dtype)
+      new[:self.size] = column[:self.size]
+      self.columns[c] = new
+
+  def _toObject(self, index):
+    """
+      Converts the buffer of a column into an object buffer.
+      @ In, index, int, the index of the column
+      @ Out, column, np.ndarray, the new buffer
+    """
+    old = self.columns[index]
+    column = np.empty(self.capacity, dtype=object)
+    # keep numpy scalars (or arrays, for multidimensional entries) as entries
+    column[:self.size] = list(old[:self.size])
+    self.columns[index] = column
+    return column
@@ -135,6 +135,21 @@ class graphObject(object):
         isolated += [vertex]
     return isolated
 
+  def findPredecessors(self):
+    """
+      This method returns, for each vertex, the vertices that have an edge toward it
+      (i.e. in the directed graph, the vertices it relies on)
+      @ In, None
+      @ Out, predecessors, dict, {vertex:[vertices with an edge toward vertex]}
+    """
+    predecessors = {vertex:[] for vertex in self.__graphDict}
+    for vertex, neighbours in self.__graphDict.items():
+      for neighbour in neighbours:
+        preds = predecessors.setdefault(neighbour, [])
+        if neighbour != vertex and vertex not in preds:
+          preds.append(vertex)
+    return predecessors
+
   def findPath(self, startVertex, endVertex, path=[]):
     """
       Method to find a path from startVertex to endVertex in graph
@@ -70,6 +70,33 @@ class BoxMullerGenerator:
     z2 = np.sqrt(-2.*np.log(u1))*np.sin(2.*np.pi*u2)
     return z1,z2
 
+  def generateArray(self,size,engine=None):
+    """
+      Provides many normally-distributed pseudorandom values at once, the same values that
+      calling "generate" "size" times would provide.
+      @ In, size, int, number of values
+      @ In, engine, instance, optional, random number generator
+      @ Out, vals, np.array, random values
+    """
+    vals = np.zeros(size)
+    with self.__queueLock:
+      queue = self.queue[engine]
+      numQueued = min(size, len(queue))
+      for i in range(numQueued):
+        vals[i] = queue.pop()
+      numPairs = (size - numQueued + 1) // 2
+      if numPairs > 0:
+        # the pairs of random numbers, in the order "createSamples" draws them
+        u1,u2 = random(2,numPairs,keepMatrix=True,engine=engine).T
+        z1 = np.sqrt(-2.*np.log(u1))*np.cos(2.*np.pi*u2)
+        z2 = np.sqrt(-2.*np.log(u1))*np.sin(2.*np.pi*u2)
+        # each pair is queued as (z1,z2) and popped from the end
+        pairs = np.column_stack((z2,z1)).ravel()
+        vals[numQueued:] = pairs[:size-numQueued]
+        if len(pairs) > size-numQueued:
+          queue.append(pairs[-1])
+    return vals
+
   def testSampling(self, n=1e5,engine=None):
     """
       Tests distribution of samples over a large number.
@@ -145,9 +172,8 @@ def random(dim=1, samples=1, keepMatrix=False, engine=None):
     vals = engine.rand(samples,dim)
   elif isinstance(engine, findCrowModule('randomENG').RandomClass):
     vals = np.zeros([samples, dim])
-    for i in range(len(vals)):
-      for j in range(len(vals[0])):
-        vals[i][j] = engine.random()
+    # filled in a single call, in the same order as one value at a time
+    engine.fill_random(vals)
   # regardless of stoch env
   if keepMatrix:
     return vals
@@ -169,9 +195,7 @@ def randomNormal(size=(1,), keepMatrix=False, engine=None):
   if isinstance(engine, np.random.RandomState):
     vals = engine.randn(*size)
   elif isinstance(engine, findCrowModule('randomENG').RandomClass):
-    vals = np.zeros(np.prod(size))
-    for i in range(len(vals)):
-      vals[i] = boxMullerGen.generate(engine=engine)
+    vals = boxMullerGen.generateArray(int(np.prod(size)), engine=engine)
     vals.shape = size
   if keepMatrix:
     return vals
@@ -238,14 +262,29 @@ def randomChoice(array, size = 1, replace = True, engine = None):
     if len(array) < size:
       raise RuntimeError("array size < of number of requested samples (size)")
 
+  engine = getEngine(engine)
+  indices = None
+  if isinstance(engine, findCrowModule('randomENG').RandomClass):
+    # draw the random numbers of all the indices at once, in the order they are used
+    if hasattr(array,"shape"):
+      highs = np.tile(np.asarray(array.shape, dtype=int) - 1, (size, 1))
+    elif replace:
+      highs = np.full((size, 1), len(array) - 1)
+    else:
+      highs = (len(array) - 1 - np.arange(size)).reshape(size, 1)
+    indices = _integersFromRandom(random(highs.shape[1], size, keepMatrix=True, engine=engine), 0, highs)
   sel = []
   coords = array
-  for _ in range(size):
+  for i in range(size):
     if hasattr(array,"shape"):
-      coord = tuple([randomIntegers(0, dim-1, engine=engine) for dim in coords.shape])
+      if indices is None:
+        coord = tuple([randomIntegers(0, dim-1, engine=engine) for dim in coords.shape])
+      else:
+        coord = tuple(indices[i])
       sel.append(coords[coord])
     else:
-      sel.append(coords[randomIntegers(0, len(coords)-1, engine=engine)])
+      index = randomIntegers(0, len(coords)-1, engine=engine) if indices is None else indices[i, 0]
+      sel.append(coords[index])
     if not replace:
       coords.remove(sel[-1])
   selected = sel[0] if size == 1 else sel
@@ -332,6 +371,18 @@ def newRNG(env=None):
 
 ### internal utilities ###
 
+def _integersFromRandom(draws, low, high):
+  """
+    Converts random numbers on [0,1] into random integers, as "randomIntegers" does with the crow engine.
+    @ In, draws, np.array, random numbers on [0,1]
+    @ In, low, int or np.array, low boundaries
+    @ In, high, int or np.array, upper boundaries (broadcast with draws)
+    @ Out, ints, np.array(int), random integers
+  """
+  rawNums = low + draws*(high - low + 1.0)
+  ints = np.clip(np.floor(rawNums), low, high).astype(int)
+  return ints
+
 def _reduceRedundantListing(data,size):
   """
     Adjusts data to be intuitive for developers.
@@ -0,0 +1,244 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+ This file contains the index used by the DataObjects to search realizations by value.
+ Float variables are organized in KD trees, while string, boolean and integer variables are hashed,
+ so that looking for a realization does not require scanning all of them.
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+import numpy as np
+from scipy import spatial
+
+from utils import cached_ndarray
+
+class RealizationIndex(object):
+  """
+    Incrementally maintained index over the scalar variables of the realizations of a data object.
+    The index only narrows the search down: it returns the realizations that CAN match the requested
+    values (a superset of the matches), and the caller confirms them with its own matching criteria.
+    Realizations are only ever appended; if they are changed or removed otherwise, the index must be discarded.
+  """
+  def __init__(self):
+    """
+      Constructor.
+      @ In, None
+      @ Out, None
+    """
+    self._kinds = {}    # var: kind of index ('float', 'int', 'bool', 'str'), None if not indexable
+    self._sizes = {}    # var: number of realizations indexed
+    self._values = {}   # float var: c1darray of the values, for building the KD trees
+    self._buckets = {}  # hashed var: {value: [realization indices]}
+    self._forests = {}  # tuple of float vars: KDForest on those variables
+
+  def candidates(self, toMatch, radii, numRlz, getValues):
+    """
+      Finds the realizations that can match the requested values.
+      @ In, toMatch, dict, {var: value} to match
+      @ In, radii, dict, {var: radius}, the variables to use in the search, with the (absolute) distance within
+        which a numeric value can match, or None if the value should be exactly equal (strings, booleans)
+      @ In, numRlz, int, the number of realizations in the data object
+      @ In, getValues, callable, getValues(var, start) returns a list of np.ndarray with the values of "var" in
+        the realizations from "start" to "numRlz"
+      @ Out, candidates, np.ndarray or None, sorted indices of the realizations that can match, or None if the
+        index cannot narrow the search down
+    """
+    if numRlz < max(self._sizes.values(), default=0):
+      # realizations were removed, so start over
+      self.__init__()
+    found = []
+    floatVars = []
+    for var, radius in radii.items():
+      self._update(var, numRlz, getValues)
+      kind = self._kinds[var]
+      value = toMatch[var]
+      if kind == 'float':
+        if radius is not None:
+          floatVars.append(var)
+      elif kind is not None:
+        usable, key = self._getHashKey(kind, value, radius)
+        if usable:
+          found.append(np.asarray(self._buckets[var].get(key, []), dtype=int))
+    if floatVars:
+      floatVars = tuple(sorted(floatVars))
+      forest = self._forests.get(floatVars, None)
+      if forest is None:
+        forest = KDForest()
+        self._forests[floatVars] = forest
+      forest.update(numRlz, lambda start, stop: np.column_stack(list(self._values[var][start:stop] for var in floatVars)))
+      point = np.array(list(toMatch[var] for var in floatVars), dtype=float)
+      found.append(forest.query(point, np.array(list(radii[var] for var in floatVars), dtype=float)))
+    if not found:
+      return None
+    found.sort(key=len)
+    candidates = found[0]
+    for other in found[1:]:
+      candidates = np.intersect1d(candidates, other, assume_unique=True)
+    return candidates
+
+  def _getHashKey(self, kind, value, radius):
+    """
+      Determines if a hashed variable can be used to search for "value", and with which key.
+      @ In, kind, str, kind of index of the variable ('int', 'bool', 'str')
+      @ In, value, object, the requested value
+      @ In, radius, float or None, distance within which a numeric value can match, None if exact
+      @ Out, usable, bool, True if the buckets of the variable contain all the possible matches
+      @ Out, key, object, the key of the bucket
+    """
+    if kind == 'str':
+      return radius is None and isinstance(value, str), value
+    if kind == 'bool':
+      return radius is None and isinstance(value, (bool, np.bool_)), value
+    # integers are exact if the tolerance cannot reach the next integer
+    if radius is None or radius >= 1.0 or not float(value).is_integer():
+      return False, None
+    return True, int(value)
+
+  def _update(self, var, numRlz, getValues):
+    """
+      Adds the realizations not yet indexed to the index of "var".
+      @ In, var, str, the variable
+      @ In, numRlz, int, the number of realizations in the data object
+      @ In, getValues, callable, see "candidates"
+      @ Out, None
+    """
+    start = self._sizes.get(var, 0)
+    if start >= numRlz:
+      return
+    for values in getValues(var, start):
+      values = np.asarray(values)
+      if len(values):
+        self._add(var, start, values)
+      start += len(values)
+    self._sizes[var] = start
+
+  def _add(self, var, start, values):
+    """
+      Adds values to the index of "var".
+      @ In, var, str, the variable
+      @ In, start, int, the index of the realization of the first value
+      @ In, values, np.ndarray, the values
+      @ Out, None
+    """
+    kind = self._getKind(values)
+    if var not in self._kinds:
+      self._kinds[var] = kind
+      if kind == 'float':
+        self._values[var] = cached_ndarray.c1darray(shape=(max(100, len(values)),), dtype=float)
+      elif kind is not None:
+        self._buckets[var] = {}
+    elif self._kinds[var] != kind and not (self._kinds[var] == 'float' and kind == 'int'):
+      # inconsistent values, so stop indexing this variable
+      self._kinds[var] = None
+      self._values.pop(var, None)
+      self._buckets.pop(var, None)
+      for key in list(key for key in self._forests if var in key):
+        del self._forests[key]
+    kind = self._kinds[var]
+    if kind == 'float':
+      self._values[var].append(values.astype(float))
+    elif kind is not None:
+      bucket = self._buckets[var]
+      for r, value in enumerate(values.tolist(), start=start):
+        bucket.setdefault(value, []).append(r)
+
+  @staticmethod
+  def _getKind(values):
+    """
+      Determines how values can be indexed.
+      @ In, values, np.ndarray, the values
+      @ Out, kind, str, kind of index ('float', 'int', 'bool', 'str'), None if not indexable
+    """
+    dtype = values.dtype.kind
+    if dtype == 'f':
+      return 'float'
+    if dtype in 'iu':
+      return 'int'
+    if dtype == 'b':
+      return 'bool'
+    if dtype == 'U' or (dtype == 'O' and all(isinstance(value, str) for value in values)):
+      return 'str'
+    return None
+
+class KDForest(object):
+  """
+    KD trees over a growing set of points, kept up to date with the logarithmic method: new points are placed
+    in a new tree, which is merged with the previous tree (rebuilding both in one) as long as it is not
+    smaller than it. There are then at most log2(N) trees, and each point is rebuilt at most log2(N) times.
+    Points with non-finite coordinates are left out, since they cannot be within a finite distance.
+  """
+  def __init__(self):
+    """
+      Constructor.
+      @ In, None
+      @ Out, None
+    """
+    self.size = 0     # number of points
+    self._trees = []  # [(start, stop, tree or None, point indices, coordinate scales)]
+
+  def query(self, point, radii):
+    """
+      Finds the points that are within "radii" of "point" along every coordinate.
+      Since the trees use a single distance, some farther points can be returned as well.
+      @ In, point, np.ndarray, coordinates of the point
+      @ In, radii, np.ndarray, distance along each coordinate
+      @ Out, found, np.ndarray, sorted indices of the points
+    """
+    found = []
+    for _, _, tree, indices, scales in self._trees:
+      if tree is None:
+        continue
+      scaled = point / scales
+      # small margin for the rounding of the scaled coordinates
+      radius = np.max(radii / scales) * (1.0 + 1e-9) + 4.0 * np.finfo(float).eps * np.max(np.abs(scaled))
+      found.append(indices[tree.query_ball_point(scaled, radius, p=np.inf)])
+    if not found:
+      return np.zeros(0, dtype=int)
+    return np.sort(np.concatenate(found))
+
+  def update(self, size, getPoints):
+    """
+      Adds the new points.
+      @ In, size, int, the number of points
+      @ In, getPoints, callable, getPoints(start, stop) returns the coordinates of those points as 2D np.ndarray
+      @ Out, None
+    """
+    if size <= self.size:
+      return
+    self._trees.append(self._build(self.size, size, getPoints))
+    self.size = size
+    while len(self._trees) > 1:
+      previous, last = self._trees[-2], self._trees[-1]
+      if previous[1] - previous[0] > last[1] - last[0]:
+        break
+      self._trees[-2:] = [self._build(previous[0], last[1], getPoints)]
+
+  @staticmethod
+  def _build(start, stop, getPoints):
+    """
+      Builds the tree of a range of points.
+      @ In, start, int, the first point
+      @ In, stop, int, the point after the last one
+      @ In, getPoints, callable, see "update"
+      @ Out, tree, tuple, (start, stop, tree or None, point indices, coordinate scales)
+    """
+    points = getPoints(start, stop)
+    finite = np.isfinite(points).all(axis=1)
+    indices = np.arange(start, stop)[finite]
+    points = points[finite]
+    if not len(indices):
+      return start, stop, None, indices, None
+    # scale the coordinates (by their spread) to balance the tree
+    scales = points.std(axis=0)
+    scales[np.logical_not(np.isfinite(scales) & (scales > 0.0))] = 1.0
+    return start, stop, spatial.cKDTree(points / scales), indices, scales
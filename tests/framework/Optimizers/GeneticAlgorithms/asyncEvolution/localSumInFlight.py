@@ -0,0 +1,49 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  The weighted sum of myLocalSum, which also reports how many evaluations are running at the same time.
+  It is used to check that the steadyState and island evolutions of the GeneticAlgorithm keep all the
+  parallel slots busy.
+"""
+import threading
+
+# the evaluations run in threads of the same process, and share these counters
+condition = threading.Condition()
+started = 0  # number of evaluations started
+running = 0  # number of evaluations running
+# the initial populations (20 runs at most in the tests) are submitted at once, so only the
+# evaluations started afterwards, i.e. the children, are checked
+initialRuns = 20
+# the evaluations wait (at most timeout seconds) for the batch to be filled, so that the check
+# does not depend on how fast the runs are submitted on a loaded machine
+batchSize = 4
+timeout = 5.0
+
+def run(self, Inputs):
+  """
+    Evaluates $ans = \Sigma_{i=1} i*x_{i}$, and the number of evaluations running at the same time
+    @ In, Inputs, dict, RAVEN sampled params.
+    @ Out, None
+  """
+  global started, running
+  with condition:
+    started += 1
+    running += 1
+    child = started > initialRuns
+    condition.notify_all()
+    condition.wait_for(lambda: running >= batchSize, timeout=timeout)
+    self.inFlight = running if child else 0
+  self.ans = Inputs['x1'] + 2 * Inputs['x2'] + 3 * Inputs['x3']
+  with condition:
+    running -= 1
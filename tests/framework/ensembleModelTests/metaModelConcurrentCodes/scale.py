@@ -0,0 +1,43 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Trivial code scaling its input: y = factor * x
+  It waits a bit before writing the results, to mimic a code whose run takes some time.
+    python scale.py input.txt output
+"""
+import sys
+import time
+
+def run(inputFileName, outputFileName):
+  """
+    Reads the input, computes y and writes it in the output csv
+    @ In, inputFileName, str, the input file
+    @ In, outputFileName, str, the output file (with or without the csv extension)
+    @ Out, None
+  """
+  values = {}
+  with open(inputFileName, 'r') as inp:
+    for line in inp:
+      if '=' in line:
+        key, value = line.split('=')
+        values[key.strip()] = float(value)
+  time.sleep(values.get('delay', 0.0))
+  if not outputFileName.endswith('.csv'):
+    outputFileName += '.csv'
+  with open(outputFileName, 'w') as out:
+    out.write('y\n')
+    out.write(repr(values['factor'] * values['x']) + '\n')
+
+if __name__ == '__main__':
+  run(sys.argv[1], sys.argv[2])
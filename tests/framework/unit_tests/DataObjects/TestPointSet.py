@@ -327,6 +327,10 @@ checkRlz('PointSet append 1 match', match, rlz1)
 idx, rlz = data.realization(matchDict={'x':1.0})
 checkSame('PointSet find bogus match index',idx,3)
 checkNone('PointSet find bogus match',rlz)
+# all matches, when the last realization is not one of them
+idx, rlzs = data.realization(matchDict={'a':11.0}, first=False)
+checkSame('PointSet all matches indices', idx, [1])
+checkRlz('PointSet all matches', rlzs[0], rlz1)
 print('DEBUGG\n\n')
 
 data2 = copy.deepcopy(data)
@@ -603,7 +607,79 @@ data.setSelectiveInput('inputRow',-1)
 data.setSelectiveOutput('operator','mean')
 data.addRealization(rlz0)
 checkRlz('PointSet selective default',data.realization(index=3),{'a':0.5,'x':1.34})
+# batches of realizations that need selecting are added one at a time
+data.addRealizations([rlz0, rlz0])
+checkSame('PointSet selective batch size',len(data),6)
+checkRlz('PointSet selective batch',data.realization(index=5),{'a':0.5,'x':1.34})
 
+######################################
+#          BATCH SAMPLING            #
+######################################
+data = DataObjects.PointSet()
+xml = createElement('PointSet',attrib={'name':'test'})
+xml.append(createElement('Input',text='a,b'))
+xml.append(createElement('Output',text='x'))
+data._readMoreXML(xml)
+data.messageHandler = mh
+data.addExpectedMeta(['prefix'])
+
+rlzs = []
+for i in range(3):
+  rlz = {'a': float(i), 'b': 10.0 + i, 'x': 100.0 + i, 'prefix': 'batch{}'.format(i), 'extra': 0.0}
+  formatRealization(rlz)
+  rlzs.append(rlz)
+# variables not in the data object are ignored
+expected = list(dict((var, val) for var, val in rlz.items() if var != 'extra') for rlz in rlzs)
+# list of realizations
+data.addRealizations(rlzs)
+checkSame('PointSet addRealizations size',len(data),3)
+checkSame('PointSet addRealizations types',data.types,[float,float,float,object])
+for i in range(3):
+  checkRlz('PointSet addRealizations idx {}'.format(i),data.realization(index=i),expected[i])
+# single realizations and batches can be mixed
+data.addRealization(rlzs[0])
+data.addRealizations(rlzs[1:], transferOwnership=True)
+checkSame('PointSet addRealizations mixed size',len(data),6)
+checkRlz('PointSet addRealizations mixed idx 5',data.realization(index=5),expected[2])
+# columnar realizations
+columns = {'a': np.array([5.0, 6.0]),
+           'b': np.array([15.0, 16.0]),
+           'x': np.array([105.0, 106.0]),
+           'prefix': np.array(['batch5', 'batch6'])}
+data.addRealizations(columns)
+checkSame('PointSet addRealizations columnar size',len(data),8)
+checkRlz('PointSet addRealizations columnar idx 7',data.realization(index=7),{'a':6.0,'b':16.0,'x':106.0,'prefix':['batch6']})
+idx, _ = data.realization(matchDict={'prefix':'batch5'})
+checkSame('PointSet addRealizations columnar match',idx,6)
+# columnar errors
+del columns['x']
+checkFails('PointSet addRealizations columnar missing','Provided realizations do not have all requisite values for object "PointSet": "x"',
+           data.addRealizations,args=[columns])
+columns['x'] = np.array([1.0, 2.0, 3.0])
+checkFails('PointSet addRealizations columnar length','Columnar realizations for "PointSet" must be one-dimensional with the same length! '+
+           "Got shapes: {'a': (2,), 'b': (2,), 'x': (3,), 'prefix': (2,)}",data.addRealizations,args=[columns])
+checkSame('PointSet addRealizations columnar errors size',len(data),8)
+# collapse and keep collecting
+data.asDataset()
+data.addRealizations(rlzs)
+checkSame('PointSet addRealizations after collapse size',len(data),11)
+checkArray('PointSet addRealizations after collapse a',data.asDataset()['a'].values,[0,1,2,0,1,2,5,6,0,1,2],float)
+
+######################################
+#            EMPTY CLONE             #
+######################################
+clone = data.emptyClone()
+checkSame('PointSet emptyClone size',len(clone),0)
+checkSame('PointSet emptyClone original size',len(data),11)
+checkSame('PointSet emptyClone vars',clone.getVars(),data.getVars())
+checkTrue('PointSet emptyClone shares message handler',clone.messageHandler is data.messageHandler)
+cloneRlz = dict((var,np.atleast_1d(float(i))) for i,var in enumerate(clone.getVars()))
+clone.addRealization(cloneRlz)
+checkSame('PointSet emptyClone collect size',len(clone),1)
+checkRlz('PointSet emptyClone collect idx 0',clone.realization(index=0),cloneRlz)
+checkSame('PointSet emptyClone collect original size',len(data),11)
+clone.addExpectedMeta(['cloneMeta'], overwrite=True)
+checkTrue('PointSet emptyClone meta not shared','cloneMeta' not in data.getVars())
 
 # TODO more exhaustive tests are needed, but this is sufficient for initial work.
 
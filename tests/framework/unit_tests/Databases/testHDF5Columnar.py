@@ -0,0 +1,152 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the columnar layout of the HDF5 database
+  (types of the columns, order of the realizations and retrieval by name).
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import numpy as np
+import xml.etree.ElementTree as ET
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path_recursively
+find_crow(frameworkDir)
+add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+import MessageHandler
+from h5py_interface_creator import hdf5Database, hdf5ColumnarDatabase
+from Databases.HDF5 import HDF5
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two values
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if not res:
+    print("checking answer",comment,value,"!=",expected)
+  if updateResults:
+    results["pass" if res else "fail"] += 1
+  return res
+
+def makeDatabase(layout, name):
+  """
+    Creates an HDF5 database with the given layout in the working directory
+    @ In, layout, str, either "groups" or "columnar"
+    @ In, name, str, name of the database (and file)
+    @ Out, db, Databases.HDF5, the database
+  """
+  db = HDF5()
+  db.applyRunInfo({'WorkingDir': workDir})
+  spec = HDF5.getInputSpecification()()
+  spec.parseNode(ET.fromstring('<HDF5 name="{}" readMode="overwrite" layout="{}" directory="."/>'.format(name, layout)))
+  db.handleInput(spec)
+  return db
+
+workDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'columnar')
+os.makedirs(workDir, exist_ok=True)
+
+# realizations with integers (also too large for floats), floats, strings and histories, and more than 10
+# realizations, so that the order of the names differs from the order they were added in
+big = 2**53 + 1
+rlzs = []
+for r in range(12):
+  rlzs.append({'prefix': np.array([str(r + 1)]),
+               'count': np.array([big + r]),
+               'x': np.array([0.5 * r]),
+               'label': np.array(['rlz{}'.format(r)]),
+               'y': np.arange(r % 3 + 1, dtype=float) + r})
+
+groups = makeDatabase('groups', 'groups')
+columnar = makeDatabase('columnar', 'columnar')
+for rlz in rlzs:
+  groups.addRealization(dict(rlz))
+columnar.addRealizations(list(dict(rlz) for rlz in rlzs))
+checkSame('columnar database', isinstance(columnar.database, hdf5ColumnarDatabase), True)
+checkSame('groups database', isinstance(groups.database, hdf5Database), True)
+
+# types of the columns
+columns = columnar.database.getColumns()
+checkSame('integer column type', columns['count'][0].dtype.kind, 'i')
+checkSame('integer values', list(columns['count'][0]), [big + r for r in range(12)])
+checkSame('float column type', columns['x'][0].dtype.kind, 'f')
+checkSame('history lengths', list(columns['y'][1]), [r % 3 + 1 for r in range(12)])
+
+# realizations are loaded in the same order for both layouts
+loadedGroups = groups.allRealizations()
+loadedColumnar = columnar.allRealizations()
+checkSame('number of realizations', len(loadedColumnar), len(loadedGroups))
+checkSame('order of realizations', [str(rlz['prefix'][0]) for rlz in loadedColumnar],
+                                   [str(rlz['prefix'][0]) for rlz in loadedGroups])
+for g, c in zip(loadedGroups, loadedColumnar):
+  # the groups layout stores the integers as floats, so these are compared to the original values
+  checkSame('loaded integer ' + str(g['prefix'][0]), int(c['count'][0]), big + int(g['prefix'][0]) - 1)
+  checkSame('loaded history ' + str(g['prefix'][0]), list(c['y']), list(g['y']))
+# but indices and names keep the order the realizations were added in
+checkSame('names', columnar.database.retrieveAllHistoryNames(), [str(r + 1) for r in range(12)])
+rlz = columnar.realization(index=10)
+checkSame('realization by index', (str(rlz['prefix'][0]), rlz['label'][0]), ('11', 'rlz10'))
+
+# realizations by name
+for r in [0, 4, 11]:
+  rlz, _ = columnar.database._getRealizationByName(str(r + 1))
+  checkSame('integer by name {}'.format(r), int(rlz['count'][0]), big + r)
+  checkSame('history by name {}'.format(r), list(rlz['y']), list(rlzs[r]['y']))
+  checkSame('string by name {}'.format(r), rlz['label'][0], 'rlz{}'.format(r))
+# the index of the names follows the new realizations
+columnar.addRealization({'prefix': np.array(['13']), 'count': np.array([1.5]), 'x': np.array([6.0]),
+                         'label': np.array(['rlz12']), 'y': np.array([1.0, 2.0])})
+rlz, _ = columnar.database._getRealizationByName('13')
+checkSame('added by name', (rlz['label'][0], list(rlz['y'])), ('rlz12', [1.0, 2.0]))
+# non-integer values turn the integer column into a float column
+columns = columnar.database.getColumns()
+checkSame('promoted column type', columns['count'][0].dtype.kind, 'f')
+checkSame('promoted values', list(columns['count'][0][-2:]), [float(big + 11), 1.5])
+rlz, _ = columnar.database._getRealizationByName('12')
+checkSame('history by name after adding', list(rlz['y']), list(rlzs[11]['y']))
+
+groups.database.closeDatabaseW()
+columnar.database.closeDatabaseW()
+for db in [groups, columnar]:
+  os.remove(db.get_fullpath())
+os.rmdir(workDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.hdf5ColumnarDatabase</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>Databases.HDF5, h5py_interface_creator.hdf5ColumnarDatabase</classesTested>
+    <description>
+       This test checks the columnar layout of the HDF5 database: the type of the values kept by each
+       column, the order the realizations are loaded in (as for the groups layout) and the retrieval
+       of the realizations by name.
+    </description>
+  </TestInfo>
+"""
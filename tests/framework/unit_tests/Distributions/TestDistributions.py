@@ -35,6 +35,7 @@ find_crow(frameworkDir)
 
 import MessageHandler
 import Distributions
+from utils import randomUtils
 
 mh = MessageHandler.MessageHandler()
 mh.initialize({'verbosity':'debug'})
@@ -1134,6 +1135,40 @@ checkAnswer("UniformDiscrete rvs10",UniformDiscrete.selectedRvs(discardedElems),
 checkAnswer("UniformDiscrete rvs11",UniformDiscrete.selectedRvs(discardedElems),4)
 checkAnswer("UniformDiscrete rvs12",UniformDiscrete.selectedRvs(discardedElems),3)
 
+#Test the array evaluations give the same values as the scalar ones
+
+def checkSameArray(comment,value,expected):
+  """
+    This method is aimed to check two arrays are exactly equal (bit by bit)
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.array, the values to compare
+    @ In, expected, np.array, the expected values
+    @ Out, None
+  """
+  if value.shape != expected.shape or value.tobytes() != expected.tobytes():
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+  else:
+    results["pass"] += 1
+
+probabilities = np.linspace(0.005,0.995,100)
+for name, dist in [('uniform',uniform), ('normal',normal), ('truncNormal',truncNormal), ('gamma',gamma), ('beta',beta),
+                   ('triangular',triangular), ('poisson',poisson), ('binomial',binomial), ('bernoulli',bernoulli),
+                   ('geometric',geometric), ('logistic',logistic), ('laplace',laplace), ('exponential',exponential),
+                   ('truncExponential',truncExponential), ('logNormal',logNormal), ('weibull',weibull)]:
+  values = np.array([dist.ppf(p) for p in probabilities])
+  checkSameArray(name+" ppf array",dist.ppf(probabilities),values)
+  checkSameArray(name+" ppf list",dist.ppf(list(probabilities)),values)
+  checkSameArray(name+" cdf array",dist.cdf(values),np.array([dist.cdf(x) for x in values]))
+  finite = values[np.isfinite(values)]
+  checkSameArray(name+" pdf array",dist.pdf(finite),np.array([dist.pdf(x) for x in finite]))
+  checkSameArray(name+" cdf matrix",dist.cdf(finite.reshape(-1,1)),np.array([dist.cdf(x) for x in finite]).reshape(-1,1))
+  randomUtils.randomSeed(42)
+  samples = np.array([dist.rvs() for _ in range(10)])
+  randomUtils.randomSeed(42)
+  checkSameArray(name+" rvs",dist.rvs(10),samples)
+checkSameArray("empty ppf",normal.ppf([]),np.zeros(0))
+
 
 print(results)
 
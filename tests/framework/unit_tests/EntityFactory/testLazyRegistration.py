@@ -0,0 +1,105 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the lazy registration of the entity factories
+  (types registered by name, whose modules are imported when first requested).
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path_recursively
+find_crow(frameworkDir)
+add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+import MessageHandler
+from EntityFactoryBase import EntityFactory
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two values
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if not res:
+    print("checking answer",comment,value,"!=",expected)
+  if updateResults:
+    results["pass" if res else "fail"] += 1
+  return res
+
+#
+# generic factory
+#
+factory = EntityFactory('Test')
+factory.registerType('Eager', dict)
+factory.registerLazyType('Fraction', 'fractions')
+factory.registerLazyType('Ratio', 'fractions', 'Fraction')
+factory.registerLazyType('Fallback', 'fractions', ['NotDefinedHere', 'Fraction'])
+checkSame('lazy module not imported', 'fractions' in sys.modules, False)
+checkSame('known types', list(factory.knownTypes()), ['Eager', 'Fraction', 'Ratio', 'Fallback'])
+checkSame('lazy module still not imported', 'fractions' in sys.modules, False)
+checkSame('eager type', factory.returnClass('Eager'), dict)
+import fractions
+checkSame('lazy type', factory.returnClass('Fraction'), fractions.Fraction)
+checkSame('lazy type with class name', factory.returnClass('Ratio'), fractions.Fraction)
+checkSame('lazy type with fallback', factory.returnClass('Fallback'), fractions.Fraction)
+checkSame('lazy instance', factory.returnInstance('Fraction', numerator=1, denominator=2), fractions.Fraction(1, 2))
+checkSame('known types after loading', sorted(factory.knownTypes()), ['Eager', 'Fallback', 'Fraction', 'Ratio'])
+factory.registerLazyType('Removed', 'fractions', 'Fraction')
+factory.unregisterSubtype('Removed')
+checkSame('unregistered lazy type', 'Removed' in factory.knownTypes(), False)
+
+#
+# ROMs are imported only on request
+#
+import SupervisedLearning
+checkSame('ROM module not imported', 'SupervisedLearning.GaussPolynomialRom' in sys.modules, False)
+checkSame('ROM type known', 'GaussPolynomialRom' in SupervisedLearning.factory.knownTypes(), True)
+rom = SupervisedLearning.factory.returnClass('GaussPolynomialRom')
+checkSame('ROM class', rom.__name__, 'GaussPolynomialRom')
+checkSame('ROM package attribute', SupervisedLearning.GaussPolynomialRom, rom)
+# HDMRRom imports the GaussPolynomialRom module, which must not hide the class in the package
+checkSame('ROM dependent class', SupervisedLearning.factory.returnClass('HDMRRom').__name__, 'HDMRRom')
+checkSame('ROM collection', SupervisedLearning.factory.returnClass('Segments'), SupervisedLearning.Segments)
+# a ROM submodule imported directly (e.g. while unpickling) is bound to the package in place of the class
+import SupervisedLearning.NDinvDistWeight
+rom = SupervisedLearning.factory.returnClass('NDinvDistWeight')
+checkSame('ROM class from imported submodule', rom, SupervisedLearning.NDinvDistWeight.NDinvDistWeight)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.entityFactoryLazyRegistration</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>EntityFactoryBase.EntityFactory</classesTested>
+    <description>
+       This test checks the types registered by name in the entity factories, whose modules are
+       imported only when the type is requested, and the lazy loading of the ROM classes.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,170 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the job bookkeeping of the JobHandler
+  (queries and removals with a large number of queued jobs).
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import time
+import threading
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path_recursively
+find_crow(frameworkDir)
+add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+import MessageHandler
+from Decorators.Parallelization import Parallel
+from JobHandler import JobHandler
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two values
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if not res:
+    print("checking answer",comment,value,"!=",expected)
+  if updateResults:
+    results["pass" if res else "fail"] += 1
+  return res
+
+@Parallel()
+def identity(value):
+  """
+    Job used for testing
+    @ In, value, int, a value
+    @ Out, value, int, the same value
+  """
+  return value
+
+started = threading.Semaphore(0)
+stopped = threading.Semaphore(0)
+
+@Parallel()
+def sleeper():
+  """
+    Job running until it is killed
+    @ In, None
+    @ Out, None
+  """
+  started.release()
+  try:
+    while True:
+      time.sleep(0.01)
+  finally:
+    stopped.release()
+
+def terminates(terminate, *args):
+  """
+    Checks that terminating jobs returns (killing a runner must not deadlock with
+    the completion signal of the dying runner)
+    @ In, terminate, method, the JobHandler method terminating the jobs
+    @ In, args, list, its arguments
+    @ Out, terminates, bool, True if the termination returned
+  """
+  terminator = threading.Thread(target=terminate, args=args)
+  terminator.daemon = True
+  terminator.start()
+  terminator.join(30)
+  return not terminator.is_alive()
+
+numJobs = 100000
+jobHandler = JobHandler()
+jobHandler.applyRunInfo({'maxQueueSize': None, 'batchSize': 4, 'internalParallel': False})
+jobHandler.initialize()
+
+# queue the jobs, with alternating uniqueHandlers (polling thread not started yet)
+for i in range(numJobs):
+  jobHandler.addJob((i, ), identity, 'job_{}'.format(i), uniqueHandler='even' if i % 2 == 0 else 'odd')
+checkSame('submitted', jobHandler.numSubmitted(), numJobs)
+
+# state queries on every queued job
+notFinished = sum(not jobHandler.isThisJobFinished('job_{}'.format(i)) for i in range(numJobs))
+checkSame('queued jobs not finished', notFinished, numJobs)
+checkSame('even jobs pending', jobHandler.areTheseJobsFinished(uniqueHandler='even'), False)
+checkSame('unknown handler', jobHandler.areTheseJobsFinished(uniqueHandler='none'), True)
+checkSame('not finished', jobHandler.isFinished(), False)
+
+# terminate all the odd jobs and all but 10 of the even ones
+toKill = ['job_{}'.format(i) for i in range(numJobs) if i % 2 == 1 or i >= 20]
+jobHandler.terminateJobs(toKill)
+checkSame('all requested jobs terminated', len(toKill), 0)
+checkSame('odd jobs all gone', jobHandler.areTheseJobsFinished(uniqueHandler='odd'), True)
+checkSame('even jobs pending', jobHandler.areTheseJobsFinished(uniqueHandler='even'), False)
+checkSame('availability', jobHandler.availability(), 4 - 10)
+
+# run the remaining jobs
+pollingThread = threading.Thread(target=jobHandler.startLoop)
+pollingThread.daemon = True
+pollingThread.start()
+collected = []
+while len(collected) < 10:
+  collected.extend(jobHandler.getFinished(uniqueHandler='even'))
+  jobHandler.waitForEvent(1.0)
+checkSame('collected', sorted(job.getEvaluation() for job in collected), list(range(0, 20, 2)))
+checkSame('even jobs all collected', jobHandler.areTheseJobsFinished(uniqueHandler='even'), True)
+checkSame('finished', jobHandler.isFinished(), True)
+
+# restart (already finished) jobs
+for i in range(1000):
+  jobHandler.addFinishedJob({'value': i})
+checkSame('restarts not finished', jobHandler.isFinished(), False)
+checkSame('restarts collected', len(jobHandler.getFinished()), 1000)
+checkSame('restarts all collected', jobHandler.isFinished(), True)
+
+# kill running jobs
+jobHandler.addJob((), sleeper, 'sleeper_0')
+started.acquire()
+killed = checkSame('terminate running job', terminates(jobHandler.terminateJobs, ['sleeper_0']), True)
+checkSame('running job killed', stopped.acquire(timeout=30), True)
+if killed:
+  for i in range(2):
+    jobHandler.addJob((), sleeper, 'sleeper_{}'.format(i+1))
+    started.acquire()
+  killed = checkSame('terminate all running jobs', terminates(jobHandler.terminateAll), True)
+  checkSame('running jobs killed', [stopped.acquire(timeout=30) for _ in range(2)], [True, True])
+
+# a deadlocked JobHandler cannot be shut down
+if killed:
+  jobHandler.shutdown()
+  pollingThread.join()
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.jobHandlerBookkeeping</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>JobHandler</classesTested>
+    <description>
+       This test checks the JobHandler queries (job finished, uniqueHandler finished, termination
+       and collection of jobs) on a queue of 100k jobs, and the termination of running jobs.
+    </description>
+  </TestInfo>
+"""
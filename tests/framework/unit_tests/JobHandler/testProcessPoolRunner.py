@@ -0,0 +1,226 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the ProcessPoolRunner (internal parallel
+  with local worker processes).
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import threading
+import importlib
+from concurrent import futures
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path_recursively
+find_crow(frameworkDir)
+add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+import MessageHandler
+import Runners
+from Decorators.Parallelization import Parallel
+from JobHandler import JobHandler
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two values
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if not res:
+    print("checking answer",comment,value,"!=",expected)
+  if updateResults:
+    results["pass" if res else "fail"] += 1
+  return res
+
+class Model(object):
+  """
+    Simple model evaluated by the jobs
+  """
+  pickled = 0 # number of times the instances were pickled (in this process)
+
+  def __init__(self, offset):
+    """
+      Constructor
+      @ In, offset, float, offset added to the evaluations
+      @ Out, None
+    """
+    self.offset = offset
+    self.calls = 0
+
+  def __getstate__(self):
+    """
+      Returns the state to pickle, counting the pickled instances
+      @ In, None
+      @ Out, state, dict, the state
+    """
+    Model.pickled += 1
+    state = dict(self.__dict__)
+    state.pop('loaded', None)
+    return state
+
+  def __setstate__(self, state):
+    """
+      Sets the unpickled state, marking the instance so that its copies can be told apart
+      @ In, state, dict, the state
+      @ Out, None
+    """
+    self.__dict__.update(state)
+    self.loaded = os.urandom(8)
+
+  @Parallel()
+  def identify(self, value):
+    """
+      Evaluates the model without changing it
+      @ In, value, float, input value
+      @ Out, (result, pid, loaded), tuple, the result, the process id and the mark of the unpickled instance
+    """
+    return self.offset + value, os.getpid(), self.loaded
+
+  @Parallel()
+  def evaluateSample(self, value):
+    """
+      Evaluates the model, counting the evaluations done with this instance
+      @ In, value, float, input value
+      @ Out, (result, pid, calls), tuple, the result, the process id and the
+        number of evaluations performed by this instance
+    """
+    if value < 0:
+      raise RuntimeError('negative input')
+    self.calls += 1
+    return self.offset + value, os.getpid(), self.calls
+
+def runJobs(pool, model, values, method=Model.evaluateSample):
+  """
+    Runs the model on the values through ProcessPoolRunners
+    @ In, pool, Runners.ProcessPool, the pool of workers
+    @ In, model, Model, the model
+    @ In, values, list, the inputs
+    @ In, method, function, optional, the method of the model to run
+    @ Out, runners, list, the finished runners
+  """
+  finished = threading.Semaphore(0)
+  runners = []
+  for i, value in enumerate(values):
+    runner = Runners.factory.returnInstance('ProcessPoolRunner', (model, value), method.original_function,
+                                            pool=pool, identifier='job_{}'.format(i))
+    runner.setCompletionCallback(lambda _: finished.release())
+    runner.start()
+    runners.append(runner)
+  for _ in values:
+    finished.acquire()
+  checkSame('all done', all(runner.isDone() for runner in runners), True)
+  return runners
+
+numWorkers = 2
+pool = Runners.ProcessPool(numWorkers)
+model = Model(10.0)
+runners = runJobs(pool, model, list(range(20)))
+outcomes = [runner.getEvaluation() for runner in runners]
+checkSame('return codes', [runner.getReturnCode() for runner in runners], [0]*20)
+checkSame('results', [outcome[0] for outcome in outcomes], [10.0 + i for i in range(20)])
+checkSame('run in workers', any(outcome[1] == os.getpid() for outcome in outcomes), False)
+# the model is kept in the workers, but each job gets its own copy: the
+# changes done by an evaluation are not seen by the following ones
+checkSame('fresh model in each job', [outcome[2] for outcome in outcomes], [1]*20)
+checkSame('model in parent untouched', model.calls, 0)
+checkSame('model pickled once', Model.pickled, 1)
+
+# the jobs that do not change the model share the copy unpickled by their worker
+runners = runJobs(pool, model, list(range(20)), Model.identify)
+outcomes = [runner.getEvaluation() for runner in runners]
+checkSame('shared results', [outcome[0] for outcome in outcomes], [10.0 + i for i in range(20)])
+checkSame('unpickled once per worker', len(set(outcome[2] for outcome in outcomes)), len(set(outcome[1] for outcome in outcomes)))
+checkSame('unchanged model not pickled again', Model.pickled, 1)
+
+# failures are reported through the return code
+runners = runJobs(pool, model, [1.0, -1.0])
+checkSame('success', runners[0].getReturnCode(), 0)
+checkSame('failure', runners[1].getReturnCode(), -1)
+checkSame('failure evaluation', isinstance(runners[1].getEvaluation(), Runners.Error), True)
+
+# a model changed within the step is shipped again
+model.offset = 50.0
+runners = runJobs(pool, model, [1.0, 2.0, 3.0, 4.0])
+checkSame('model changed in step', [runner.getEvaluation()[0] for runner in runners], [51.0, 52.0, 53.0, 54.0])
+checkSame('changed model pickled again', Model.pickled, 2)
+
+# after a reset (new step), the updated model is shipped again
+pool.reset()
+model.offset = 100.0
+runners = runJobs(pool, model, [1.0, 2.0])
+checkSame('updated model', [runner.getEvaluation()[0] for runner in runners], [101.0, 102.0])
+pool.shutdown()
+
+# a worker that has not received the model (e.g. started after it was shipped)
+# rejects the job, which is then submitted again along with the model
+pool = Runners.ProcessPool(1)
+otherModel = Model(10.0)
+runners = runJobs(pool, otherModel, [1.0])
+worker = runners[0].getEvaluation()[1]
+pool.executor.shutdown(wait=True)
+poolModule = importlib.import_module('Runners.ProcessPoolRunner')
+pool.executor = futures.ProcessPoolExecutor(max_workers=1, initializer=poolModule._initializeWorker,
+                                            initargs=(list(sys.path),))
+runners = runJobs(pool, otherModel, [2.0, 3.0])
+checkSame('new worker', runners[0].getEvaluation()[1] != worker, True)
+checkSame('model shipped to new worker', [runner.getEvaluation()[0] for runner in runners], [12.0, 13.0])
+pool.shutdown()
+
+# the JobHandler uses the pool for internal parallel runs when Ray is not available
+jobHandler = JobHandler()
+jobHandler.applyRunInfo({'maxQueueSize': None, 'batchSize': 2, 'internalParallel': True,
+                         'Nodes': [], 'totalNumCoresUsed': numWorkers})
+jobHandler.initialize()
+if jobHandler.processPool is not None:
+  pollingThread = threading.Thread(target=jobHandler.startLoop)
+  pollingThread.daemon = True
+  pollingThread.start()
+  for i in range(6):
+    jobHandler.addJob((model, float(i)), Model.evaluateSample, 'job_{}'.format(i))
+  collected = []
+  while len(collected) < 6:
+    collected.extend(jobHandler.getFinished())
+    jobHandler.waitForEvent(1.0)
+  checkSame('JobHandler runners', set(type(job).__name__ for job in collected), set(['ProcessPoolRunner']))
+  checkSame('JobHandler results', sorted(job.getEvaluation()[0] for job in collected), [100.0 + i for i in range(6)])
+  jobHandler.shutdown()
+  pollingThread.join()
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.processPoolRunner</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>Runners.ProcessPoolRunner, JobHandler</classesTested>
+    <description>
+       This test checks the execution of jobs in the pool of local worker processes, the
+       shipping of the model to the workers (again when it changes, and only then), its reuse by
+       the jobs of a worker and the handling of failed jobs.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,211 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the Metrics.metrics.DTW class.
+  It can not be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import numpy as np
+
+# add RAVEN to path
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)] + [os.pardir]*4 + ['framework'])))
+if frameworkDir not in sys.path:
+  sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+from utils import xmlUtils
+
+from Metrics.metrics.DTW import DTW, _lbKeogh
+
+print('Module undergoing testing:')
+print(DTW)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkFloat(comment, value, expected, tol=1e-10, update=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  if np.isnan(value) and np.isnan(expected):
+    res = True
+  elif np.isnan(value) or np.isnan(expected):
+    res = False
+  else:
+    res = abs(value - expected) <= tol
+  if update:
+    if not res:
+      print("checking float",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkTrue(comment, res, update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+######################################
+#            CONSTRUCTION            #
+######################################
+def createDTW(order=0, localDistance='euclidean', window=None, cutoff=None, workers=None):
+  """
+    Creates a DTW metric from its XML input
+    @ In, order, int, optional, order of the DTW
+    @ In, localDistance, str, optional, local distance
+    @ In, window, int, optional, half width of the Sakoe-Chiba band
+    @ In, cutoff, float, optional, cutoff distance
+    @ In, workers, int, optional, number of processes
+    @ Out, dtw, DTW, the metric
+  """
+  xml = xmlUtils.newNode('DTW', attrib={'name':'dtw'})
+  xml.append(xmlUtils.newNode('order', text=str(order)))
+  xml.append(xmlUtils.newNode('localDistance', text=localDistance))
+  for node, value in [('window', window), ('cutoff', cutoff), ('workers', workers)]:
+    if value is not None:
+      xml.append(xmlUtils.newNode(node, text=str(value)))
+  dtw = DTW()
+  inputSpec = DTW.getInputSpecification()()
+  inputSpec.parseNode(xml)
+  dtw.handleInput(inputSpec)
+  return dtw
+
+def referenceDTW(x, y, localDistance, window=None):
+  """
+    Reference (textbook) DTW, computed one cell at the time
+    @ In, x, np.array, data matrix, shape (numParameters, numStepsX)
+    @ In, y, np.array, data matrix, shape (numParameters, numStepsY)
+    @ In, localDistance, str, local distance (euclidean or cityblock)
+    @ In, window, int, optional, half width of the Sakoe-Chiba band
+    @ Out, value, float, DTW distance
+  """
+  r, c = x.shape[1], y.shape[1]
+  band = None if window is None else max(window, abs(r - c))
+  acc = np.full((r + 1, c + 1), np.inf)
+  acc[0, 0] = 0.0
+  for i in range(1, r + 1):
+    for j in range(1, c + 1):
+      if band is not None and abs(i - j) > band:
+        continue
+      diff = x[:, i - 1] - y[:, j - 1]
+      cost = np.sqrt(np.sum(diff**2)) if localDistance == 'euclidean' else np.sum(np.abs(diff))
+      acc[i, j] = cost + min(acc[i - 1, j - 1], acc[i - 1, j], acc[i, j - 1])
+  return acc[r, c]
+
+np.random.seed(42)
+histories = [np.cumsum(np.random.randn(2, length), axis=1) for length in [20, 25, 20, 31, 18, 20]]
+
+######################################
+#         SINGLE DISTANCES           #
+######################################
+# a time series and its (stretched) copy are at null distance
+dtw = createDTW()
+x = np.array([[0., 1., 2., 3., 2., 1.]])
+y = np.array([[0., 0., 1., 2., 2., 3., 3., 2., 1.]])
+checkFloat('Stretched copy', dtw.dtwDistance(x, y), 0.0)
+value, (p, q) = dtw.dtwDistance(x, y, returnPath=True)
+checkTrue('Path start', p[0] == 0 and q[0] == 0)
+checkTrue('Path end', p[-1] == x.shape[1] - 1 and q[-1] == y.shape[1] - 1)
+checkFloat('Path cost', sum(abs(x[0, i] - y[0, j]) for i, j in zip(p, q)), 0.0)
+
+# anti-diagonal recurrence versus the reference
+for localDistance in ['euclidean', 'cityblock']:
+  dtw = createDTW(localDistance=localDistance)
+  for i in range(len(histories) - 1):
+    expected = referenceDTW(histories[i], histories[i + 1], localDistance)
+    checkFloat('{} DTW {}'.format(localDistance, i), dtw.dtwDistance(histories[i], histories[i + 1]), expected, tol=1e-8)
+
+# Sakoe-Chiba band
+for window in [0, 2, 5]:
+  dtw = createDTW(window=window)
+  for i in range(len(histories) - 1):
+    expected = referenceDTW(histories[i], histories[i + 1], 'euclidean', window)
+    value = dtw.dtwDistance(histories[i], histories[i + 1])
+    checkFloat('Window {} DTW {}'.format(window, i), value, expected, tol=1e-8)
+    checkTrue('Window {} DTW {} not below the unconstrained'.format(window, i),
+              value >= referenceDTW(histories[i], histories[i + 1], 'euclidean') - 1e-10)
+
+# LB_Keogh lower bound and cutoff
+for window in [None, 3]:
+  for i in range(len(histories) - 1):
+    expected = referenceDTW(histories[i], histories[i + 1], 'euclidean', window)
+    bound = _lbKeogh(histories[i], histories[i + 1], 'euclidean', window)
+    checkTrue('LB_Keogh window {} pair {}'.format(window, i), bound <= expected + 1e-10)
+    for cutoff in [0.5 * expected, 2.0 * expected]:
+      value = createDTW(window=window, cutoff=cutoff).dtwDistance(histories[i], histories[i + 1])
+      if expected > cutoff:
+        checkTrue('Pruned window {} pair {}'.format(window, i), cutoff < value <= expected + 1e-10)
+      else:
+        checkFloat('Not pruned window {} pair {}'.format(window, i), value, expected, tol=1e-8)
+
+# derivative DTW
+dtw = createDTW(order=1)
+checkFloat('Derivative DTW', dtw.run(histories[0], histories[2]),
+           referenceDTW(np.gradient(histories[0], axis=1), np.gradient(histories[2], axis=1), 'euclidean'), tol=1e-8)
+
+######################################
+#        PAIRWISE DISTANCES          #
+######################################
+dtw = createDTW(window=4)
+distances = dtw.evaluatePairwise(histories)
+checkTrue('Pairwise shape', distances.shape == (len(histories), len(histories)))
+checkTrue('Pairwise symmetric', np.allclose(distances, distances.T))
+for i in range(len(histories)):
+  checkFloat('Pairwise diagonal {}'.format(i), distances[i, i], 0.0)
+  for j in range(i + 1, len(histories)):
+    checkFloat('Pairwise {} {}'.format(i, j), distances[i, j], referenceDTW(histories[i], histories[j], 'euclidean', 4), tol=1e-8)
+
+distances = dtw.evaluatePairwise(histories[:2], histories[2:])
+checkTrue('Pairwise rectangular shape', distances.shape == (2, len(histories) - 2))
+checkFloat('Pairwise rectangular', distances[1, 2], referenceDTW(histories[1], histories[4], 'euclidean', 4), tol=1e-8)
+
+parallelDistances = createDTW(window=4, workers=3).evaluatePairwise(histories)
+checkTrue('Pairwise in parallel', np.allclose(parallelDistances, dtw.evaluatePairwise(histories), rtol=0.0, atol=1e-12))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.Metrics.DTW</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>Metrics.metrics.DTW</classesTested>
+    <description>
+       This test is a Unit Test for the DTW metric: anti-diagonal recurrence, Sakoe-Chiba band,
+       LB_Keogh pruning and pairwise distances among stacks of histories (serial and in parallel).
+    </description>
+  </TestInfo>
+"""
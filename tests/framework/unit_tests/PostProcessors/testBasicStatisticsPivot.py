@@ -0,0 +1,183 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the time-dependent metrics of the BasicStatistics postprocessor,
+  which are computed for all the pivot values at once: each result must match the one computed for
+  each pivot value separately.
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import numpy as np
+import xarray as xr
+from sklearn.linear_model import LinearRegression
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path_recursively
+find_crow(frameworkDir)
+add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+import MessageHandler
+from Models.PostProcessors.BasicStatistics import BasicStatistics
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,value,expected,tol=1e-10,updateResults=True):
+  """
+    This method is aimed to compare two arrays of floats
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the values to check
+    @ In, expected, np.ndarray, the expected values
+    @ In, tol, float, optional, the tolerance (relative to the largest expected value)
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  value = np.asarray(value)
+  expected = np.asarray(expected)
+  res = value.shape == expected.shape and np.allclose(value, expected, rtol=0.0, atol=tol*max(1.0, np.max(np.abs(expected))))
+  if not res:
+    print("checking answer",comment,value,"!=",expected)
+  if updateResults:
+    results["pass" if res else "fail"] += 1
+  return res
+
+def percentileReference(arrayIn, pbWeight, percent):
+  """
+    Weighted percentile of a single array of samples, computed one percent at a time
+    @ In, arrayIn, np.ndarray, the samples
+    @ In, pbWeight, np.ndarray, the weights of the samples
+    @ In, percent, float, the percentile (between 0 and 1)
+    @ Out, result, float, the percentile
+  """
+  idxs = np.argsort(arrayIn)
+  sortedPoints = np.insert(arrayIn[idxs], 0, arrayIn[idxs[0]])
+  weightsCDF = np.cumsum(np.insert(pbWeight[idxs], 0, 0.0))
+  indexL = np.nonzero(weightsCDF >= percent)[0]
+  # the summed weights can fall short of 1.0 by round-off
+  indexL = indexL[0] if len(indexL) else len(weightsCDF) - 1
+  indexH = np.nonzero(weightsCDF > percent)[0]
+  if len(indexH):
+    return 0.5*(sortedPoints[indexL] + sortedPoints[indexH[0]])
+  return sortedPoints[indexL]
+
+np.random.seed(42)
+numPivot, numSamples = 5, 40
+pivotVals = np.linspace(0.0, 1.0, numPivot)
+pp = BasicStatistics()
+pp.pivotParameter = 'time'
+
+#
+# weighted percentiles
+#
+weights = np.random.rand(numSamples)
+weights /= weights.sum()
+samples = np.random.normal(size=(numPivot, numSamples))
+# some ties, as in discrete distributions
+samples[1] = np.round(samples[1])
+percents = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 1.0]
+values = pp._computeWeightedPercentile(samples, weights, percent=percents)
+expected = [[percentileReference(samples[t], weights, p) for t in range(numPivot)] for p in percents]
+checkArray('weighted percentiles', values, expected)
+for t in range(numPivot):
+  checkArray('weighted median at pivot {}'.format(t), pp._computeWeightedPercentile(samples[t], weights), percentileReference(samples[t], weights, 0.5))
+# equal weights, with the median between two samples
+equal = np.ones(numSamples) / numSamples
+checkArray('median with equal weights', pp._computeWeightedPercentile(samples, equal), [percentileReference(samples[t], equal, 0.5) for t in range(numPivot)])
+
+#
+# covariance and pearson
+#
+params = np.random.normal(size=(numPivot, 3, numSamples))
+params[:, 1] += 2.0 * params[:, 0]
+for weighted in [False, True]:
+  pp.pbPresent = weighted
+  pp.realizationWeight = xr.Dataset({'ProbabilityWeight': ('RAVEN_sample_ID', weights)})
+  w = weights if weighted else np.ones(numSamples) / numSamples
+  centered = params - np.sum(params * w, axis=-1, keepdims=True)
+  fact = 1.0 / (1.0 - np.sum(w**2)) if weighted else 1.0 / (numSamples - 1.0)
+  variance = np.sum(w * centered**2, axis=-1) * (fact if weighted else numSamples * fact)
+  tag = 'weighted ' if weighted else ''
+  covAll = pp.covarianceCalculation(centered, fact, variance, ['a', 'b', 'c'], pivotVals=pivotVals)
+  pearsonAll = pp.corrCoeff(covAll.values.copy())
+  for t in range(numPivot):
+    cov = pp.covarianceCalculation(centered[t], fact, variance[t], ['a', 'b', 'c'])
+    checkArray(tag + 'covariance at pivot {}'.format(t), covAll.sel(time=pivotVals[t]).values, cov.values)
+    checkArray(tag + 'pearson at pivot {}'.format(t), pearsonAll[t], pp.corrCoeff(cov.values.copy()))
+    if not weighted:
+      checkArray('covariance reference at pivot {}'.format(t), cov.values, np.cov(params[t]))
+      checkArray('pearson reference at pivot {}'.format(t), pearsonAll[t], np.corrcoef(params[t]))
+  checkArray(tag + 'covariance coordinates', covAll.coords['time'].values, pivotVals)
+
+#
+# sensitivity, with a rank-deficient set of features (the third is the sum of the first two)
+#
+feats = np.random.normal(size=(numPivot, numSamples, 3))
+feats[..., 2] = feats[..., 0] + feats[..., 1]
+targs = np.stack([feats[..., 0] - 3.0*feats[..., 1] + 0.1*np.random.normal(size=(numPivot, numSamples)),
+                  2.0*feats[..., 2] + 1.0], axis=-1)
+for multiple in [True, False]:
+  pp.multipleFeatures = multiple
+  tag = 'multiple ' if multiple else 'single '
+  senAll = pp.sensitivityCalculation(['x', 'y', 'z'], ['f', 'g'], feats, targs, False, pivotVals=pivotVals)
+  for t in range(numPivot):
+    sen = pp.sensitivityCalculation(['x', 'y', 'z'], ['f', 'g'], feats[t], targs[t], False)
+    checkArray(tag + 'sensitivity at pivot {}'.format(t), senAll.sel(time=pivotVals[t]).values, sen.values)
+    if multiple:
+      # minimum norm least squares solution, as given by a linear regression
+      reference = LinearRegression().fit(feats[t], targs[t]).coef_
+    else:
+      reference = [[LinearRegression().fit(feats[t][:, f:f+1], targs[t][:, g]).coef_[0] for f in range(3)] for g in range(2)]
+    checkArray(tag + 'sensitivity reference at pivot {}'.format(t), sen.values, reference, tol=1e-8)
+# targets also used as features
+pp.multipleFeatures = True
+both = np.concatenate([feats[..., :2], targs[..., :1]], axis=-1)
+senAll = pp.sensitivityCalculation(['x', 'y', 'f'], ['f'], both, targs[..., :1], True, pivotVals=pivotVals)
+for t in range(numPivot):
+  sen = pp.sensitivityCalculation(['x', 'y', 'f'], ['f'], both[t], targs[t, :, :1], True)
+  checkArray('sensitivity with targets in features at pivot {}'.format(t), senAll.sel(time=pivotVals[t]).values, sen.values)
+
+#
+# variance dependent sensitivity, also on the rank-deficient covariance
+#
+covs = np.stack([np.cov(np.concatenate([feats[t], targs[t]], axis=-1).T) for t in range(numPivot)])
+for multiple in [True, False]:
+  pp.multipleFeatures = multiple
+  tag = 'multiple ' if multiple else 'single '
+  names = ['x', 'y', 'z', 'f', 'g']
+  senAll = pp.varianceDepSenCalculation(names, covs, pivotVals=pivotVals)
+  for t in range(numPivot):
+    sen = pp.varianceDepSenCalculation(names, covs[t])
+    checkArray(tag + 'variance dependent sensitivity at pivot {}'.format(t), senAll.sel(time=pivotVals[t]).values, sen.values)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.basicStatisticsPivot</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>PostProcessors.BasicStatistics</classesTested>
+    <description>
+       This test checks the time-dependent metrics of the BasicStatistics postprocessor (weighted percentiles,
+       covariance, pearson, sensitivity and variance dependent sensitivity), computed for all the pivot values
+       at once, against the same metrics computed for each pivot value separately, including a rank-deficient
+       set of features for the sensitivity.
+    </description>
+  </TestInfo>
+"""
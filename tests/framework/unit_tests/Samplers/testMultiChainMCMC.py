@@ -0,0 +1,307 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the multiple chain MCMC samplers: the running Gelman-Rubin factor,
+  the acceptance of the stretch move and the exchange probability of parallel tempering.
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow, add_path_recursively
+find_crow(frameworkDir)
+add_path_recursively(os.path.join(frameworkDir, 'contrib'))
+import MessageHandler
+import Distributions
+from utils import randomUtils
+from Samplers.MCMC import MultiChainMetropolis, AffineInvariantEnsemble, ParallelTempering
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkFloat(comment,value,expected,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  if np.isnan(value) and np.isnan(expected):
+    res = True
+  elif np.isnan(value) or np.isnan(expected):
+    res = False
+  else:
+    res = abs(value - expected) <= tol
+  if update:
+    if not res:
+      print("checking float",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking answer",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+class SolutionExport:
+  """
+    Collects the realizations that the samplers add to the solution export
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self.rlzs = []
+
+  def addRealization(self, rlz):
+    """
+      Stores a realization
+      @ In, rlz, dict, the realization
+      @ Out, None
+    """
+    self.rlzs.append(rlz)
+
+def makeSampler(cls, numChains, limit=1000, burnIn=0):
+  """
+    Builds a sampler on the variables "x" and "y", both uniform on [-5, 5], with its chains
+    @ In, cls, class, the sampler class
+    @ In, numChains, int, the number of chains
+    @ In, limit, int, optional, the samples of all the chains
+    @ In, burnIn, int, optional, the burn-in of each chain
+    @ Out, sampler, MultiChainMCMC instance, the sampler
+  """
+  sampler = cls()
+  sampler.messageHandler = mh
+  sampler.toBeCalibrated = {'x': 'uniform', 'y': 'uniform'}
+  for var in sampler.toBeCalibrated:
+    dist = Distributions.Uniform(-5.0, 5.0)
+    dist.initializeDistribution()
+    sampler.distDict[var] = dist
+  sampler._numChains = numChains
+  sampler.limit = limit
+  sampler._burnIn = burnIn
+  sampler._solutionExport = SolutionExport()
+  randomUtils.randomSeed(42)
+  sampler._chains = [sampler._newChain(c) for c in range(sampler._numReplicas())]
+  return sampler
+
+def state(x, y, logPrior=0.0, logLikelihood=0.0):
+  """
+    Builds an evaluated chain state
+    @ In, x, float, value of "x"
+    @ In, y, float, value of "y"
+    @ In, logPrior, float, optional, the log prior
+    @ In, logLikelihood, float, optional, the log likelihood
+    @ Out, state, dict, the chain state
+  """
+  return {'rlz': {'x': x, 'y': y}, 'logPrior': logPrior, 'logLikelihood': logLikelihood}
+
+#
+# Gelman-Rubin factor from the running (Welford) means and variances
+#
+sampler = makeSampler(MultiChainMetropolis, 3, burnIn=5)
+checkSame('Gelman-Rubin without samples', np.isnan(sampler.gelmanRubin()['x']), True)
+np.random.seed(3)
+samples = [np.random.normal(loc=shift, scale=scale, size=(40, 2)) for shift, scale in [(0.0, 1.0), (0.5, 2.0), (-1.0, 0.5)]]
+for step in range(40):
+  for index, chainSamples in enumerate(samples):
+    sampler._advanceChain(index, state(*chainSamples[step]), True)
+rhat = sampler.gelmanRubin()
+# the samples during the burn-in are not used
+kept = np.array([chainSamples[5:] for chainSamples in samples])
+n = kept.shape[1]
+within = kept.var(axis=1, ddof=1).mean(axis=0)
+between = n * kept.mean(axis=1).var(axis=0, ddof=1)
+expected = np.sqrt(((n - 1.) / n * within + between / n) / within)
+checkFloat('Gelman-Rubin factor of x', rhat['x'], expected[0])
+checkFloat('Gelman-Rubin factor of y', rhat['y'], expected[1])
+for index in range(3):
+  checkSame('samples after burn-in of chain {}'.format(index), sampler._chains[index]['n'], n)
+  checkFloat('running mean of chain {}'.format(index), sampler._chains[index]['mean'][0], kept[index, :, 0].mean())
+checkSame('exported samples', len(sampler._solutionExport.rlzs), 3 * n)
+checkFloat('exported factor', sampler._solutionExport.rlzs[-1]['Rhat_y'][0], expected[1])
+# rejected moves repeat the current state in the diagnostics
+sampler._advanceChain(0, None, False)
+checkSame('rejected move sample', sampler._chains[0]['n'], n + 1)
+checkFloat('rejected move mean', sampler._chains[0]['mean'][0], np.append(kept[0, :, 0], kept[0, -1, 0]).mean())
+checkFloat('rejected move accept rate', sampler._chainAcceptRate(sampler._chains[0]), 40. / 41.)
+# identical chains are converged
+sampler = makeSampler(MultiChainMetropolis, 2)
+for step in range(20):
+  for index in range(2):
+    sampler._advanceChain(index, state(*samples[0][step]), True)
+checkFloat('Gelman-Rubin factor of identical chains', sampler.gelmanRubin()['x'], np.sqrt(19. / 20.))
+
+#
+# samples of each chain
+#
+sampler = makeSampler(MultiChainMetropolis, 3, limit=31)
+checkSame('samples of each chain', sampler._chainLimit(), 10)
+sampler._chains[0]['step'] = 8
+checkSame('chain with samples left', sampler._chainFinished(0), False)
+sampler._chains[0]['step'] = 9
+checkSame('chain without samples left', sampler._chainFinished(0), True)
+
+#
+# stretch move
+#
+sampler = makeSampler(AffineInvariantEnsemble, 4)
+sampler._halves = [[0, 1], [2, 3]]
+for index, (x, y) in enumerate([(0.0, 0.0), (1.0, -1.0), (2.0, 1.0), (-1.0, 3.0)]):
+  sampler._chains[index]['current'] = dict(state(x, y, logPrior=-0.1*index, logLikelihood=-0.5*index), beta=1.0)
+# proposals drawn with the same random numbers as the walkers
+twins = []
+for index in range(4):
+  twin = randomUtils.newRNG()
+  randomUtils.randomSeed(index + 100, engine=twin)
+  randomUtils.randomSeed(index + 100, engine=sampler._chains[index]['engine'])
+  twins.append(twin)
+sampler._activeHalf = 0
+sampler._pending = 2
+sampler._proposeHalf()
+checkSame('stretch proposals', len(sampler._proposals), 2)
+for k, values, info in sampler._proposals:
+  j = [2, 3][randomUtils.randomIntegers(0, 1, None, engine=twins[k])]
+  z = (randomUtils.random(engine=twins[k]) + 1.) ** 2 / 2.
+  checkFloat('stretch of walker {}'.format(k), info['z'], z)
+  checkSame('stretch in [1/a, a] of walker {}'.format(k), 0.5 <= z <= 2.0, True)
+  walker = sampler._chains[k]['current']['rlz']
+  partner = sampler._chains[j]['current']['rlz']
+  for var in ['x', 'y']:
+    checkFloat('stretch proposal of walker {} on {}'.format(k, var), values[var], partner[var] + z * (walker[var] - partner[var]))
+# acceptance: min(1, z^(d-1) p(Y)/p(X)), with d=2 variables
+alphas = []
+def recordAcceptance(alpha, index):
+  """
+    Records the log acceptance probability, and accepts if it is larger than log(0.5)
+    @ In, alpha, float, the log accepted probabilty
+    @ In, index, int, the index of the chain
+    @ Out, acceptable, bool, True if accepted
+  """
+  alphas.append(alpha)
+  return alpha > np.log(0.5)
+sampler._checkChainAcceptance = recordAcceptance
+sampler._proposals.clear()
+sampler._useChainRealization(1, state(1.2, -0.8, logPrior=-0.1, logLikelihood=-1.5), {'z': 1.2})
+checkFloat('stretch move acceptance', alphas[-1], np.log(1.2) + (-0.1 - 1.5) - (-0.1 - 0.5))
+checkSame('stretch move rejected', sampler._chains[1]['current']['rlz']['x'], 1.0)
+sampler._useChainRealization(0, state(0.1, 0.2, logPrior=0.0, logLikelihood=-0.1), {'z': 0.8})
+checkFloat('stretch move acceptance with a shrinking move', alphas[-1], np.log(0.8) - 0.1)
+checkSame('stretch move accepted', sampler._chains[0]['current']['rlz']['x'], 0.1)
+checkSame('stretch move accepted step', sampler._chains[0]['step'], 1)
+# after both walkers of the half are resolved, the other half moves
+checkSame('other half active', sampler._activeHalf, 1)
+checkSame('other half proposals', sorted(k for k, _, _ in sampler._proposals), [2, 3])
+sampler._useChainRealization(2, state(2.0, 1.5, logPrior=-0.2, logLikelihood=-0.1), {'z': 1.5})
+checkFloat('stretch move acceptance capped', alphas[-1], 0.0)
+# proposals out of the bounds are rejected without evaluating the model
+sampler._proposals.clear()
+for index in range(4):
+  sampler._chains[index]['current']['rlz'] = {'x': 6.0, 'y': float(index)}
+sampler._activeHalf = 1
+sampler._pending = 2
+steps = [chain['step'] for chain in sampler._chains]
+sampler._proposeHalf()
+checkSame('out of bounds proposals', len(sampler._proposals), 0)
+checkSame('out of bounds steps', [chain['step'] for chain in sampler._chains[2:]], [steps[2] + 1, steps[3] + 1])
+checkSame('out of bounds resolved', sampler._pending, 0)
+
+#
+# exchanges of parallel tempering
+#
+sampler = makeSampler(ParallelTempering, 1)
+sampler._temperatures = [1.0, 2.0, 4.0]
+sampler._chains = [sampler._newChain(c) for c in range(sampler._numReplicas())]
+logLikelihoods = [-3.0, -1.0, -2.0]
+for rung, chain in enumerate(sampler._chains):
+  chain['beta'] = 1.0 / sampler._temperatures[rung]
+  chain['current'] = dict(state(float(rung), 0.0, logPrior=-0.2, logLikelihood=logLikelihoods[rung]), beta=chain['beta'])
+  chain['swapTried'] = 0
+  chain['swapAccepted'] = 0
+alphas = []
+sampler._checkChainAcceptance = recordAcceptance
+sampler._swap([0, 1, 2])
+# the hottest pair first: (1/2 - 1/4) * (-2 + 1) = -0.25 > log(0.5), exchanged
+checkFloat('exchange of the hottest pair', alphas[0], -0.25)
+# then the coldest pair, with the state just received: (1 - 1/2) * (-2 + 3) = 0.5, capped at 0
+checkFloat('exchange of the coldest pair', alphas[1], 0.0)
+checkSame('cold replica state', sampler._chains[0]['current']['rlz']['x'], 2.0)
+checkSame('middle replica state', sampler._chains[1]['current']['rlz']['x'], 0.0)
+checkSame('hot replica state', sampler._chains[2]['current']['rlz']['x'], 1.0)
+checkSame('exchanged states keep the temperature', [chain['current']['beta'] for chain in sampler._chains], [1.0, 0.5, 0.25])
+checkSame('exchanges tried', [chain['swapTried'] for chain in sampler._chains], [1, 2, 1])
+checkSame('exchanges accepted', [chain['swapAccepted'] for chain in sampler._chains], [1, 2, 1])
+# an unfavorable exchange: (1 - 1/2) * (-10 + 2) = -4 < log(0.5)
+sampler._chains[1]['current']['logLikelihood'] = -10.0
+sampler._swap([0, 1])
+checkFloat('unfavorable exchange', alphas[-1], -4.0)
+checkSame('unfavorable exchange rejected', sampler._chains[0]['current']['rlz']['x'], 2.0)
+# the exchange is accepted with its probability
+sampler = makeSampler(ParallelTempering, 1)
+sampler._temperatures = [1.0, 2.0]
+sampler._chains = [sampler._newChain(c) for c in range(sampler._numReplicas())]
+accepted = 0
+numTrials = 4000
+for trial in range(numTrials):
+  for rung, chain in enumerate(sampler._chains):
+    chain['beta'] = 1.0 / sampler._temperatures[rung]
+    chain['current'] = dict(state(float(rung), 0.0, logLikelihood=[-1.0, -3.0][rung]), beta=chain['beta'])
+    chain['swapTried'] = chain['swapAccepted'] = 0
+  sampler._swap([0, 1])
+  accepted += sampler._chains[0]['swapAccepted']
+checkFloat('exchange probability', accepted / numTrials, np.exp(-1.0), tol=0.03)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.multiChainMCMC</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>Samplers.MultiChainMetropolis, Samplers.AffineInvariantEnsemble, Samplers.ParallelTempering</classesTested>
+    <description>
+       This test checks the multiple chain MCMC samplers: the Gelman-Rubin factor computed from the running
+       means and variances of the chains, the share of the samples of each chain, the stretch move of the
+       affine invariant ensemble sampler and its acceptance probability, and the exchanges of states of
+       parallel tempering and their acceptance probability.
+    </description>
+  </TestInfo>
+"""
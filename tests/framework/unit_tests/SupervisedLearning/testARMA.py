@@ -48,6 +48,7 @@ from Models import ROM
 
 # find location of ARMA
 from SupervisedLearning import ARMA
+from SupervisedLearning.ARMA import armaResultsProxy, varmaResultsProxy
 
 print('Module undergoing testing:')
 print(ARMA)
@@ -477,6 +478,70 @@ sig7=[0.39975177, -0.14531468,  0.13138866, -0.56565224,  0.06020252,
 for n in range(10):
   checkFloat('signal 7, evaluation ind{}'.format(n), signal7[n], sig7[n], tol=1e-7)
 
+# several realizations at once, the first uses the same random numbers as a single one
+arma.setEngine(eng,seed=901017,count=0)
+signals8=arma._generateARMASignal(testVal, numRealizations=3)
+checkTrue('realizations shape', signals8.shape == (3, len(data)))
+for n in range(10):
+  checkFloat('signals 8, evaluation ind{}'.format(n), signals8[0][n], signal7[n], tol=1e-12)
+checkTrue('realizations differ', not np.allclose(signals8[0], signals8[1]))
+
+#############################################
+#          STATE SPACE SIMULATION           #
+#############################################
+# VAR(1) with an intercept: x_{t+1} = c + T x_t + e_t, observed directly
+transition = np.array([[0.5, 0.2], [-0.1, 0.3]])
+varma = varmaResultsProxy(np.eye(2), np.array([1.0, -1.0]), transition, np.array([0.1, 0.2]), np.eye(2))
+shocks = np.random.normal(size=(2, 57, 2))
+init = np.random.normal(size=(2, 2))
+obs = arma._simulateStateSpace(varma, shocks, init)
+checkTrue('state space shape', obs.shape == (2, 57, 2))
+for r in range(2):
+  state = init[r]
+  for n in range(57):
+    for v in range(2):
+      checkFloat('state space realization {} step {} variable {}'.format(r, n, v), obs[r, n, v], state[v] + varma.obsIntercept[v], tol=1e-10)
+    state = varma.stateIntercept + transition.dot(state) + shocks[r, n]
+
+#############################################
+#       PICKLES OF OLDER RAVEN VERSIONS     #
+#############################################
+# older ROMs kept the statsmodels results, which are converted on unpickling
+class oldARMAResults:
+  """
+    Stands for the statsmodels ARMAResults kept by the older ROMs
+  """
+  arparams = np.array([0.5, -0.2])
+  maparams = np.array([0.3])
+  sigma2 = 4.0
+
+import statsmodels.api
+varmaModel = statsmodels.api.tsa.VARMAX(endog=np.random.normal(size=(200, 2)), order=(1, 0))
+varmaModel.update(varmaModel.start_params)
+state = arma.__getstate__()
+state['armaResult'] = {'a': oldARMAResults()}
+state['varmaResult'] = (varmaModel, oldARMAResults())
+old = ARMA.__new__(ARMA)
+old.__setstate__(state)
+checkTrue('old ARMA converted', isinstance(old.armaResult['a'], armaResultsProxy))
+checkArray('old ARMA ar params', old.armaResult['a'].arparams, oldARMAResults.arparams, float)
+checkArray('old ARMA ma params', old.armaResult['a'].maparams, oldARMAResults.maparams, float)
+checkFloat('old ARMA variance', old.armaResult['a'].sigma2, oldARMAResults.sigma2)
+checkTrue('old VARMA converted', isinstance(old.varmaResult[0], varmaResultsProxy))
+checkTrue('old zeroed ARMA converted', isinstance(old.varmaResult[1], armaResultsProxy))
+shocks = np.random.normal(size=(31, 2))
+init = np.random.normal(size=2)
+obs = old._simulateStateSpace(old.varmaResult[0], shocks[None], init[None])[0]
+expected = varmaModel.ssm.simulate(31, initial_state=init, measurement_shocks=np.zeros((31, 2)), state_shocks=shocks)[0]
+checkArray('old VARMA sampling', obs.ravel(), expected.ravel(), float, tol=1e-10)
+# results that cannot be converted ask for retraining
+state = arma.__getstate__()
+state['armaResult'] = {'a': object()}
+old = ARMA.__new__(ARMA)
+checkFails('old ARMA not convertible',
+           'The ARMA of target "a" was pickled by an older RAVEN version and cannot be converted (object). Please retrain the ROM.',
+           old.__setstate__, args=[state])
+
 #################
 # TODO UNTESTED #
 #################
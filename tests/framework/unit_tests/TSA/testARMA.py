@@ -328,6 +328,15 @@ checkFloat('Simple denorm 250', 2.051286365253135, new[250], tol=1e-6)
 checkFloat('Simple denorm 500', -0.5047179383332892, new[500], tol=1e-6)
 checkFloat('Simple denorm 999', 1.3200315405820204, new[999], tol=1e-6)
 
+# several histories at once are the same as one at a time
+randomUtils.randomSeed(42)
+many = arma.generateSamples(params, pivot, settings, 3)
+randomUtils.randomSeed(42)
+single = [arma.generate(params, pivot, settings) for _ in range(3)]
+checkSame('Multiple samples shape', many.shape, (3, N, 1))
+for s in range(3):
+  checkArray(f'Multiple samples {s}', single[s][:, 0], many[s, :, 0], float)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -290,6 +290,12 @@ checkFloat('Residual check', (resid-const).sum(), 0)
 res = fourier.generate(params, pivot, None)
 for tg, target in enumerate(targets):
   checkArray(f'Signal {target} replication', res[:, tg], signals[:, tg], float)
+# several histories at once
+many = fourier.generateSamples(params, pivot, None, 3)
+checkSame('Multiple samples shape', many.shape, (3, len(pivot), len(targets)))
+for s in range(3):
+  for tg, target in enumerate(targets):
+    checkArray(f'Signal {target} sample {s} replication', many[s, :, tg], signals[:, tg], float)
 
 
 
@@ -105,6 +105,74 @@ else:
   print('checking string representation does not match:\n'+msg,'\n!=\n'+right)
   results['fail']+=1
 
+def checkSame(comment,value,expected):
+  """
+    This method is aimed to compare two objects
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if value != expected:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+  else:
+    results["pass"] += 1
+
+#test columnar collector
+collector = cached_ndarray.cColumnarArray(width=4,length=2)
+checkAnswer('columnar empty length',len(collector),0)
+collector.append([1.5, 3, 'first', np.array([0.1, 0.2, 0.3])])
+collector.append([np.float64(2.5), np.int64(4), 'second', np.array([1.1, 1.2, 1.3])])
+checkAnswer('columnar length',len(collector),2)
+checkSame('columnar shape',collector.shape,(2,4))
+checkSame('columnar float type',collector.getColumn(0).dtype,np.dtype(float))
+checkSame('columnar int type',collector.getColumn(1).dtype,np.dtype(np.int64))
+checkSame('columnar str type',collector.getColumn(2).dtype,np.dtype(object))
+checkSame('columnar aligned history shape',collector.getColumn(3).shape,(2,3))
+checkAnswer('columnar element',collector[1,0],2.5)
+checkSame('columnar string element',collector[0,2],'first')
+checkAnswer('columnar history element',collector[1,3][2],1.3)
+row = collector[0]
+checkSame('columnar row length',len(row),4)
+checkAnswer('columnar row history',row[3][0],0.1)
+checkSame('columnar history column as objects',collector[:,3].shape,(2,))
+# growing past the capacity, as a block
+collector.extendColumns([np.array([3.5, 4.5]), np.array([5, 6]), np.array(['third', 'fourth']), np.ones((2, 3))])
+checkAnswer('columnar extend length',len(collector),4)
+checkAnswer('columnar extend element',collector[3,1],6)
+checkAnswer('columnar kept element',collector[0,0],1.5)
+# values that do not fit switch the column to objects
+collector.append([None, 7.5, 'fifth', np.array([1.0, 2.0])])
+checkSame('columnar float to object type',collector.getColumn(0).dtype,np.dtype(object))
+checkSame('columnar int to object type',collector.getColumn(1).dtype,np.dtype(object))
+checkSame('columnar ragged type',collector.getColumn(3).dtype,np.dtype(object))
+checkAnswer('columnar converted float',collector[3,0],4.5)
+checkAnswer('columnar converted int',collector[4,1],7.5)
+checkAnswer('columnar ragged history',len(collector[4,3]),2)
+checkAnswer('columnar converted history',collector[2,3][0],1.0)
+# integers are not rounded into float columns
+big = 2**53 + 1
+ints = cached_ndarray.cColumnarArray(width=3,length=2)
+ints.append([1.5, 1, np.array([0.5, 1.5])])
+ints.append([big, 2, np.array([big, big])])
+checkSame('columnar float to object for int type',ints.getColumn(0).dtype,np.dtype(object))
+checkSame('columnar int into float column',ints[1,0],big)
+checkSame('columnar int into history column',int(ints[1,2][1]),big)
+ints.extendColumns([np.array([big, big]), np.array([2**63, 2]), np.ones((2, 2))])
+checkSame('columnar int array into float column',ints[2,0],big)
+checkSame('columnar int beyond int64 range',ints[2,1],2**63)
+checkSame('columnar int beyond int64 range type',ints.getColumn(1).dtype,np.dtype(object))
+# setting values
+collector[0,1] = 10
+checkAnswer('columnar set value',collector[0,1],10)
+# entities
+collector.addEntity([True]*5)
+checkSame('columnar add entity type',collector.getColumn(4).dtype,np.dtype(bool))
+collector.removeEntity(2)
+checkSame('columnar remove entity shape',collector.shape,(5,4))
+checkSame('columnar selection',list(collector[np.where(collector[:,3])][:,1]),[10,4,5,6,7.5])
+
 print(results)
 
 sys.exit(results["fail"])
@@ -396,6 +396,50 @@ engine.seed(42)
 sampled = [engine.random() for _ in range(5)]
 checkArray('Independent RNG, seeded',sampled,correct)
 
+## bulk fill -> should be same as one at a time
+engine.seed(42)
+sampled = np.zeros(5)
+engine.fill_random(sampled)
+checkArray('Independent RNG, filled',sampled,correct)
+checkArray('Independent RNG, continued after fill',[engine.random()],[0.779690986872])
+try:
+  engine.fill_random(np.zeros(5, dtype=np.float32))
+  checkTrue('Independent RNG, fill rejects floats',False,True)
+except TypeError:
+  checkTrue('Independent RNG, fill rejects floats',True,True)
+
+# batches of samples use the same random numbers as single samples, in order
+for eng in [None, randomUtils.newRNG()]:
+  label = 'engine not provided' if eng is None else 'local engine provided'
+  randomUtils.randomSeed(7,engine=eng)
+  single = [randomUtils.random(engine=eng) for _ in range(12)]
+  randomUtils.randomSeed(7,engine=eng)
+  batch = randomUtils.random(3,4,engine=eng)
+  checkArray('Batch of random samples for {}'.format(label),batch.ravel(),single,tol=0)
+  ## normal samples are generated in pairs, so also check odd sizes (starting without queued samples)
+  randomUtils.boxMullerGen.queue.clear()
+  randomUtils.randomSeed(7,engine=eng)
+  single = [randomUtils.randomNormal(engine=eng) for _ in range(12)]
+  randomUtils.boxMullerGen.queue.clear()
+  randomUtils.randomSeed(7,engine=eng)
+  batch = [randomUtils.randomNormal(engine=eng)] + list(randomUtils.randomNormal(3,engine=eng)) + \
+          list(randomUtils.randomNormal((2,4),engine=eng).ravel())
+  checkArray('Batch of random normal samples for {}'.format(label),batch,single,tol=0)
+  randomUtils.randomSeed(7,engine=eng)
+  single = [randomUtils.randomChoice([1,2,3,4],engine=eng) for _ in range(10)]
+  randomUtils.randomSeed(7,engine=eng)
+  batch = randomUtils.randomChoice([1,2,3,4],size=10,engine=eng)
+  checkArray('Batch of random choices for {}'.format(label),batch,single,tol=0)
+  testArray = np.arange(12).reshape(3,4)
+  randomUtils.randomSeed(7,engine=eng)
+  single = [randomUtils.randomChoice(testArray,engine=eng) for _ in range(10)]
+  randomUtils.randomSeed(7,engine=eng)
+  batch = randomUtils.randomChoice(testArray,size=10,engine=eng)
+  checkArray('Batch of random choices from ND-array for {}'.format(label),batch,single,tol=0)
+  randomUtils.randomSeed(7,engine=eng)
+  batch = randomUtils.randomChoice([1,2,3,4,5],size=5,replace=False,engine=eng)
+  checkArray('Random choices without replacement for {}'.format(label),sorted(batch),[1,2,3,4,5],tol=0)
+
 
 print(results)
 
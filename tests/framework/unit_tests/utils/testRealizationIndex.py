@@ -0,0 +1,194 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the realizationIndex module
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+from utils import realizationIndex
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two objects
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, None
+  """
+  if value != expected:
+    print("checking answer",comment,value,"!=",expected)
+    if updateResults:
+      results["fail"] += 1
+    return False
+  else:
+    if updateResults:
+      results["pass"] += 1
+    return True
+
+def bruteForce(toMatch, radii):
+  """
+    Finds the matches by checking all the realizations
+    @ In, toMatch, dict, {var: value} to match
+    @ In, radii, dict, {var: radius}
+    @ Out, matches, list, indices of the matching realizations
+  """
+  numRlz = len(data['x'])
+  match = np.ones(numRlz, dtype=bool)
+  for var, value in toMatch.items():
+    if radii[var] is None:
+      match &= np.array(list(v == value for v in data[var]))
+    else:
+      match &= np.abs(data[var] - value) <= radii[var]
+  return list(np.arange(numRlz)[match])
+
+def getValues(var, start):
+  """
+    Provides the values to the index, in two chunks like a data object with data and collector
+    @ In, var, str, the variable
+    @ In, start, int, the first realization
+    @ Out, values, list, np.ndarray of the values
+  """
+  values = data[var][start:]
+  half = len(values) // 2
+  return [values[:half], values[half:]]
+
+def candidates(toMatch, radii):
+  """
+    Finds the candidates with the index
+    @ In, toMatch, dict, {var: value} to match
+    @ In, radii, dict, {var: radius}
+    @ Out, candidates, list or None, the candidates
+  """
+  found = index.candidates(toMatch, radii, len(data['x']), getValues)
+  return None if found is None else list(found)
+
+def contains(found, expected):
+  """
+    Checks the candidates include all the matches
+    @ In, found, list, candidates
+    @ In, expected, list, matches
+    @ Out, contains, bool, True if all the matches are candidates
+  """
+  return set(expected).issubset(set(found))
+
+rng = np.random.RandomState(42)
+data = {'x': np.zeros(0), 'y': np.zeros(0), 'n': np.zeros(0, dtype=int), 'flag': np.zeros(0, dtype=bool), 'name': np.zeros(0, dtype=object)}
+index = realizationIndex.RealizationIndex()
+
+def grow(size):
+  """
+    Adds realizations to the data
+    @ In, size, int, the number of realizations to add
+    @ Out, None
+  """
+  new = {'x': rng.randint(0, 10, size) * 0.1,
+         'y': rng.rand(size) * 1e6,
+         'n': rng.randint(0, 5, size),
+         'flag': rng.rand(size) > 0.5,
+         'name': np.array(list('run{}'.format(i) for i in rng.randint(0, 20, size)), dtype=object)}
+  for var, values in new.items():
+    data[var] = np.concatenate([data[var], values])
+
+# the index follows the realizations as they are added, one or many at a time
+for step in [1, 1, 1, 5, 30, 1, 200, 3]:
+  grow(step)
+  last = len(data['x']) - 1
+  toMatch = dict((var, data[var][last]) for var in ['x', 'y'])
+  radii = {'x': 1e-12, 'y': 1e-6}
+  found = candidates(toMatch, radii)
+  checkSame('floats after adding {}: contains matches'.format(step), contains(found, bruteForce(toMatch, radii)), True)
+  checkSame('floats after adding {}: found last'.format(step), last in found, True)
+
+# float searches narrow down the realizations, with matches only along all the coordinates
+toMatch = {'x': 0.3, 'y': data['y'][10]}
+found = candidates(toMatch, {'x': 1e-12, 'y': 1e-6})
+checkSame('floats narrowed', len(found) < 5, True)
+checkSame('floats contains', contains(found, bruteForce(toMatch, {'x': 1e-12, 'y': 1e-6})), True)
+toMatch = {'x': 0.3}
+radii = {'x': 0.15}
+checkSame('float tolerance', candidates(toMatch, radii), bruteForce(toMatch, radii))
+toMatch = {'x': 7.0}
+checkSame('float no match', candidates(toMatch, {'x': 1e-6}), [])
+
+# hashed variables match exactly
+toMatch = {'name': 'run3'}
+checkSame('string', candidates(toMatch, {'name': None}), bruteForce(toMatch, {'name': None}))
+toMatch = {'flag': True}
+checkSame('boolean', candidates(toMatch, {'flag': None}), bruteForce(toMatch, {'flag': None}))
+toMatch = {'n': 2}
+checkSame('integer', candidates(toMatch, {'n': 1e-10}), bruteForce(toMatch, {'n': 1e-10}))
+toMatch = {'n': 2.0}
+checkSame('integer from float', candidates(toMatch, {'n': 1e-10}), bruteForce(toMatch, {'n': 1e-10}))
+# integers within a wide tolerance or matching a fraction cannot be hashed
+checkSame('integer wide tolerance', candidates({'n': 2}, {'n': 1.5}), None)
+checkSame('integer fraction', candidates({'n': 2.5}, {'n': 0.6}), None)
+checkSame('string with number', candidates({'name': 3.0}, {'name': 1e-10}), None)
+
+# mixed searches intersect the candidates
+toMatch = {'name': 'run3', 'n': 1, 'x': 0.5}
+radii = {'name': None, 'n': 1e-10, 'x': 1e-10}
+found = candidates(toMatch, radii)
+checkSame('mixed contains', contains(found, bruteForce(toMatch, radii)), True)
+checkSame('mixed narrowed', all(data['name'][r] == 'run3' and data['n'][r] == 1 for r in found), True)
+
+# non-finite values are never within a finite distance
+data['y'][5] = np.inf
+data['y'][6] = np.nan
+index = realizationIndex.RealizationIndex()
+found = candidates({'y': data['y'][7]}, {'y': 1e300})
+checkSame('non-finite excluded', 5 in found or 6 in found, False)
+checkSame('finite included', len(found), len(data['y']) - 2)
+
+# inconsistent values stop the indexing of a variable
+data['n'] = data['n'].astype(object)
+data['n'][-1] = 'mixed'
+index = realizationIndex.RealizationIndex()
+checkSame('not indexable', candidates({'n': 1}, {'n': 1e-10}), None)
+
+# removing realizations restarts the index
+for var in data:
+  data[var] = data[var][:10]
+toMatch = {'x': data['x'][3]}
+checkSame('restart', candidates(toMatch, {'x': 1e-10}), bruteForce(toMatch, {'x': 1e-10}))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.realizationIndex</name>
+    <author>talbpaul</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.realizationIndex</classesTested>
+    <description>
+       This test performs Unit Tests for the realizationIndex module
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""